@@ -71,7 +71,7 @@ class BasicTackle:
 
         ball_next = wm.ball().pos() + result._ball_vel
 
-        log.debug_client().add_message(f"Basic{'Foul' if use_foul else 'Tackle'}{result._tackle_angle.degree()}")
+        log.debug_client().add_message('Basic{}{}', 'Foul' if use_foul else 'Tackle', result._tackle_angle.degree())
         tackle_dir = (result._tackle_angle - wm.self().body()).degree()
 
         agent.do_tackle(tackle_dir, use_foul)
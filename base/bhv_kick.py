@@ -24,7 +24,10 @@ class BhvKick:
 
     def execute(self, agent: 'PlayerAgent'):
         wm: 'WorldModel' = agent.world()
-        shoot_candidate: ShootAction = BhvShhotGen().generator(wm)
+        # each generator gets a share of the time left in the cycle and returns the best it found so far
+        deadline = agent.decision_deadline()
+        with deadline.budget('shoot', 0.3) as budget:
+            shoot_candidate: ShootAction = BhvShhotGen().generator(wm, budget)
         if shoot_candidate:
             log.debug_client().set_target(shoot_candidate.target_point)
             log.debug_client().add_message(
@@ -35,20 +38,23 @@ class BhvKick:
         else:
             action_candidates: List[KickAction] = []
             
-            action_candidates += BhvPassGen().generator(wm)
+            with deadline.budget('pass', 0.7) as budget:
+                action_candidates += BhvPassGen().generator(wm, budget)
 
-            dribbles = BhvDribbleGen().generator(wm)
+            with deadline.budget('dribble') as budget:
+                dribbles = BhvDribbleGen().generator(wm, budget)
             if dribbles is not None:
-                action_candidates += BhvDribbleGen().generator(wm)
+                action_candidates += dribbles
 
             if len(action_candidates) == 0:
-                return True
+                return self.no_candidate_action(agent)
 
             best_action: KickAction = max(action_candidates)
 
             target = best_action.target_ball_pos
             log.debug_client().set_target(target)
-            log.debug_client().add_message(best_action.type.value + 'to ' + best_action.target_ball_pos.__str__() + ' ' + str(best_action.start_ball_speed))
+            log.debug_client().add_message('{}to {} {}', best_action.type.value, best_action.target_ball_pos,
+                                           best_action.start_ball_speed)
             SmartKick(target, best_action.start_ball_speed, best_action.start_ball_speed - 1, 3).execute(agent)
 
             if best_action.type is KickActionType.Pass:
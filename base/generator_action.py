@@ -3,6 +3,7 @@ from pyrusgeom.geom_2d import *
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from lib.player.decision_deadline import GeneratorBudget
     from lib.player.world_model import WorldModel
     from lib.player.object_player import PlayerObject
 
@@ -104,6 +105,12 @@ class BhvKickGen:
         self.candidates: list = []
         self.index = 0
         self.debug_list = []
+        self.budget: 'GeneratorBudget' = None
+
+    def out_of_time(self):
+        # generators without a budget run to completion, the others until their first candidate at least: a budget
+        # used up before they start (e.g. by a slow world update) still gives the best candidate found
+        return self.budget is not None and len(self.candidates) > 0 and self.budget.expired()
 
     def can_opponent_cut_ball(self, wm: 'WorldModel', ball_pos, cycle):
         for unum in range(1, 12):
@@ -16,7 +16,7 @@ class BhvClearGen(BhvKickGen):
         self.generate_clear_ball(wm)
         log.sw_log().clear().add_text("=========generated clear ball actions:")
         for candid in self.candidates:
-            log.sw_log().clear().add_text(f'{candid.index} {candid.target_ball_pos} {candid.eval}')
+            log.sw_log().clear().add_text('{} {} {}', candid.index, candid.target_ball_pos, candid.eval)
         if debug_clear_ball:
             for candid in self.debug_list:
                 if candid[2]:
@@ -61,10 +61,10 @@ class BhvClearGen(BhvKickGen):
             ball_pos = wm.ball().pos()
             angle = AngleDeg(a * angle_step)
             speed = 2.5
-            log.sw_log().clear().add_text(f'========= a:{a} speed:{speed} angle:{angle} ball:{ball_pos}')
+            log.sw_log().clear().add_text('========= a:{} speed:{} angle:{} ball:{}', a, speed, angle, ball_pos)
             for c in range(30):
                 ball_pos += Vector2D.polar2vector(speed, angle)
-                log.sw_log().clear().add_text(f'--->>>{ball_pos}')
+                log.sw_log().clear().add_text('--->>>{}', ball_pos)
                 speed *= SP.i().ball_decay()
                 if ball_pos.x() > SP.i().pitch_half_length():
                     break
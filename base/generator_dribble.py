@@ -9,6 +9,7 @@ from base.generator_action import BhvKickGen, KickActionType, KickAction
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from lib.player.decision_deadline import GeneratorBudget
     from lib.player.world_model import WorldModel
     from lib.player.object_player import PlayerObject
 
@@ -17,13 +18,14 @@ max_dribble_time = 0
 
 
 class BhvDribbleGen(BhvKickGen):
-    def generator(self, wm: 'WorldModel'):
+    def generator(self, wm: 'WorldModel', budget: 'GeneratorBudget' = None):
         global max_dribble_time
 
         if wm.self().pos().x() > 40:
             return None
 
         start_time = time.time()
+        self.budget = budget
         self.generate_simple_dribble(wm)
 
         if debug_dribble:
@@ -39,7 +41,7 @@ class BhvDribbleGen(BhvKickGen):
         end_time = time.time()
         if end_time - start_time > max_dribble_time:
             max_dribble_time = end_time - start_time
-        log.sw_log().dribble().add_text( 'time:{} max is {}'.format(end_time - start_time, max_dribble_time))
+        log.sw_log().dribble().add_text( 'time:{} max is {}', end_time - start_time, max_dribble_time)
         return self.candidates
 
     def generate_simple_dribble(self, wm: 'WorldModel'):
@@ -51,17 +53,20 @@ class BhvDribbleGen(BhvKickGen):
 
         my_first_speed = wm.self().vel().r()
 
-        for a in range(angle_div):
+        # forward dashes first, they get the best evaluations
+        for a in sorted(range(angle_div), key=lambda i: (wm.self().body() + angle_step * i).abs()):
+            if self.out_of_time():
+                break
             dash_angle = wm.self().body() + (angle_step * a)
 
             if wm.self().pos().x() < 16.0 and dash_angle.abs() > 100.0:
                 if debug_dribble:
-                    log.sw_log().dribble().add_text( '#dash angle:{} cancel is not safe1'.format(dash_angle))
+                    log.sw_log().dribble().add_text( '#dash angle:{} cancel is not safe1', dash_angle)
                 continue
 
             if wm.self().pos().x() < -36.0 and wm.self().pos().abs_y() < 20.0 and dash_angle.abs() > 45.0:
                 if debug_dribble:
-                    log.sw_log().dribble().add_text( '#dash angle:{} cancel is not safe2'.format(dash_angle))
+                    log.sw_log().dribble().add_text( '#dash angle:{} cancel is not safe2', dash_angle)
                 continue
 
             n_turn = 0
@@ -84,7 +89,7 @@ class BhvDribbleGen(BhvKickGen):
             else:
                 dash_angle += dir_diff
                 if debug_dribble:
-                    log.sw_log().dribble().add_text( '#dash angle:{} turn:{}'.format(dash_angle, n_turn))
+                    log.sw_log().dribble().add_text( '#dash angle:{} turn:{}', dash_angle, n_turn)
             self.simulate_kick_turns_dashes(wm, dash_angle, n_turn)
 
     def simulate_kick_turns_dashes(self, wm: 'WorldModel', dash_angle, n_turn):
@@ -95,7 +100,7 @@ class BhvDribbleGen(BhvKickGen):
 
         self.create_self_cache(wm, dash_angle, n_turn, max_dash, self_cache)
         if debug_dribble:
-            log.sw_log().dribble().add_text( '##self_cache:{}'.format(self_cache))
+            log.sw_log().dribble().add_text( '##self_cache:{}', self_cache)
         sp = SP.i()
         ptype = wm.self().player_type()
 
@@ -106,13 +111,15 @@ class BhvDribbleGen(BhvKickGen):
         max_y = sp.pitch_half_width() - 1.0
 
         for n_dash in range(max_dash, min_dash - 1, -1):
+            if self.out_of_time():
+                break
             self.index += 1
             ball_trap_pos:Vector2D = self_cache[n_turn + n_dash] + trap_rel
 
             if ball_trap_pos.abs_x() > max_x or ball_trap_pos.abs_y() > max_y:
                 if debug_dribble:
                     log.sw_log().dribble().add_text(
-                                  '#index:{} target:{} our of field'.format(self.index, ball_trap_pos))
+                                  '#index:{} target:{} our of field', self.index, ball_trap_pos)
                     self.debug_list.append((self.index, ball_trap_pos, False))
                 continue
 
@@ -125,16 +132,14 @@ class BhvDribbleGen(BhvKickGen):
                     sp.ball_speed_max(), 2):
                 if debug_dribble:
                     log.sw_log().dribble().add_text(
-                                  '#index:{} target:{} need more power, power:{}, accel:{}, vel:{}'.format(
-                                      self.index, ball_trap_pos, kick_power, kick_accel, first_vel))
+                                  '#index:{} target:{} need more power, power:{}, accel:{}, vel:{}', self.index, ball_trap_pos, kick_power, kick_accel, first_vel)
                     self.debug_list.append((self.index, ball_trap_pos, False))
                 continue
 
             if (wm.ball().pos() + first_vel).dist2(self_cache[0]) < pow(ptype.player_size() + sp.ball_size() + 0.1, 2):
                 if debug_dribble:
                     log.sw_log().dribble().add_text(
-                                  '#index:{} target:{} in body, power:{}, accel:{}, vel:{}'.format(
-                                      self.index, ball_trap_pos, kick_power, kick_accel, first_vel))
+                                  '#index:{} target:{} in body, power:{}, accel:{}, vel:{}', self.index, ball_trap_pos, kick_power, kick_accel, first_vel)
                 self.debug_list.append((self.index, ball_trap_pos, False))
                 continue
 
@@ -150,14 +155,12 @@ class BhvDribbleGen(BhvKickGen):
                 self.candidates.append(candidate)
                 if debug_dribble:
                     log.sw_log().dribble().add_text(
-                                  '#index:{} target:{}, power:{}, accel:{}, vel:{} OK'.format(
-                                      self.index, ball_trap_pos, kick_power, kick_accel, first_vel))
+                                  '#index:{} target:{}, power:{}, accel:{}, vel:{} OK', self.index, ball_trap_pos, kick_power, kick_accel, first_vel)
                     self.debug_list.append((self.index, ball_trap_pos, True))
             else:
                 if debug_dribble:
                     log.sw_log().dribble().add_text(
-                                  '#index:{} target:{}, power:{}, accel:{}, vel:{} Opponent catch it'.format(
-                                      self.index, ball_trap_pos, kick_power, kick_accel, first_vel))
+                                  '#index:{} target:{}, power:{}, accel:{}, vel:{} Opponent catch it', self.index, ball_trap_pos, kick_power, kick_accel, first_vel)
                     self.debug_list.append((self.index, ball_trap_pos, False))
 
     def create_self_cache(self, wm: 'WorldModel', dash_angle, n_turn, n_dash, self_cache):
@@ -204,12 +207,12 @@ class BhvDribbleGen(BhvKickGen):
             opp: 'PlayerObject' = wm.their_player(o)
             if opp is None or opp.unum() == 0:
                 if debug_dribble:
-                    log.sw_log().dribble().add_text( "###OPP {} is ghost".format(o))
+                    log.sw_log().dribble().add_text( "###OPP {} is ghost", o)
                 continue
 
             if opp.dist_from_self() > 20.0:
                 if debug_dribble:
-                    log.sw_log().dribble().add_text( "###OPP {} is far".format(o))
+                    log.sw_log().dribble().add_text( "###OPP {} is far", o)
                 continue
 
             ptype = opp.player_type()
@@ -226,14 +229,14 @@ class BhvDribbleGen(BhvKickGen):
 
             if ball_to_opp_rel.x() < -4.0:
                 if debug_dribble:
-                    log.sw_log().dribble().add_text( "###OPP {} is behind".format(o))
+                    log.sw_log().dribble().add_text( "###OPP {} is behind", o)
                 continue
 
             target_dist = opp_pos.dist(ball_trap_pos)
 
             if target_dist - control_area < 0.01:
                 if debug_dribble:
-                    log.sw_log().dribble().add_text( "###OPP {} Catch, ball will be in his body".format(o))
+                    log.sw_log().dribble().add_text( "###OPP {} Catch, ball will be in his body", o)
                 return False
 
             dash_dist = target_dist
@@ -269,13 +272,13 @@ class BhvDribbleGen(BhvKickGen):
             if n_step - bonus_step <= dribble_step:
                 if debug_dribble:
                     log.sw_log().dribble().add_text(
-                                  "###OPP {} catch n_step:{}, dr_step:{}, bonas:{}".format(o, n_step, dribble_step,
-                                                                                       bonus_step))
+                                  "###OPP {} catch n_step:{}, dr_step:{}, bonas:{}", o, n_step, dribble_step,
+                                                                                       bonus_step)
                 return False
             else:
                 if debug_dribble:
                     log.sw_log().dribble().add_text(
-                                  "###OPP {} can't catch n_step:{}, dr_step:{}, bonas:{}".format(o, n_step, dribble_step,
-                                                                                           bonus_step))
+                                  "###OPP {} can't catch n_step:{}, dr_step:{}, bonas:{}", o, n_step, dribble_step,
+                                                                                           bonus_step)
         return True
 
@@ -1,9 +1,11 @@
+import numpy as np
 from pyrusgeom.geom_2d import *
 import pyrusgeom.soccer_math as smath
 from lib.debug.color import Color
 from lib.debug.debug import log
 from lib.rcsc.server_param import ServerParam as SP
 from base.tools import Tools
+from base.pass_evaluator import PassEvaluator
 import time
 from base.generator_action import KickAction, KickActionType, BhvKickGen
 
@@ -11,34 +13,49 @@ from typing import TYPE_CHECKING
 
 from lib.rcsc.types import GameModeType
 if TYPE_CHECKING:
+    from lib.player.decision_deadline import GeneratorBudget
     from lib.player.world_model import WorldModel
     from lib.player.object_player import PlayerObject
 
-debug_pass = True
 max_pass_time = 0
 
+# results of the speed checks of a pass step, the steps that pass them get a row of the evaluator
+FIRST_SPEED_LOW = -1
+FIRST_SPEED_HIGH = -2
+RECEIVE_SPEED_LOW = -3
+RECEIVE_SPEED_HIGH = -4
+
 
 class BhvPassGen(BhvKickGen):
     def __init__(self):
         super().__init__()
         self.best_pass: KickAction = None
         self.receivers: list['PlayerObject'] = []
+        self.courses: list[tuple] = []
+        self.evaluator: PassEvaluator = None
 
-    def generator(self, wm: 'WorldModel'):
+    def generator(self, wm: 'WorldModel', budget: 'GeneratorBudget' = None):
         global max_pass_time
         start_time = time.time()
+        self.budget = budget
         self.update_receivers(wm)
+        self.evaluator = PassEvaluator(wm)
 
+        # receivers are sorted by x, the most promising passes are created first
         for r in self.receivers:
-            log.sw_log().pass_().add_text(f'=============== Lead Pass to {r.unum()} pos: {r.pos()}')
+            if self.out_of_time():
+                log.sw_log().pass_().add_text('out of time, {} candidates', len(self.candidates))
+                break
+            log.sw_log().pass_().add_text('=============== Lead Pass to {} pos: {}', r.unum(), r.pos())
             # if self.best_pass is not None \
             #         and r.pos().x() < self.best_pass.target_ball_pos.x() - 5:
             #     break
             self.generate_direct_pass(wm, r)
-            #self.generate_lead_pass(wm, r)
-            #self.generate_through_pass(wm, r)
+            self.generate_lead_pass(wm, r)
+            self.generate_through_pass(wm, r)
+            self.evaluate_passes(wm)
 
-        if debug_pass:
+        if log.sw_log().pass_().enabled:
             for candid in self.debug_list:
                 if candid[2]:
                     log.sw_log().pass_().add_message(candid[1].x(), candid[1].y(), '{}'.format(candid[0]))
@@ -49,7 +66,7 @@ class BhvPassGen(BhvKickGen):
         end_time = time.time()
         if end_time - start_time > max_pass_time:
             max_pass_time = end_time - start_time
-        log.sw_log().pass_().add_text( 'time:{} max is {}'.format(end_time - start_time, max_pass_time))
+        log.sw_log().pass_().add_text( 'time:{} max is {}', end_time - start_time, max_pass_time)
         return self.candidates
 
     def update_receivers(self, wm: 'WorldModel'):
@@ -60,24 +77,24 @@ class BhvPassGen(BhvKickGen):
                 log.sw_log().pass_().add_text('-----<<< TM is none')
                 continue
             if tm.unum() <= 0:
-                log.sw_log().pass_().add_text(f'-----<<< TM unum is {tm.unum()}')
+                log.sw_log().pass_().add_text('-----<<< TM unum is {}', tm.unum())
                 continue
             if tm.unum() == wm.self().unum():
-                log.sw_log().pass_().add_text(f'-----<<< TM unum is {tm.unum()} (self)')
+                log.sw_log().pass_().add_text('-----<<< TM unum is {} (self)', tm.unum())
                 continue
             if tm.pos_count() > 10:
-                log.sw_log().pass_().add_text(f'-----<<< TM unum pos count {tm.pos_count()}')
+                log.sw_log().pass_().add_text('-----<<< TM unum pos count {}', tm.pos_count())
                 continue
             if tm.is_tackling():
-                log.sw_log().pass_().add_text(f'-----<<< TM is tackling')
+                log.sw_log().pass_().add_text('-----<<< TM is tackling')
                 continue
             if tm.pos().x() > wm.offside_line_x():
-                log.sw_log().pass_().add_text(f'-----<<< TM is in offside {tm.pos().x()} > {wm.offside_line_x()}')
+                log.sw_log().pass_().add_text('-----<<< TM is in offside {} > {}', tm.pos().x(), wm.offside_line_x())
                 continue
             if tm.goalie() and tm.pos().x() < sp.our_penalty_area_line_x() + 15:
-                log.sw_log().pass_().add_text(f'-----<<< TM is goalie and danger {tm.pos().x()} < {sp.our_penalty_area_line_x() + 15}')
+                log.sw_log().pass_().add_text('-----<<< TM is goalie and danger {} < {}', tm.pos().x(), sp.our_penalty_area_line_x() + 15)
                 continue
-            log.sw_log().pass_().add_text(f'--->>>>> TM {tm.unum()} is added')
+            log.sw_log().pass_().add_text('--->>>>> TM {} is added', tm.unum())
             self.receivers.append(tm)
         self.receivers = sorted(self.receivers, key=lambda p: p.pos().x(), reverse=True)
 
@@ -90,13 +107,13 @@ class BhvPassGen(BhvKickGen):
         #if receiver.pos().x() > sp.pitch_half_length() - 1.5 \
         #        or receiver.pos().x() < -sp.pitch_half_length() + 5.0 \
         #        or receiver.pos().abs_y() > sp.pitch_half_width() - 1.5:
-        #    if debug_pass:
+        #    if log.sw_log().pass_().enabled:
         #        log.sw_log().pass_().add_text( '#DPass to {} {}, out of field'.format(receiver.unum(), receiver.pos()))
         #    return
         # TODO sp.ourTeamGoalPos()
         #if receiver.pos().x() < wm.ball().pos().x() + 1.0 \
         #        and receiver.pos().dist2(Vector2D(-52.5, 0)) < pow(18.0, 2):
-        #    if debug_pass:
+        #    if log.sw_log().pass_().enabled:
         #        log.sw_log().pass_().add_text( '#DPass to {} {}, danger near goal'.format(receiver.unum(), receiver.pos()))
         #    return
 
@@ -112,14 +129,14 @@ class BhvPassGen(BhvKickGen):
         ball_move_dist = wm.ball().pos().dist(receive_point)
 
         #if ball_move_dist < min_direct_pass_dist or max_direct_pass_dist < ball_move_dist:
-        #    if debug_pass:
+        #    if log.sw_log().pass_().enabled:
         #        log.sw_log().pass_().add_text( '#DPass to {} {}, far or close'.format(receiver.unum(), receiver.pos()))
         #    return
 
         #if wm.game_mode().type().is_goal_kick() \
         #        and receive_point.x() < sp.our_penalty_area_line_x() + 1.0 \
         #        and receive_point.abs_y() < sp.penalty_area_half_width() + 1.0:
-        #    if debug_pass:
+        #    if log.sw_log().pass_().enabled:
         #        log.sw_log().pass_().add_text(
         #                      '#DPass to {} {}, in penalty area in goal kick mode'.format(receiver.unum(), receiver.pos()))
         #    return
@@ -134,7 +151,7 @@ class BhvPassGen(BhvKickGen):
         # TODO Penalty step
         start_step = max(max(min_receive_step, min_ball_step), 0)
         max_step = start_step + 30
-        log.sw_log().pass_().add_text( '#DPass to {} {}'.format(receiver.unum(), receiver.pos()))
+        log.sw_log().pass_().add_text( '#DPass to {} {}', receiver.unum(), receiver.pos())
         self.create_pass(wm, receiver, receive_point,
                          start_step, max_step, min_ball_speed,
                          max_ball_speed, min_receive_ball_speed,
@@ -152,8 +169,8 @@ class BhvPassGen(BhvKickGen):
 
         max_player_distance = 35
         if receiver.pos().dist(wm.ball().pos()) > max_player_distance:
-            if debug_pass:
-                log.sw_log().pass_().add_text( '#####LPass to {} {}, player is far'.format(receiver.unum(), receiver.pos()))
+            if log.sw_log().pass_().enabled:
+                log.sw_log().pass_().add_text( '#####LPass to {} {}, player is far', receiver.unum(), receiver.pos())
             return
 
         abgle_divs = 8
@@ -178,6 +195,8 @@ class BhvPassGen(BhvKickGen):
             player_move_dist = dist_step * d
             a_step = 2 if player_move_dist * 2.0 * math.pi / abgle_divs < 0.6 else 1
             for a in range(abgle_divs + 1):
+                if self.out_of_time():
+                    return
                 angle = angle_from_ball + angle_step * a
                 receive_point = receiver.inertia_point(1) + Vector2D.from_polar(player_move_dist, angle)
 
@@ -188,36 +207,36 @@ class BhvPassGen(BhvKickGen):
                 if receive_point.x() > sp.pitch_half_length() - 3.0 \
                         or receive_point.x() < -sp.pitch_half_length() + 5.0 \
                         or receive_point.abs_y() > sp.pitch_half_width() - 3.0:
-                    if debug_pass:
-                        log.sw_log().pass_().add_text( '#####LPass to {} {}, out of field'.format(receiver.unum(), receive_point))
+                    if log.sw_log().pass_().enabled:
+                        log.sw_log().pass_().add_text( '#####LPass to {} {}, out of field', receiver.unum(), receive_point)
                     continue
 
                 if receive_point.x() < wm.ball().pos().x() \
                         and receive_point.dist2(our_goal) < our_goal_dist_thr2:
-                    if debug_pass:
-                        log.sw_log().pass_().add_text( '#####LPass to {} {}, pass is danger'.format(receiver.unum(), receive_point))
+                    if log.sw_log().pass_().enabled:
+                        log.sw_log().pass_().add_text( '#####LPass to {} {}, pass is danger', receiver.unum(), receive_point)
                     continue
 
                 if wm.game_mode().type() in [GameModeType.GoalKick_Right, GameModeType.GoalKick_Left] \
                         and receive_point.x() < sp.our_penalty_area_line_x() + 1.0 \
                         and receive_point.abs_y() < sp.penalty_area_half_width() + 1.0:
-                    if debug_pass:
-                        log.sw_log().pass_().add_text( '#####LPass to {} {}, in penalty area'.format(receiver.unum(), receive_point))
+                    if log.sw_log().pass_().enabled:
+                        log.sw_log().pass_().add_text( '#####LPass to {} {}, in penalty area', receiver.unum(), receive_point)
                     return
 
                 ball_move_dist = wm.ball().pos().dist(receive_point)
 
                 if ball_move_dist < min_leading_pass_dist or max_leading_pass_dist < ball_move_dist:
-                    if debug_pass:
-                        log.sw_log().pass_().add_text( '#####LPass to {} {}, so far or so close'.format(receiver.unum(), receive_point))
+                    if log.sw_log().pass_().enabled:
+                        log.sw_log().pass_().add_text( '#####LPass to {} {}, so far or so close', receiver.unum(), receive_point)
                     continue
 
                 nearest_receiver = Tools.get_nearest_teammate(wm, receive_point, self.receivers)
                 if nearest_receiver.unum() != receiver.unum():
-                    if debug_pass:
+                    if log.sw_log().pass_().enabled:
                         log.sw_log().pass_().add_text(
-                                      '#####LPass to {} {}, {} is closer than receiver '.format(receiver.unum(), receive_point,
-                                                                                            nearest_receiver.unum()))
+                                      '#####LPass to {} {}, {} is closer than receiver ', receiver.unum(), receive_point,
+                                                                                            nearest_receiver.unum())
                     continue
 
                 receiver_step = self.predict_receiver_reach_step(receiver, receive_point, True,
@@ -230,8 +249,8 @@ class BhvPassGen(BhvKickGen):
                 # ifdef CREATE_SEVERAL_CANDIDATES_ON_SAME_POINT
                 # max_step = std::max(max_receive_step, start_step + 3);
                 # else
-                if debug_pass:
-                    log.sw_log().pass_().add_text( '#####LPass to {} {}'.format(receiver.unum(), receive_point))
+                if log.sw_log().pass_().enabled:
+                    log.sw_log().pass_().add_text( '#####LPass to {} {}', receiver.unum(), receive_point)
                 max_step = start_step + 3
                 self.create_pass(wm, receiver, receive_point,
                                  start_step, max_step,
@@ -251,24 +270,24 @@ class BhvPassGen(BhvKickGen):
 
         max_player_distance = 35
         if receiver.pos().dist(wm.ball().pos()) > max_player_distance:
-            if debug_pass:
-                log.sw_log().pass_().add_text('#####TPass to {} {}, player is far'.format(receiver.unum(), receiver.pos()))
+            if log.sw_log().pass_().enabled:
+                log.sw_log().pass_().add_text('#####TPass to {} {}, player is far', receiver.unum(), receiver.pos())
             return
         if receiver.pos().x() < teammate_min_x:
-            if debug_pass:
-                log.sw_log().pass_().add_text('#####TPass to {} {}, player is far'.format(receiver.unum(), receiver.pos()))
+            if log.sw_log().pass_().enabled:
+                log.sw_log().pass_().add_text('#####TPass to {} {}, player is far', receiver.unum(), receiver.pos())
             return
         if receiver.pos().x() < wm.offside_line_x() - 5.0:
-            if debug_pass:
-                log.sw_log().pass_().add_text('#####TPass to {} {}, player is not close to offside line'.format(receiver.unum(), receiver.pos()))
+            if log.sw_log().pass_().enabled:
+                log.sw_log().pass_().add_text('#####TPass to {} {}, player is not close to offside line', receiver.unum(), receiver.pos())
             return
         if receiver.pos().x() > wm.offside_line_x() - 0.5:
-            if debug_pass:
-                log.sw_log().pass_().add_text('#####TPass to {} {}, player is in offside'.format(receiver.unum(), receiver.pos()))
+            if log.sw_log().pass_().enabled:
+                log.sw_log().pass_().add_text('#####TPass to {} {}, player is in offside', receiver.unum(), receiver.pos())
             return
         if wm.ball().pos().x() < -10.0 or wm.ball().pos().x() > 30.0:
-            if debug_pass:
-                log.sw_log().pass_().add_text('#####TPass to {} {}, ball x is low or high'.format(receiver.unum(), receiver.pos()))
+            if log.sw_log().pass_().enabled:
+                log.sw_log().pass_().add_text('#####TPass to {} {}, ball x is low or high', receiver.unum(), receiver.pos())
             return
 
         min_angle = -30
@@ -293,6 +312,8 @@ class BhvPassGen(BhvKickGen):
         for d in range(5, dist_divs + 1):
             player_move_dist = dist_step * d
             for a in range(min_angle, max_angle + 1, angle_step):
+                if self.out_of_time():
+                    return
                 receive_point = receiver.inertia_point(1) + Vector2D.from_polar(player_move_dist, a)
 
                 move_dist_penalty_step = 0
@@ -302,28 +323,28 @@ class BhvPassGen(BhvKickGen):
                 if receive_point.x() > sp.pitch_half_length() - 3.0 \
                         or receive_point.x() < -sp.pitch_half_length() + 5.0 \
                         or receive_point.abs_y() > sp.pitch_half_width() - 3.0:
-                    if debug_pass:
-                        log.sw_log().pass_().add_text('#####TPass to {} {}, out of field'.format(receiver.unum(), receive_point))
+                    if log.sw_log().pass_().enabled:
+                        log.sw_log().pass_().add_text('#####TPass to {} {}, out of field', receiver.unum(), receive_point)
                     continue
 
                 if receive_point.x() < target_min_x:
-                    if debug_pass:
-                        log.sw_log().pass_().add_text('#####TPass to {} {}, pass is danger'.format(receiver.unum(), receive_point))
+                    if log.sw_log().pass_().enabled:
+                        log.sw_log().pass_().add_text('#####TPass to {} {}, pass is danger', receiver.unum(), receive_point)
                     continue
 
                 ball_move_dist = wm.ball().pos().dist(receive_point)
 
                 if ball_move_dist < min_pass_dist or max_pass_dist < ball_move_dist:
-                    if debug_pass:
-                        log.sw_log().pass_().add_text('#####TPass to {} {}, so far or so close'.format(receiver.unum(), receive_point))
+                    if log.sw_log().pass_().enabled:
+                        log.sw_log().pass_().add_text('#####TPass to {} {}, so far or so close', receiver.unum(), receive_point)
                     continue
 
                 nearest_receiver = Tools.get_nearest_teammate(wm, receive_point, self.receivers)
                 if nearest_receiver.unum() != receiver.unum():
-                    if debug_pass:
+                    if log.sw_log().pass_().enabled:
                         log.sw_log().pass_().add_text(
-                            '#####TPass to {} {}, {} is closer than receiver '.format(receiver.unum(), receive_point,
-                                                                                      nearest_receiver.unum()))
+                            '#####TPass to {} {}, {} is closer than receiver ', receiver.unum(), receive_point,
+                                                                                      nearest_receiver.unum())
                     continue
 
                 receiver_step = self.predict_receiver_reach_step(receiver, receive_point, True,
@@ -336,8 +357,8 @@ class BhvPassGen(BhvKickGen):
                 # ifdef CREATE_SEVERAL_CANDIDATES_ON_SAME_POINT
                 # max_step = std::max(max_receive_step, start_step + 3);
                 # else
-                if debug_pass:
-                    log.sw_log().pass_().add_text('#####TPass to {} {}'.format(receiver.unum(), receive_point))
+                if log.sw_log().pass_().enabled:
+                    log.sw_log().pass_().add_text('#####TPass to {} {}', receiver.unum(), receive_point)
                 max_step = start_step + 3
                 self.create_pass(wm, receiver, receive_point,
                                  start_step, max_step,
@@ -377,253 +398,184 @@ class BhvPassGen(BhvKickGen):
                     min_step, max_step, min_first_ball_speed, max_first_ball_speed,
                     min_receive_ball_speed, max_receive_ball_speed,
                     ball_move_dist, ball_move_angle: AngleDeg, description):
+        # the courses of a receiver are evaluated together by evaluate_passes
+        self.courses.append((receiver, receive_point, min_step, max_step, min_first_ball_speed, max_first_ball_speed,
+                             min_receive_ball_speed, max_receive_ball_speed, ball_move_dist, ball_move_angle,
+                             description))
+
+    def evaluate_passes(self, wm: 'WorldModel'):
+        """
+            checks the ball speeds of every step of the created courses, then the opponents of the remaining
+            (course, step) rows at once with PassEvaluator, and adds the passes nobody can cut
+        """
         sp = SP.i()
+        courses = self.courses
+        self.courses = []
+        if not courses:
+            return
 
-        for step in range(min_step, max_step + 1):
-            self.index += 1
-            first_ball_speed = smath.calc_first_term_geom_series(ball_move_dist, sp.ball_decay(), step)
-
-            if first_ball_speed < min_first_ball_speed:
-                if debug_pass:
-                    log.sw_log().pass_().add_text(
-                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, first ball speed is low'.format(
-                                      self.index,
-                                      receiver.unum(),
-                                      receiver.pos(),
-                                      step,
-                                      first_ball_speed))
-                    self.debug_list.append((self.index, receive_point, False))
-                break
-
-            if max_first_ball_speed < first_ball_speed:
-                if debug_pass:
-                    log.sw_log().pass_().add_text(
-                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, first ball speed is high'.format(
-                                      self.index,
-                                      receiver.unum(),
-                                      receiver.pos(),
-                                      step,
-                                      first_ball_speed))
-                    self.debug_list.append((self.index, receive_point, False))
-                continue
-
-            receive_ball_speed = first_ball_speed * pow(sp.ball_decay(), step)
-
-            if receive_ball_speed < min_receive_ball_speed:
-                if debug_pass:
-                    log.sw_log().pass_().add_text(
-                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, rball_speed:{}, receive ball speed is low'.format(
-                                      self.index,
-                                      receiver.unum(),
-                                      receiver.pos(),
-                                      step,
-                                      first_ball_speed,
-                                      receive_ball_speed))
-                    self.debug_list.append((self.index, receive_point, False))
-                break
-
-            if max_receive_ball_speed < receive_ball_speed:
-                if debug_pass:
-                    log.sw_log().pass_().add_text(
-                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, rball_speed:{}, receive ball speed is high'.format(
-                                      self.index,
-                                      receiver.unum(),
-                                      receiver.pos(),
-                                      step,
-                                      first_ball_speed,
-                                      receive_ball_speed))
-                    self.debug_list.append((self.index, receive_point, False))
-                continue
-
-            kick_count = Tools.predict_kick_count(wm, wm.self().unum(), first_ball_speed, ball_move_angle)
-
-            o_step, o_unum, o_intercepted_pos = self.predict_opponents_reach_step(wm, wm.ball().pos(),
-                                                                                  first_ball_speed, ball_move_angle,
-                                                                                  receive_point, step + (kick_count - 1) + 5,
-                                                                                  description)
-
-            failed = False
-            if description == 'T':
-                if o_step <= step:
-                    failed = True
-            else:
-                if o_step <= step + (kick_count - 1):
-                    failed = True
-            if failed:
-                if debug_pass:
-                    log.sw_log().pass_().add_text(
-                                  '------<<<<<Failed Pass #{} to {} in {} speed {}, opp {} cut in {} cycle {}, max_step {} step {}'.format(self.index,
-                                                                                                                                  receiver.unum(),
-                                                                                                                                  receive_point,
-                                                                                                                                  first_ball_speed,
-                                                                                                                                  o_unum,
-                                                                                                                                  o_step,
-                                                                                                                                  o_intercepted_pos,
-                                                                                                                                  max_step,
-                                                                                                                                  step))
-                    self.debug_list.append((self.index, receive_point, False))
-                break
-            if debug_pass:
-                log.sw_log().pass_().add_text(
-                              '------>>>>> OK Pass {} to {} {}, opp {} step {} max_step {}'.format(self.index,
-                                                                                                   receiver.unum(),
-                                                                                                   receive_point,
-                                                                                                   o_unum,
-                                                                                                   o_step,
-                                                                                                   max_step))
-            self.debug_list.append((self.index, receive_point, True))
-            
-            candidate = KickAction()
-            candidate.type = KickActionType.Pass
-            candidate.start_ball_pos = wm.ball().pos()
-            candidate.target_ball_pos = receive_point
-            candidate.target_unum = receiver.unum()
-            candidate.start_ball_speed = max_first_ball_speed
-            candidate.evaluate(wm)
-            candidate.eval += 5
-            opp_min = wm.intercept_table().opponent_reach_cycle()
-            if opp_min <= 5:
-                candidate.eval += 30
-            else:
-                candidate.eval -= 10
-
-            if candidate.target_ball_pos.abs_y() <= 5:
-                candidate.eval += 30
-
-            if candidate.target_ball_pos.x() <= -50:
-                candidate.eval -= 1000
-
-            if wm.game_mode() != GameModeType.PlayOn:
-                candidate.eval += 100
-
-            if wm.self().pos().abs_x() > 40:
-                candidate.eval += 30
-
-            if candidate.target_ball_pos.abs_x() <= 30 and candidate.target_ball_pos.x() > candidate.start_ball_pos.x():
-                candidate.eval += 10
-            if candidate.target_ball_pos.x() >= 40 and candidate.target_ball_pos.x() < candidate.start_ball_pos.x():
-                candidate.eval += 30
-            """
-
-            if wm.game_mode() != GameModeType.PlayOn:
-                candidate.eval += 100
-
-            if candidate.start_ball_pos.x() >= 30 and candidate.target_ball_pos.abs_y() <= 5:
-                candidate.eval += 60
-
-            if candidate.target_ball_pos.abs_y() >= 20:
-                candidate.eval -= 30
-
-            if candidate.target_ball_pos.abs_x() <= 30 and candidate.target_ball_pos.x() > candidate.start_ball_pos.x():
-                candidate.eval += 10
-            if candidate.target_ball_pos.x() >= 40 and candidate.target_ball_pos.x() < candidate.start_ball_pos.x():
-                candidate.eval += 30
-
-            opp_min = wm.intercept_table().opponent_reach_cycle()
-            if opp_min <= 5:
-                candidate.eval += 30
-            else:
-                candidate.eval -= 10
-
-            if wm.self().pos().abs_x() > 40:
-                candidate.eval += 30
-            """
-            self.candidates.append(candidate)
-
-            if self.best_pass is None or candidate.eval > self.best_pass.eval:
-                self.best_pass = candidate
-
-            find_another_pass = True
-            if not find_another_pass:
-                break
-            """
-            if o_step <= step + 3:
-                break
-
-            if min_step + 3 <= step:
-                break
-            """
-
-    def predict_opponents_reach_step(self, wm: 'WorldModel', first_ball_pos: Vector2D, first_ball_speed,
-                                     ball_move_angle: AngleDeg, receive_point: Vector2D, max_cycle, description):
-        first_ball_vel = Vector2D.polar2vector(first_ball_speed, ball_move_angle)
-        min_step = 1000
-        min_opp = 0
-        intercepted_pos = None
-        for opp in wm.opponents():
-            if opp is None or opp.unum() == 0:
-                continue
-            step, intercepted_pos = self.predict_opponent_reach_step(wm, opp, first_ball_pos, first_ball_vel, ball_move_angle,
-                                                                     receive_point, max_cycle, description)
-            if step < min_step:
-                min_step = step
-                min_opp = opp.unum()
-        return min_step, min_opp, intercepted_pos
-
-    def predict_opponent_reach_step(self, wm: 'WorldModel', opp: 'PlayerObject', first_ball_pos: Vector2D, first_ball_vel: Vector2D,
-                                    ball_move_angle: AngleDeg, receive_point: Vector2D, max_cycle, description):
-        sp = SP.i()
-
-        penalty_area = Rect2D(Vector2D(sp.their_penalty_area_line_x(), -sp.penalty_area_half_width() ),
-                                Size2D(sp.penalty_area_length(), sp.penalty_area_width()))
-        CONTROL_AREA_BUF = 0.15
-
-
-        opponent = opp
-        ptype = opponent.player_type()
-        min_cycle = Tools.estimate_min_reach_cycle(opponent.pos(), ptype.real_speed_max(), first_ball_pos,
-                                                   ball_move_angle)
-
-        if min_cycle < 0:
-            return 1000, None
-
-        for cycle in range(max(1, min_cycle), max_cycle + 1):
-            ball_pos = smath.inertia_n_step_point(first_ball_pos, first_ball_vel, cycle, sp.ball_decay())
-            control_area = sp.catchable_area() if opponent.is_goalie() and penalty_area.contains(ball_pos) else ptype.kickable_area()
-
-            inertia_pos = ptype.inertia_point(opponent.pos(), opponent.vel(), cycle)
-            target_dist = inertia_pos.dist(ball_pos)
-
-            dash_dist = target_dist
-            if description == 'T' \
-                and first_ball_vel.x() > 2.\
-                and ( receive_point.x() > wm.offside_line_x() or receive_point.x() > 30.):
-
-                pass
-            else:
-                dash_dist -= Tools.estimate_virtual_dash_distance(opp)
-            if dash_dist - control_area - CONTROL_AREA_BUF < 0.001:
-                return cycle, ball_pos
-
-            if description == 'T' \
-                and first_ball_vel.x() > 2.\
-                and ( receive_point.x() > wm.offside_line_x() or receive_point.x() > 30.):
+        # per course the checked steps: (step, first ball speed, receive ball speed, row or the failed check)
+        course_steps = []
+        row_course = []
+        row_speed = []
+        row_step = []
+        row_kick_count = []
+        for c, (receiver, receive_point, min_step, max_step, min_first_ball_speed, max_first_ball_speed,
+                min_receive_ball_speed, max_receive_ball_speed, ball_move_dist, ball_move_angle,
+                description) in enumerate(courses):
+            checked = []
+            speeds = []
+            for step in range(min_step, max_step + 1):
+                first_ball_speed = smath.calc_first_term_geom_series(ball_move_dist, sp.ball_decay(), step)
+                if first_ball_speed < min_first_ball_speed:
+                    checked.append((step, first_ball_speed, None, FIRST_SPEED_LOW))
+                    break
+                if max_first_ball_speed < first_ball_speed:
+                    checked.append((step, first_ball_speed, None, FIRST_SPEED_HIGH))
+                    continue
+                receive_ball_speed = first_ball_speed * pow(sp.ball_decay(), step)
+                if receive_ball_speed < min_receive_ball_speed:
+                    checked.append((step, first_ball_speed, receive_ball_speed, RECEIVE_SPEED_LOW))
+                    break
+                if max_receive_ball_speed < receive_ball_speed:
+                    checked.append((step, first_ball_speed, receive_ball_speed, RECEIVE_SPEED_HIGH))
+                    continue
+                checked.append((step, first_ball_speed, receive_ball_speed, len(row_course)))
+                row_course.append(c)
+                row_speed.append(first_ball_speed)
+                row_step.append(step)
+                speeds.append(first_ball_speed)
+            row_kick_count += Tools.predict_kick_counts(wm, wm.self().unum(), speeds, ball_move_angle)
+            course_steps.append(checked)
+
+        row_step = np.array(row_step, dtype=np.int64)
+        row_kick_count = np.array(row_kick_count, dtype=np.int64)
+        o_steps, o_unums, o_intercepted = self.evaluator.reach_steps(
+            [course[9] for course in courses],
+            np.array([course[1].x() for course in courses]),
+            np.array([course[10] == 'T' for course in courses], dtype=bool),
+            np.array(row_course, dtype=np.int64),
+            np.array(row_speed),
+            row_step + (row_kick_count - 1) + 5)
+
+        debug = log.sw_log().pass_().enabled
+        for (receiver, receive_point, min_step, max_step, min_first_ball_speed, max_first_ball_speed,
+             min_receive_ball_speed, max_receive_ball_speed, ball_move_dist, ball_move_angle,
+             description), checked in zip(courses, course_steps):
+            for step, first_ball_speed, receive_ball_speed, row in checked:
+                self.index += 1
+                if row == FIRST_SPEED_LOW or row == FIRST_SPEED_HIGH:
+                    if debug:
+                        log.sw_log().pass_().add_text(
+                                      '##Pass {},to {} {}, step:{}, ball_speed:{}, first ball speed is {}', self.index,
+                                          receiver.unum(),
+                                          receiver.pos(),
+                                          step,
+                                          first_ball_speed,
+                                          'low' if row == FIRST_SPEED_LOW else 'high')
+                        self.debug_list.append((self.index, receive_point, False))
+                    continue
+                if row == RECEIVE_SPEED_LOW or row == RECEIVE_SPEED_HIGH:
+                    if debug:
+                        log.sw_log().pass_().add_text(
+                                      '##Pass {},to {} {}, step:{}, ball_speed:{}, rball_speed:{}, receive ball speed is {}', self.index,
+                                          receiver.unum(),
+                                          receiver.pos(),
+                                          step,
+                                          first_ball_speed,
+                                          receive_ball_speed,
+                                          'low' if row == RECEIVE_SPEED_LOW else 'high')
+                        self.debug_list.append((self.index, receive_point, False))
+                    continue
 
-                dash_dist -= control_area
-            else:
-                if receive_point.x() < 25.:
-                    dash_dist -= control_area + 0.5
+                o_step = int(o_steps[row])
+                kick_count = int(row_kick_count[row])
+                if description == 'T':
+                    failed = o_step <= step
                 else:
-                    dash_dist -= control_area + 0.2
-
-            if dash_dist > ptype.real_speed_max() * (cycle + min(opponent.pos_count(), 5)):
-                continue
-
-            n_dash = ptype.cycles_to_reach_distance(dash_dist)
-            if n_dash > cycle + opponent.pos_count():
-                continue
-
-            n_turn = 0
-            if opponent.body_count() > 1:
-                n_turn = Tools.predict_player_turn_cycle(ptype, opponent.body(), opponent.vel().r(), target_dist,
-                                                         (ball_pos - inertia_pos).th(), control_area, True)
-
-            n_step = n_turn + n_dash if n_turn == 0 else n_turn + n_dash + 1
-
-            bonus_step = 0
-            if opponent.is_tackling():
-                bonus_step = -5
-            if n_step - bonus_step <= cycle:
-                return cycle, ball_pos
-        return 1000, None
-
+                    failed = o_step <= step + (kick_count - 1)
+                if failed:
+                    if debug:
+                        log.sw_log().pass_().add_text(
+                                      '------<<<<<Failed Pass #{} to {} in {} speed {}, opp {} cut in {} cycle {}, max_step {} step {}', self.index,
+                                                                                                                                      receiver.unum(),
+                                                                                                                                      receive_point,
+                                                                                                                                      first_ball_speed,
+                                                                                                                                      o_unums[row],
+                                                                                                                                      o_step,
+                                                                                                                                      o_intercepted[row],
+                                                                                                                                      max_step,
+                                                                                                                                      step)
+                        self.debug_list.append((self.index, receive_point, False))
+                    break
+                if debug:
+                    log.sw_log().pass_().add_text(
+                                  '------>>>>> OK Pass {} to {} {}, opp {} step {} max_step {}', self.index,
+                                                                                                       receiver.unum(),
+                                                                                                       receive_point,
+                                                                                                       o_unums[row],
+                                                                                                       o_step,
+                                                                                                       max_step)
+                self.debug_list.append((self.index, receive_point, True))
+                self.add_candidate(wm, receiver, receive_point, max_first_ball_speed)
+
+    def add_candidate(self, wm: 'WorldModel', receiver, receive_point: Vector2D, max_first_ball_speed):
+        candidate = KickAction()
+        candidate.type = KickActionType.Pass
+        candidate.start_ball_pos = wm.ball().pos()
+        candidate.target_ball_pos = receive_point
+        candidate.target_unum = receiver.unum()
+        candidate.start_ball_speed = max_first_ball_speed
+        candidate.evaluate(wm)
+        candidate.eval += 5
+        opp_min = wm.intercept_table().opponent_reach_cycle()
+        if opp_min <= 5:
+            candidate.eval += 30
+        else:
+            candidate.eval -= 10
+
+        if candidate.target_ball_pos.abs_y() <= 5:
+            candidate.eval += 30
+
+        if candidate.target_ball_pos.x() <= -50:
+            candidate.eval -= 1000
+
+        if wm.game_mode() != GameModeType.PlayOn:
+            candidate.eval += 100
+
+        if wm.self().pos().abs_x() > 40:
+            candidate.eval += 30
+
+        if candidate.target_ball_pos.abs_x() <= 30 and candidate.target_ball_pos.x() > candidate.start_ball_pos.x():
+            candidate.eval += 10
+        if candidate.target_ball_pos.x() >= 40 and candidate.target_ball_pos.x() < candidate.start_ball_pos.x():
+            candidate.eval += 30
+        """
+
+        if wm.game_mode() != GameModeType.PlayOn:
+            candidate.eval += 100
+
+        if candidate.start_ball_pos.x() >= 30 and candidate.target_ball_pos.abs_y() <= 5:
+            candidate.eval += 60
+
+        if candidate.target_ball_pos.abs_y() >= 20:
+            candidate.eval -= 30
+
+        if candidate.target_ball_pos.abs_x() <= 30 and candidate.target_ball_pos.x() > candidate.start_ball_pos.x():
+            candidate.eval += 10
+        if candidate.target_ball_pos.x() >= 40 and candidate.target_ball_pos.x() < candidate.start_ball_pos.x():
+            candidate.eval += 30
+
+        opp_min = wm.intercept_table().opponent_reach_cycle()
+        if opp_min <= 5:
+            candidate.eval += 30
+        else:
+            candidate.eval -= 10
+
+        if wm.self().pos().abs_x() > 40:
+            candidate.eval += 30
+        """
+        self.candidates.append(candidate)
+
+        if self.best_pass is None or candidate.eval > self.best_pass.eval:
+            self.best_pass = candidate
@@ -11,6 +11,7 @@ from lib.rcsc.types import GameModeType
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from lib.player.decision_deadline import GeneratorBudget
     from lib.player.world_model import WorldModel
     from lib.player.object_player import PlayerObject
 
@@ -20,9 +21,10 @@ max_shoot_time = 0
 
 
 class BhvShhotGen(BhvKickGen):
-    def generator(self, wm: 'WorldModel') -> ShootAction:
+    def generator(self, wm: 'WorldModel', budget: 'GeneratorBudget' = None) -> ShootAction:
         global max_shoot_time
         start_time = time.time()
+        self.budget = budget
         self.total_count = 0
         goal_l = Vector2D(SP.i().pitch_half_length(), -SP.i().goal_half_width())
         goal_r = Vector2D(SP.i().pitch_half_length(), +SP.i().goal_half_width())
@@ -37,10 +39,15 @@ class BhvShhotGen(BhvKickGen):
         DIST_DIVS = 25
         dist_step = abs(goal_l.y() - goal_r.y()) / (DIST_DIVS - 1)
 
-        for i in range(DIST_DIVS):
+        # the targets are tried from the goal centre outward, so a budget that stops the loop early keeps the
+        # central shots instead of the ones near the left post
+        center = (DIST_DIVS - 1) / 2
+        for i in sorted(range(DIST_DIVS), key=lambda d: abs(d - center)):
+            if self.out_of_time():
+                break
             self.total_count += 1
             target_point = Vector2D(goal_l.x(), goal_l.y() + dist_step * i)
-            log.sw_log().shoot().add_text( "#shoot {} to {}".format(self.total_count, target_point))
+            log.sw_log().shoot().add_text( "#shoot {} to {}", self.total_count, target_point)
             self.create_shoot(wm, target_point)
             self.create_shoot(wm, Vector2D(target_point.x(), target_point.y() + 2))
             self.create_shoot(wm, Vector2D(target_point.x(), target_point.y() - 2))
@@ -107,11 +114,11 @@ class BhvShhotGen(BhvKickGen):
         #if ball_reach_step == -1:
         #    log.sw_log().shoot().add_text( 'Cant arrive to target')
         #    return False
-        log.sw_log().shoot().add_text( '{} {} {} {} {}'.format(first_ball_speed, ball_move_dist, sp.ball_decay(), smath.calc_length_geom_series(first_ball_speed, ball_move_dist, sp.ball_decay()), math.ceil(smath.calc_length_geom_series(first_ball_speed, ball_move_dist, sp.ball_decay()))))
+        log.sw_log().shoot().add_text( '{} {} {} {} {}', first_ball_speed, ball_move_dist, sp.ball_decay(), smath.calc_length_geom_series(first_ball_speed, ball_move_dist, sp.ball_decay()), math.ceil(smath.calc_length_geom_series(first_ball_speed, ball_move_dist, sp.ball_decay())))
         course = ShootAction(self.total_count, target_point, first_ball_speed, ball_move_angle, ball_move_dist,
                              ball_reach_step)
 
-        log.sw_log().shoot().add_text( 'course: {}'.format(course))
+        log.sw_log().shoot().add_text( 'course: {}', course)
         if ball_reach_step <= 1:
             course.ball_reach_step = 1
             self.candidates.append(course)
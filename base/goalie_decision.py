@@ -27,8 +27,6 @@ if TYPE_CHECKING:
     from lib.player.player_agent import PlayerAgent
 
 
-DEBUG = True
-
 def decision(agent: 'PlayerAgent'):
     SP = ServerParam.i()
     wm = agent.world()
@@ -36,8 +34,8 @@ def decision(agent: 'PlayerAgent'):
     our_penalty = Rect2D(Vector2D(-SP.pitch_half_length(), -SP.penalty_area_half_width() - 5),
                          Size2D(SP.penalty_area_length() - 1, SP.penalty_area_width() - 5))
 
-    log.os_log().debug(f'########## gdc={wm.time().cycle()}')
-    log.os_log().debug(f'########## gd gmt={wm.game_mode().type()}')
+    log.os_log().debug('########## gdc=%s', wm.time().cycle())
+    log.os_log().debug('########## gd gmt=%s', wm.game_mode().type())
     if wm.game_mode().type() != GameModeType.PlayOn:
         if Bhv_GoalieSetPlay().execute(agent):
             return True
@@ -68,8 +66,8 @@ def do_kick(agent: 'PlayerAgent'):
     best_action: KickAction = max(action_candidates)
     target = best_action.target_ball_pos
     log.debug_client().set_target(target)
-    log.debug_client().add_message(best_action.type.value + 'to ' + best_action.target_ball_pos.__str__() + ' ' + str(
-        best_action.start_ball_speed))
+    log.debug_client().add_message('{}to {} {}', best_action.type.value, best_action.target_ball_pos,
+                                   best_action.start_ball_speed)
     SmartKick(target, best_action.start_ball_speed, best_action.start_ball_speed - 1, 3).execute(agent)
     agent.set_neck_action(NeckScanPlayers())
     return True
@@ -109,7 +107,7 @@ def do_move(agent: 'PlayerAgent'):
     target = goalie_move_line.intersection(ball_move_line)
     target.set_y(bound(-SP.goal_half_width(), target.y(), SP.goal_half_width()))
 
-    if DEBUG:
+    if log.sw_log().positioning().enabled:
         log.sw_log().positioning().add_line(
                       start=Vector2D(ball_pos.x(), ball_move_line.get_y(ball_pos.x())),
                       end=Vector2D(-SP.pitch_half_length(), ball_move_line.get_y(-SP.pitch_half_length())),
@@ -0,0 +1,224 @@
+import math
+
+import numpy as np
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.math_values import DEG2RAD, EPSILON, RAD2DEG
+
+from base.tools import Tools
+from lib.rcsc.server_param import ServerParam as SP
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from lib.player.world_model import WorldModel
+
+"""
+    batched opponent reach steps of pass courses, the array version of the opponent loop of BhvPassGen.
+    one row is a pass course (receive point, first ball speed), every (row, opponent, cycle) the opponent can reach
+    is one array element, so a whole receiver (direct, lead and through passes) is evaluated with a few numpy calls.
+    the arithmetic is done in the same order as the scalar code (pyrusgeom Vector2D/AngleDeg, Tools), the steps
+    are the same as predict_opponents_reach_step's.
+"""
+
+NEVER = 1000
+CONTROL_AREA_BUF = 0.15
+
+
+class PassEvaluator:
+    def __init__(self, wm: 'WorldModel'):
+        sp = SP.i()
+        self._ball_pos = wm.ball().pos()
+        self._offside_line_x = wm.offside_line_x()
+        self._ball_decay = sp.ball_decay()
+        self._catchable_area = sp.catchable_area()
+        self._penalty_left = sp.their_penalty_area_line_x()
+        self._penalty_right = self._penalty_left + sp.penalty_area_length()
+        self._penalty_top = -sp.penalty_area_half_width()
+        self._penalty_bottom = self._penalty_top + sp.penalty_area_width()
+        self._back_dash = sp.min_dash_power() < -sp.max_dash_power() + 1.0
+        self._max_moment = sp.max_moment()
+
+        opponents = [opp for opp in wm.opponents() if opp is not None and opp.unum() != 0]
+        self._opponents = opponents
+        ptypes = [opp.player_type() for opp in opponents]
+        self._unum = np.array([opp.unum() for opp in opponents], dtype=np.int64)
+        self._pos = np.array([[opp.pos().x(), opp.pos().y()] for opp in opponents]).reshape(-1, 2)
+        self._goalie = np.array([opp.is_goalie() for opp in opponents], dtype=bool)
+        self._pos_count = np.array([opp.pos_count() for opp in opponents], dtype=np.int64)
+        self._turn = np.array([opp.body_count() > 1 for opp in opponents], dtype=bool)
+        self._body = np.array([opp.body().degree() for opp in opponents])
+        self._speed = np.array([opp.vel().r() for opp in opponents])
+        self._bonus = np.array([-5 if opp.is_tackling() else 0 for opp in opponents], dtype=np.int64)
+        self._virtual_dash = np.array([Tools.estimate_virtual_dash_distance(opp) for opp in opponents])
+        self._kickable_area = np.array([t.kickable_area() for t in ptypes])
+        self._real_speed_max = np.array([t.real_speed_max() for t in ptypes])
+        self._decay = np.array([t.player_decay() for t in ptypes])
+        self._inertia_moment = np.array([t.inertia_moment() for t in ptypes])
+        self._dash_tables = [np.array(t._dash_distance_table) for t in ptypes]
+
+        # [cycle] ball travel factor, [opponent, cycle] inertia points, grown on demand
+        self._ball_travel = np.zeros(0)
+        self._inertia = np.zeros((len(opponents), 0, 2))
+
+    def _grow_cycles(self, max_cycle: int):
+        size = self._ball_travel.shape[0]
+        if max_cycle < size:
+            return
+        size = max(max_cycle + 1, 2 * size)
+        decay = self._ball_decay
+        self._ball_travel = np.array([(1.0 - math.pow(decay, c)) / (1.0 - decay) for c in range(size)])
+        inertia = np.zeros((len(self._opponents), size, 2))
+        for o, opp in enumerate(self._opponents):
+            pos = opp.pos()
+            vel = opp.vel()
+            p_decay = opp.player_type().player_decay()
+            for c in range(size):
+                travel = (1.0 - math.pow(p_decay, c)) / (1.0 - p_decay)
+                inertia[o, c] = (pos.x() + vel.x() * travel, pos.y() + vel.y() * travel)
+        self._inertia = inertia
+
+    def min_reach_cycles(self, angles: list[AngleDeg]) -> np.ndarray:
+        """
+            Tools.estimate_min_reach_cycle of every (course angle, opponent), -1 if the opponent is behind the ball
+        """
+        rotation = np.array([[math.cos((-a).degree() * DEG2RAD), math.sin((-a).degree() * DEG2RAD)] for a in angles])
+        rotation = rotation.reshape(-1, 2)
+        rel_x = self._pos[:, 0] - self._ball_pos.x()
+        rel_y = self._pos[:, 1] - self._ball_pos.y()
+        cos = rotation[:, 0:1]
+        sin = rotation[:, 1:2]
+        x = rel_x * cos - rel_y * sin
+        y = rel_x * sin + rel_y * cos
+        cycles = np.maximum(1, np.floor(np.fabs(y) / self._real_speed_max)).astype(np.int64)
+        cycles[x < -1.0] = -1
+        return cycles
+
+    def reach_steps(self, angles: list[AngleDeg], receive_x: np.ndarray, through: np.ndarray,
+                    plan: np.ndarray, first_ball_speed: np.ndarray, max_cycle: np.ndarray):
+        """
+            predict_opponents_reach_step of every row.
+            angles, receive_x and through ('T' passes) are per course (plan), the other arrays per row.
+            returns the min reach step, the unum of that opponent (0 if nobody) and the ball position there.
+        """
+        rows = plan.shape[0]
+        n_opp = len(self._opponents)
+        steps = np.full(rows, NEVER, dtype=np.int64)
+        unums = np.zeros(rows, dtype=np.int64)
+        ball_pos = np.full((rows, 2), np.nan)
+        if rows == 0 or n_opp == 0:
+            return steps, unums, ball_pos
+        self._grow_cycles(int(max_cycle.max()))
+
+        deg = np.array([a.degree() for a in angles])
+        cos = np.array([math.cos(d * DEG2RAD) for d in deg])
+        sin = np.array([math.sin(d * DEG2RAD) for d in deg])
+        vel_x = first_ball_speed * cos[plan]
+        vel_y = first_ball_speed * sin[plan]
+        rx = receive_x[plan]
+        no_virtual = through[plan] & (vel_x > 2.) & ((rx > self._offside_line_x) | (rx > 30.))
+        margin = np.where(rx < 25., 0.5, 0.2)
+
+        # every (opponent, row) pair with the cycles it is checked, opponent major
+        min_cycle = self.min_reach_cycles(angles)[plan].T
+        first = np.maximum(1, min_cycle)
+        count = np.where(min_cycle < 0, 0, max_cycle - first + 1)
+        pair_opp, pair_row = np.nonzero(count > 0)
+        if pair_opp.shape[0] == 0:
+            return steps, unums, ball_pos
+        pair_count = count[pair_opp, pair_row]
+        pair_start = np.cumsum(pair_count) - pair_count
+        elem_pair = np.repeat(np.arange(pair_opp.shape[0]), pair_count)
+        cycle = first[pair_opp, pair_row][elem_pair] + np.arange(elem_pair.shape[0]) - pair_start[elem_pair]
+        o = pair_opp[elem_pair]
+        r = pair_row[elem_pair]
+
+        travel = self._ball_travel[cycle]
+        ball_x = self._ball_pos.x() + vel_x[r] * travel
+        ball_y = self._ball_pos.y() + vel_y[r] * travel
+        inertia_x = self._inertia[o, cycle, 0]
+        inertia_y = self._inertia[o, cycle, 1]
+        diff_x = inertia_x - ball_x
+        diff_y = inertia_y - ball_y
+        target_dist = np.sqrt(diff_x * diff_x + diff_y * diff_y)
+
+        in_penalty = ((self._penalty_left <= ball_x) & (ball_x <= self._penalty_right)
+                      & (self._penalty_top <= ball_y) & (ball_y <= self._penalty_bottom))
+        control_area = np.where(self._goalie[o] & in_penalty, self._catchable_area, self._kickable_area[o])
+
+        no_virtual_e = no_virtual[r]
+        dash_dist = np.where(no_virtual_e, target_dist, target_dist - self._virtual_dash[o])
+        reached = dash_dist - control_area - CONTROL_AREA_BUF < 0.001
+        dash_dist = np.where(no_virtual_e, dash_dist - control_area, dash_dist - (control_area + margin[r]))
+
+        pos_count = self._pos_count[o]
+        check = ~reached & ~(dash_dist > self._real_speed_max[o] * (cycle + np.minimum(pos_count, 5)))
+        n_dash = self._cycles_to_reach_distance(dash_dist, pair_opp, pair_start, pair_count)
+        check &= n_dash <= cycle + pos_count
+
+        n_step = n_dash.copy()
+        turn = np.nonzero(check & self._turn[o])[0]
+        if turn.shape[0] > 0:
+            n_turn = self._turn_cycles(turn, o[turn], ball_x[turn] - inertia_x[turn], ball_y[turn] - inertia_y[turn],
+                                       target_dist[turn], control_area[turn])
+            n_step[turn] = np.where(n_turn == 0, n_dash[turn], n_turn + n_dash[turn] + 1)
+        reached |= check & (n_step - self._bonus[o] <= cycle)
+
+        # first reach cycle of every pair, cycles of a pair are increasing
+        pair_step = np.minimum.reduceat(np.where(reached, cycle, NEVER), pair_start)
+        table = np.full((n_opp, rows), NEVER, dtype=np.int64)
+        table[pair_opp, pair_row] = pair_step
+        best = np.argmin(table, axis=0)
+        steps = table[best, np.arange(rows)]
+        found = steps < NEVER
+        unums[found] = self._unum[best[found]]
+        travel = self._ball_travel[np.where(found, steps, 0)]
+        ball_pos[found, 0] = (self._ball_pos.x() + vel_x * travel)[found]
+        ball_pos[found, 1] = (self._ball_pos.y() + vel_y * travel)[found]
+        return steps, unums, ball_pos
+
+    def _cycles_to_reach_distance(self, dash_dist: np.ndarray, pair_opp: np.ndarray, pair_start: np.ndarray,
+                                  pair_count: np.ndarray) -> np.ndarray:
+        # PlayerType.cycles_to_reach_distance, elements are grouped by opponent
+        n_dash = np.zeros(dash_dist.shape[0], dtype=np.int64)
+        bounds = np.searchsorted(pair_opp, np.arange(len(self._opponents) + 1))
+        for o, table in enumerate(self._dash_tables):
+            if bounds[o] == bounds[o + 1]:
+                continue
+            begin = pair_start[bounds[o]]
+            end = pair_start[bounds[o + 1] - 1] + pair_count[bounds[o + 1] - 1]
+            dist = dash_dist[begin:end]
+            cycles = np.searchsorted(table, dist, side='left')
+            over = cycles == table.shape[0]
+            if over.any():
+                cycles[over] += np.ceil((dist[over] - table[-1]) / self._real_speed_max[o]).astype(np.int64)
+            cycles[dist <= 0.001] = 0
+            n_dash[begin:end] = cycles
+        return n_dash
+
+    def _turn_cycles(self, index: np.ndarray, o: np.ndarray, x: np.ndarray, y: np.ndarray,
+                     target_dist: np.ndarray, dist_thr: np.ndarray) -> np.ndarray:
+        # Tools.predict_player_turn_cycle(use_back_dash=True) of the elements
+        target_angle = np.arctan2(y, x) * RAD2DEG
+        target_angle[(np.fabs(x) < EPSILON) & (np.fabs(y) < EPSILON)] = 0.0
+        angle_diff = target_angle - self._body[o]
+        angle_diff[angle_diff < -180.0] += 360.0
+        angle_diff[angle_diff > 180.0] -= 360.0
+        angle_diff = np.fabs(angle_diff)
+        if self._back_dash:
+            back = (target_dist < 5.0) & (angle_diff > 90.0)
+            angle_diff[back] = np.fabs(angle_diff[back] - 180.0)
+
+        turn_margin = np.full(index.shape[0], 180.0)
+        far = dist_thr < target_dist
+        turn_margin[far] = np.maximum(15.0, np.arcsin(dist_thr[far] / target_dist[far]) * RAD2DEG)
+
+        n_turn = np.zeros(index.shape[0], dtype=np.int64)
+        speed = self._speed[o]
+        inertia_moment = self._inertia_moment[o]
+        decay = self._decay[o]
+        turning = angle_diff > turn_margin
+        while turning.any():
+            angle_diff[turning] -= self._max_moment / (1.0 + inertia_moment[turning] * speed[turning])
+            speed = speed * decay
+            n_turn += turning
+            turning = angle_diff > turn_margin
+        return n_turn
@@ -63,15 +63,13 @@ class SampleCommunication:
             prev_ball_speed = wm.prev_ball().vel().r()
             angle_diff = (wm.ball().vel().th() - wm.prev_ball().vel().th()).abs()
 
-            log.sw_log().communication().add_text(f'(sample communication)'
-                                       f'prev vel={wm.prev_ball().vel()}, r={prev_ball_speed}'
-                                       f'current_vel={wm.ball().vel()}, r={wm.ball().vel()}')
+            log.sw_log().communication().add_text('(sample communication)prev vel={}, r={}current_vel={}, r={}', wm.prev_ball().vel(), prev_ball_speed, wm.ball().vel(), wm.ball().vel())
 
             if current_ball_speed > prev_ball_speed + 0.1 \
                     or (
                     prev_ball_speed > 0.5 and current_ball_speed < prev_ball_speed * ServerParam.i().ball_decay() / 2) \
                     or (prev_ball_speed > 0.5 and angle_diff > 20.):
-                log.sw_log().communication().add_text(f'(sample communication) ball vel changed')
+                log.sw_log().communication().add_text('(sample communication) ball vel changed')
                 ball_vel_changed = True
 
         if wm.self().is_kickable():
@@ -318,7 +316,7 @@ class SampleCommunication:
                 self._ball_send_time = wm.time().copy()
                 self.update_player_send_time(wm, p.side(), p.unum())
 
-                log.sw_log().communication().add_text(f'(sample communication) ball and player {p.side()}{p.unum()}')
+                log.sw_log().communication().add_text('(sample communication) ball and player {}{}', p.side(), p.unum())
                 return True
 
         if wm.ball().pos().x() > 34 and wm.ball().pos().abs_y() < 20:
@@ -353,9 +351,7 @@ class SampleCommunication:
                         self.update_player_send_time(wm, goalie.side(), goalie.unum())
                         self.update_player_send_time(wm, player.side(), player.unum())
 
-                        log.sw_log().communication().add_text(f'(sample communication) say goalie and player: '
-                                                              f'goalie({goalie.unum()}): p={goalie.pos()} b={goalie.body()}'
-                                                              f'player({player.side()}{player.unum()}: {player.pos()})')
+                        log.sw_log().communication().add_text('(sample communication) say goalie and player: goalie({}): p={} b={}player({}{}: {})', goalie.unum(), goalie.pos(), goalie.body(), player.side(), player.unum(), player.pos())
                         return True
 
                 if available_len >= Messenger.SIZES[Messenger.Types.GOALIE]:
@@ -370,8 +366,7 @@ class SampleCommunication:
                     self._ball_send_time = wm.time().copy()
                     self._opponent_send_time[goalie.unum()] = wm.time().copy()
 
-                    log.sw_log().communication().add_text(f'(sample communication) say goalie info:'
-                                                          f'{goalie.unum()} {goalie.pos()} {goalie.body()}')
+                    log.sw_log().communication().add_text('(sample communication) say goalie info:{} {} {}', goalie.unum(), goalie.pos(), goalie.body())
                     return True
 
         if len(send_players) >= 3 and available_len >= Messenger.SIZES[Messenger.Types.THREE_PLAYER]:
@@ -392,10 +387,7 @@ class SampleCommunication:
             self.update_player_send_time(wm, p1.side(), p1.unum())
             self.update_player_send_time(wm, p2.side(), p2.unum())
 
-            log.sw_log().communication().add_text(f'(sample communication) three players:'
-                                                  f'{p0.side()}{p0.unum()}'
-                                                  f'{p1.side()}{p1.unum()}'
-                                                  f'{p2.side()}{p2.unum()}')
+            log.sw_log().communication().add_text('(sample communication) three players:{}{}{}{}{}{}', p0.side(), p0.unum(), p1.side(), p1.unum(), p2.side(), p2.unum())
             return True
 
         if len(send_players) >= 2 and available_len >= Messenger.SIZES[Messenger.Types.TWO_PLAYER]:
@@ -409,9 +401,7 @@ class SampleCommunication:
             self.update_player_send_time(wm, p0.side(), p0.unum())
             self.update_player_send_time(wm, p1.side(), p1.unum())
 
-            log.sw_log().communication().add_text(f'(sample communication) two players:'
-                                                  f'{p0.side()}{p0.unum()}'
-                                                  f'{p1.side()}{p1.unum()}')
+            log.sw_log().communication().add_text('(sample communication) two players:{}{}{}{}', p0.side(), p0.unum(), p1.side(), p1.unum())
             return True
 
         if len(send_players) >= 1 and available_len >= Messenger.SIZES[Messenger.Types.GOALIE]:
@@ -432,8 +422,7 @@ class SampleCommunication:
 
                 self.update_player_send_time(wm, p0.side(), p0.unum())
 
-                log.sw_log().communication().add_text(f'(sample communication) goalie:'
-                                                      f'{p0.side()}{p0.unum()}')
+                log.sw_log().communication().add_text('(sample communication) goalie:{}{}', p0.side(), p0.unum())
                 return True
 
         if len(send_players) >= 1 and available_len >= Messenger.SIZES[Messenger.Types.ONE_PLAYER]:
@@ -444,8 +433,7 @@ class SampleCommunication:
 
             self.update_player_send_time(wm, p0.side(), p0.unum())
 
-            log.sw_log().communication().add_text(f'(sample communication) one player:'
-                                                  f'{p0.side()}{p0.unum()}')
+            log.sw_log().communication().add_text('(sample communication) one player:{}{}', p0.side(), p0.unum())
             return True
 
         return False
@@ -508,7 +496,7 @@ class SampleCommunication:
                 if player is not None:
                     log.debug_client().add_circle(player.pos(), 3., color='#000088')
                     log.debug_client().add_line(player.pos(), wm.self().pos(), '#000088')
-                log.debug_client().add_message(f'AttCurSender{self._current_sender_unum}')
+                log.debug_client().add_message('AttCurSender{}', self._current_sender_unum)
             else:
                 candidates: list[PlayerObject] = []
                 for p in wm.teammates_from_self():
@@ -531,8 +519,8 @@ class SampleCommunication:
                         target_teammate = p
 
                 if target_teammate is not None:
-                    log.sw_log().communication().add_text(f'(attentionto someone) most front teammate')
-                    log.debug_client().add_message(f'AttFrontMate{target_teammate.unum()}')
+                    log.sw_log().communication().add_text('(attentionto someone) most front teammate')
+                    log.debug_client().add_message('AttFrontMate{}', target_teammate.unum())
                     log.debug_client().add_circle(target_teammate.pos(), 3., color='#000088')
                     log.debug_client().add_line(target_teammate.pos(), wm.self().pos(), '#000088')
                     agent.do_attentionto(wm.our_side(), target_teammate.unum())
@@ -556,7 +544,7 @@ class SampleCommunication:
             and mate_min <= opp_min + 1 \
             and mate_min <= 5 + min(4, fastest_teammate.pos_count()) \
             and wm.ball().inertia_point(mate_min).dist2(ef.queued_next_self_pos()) < 35.**2:
-            log.debug_client().add_message(f'AttBallOwner{fastest_teammate.unum()}')
+            log.debug_client().add_message('AttBallOwner{}', fastest_teammate.unum())
             log.debug_client().add_circle(fastest_teammate.pos(), 3., color='#000088')
             log.debug_client().add_line(fastest_teammate.pos(), wm.self().pos(), '#000088')
             agent.do_attentionto(wm.our_side(), fastest_teammate.unum())
@@ -570,7 +558,7 @@ class SampleCommunication:
             and opp_min <= self_min \
             and nearest_teammate.dist_from_self() < 45. \
             and nearest_teammate.dist_from_ball() < 20.:
-            log.debug_client().add_message(f'AttBallNearest(1){nearest_teammate.unum()}')
+            log.debug_client().add_message('AttBallNearest(1){}', nearest_teammate.unum())
             log.debug_client().add_circle(nearest_teammate.pos(), 3., color='#000088')
             log.debug_client().add_line(nearest_teammate.pos(), wm.self().pos(), '#000088')
             agent.do_attentionto(wm.our_side(), nearest_teammate.unum())
@@ -580,7 +568,7 @@ class SampleCommunication:
             and nearest_teammate.unum() != UNUM_UNKNOWN \
             and wm.ball().pos_count() >= 3 \
             and nearest_teammate.dist_from_ball() < 20.:
-            log.debug_client().add_message(f'AttBallNearest(2){nearest_teammate.unum()}')
+            log.debug_client().add_message('AttBallNearest(2){}', nearest_teammate.unum())
             log.debug_client().add_circle(nearest_teammate.pos(), 3., color='#000088')
             log.debug_client().add_line(nearest_teammate.pos(), wm.self().pos(), '#000088')
             agent.do_attentionto(wm.our_side(), nearest_teammate.unum())
@@ -590,21 +578,21 @@ class SampleCommunication:
             and nearest_teammate.unum() != 45. \
             and nearest_teammate.dist_from_self() < 45. \
             and nearest_teammate.dist_from_ball() < 3.5:
-            log.debug_client().add_message(f'AttBallNearest(3){nearest_teammate.unum()}')
+            log.debug_client().add_message('AttBallNearest(3){}', nearest_teammate.unum())
             log.debug_client().add_circle(nearest_teammate.pos(), 3., color='#000088')
             log.debug_client().add_line(nearest_teammate.pos(), wm.self().pos(), '#000088')
             agent.do_attentionto(wm.our_side(), nearest_teammate.unum())
             return
 
         if self._current_sender_unum != wm.self().unum() and self._current_sender_unum != UNUM_UNKNOWN:
-            log.debug_client().add_message(f'AttCurSender{self._current_sender_unum}')
+            log.debug_client().add_message('AttCurSender{}', self._current_sender_unum)
             player = wm.our_player(self._current_sender_unum)
             if player is not None:
                 log.debug_client().add_circle(player.pos(), 3., color='#000088')
                 log.debug_client().add_line(player.pos(), wm.self().pos(), '#000088')
             agent.do_attentionto(wm.our_side(), self._current_sender_unum)
         else:
-            log.debug_client().add_message(f'AttOff')
+            log.debug_client().add_message('AttOff')
             agent.do_attentionto_off()
 
 
@@ -1,4 +1,8 @@
 from base.decision import get_decision
+from base.generator_clear import BhvClearGen
+from base.generator_dribble import BhvDribbleGen
+from base.generator_pass import BhvPassGen
+from base.generator_shoot import BhvShhotGen
 from base.sample_communication import SampleCommunication
 from base.view_tactical import ViewTactical
 from lib.action.go_to_point import GoToPoint
@@ -7,6 +11,7 @@ from lib.action.neck_body_to_ball import NeckBodyToBall
 from lib.action.neck_turn_to_ball import NeckTurnToBall
 from lib.action.neck_turn_to_ball_or_scan import NeckTurnToBallOrScan
 from lib.action.scan_field import ScanField
+from lib.debug.cycle_profile import profile_method
 from lib.debug.debug import log
 from lib.debug.level import Level
 from lib.player.player_agent import PlayerAgent
@@ -19,6 +24,10 @@ class SamplePlayer(PlayerAgent):
         super().__init__(goalie)
 
         self._communication = SampleCommunication()
+        if self.cycle_profile() is not None:
+            for generator, scope in ((BhvPassGen, 'pass'), (BhvDribbleGen, 'dribble'), (BhvShhotGen, 'shoot'),
+                                     (BhvClearGen, 'clear')):
+                profile_method(generator, 'generator', scope)
     
     def action_impl(self):
         wm = self.world()
@@ -32,15 +32,16 @@ class Bhv_GoalieSetPlay:
         gm = wm.game_mode()
 
         if not gm.type().is_goalie_catch_ball() or gm.side() != wm.our_side() or not wm.self().is_kickable():
-            log.os_log().debug(f'### goalie set play gm.catch?={gm.type().is_goalie_catch_ball()}')
-            log.os_log().debug(f'### goalie set play gm.side,ourside={gm.side()}, {wm.our_side()}')
-            log.os_log().debug(f'### goalie set play iskick?={wm.self().is_kickable()}')
+            if log.os_debug():
+                log.os_log().debug('### goalie set play gm.catch?=%s', gm.type().is_goalie_catch_ball())
+                log.os_log().debug('### goalie set play gm.side,ourside=%s, %s', gm.side(), wm.our_side())
+                log.os_log().debug('### goalie set play iskick?=%s', wm.self().is_kickable())
             log.sw_log().team().add_text('not a goalie catch mode')
             return False
 
         time_diff = wm.time().cycle() - agent.effector().catch_time().cycle()
-        log.os_log().debug(f'### goalie set play catch_time={agent.effector().catch_time()}')
-        log.os_log().debug(f'### goalie set play time diff={time_diff}')
+        log.os_log().debug('### goalie set play catch_time=%s', agent.effector().catch_time())
+        log.os_log().debug('### goalie set play time diff=%s', time_diff)
         if time_diff <= 2:
             Bhv_GoalieSetPlay._first_move = False
             Bhv_GoalieSetPlay._second_move = False
@@ -51,7 +52,7 @@ class Bhv_GoalieSetPlay:
 
         if not Bhv_GoalieSetPlay._first_move:
             move_point = Vector2D(SP.our_penalty_area_line_x() - 1.5, -13. if wm.ball().pos().y() < 0 else 13.)
-            log.os_log().debug(f'### goalie set play move_point={move_point}')
+            log.os_log().debug('### goalie set play move_point=%s', move_point)
             Bhv_GoalieSetPlay._first_move = True
             Bhv_GoalieSetPlay._second_move = False
             Bhv_GoalieSetPlay._wait_count = 0
@@ -72,7 +73,7 @@ class Bhv_GoalieSetPlay:
 
         if not Bhv_GoalieSetPlay._second_move:
             move_point = self.get_kick_point(agent)
-            log.os_log().debug(f'goalie set play move_point 2 ={move_point}')
+            log.os_log().debug('goalie set play move_point 2 =%s', move_point)
             agent.do_move(move_point.x(), move_point.y())
             agent.set_neck_action(NeckScanField())
             Bhv_GoalieSetPlay._second_move = True
@@ -19,8 +19,9 @@ if TYPE_CHECKING:
 
 
 class Bhv_SetPlay:
-    _kickable_time: int = -1
-    _waiting = False
+    # keyed by unum, all the players of a single process team share the class
+    _kickable_time: dict[int, int] = {}
+    _waiting: dict[int, bool] = {}
     def __init__(self):
         pass
 
@@ -148,12 +149,13 @@ class Bhv_SetPlay:
         if not wm.self().is_kickable():
             return False
 
-        if not Bhv_SetPlay._waiting:
-            Bhv_SetPlay._kickable_time = wm.time().cycle()
-            Bhv_SetPlay._waiting = True
+        unum = wm.self().unum()
+        if not Bhv_SetPlay._waiting.get(unum, False):
+            Bhv_SetPlay._kickable_time[unum] = wm.time().cycle()
+            Bhv_SetPlay._waiting[unum] = True
 
-        if Bhv_SetPlay._waiting and wm.time().cycle() - Bhv_SetPlay._kickable_time > 30:
-            Bhv_SetPlay._waiting = False
+        if Bhv_SetPlay._waiting[unum] and wm.time().cycle() - Bhv_SetPlay._kickable_time[unum] > 30:
+            Bhv_SetPlay._waiting[unum] = False
         else:
             ScanField().execute(agent)
             return True
@@ -167,7 +169,8 @@ class Bhv_SetPlay:
 
         target = best_action.target_ball_pos
         log.debug_client().set_target(target)
-        log.debug_client().add_message(f'{best_action.type.value} to {best_action.target_ball_pos} {best_action.start_ball_speed}')
+        log.debug_client().add_message('{} to {} {}', best_action.type.value, best_action.target_ball_pos,
+                                       best_action.start_ball_speed)
         SmartKick(target, best_action.start_ball_speed, best_action.start_ball_speed - 1, 3).execute(agent)
         agent.add_say_message(PassMessenger(best_action.target_unum,
                                             best_action.target_ball_pos,
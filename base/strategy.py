@@ -29,8 +29,10 @@ class _Strategy:
 
 
 class Strategy:
-    _i: _Strategy = _Strategy()
+    _i: _Strategy = None
 
     @staticmethod
     def i() -> _Strategy:
+        if Strategy._i is None:
+            Strategy._i = _Strategy()
         return Strategy._i
@@ -16,25 +16,39 @@ class Situation(Enum):
     PenaltyKick_Situation = 4
 
 
+FORMATION_FILES = {'before_kick_off': 'before_kick_off.conf',
+                   'defense': 'defense_formation.conf',
+                   'offense': 'offense_formation.conf',
+                   'goalie_kick_opp': 'goalie_kick_opp_formation.conf',
+                   'goalie_kick_our': 'goalie_kick_our_formation.conf',
+                   'kickin_our': 'kickin_our_formation.conf',
+                   'setplay_opp': 'setplay_opp_formation.conf',
+                   'setplay_our': 'setplay_our_formation.conf'}
+
+
 class _StrategyFormation:
     def __init__(self):
         pwd = '.'
         if "base" in os.listdir('.'):
             pwd = 'base'
-        self.before_kick_off_formation: Formation = Formation(f'{pwd}/formation_dt/before_kick_off.conf')
-        self.defense_formation: Formation = Formation(f'{pwd}/formation_dt/defense_formation.conf')
-        self.offense_formation: Formation = Formation(f'{pwd}/formation_dt/offense_formation.conf')
-        self.goalie_kick_opp_formation: Formation = Formation(f'{pwd}/formation_dt/goalie_kick_opp_formation.conf')
-        self.goalie_kick_our_formation: Formation = Formation(f'{pwd}/formation_dt/goalie_kick_our_formation.conf')
-        self.kickin_our_formation: Formation = Formation(f'{pwd}/formation_dt/kickin_our_formation.conf')
-        self.setplay_opp_formation: Formation = Formation(f'{pwd}/formation_dt/setplay_opp_formation.conf')
-        self.setplay_our_formation: Formation = Formation(f'{pwd}/formation_dt/setplay_our_formation.conf')
+        self._path = f'{pwd}/formation_dt'
+        self._formations: dict[str, Formation] = {}
         self._poses = [Vector2D(0, 0) for i in range(11)]
         self.current_situation = Situation.Offense_Situation
-        self.current_formation = self.offense_formation
+        self.current_formation: Formation = None
+
+    def formation(self, name: str) -> Formation:
+        """
+        the formation of FORMATION_FILES, read at the first use
+        """
+        if name not in self._formations:
+            self._formations[name] = Formation(f'{self._path}/{FORMATION_FILES[name]}')
+        return self._formations[name]
 
     def update(self, wm: 'WorldModel'):
-        log.os_log().debug(f'form{wm.time().cycle()},{wm.time().stopped_cycle()}, {wm.game_mode().type()} {wm.game_mode().is_our_set_play(wm.our_side())}')
+        if log.os_debug():
+            log.os_log().debug('form%s,%s, %s %s', wm.time().cycle(), wm.time().stopped_cycle(), wm.game_mode().type(),
+                               wm.game_mode().is_our_set_play(wm.our_side()))
         tm_min = wm.intercept_table().teammate_reach_cycle()
         opp_min = wm.intercept_table().opponent_reach_cycle()
         self_min = wm.intercept_table().self_reach_cycle()
@@ -61,34 +75,34 @@ class _StrategyFormation:
 
         if wm.game_mode().type() is GameModeType.PlayOn:
             if self.current_situation is Situation.Offense_Situation:
-                self.current_formation = self.offense_formation
+                self.current_formation = self.formation('offense')
             else:
-                self.current_formation = self.defense_formation
+                self.current_formation = self.formation('defense')
 
         elif wm.game_mode().type() in [GameModeType.BeforeKickOff, GameModeType.AfterGoal_Left,
                                        GameModeType.AfterGoal_Right]:
-            self.current_formation = self.before_kick_off_formation
+            self.current_formation = self.formation('before_kick_off')
 
         elif wm.game_mode().type() in [GameModeType.GoalKick_Left, GameModeType.GoalKick_Right, GameModeType.GoalieCatchBall_Left, GameModeType.GoalieCatchBall_Right]: # Todo add Goal Catch!!
             if wm.game_mode().is_our_set_play(wm.our_side()):
-                self.current_formation = self.goalie_kick_our_formation
+                self.current_formation = self.formation('goalie_kick_our')
             else:
-                self.current_formation = self.goalie_kick_opp_formation
+                self.current_formation = self.formation('goalie_kick_opp')
 
         else:
             if wm.game_mode().is_our_set_play(wm.our_side()):
                 if wm.game_mode().type() in [GameModeType.KickIn_Right, GameModeType.KickIn_Left,
                                              GameModeType.CornerKick_Right, GameModeType.CornerKick_Left]:
-                    self.current_formation = self.kickin_our_formation
+                    self.current_formation = self.formation('kickin_our')
                 else:
-                    self.current_formation = self.setplay_our_formation
+                    self.current_formation = self.formation('setplay_our')
             else:
-                self.current_formation = self.setplay_opp_formation
+                self.current_formation = self.formation('setplay_opp')
 
         self.current_formation.update(ball_pos)
         self._poses = self.current_formation.get_poses()
 
-        if self.current_formation is self.before_kick_off_formation or wm.game_mode().type() in \
+        if self.current_formation is self._formations.get('before_kick_off') or wm.game_mode().type() in \
                 [GameModeType.KickOff_Left, GameModeType.KickOff_Right]:
             for pos in self._poses:
                 pos._x = min(pos.x(), -0.5)
@@ -102,8 +116,10 @@ class _StrategyFormation:
 
 
 class StrategyFormation:
-    _i: _StrategyFormation = _StrategyFormation()
+    _i: _StrategyFormation = None
 
     @staticmethod
     def i() -> _StrategyFormation:
+        if StrategyFormation._i is None:
+            StrategyFormation._i = _StrategyFormation()
         return StrategyFormation._i
@@ -29,6 +29,7 @@ class TackleGenerator:
 
 
     _update_time: GameTime = GameTime()
+    _update_world: 'WorldModel' = None
     _instance = None
     def __init__(self):
         self._candidates: list[TackleAction] = []
@@ -43,10 +44,11 @@ class TackleGenerator:
 
 
     def generate(self, wm: 'WorldModel'):
-        if TackleGenerator._update_time == wm.time():
+        if TackleGenerator._update_time == wm.time() and TackleGenerator._update_world is wm:
             return
 
-        self._update_time = wm.time().copy()
+        TackleGenerator._update_time = wm.time().copy()
+        TackleGenerator._update_world = wm
 
         self.clear()
 
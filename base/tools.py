@@ -49,6 +49,29 @@ class Tools:
             return 2
         return 1
 
+    @staticmethod
+    def predict_kick_counts(wm: 'WorldModel', kicker, first_ball_speeds: list[float], ball_move_angle: AngleDeg):
+        # predict_kick_count of the speeds of one angle, the max velocity is calculated once
+        if not first_ball_speeds:
+            return []
+        if wm.game_mode().type() != GameModeType.PlayOn and not wm.game_mode().is_penalty_kick_mode():
+            return [1] * len(first_ball_speeds)
+
+        max_vel_r2 = -1.0
+        if kicker == wm.self().unum() and wm.self().is_kickable():
+            max_vel_r2 = calc_max_velocity(ball_move_angle, wm.self().kick_rate(), wm.ball().vel()).r2()
+        counts = []
+        for first_ball_speed in first_ball_speeds:
+            if max_vel_r2 >= pow(first_ball_speed, 2):
+                counts.append(1)
+            elif first_ball_speed > 2.5:
+                counts.append(3)
+            elif first_ball_speed > 1.5:
+                counts.append(2)
+            else:
+                counts.append(1)
+        return counts
+
     @staticmethod
     def estimate_min_reach_cycle(player_pos: Vector2D, player_speed_max, target_first_point: Vector2D, target_move_angle: AngleDeg):
         target_to_player: Vector2D = (player_pos - target_first_point).rotated_vector(-target_move_angle)
@@ -61,8 +84,13 @@ class Tools:
     def get_nearest_teammate(wm: 'WorldModel', position: Vector2D, players: list['PlayerObject'] =None):
         if players is None:
             players = wm.teammates()
-        best_player: 'PlayerObject' = None
         min_dist2 = 1000
+        index = wm.player_index()
+        rows = index.rows(players)
+        if rows is not None:
+            nearest = index.nearest(position, rows, max_dist2=min_dist2)
+            return nearest[0] if nearest else None
+        best_player: 'PlayerObject' = None
         for player in players:
             d2 = player.pos().dist2( position )
             if d2 < min_dist2:
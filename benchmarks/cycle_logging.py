@@ -0,0 +1,79 @@
+"""
+per cycle cpu time of a SamplePlayer with the logging of the run (default team_config: every soccer window level,
+debug client, os_log at ERROR) against the logging turned off (--sw-log-levels none --disable-debug-client).
+
+the player (HELIOS_base 9, play_on) gets a sense_body and the see message of tests/test_visual_sensor.py
+every cycle, then makes its decision and flushes its logs, as PlayerAgent.handle_decision_timer does.
+the sense_body command counters follow the commands of the player, so no command is reported as lost.
+every mode runs in a fresh interpreter and the modes are interleaved.
+run from the repository root:
+    python -m benchmarks.cycle_logging [cycles] [rounds]
+"""
+import socket
+import subprocess
+import sys
+import time
+
+from fixtures.messages import COUNTS, PLAYER_TYPES, SEE, SENSE_BODY, SERVER_PARAM
+
+WARMUP = 5
+MODES = {
+    'default': {},
+    'off': {'SW_LOG_LEVELS': 'none', 'USE_DEBUG_CLIENT': False},
+}
+
+
+def run(mode: str, cycles: int):
+    import team_config
+    team_config.DISABLE_FILE_LOG = True
+    for key, value in MODES[mode].items():
+        setattr(team_config, key, value)
+
+    from base.sample_player import SamplePlayer
+    from lib.network.udp_socket import IPAddress
+    from lib.player_command.player_command import CommandType
+
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(('127.0.0.1', 0))
+    agent = SamplePlayer()
+    agent._client.connect_to(IPAddress('127.0.0.1', sink.getsockname()[1]))
+    agent._team_name = 'HELIOS_base'
+    agent.parse_message('(init l 9 before_kick_off)')
+    agent.parse_message(SERVER_PARAM)
+    for message in PLAYER_TYPES:
+        agent.parse_message(message)
+    agent.parse_message('(hear 0 referee play_on)\x00')
+
+    def cycle(t: int):
+        counts = {c: agent._effector._command_counter[CommandType[c].value] for c in COUNTS}
+        agent.parse_message(SENSE_BODY.format(time=t, **counts))
+        agent.parse_message(SEE.replace('(see 245', f'(see {t}', 1))
+        agent.action()
+        agent.flush_logs()
+
+    for t in range(1, WARMUP + 1):
+        cycle(t)
+    start = time.process_time()
+    for t in range(WARMUP + 1, WARMUP + cycles + 1):
+        cycle(t)
+    print((time.process_time() - start) / cycles * 1000)
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    results = {mode: [] for mode in MODES}
+    for _ in range(rounds):
+        for mode in MODES:
+            out = subprocess.run([sys.executable, '-m', 'benchmarks.cycle_logging', '--run', mode, str(cycles)],
+                                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True).stdout
+            results[mode].append(float(out.split()[-1]))
+    for mode, times in results.items():
+        print(f'{mode:<8} {min(times):7.2f} ms/cycle  (runs: {" ".join(f"{t:.2f}" for t in times)})')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--run':
+        run(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
@@ -0,0 +1,49 @@
+"""
+cost of team_config.CYCLE_PROFILE_DIR (main.py --profile-cycles): cycles per second of a SamplePlayer replaying the
+synthetic recording of fixtures.recordings without and with the cycle profile, then the percentiles of the phases
+of the profile (lib/debug/cycle_profile.py). the profiled replay must send the recorded commands too.
+run from the repository root:
+    python -m benchmarks.cycle_profile [cycles] [rounds]
+"""
+import os
+import sys
+import tempfile
+
+import team_config
+from base.sample_player import SamplePlayer
+from fixtures.recordings import read_profile, replay_profiled, synthesize
+from lib.player.replay import Replay
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    team_config.DISABLE_FILE_LOG = True
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'synthetic.rec')
+    synthesize(path, cycles)
+    replay = Replay(path)
+
+    best = {'off': 0., 'on': 0.}
+    profile = None
+    for _ in range(rounds):
+        result = replay.run(SamplePlayer)
+        best['off'] = max(best['off'], result.cycles_per_sec())
+        result, profile = replay_profiled(replay, directory)
+        best['on'] = max(best['on'], result.cycles_per_sec())
+        if result.mismatches:
+            print(f'profiled: {result}')
+    for mode, cycles_per_sec in best.items():
+        print(f'{mode:<4} {cycles_per_sec:8.1f} cycles/sec')
+    print(f'overhead {(best["off"] / best["on"] - 1) * 100:5.1f}%')
+
+    lines, summary = read_profile(profile)
+    print(f'{profile}: {len(lines)} decisions')
+    print(f'{"ms":<40s} {"count":>6s} {"mean":>8s} {"p50":>8s} {"p95":>8s} {"p99":>8s} {"max":>8s}')
+    for scope, s in sorted(summary.items()):
+        print(f'{scope:<40s} {s["count"]:6d} {s["mean"]:8.3f} {s["p50"]:8.3f} {s["p95"]:8.3f} {s["p99"]:8.3f} '
+              f'{s["max"]:8.3f}')
+
+
+if __name__ == '__main__':
+    main()
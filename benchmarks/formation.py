@@ -0,0 +1,116 @@
+"""
+Formation.update of the delaunay formations of base/formation_dt over random ball positions (some of them out of
+the pitch):
+  - legacy: the linear scan over _triangles and the Vector2D interpolation it replaced (LegacyFormation below,
+    a verbatim copy of the old method)
+  - indexed: the triangle index and the numpy interpolation, the positions must be the same
+  - grid: the positions looked up in a precomputed pitch grid of [step] meters (built in a temporary directory),
+    with its error against the interpolation in the pitch. the interpolation is not continuous on some triangle
+    edges (the positions jump by meters), the grid smooths these jumps over a cell
+run from the repository root:
+    python -m benchmarks.formation [step] [points]
+"""
+import random
+import sys
+import tempfile
+import time
+
+from pyrusgeom.geom_2d import *
+from pyrusgeom.soccer_math import min_max
+
+import team_config
+from lib.formation.delaunay_triangulation import Formation, FormationType
+from lib.rcsc.server_param import ServerParam
+
+FORMATIONS = ['defense_formation', 'offense_formation', 'kickin_our_formation', 'setplay_opp_formation',
+              'setplay_our_formation']
+
+
+class LegacyFormation(Formation):
+    def update(self, B:Vector2D):
+        SP = ServerParam.i()
+        if self._formation_type == FormationType.Static:
+            return
+        ids = []
+
+        point = B.copy()
+        if point.abs_x() > SP.pitch_half_length():
+            point._x = min_max(-SP.pitch_half_length(), point.x(), +SP.pitch_half_length())
+        if point.abs_y() > SP.pitch_half_width():
+            point._y = min_max(-SP.pitch_half_width(), point.y(), +SP.pitch_half_width())
+
+        for tri in self._triangles:
+            if tri[0].contains(point):
+                ids = [tri[1], tri[2], tri[3]]
+                break
+        Pa = Vector2D(self._balls[ids[0]][0], self._balls[ids[0]][1])
+        Pb = Vector2D(self._balls[ids[1]][0], self._balls[ids[1]][1])
+        Pc = Vector2D(self._balls[ids[2]][0], self._balls[ids[2]][1])
+        lineProj = Line2D(p1=Pb, p2=Pc).projection(B)
+        m1 = Pb.dist(lineProj)
+        n1 = Pc.dist(lineProj)
+        m2 = Pa.dist(B)
+        n2 = lineProj.dist(B)
+
+        self._target_players.clear()
+        for p in range(11):
+            OPa = Vector2D(self._players[ids[0]][p][0], self._players[ids[0]][p][1])
+            OPb = Vector2D(self._players[ids[1]][p][0], self._players[ids[1]][p][1])
+            OPc = Vector2D(self._players[ids[2]][p][0], self._players[ids[2]][p][1])
+            OI = (OPc - OPb)
+            OI *= (m1 / (m1 + n1))
+            OI += OPb
+            OB = (OI - OPa)
+            OB *= (m2 / (m2 + n2))
+            OB += OPa
+            self._target_players.append(OB)
+
+
+def random_points(count: int, seed: int = 0) -> list[Vector2D]:
+    rng = random.Random(seed)
+    return [Vector2D(rng.uniform(-56, 56), rng.uniform(-37, 37)) for _ in range(count)]
+
+
+def positions(formation: Formation, point: Vector2D):
+    formation.update(point)
+    return [(p.x(), p.y()) for p in formation.get_poses()]
+
+
+def main():
+    step = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    points = random_points(count)
+    SP = ServerParam.i()
+    in_pitch = [p for p in points if p.abs_x() <= SP.pitch_half_length() and p.abs_y() <= SP.pitch_half_width()]
+    with tempfile.TemporaryDirectory() as directory:
+        team_config.FORMATION_CACHE_PATH = directory
+        for name in FORMATIONS:
+            path = f'base/formation_dt/{name}.conf'
+            legacy = LegacyFormation(path, grid_step=0)
+            indexed = Formation(path, grid_step=0)
+            start = time.process_time()
+            grid = Formation(path, grid_step=step)
+            build = time.process_time() - start
+            start = time.process_time()
+            Formation(path, grid_step=step)
+            load = time.process_time() - start
+
+            same = all(positions(legacy, p) == positions(indexed, p) for p in points)
+            errors = sorted(max(abs(a - b) for pa, pb in zip(positions(indexed, p), positions(grid, p))
+                                for a, b in zip(pa, pb))
+                            for p in in_pitch)
+            times = {}
+            for kind, formation in (('legacy', legacy), ('indexed', indexed), ('grid', grid)):
+                start = time.process_time()
+                for p in points:
+                    formation.update(p)
+                times[kind] = (time.process_time() - start) / count * 1e6
+            print(f'{name}: {len(indexed._triangles)} triangles, same positions: {same}, '
+                  f'grid build {build:.2f} s load {load * 1000:.1f} ms, '
+                  f'grid error median {errors[len(errors) // 2]:.3f} m p95 {errors[len(errors) * 95 // 100]:.3f} m '
+                  f'max {errors[-1]:.3f} m')
+            print('  ' + '  '.join(f'{kind} {t:7.1f} us' for kind, t in times.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+startup of one agent process with the formations of base/formation_dt, every run in a new interpreter:
+  - eager: the eight formations triangulated with scipy at import, as _StrategyFormation did before
+    (no cache, FORMATION_CACHE_PATH = None)
+  - coach: the imports of main.py only, the formations are never used
+  - player: the imports and the formations of the first cycles (before kick off, offense, defense) read at the
+    first use, [uncached] triangulated with scipy, [cached] loaded from the cache files
+the median wall time from the interpreter start and the peak RSS of [runs] runs (default 5) are printed.
+run from the repository root:
+    python -m benchmarks.formation_startup [runs]
+"""
+import json
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+MODES = ['eager', 'coach', 'player uncached', 'player cached']
+
+
+def agent(mode: str, cache: str):
+    import team_config
+    team_config.DISABLE_FILE_LOG = True
+    team_config.FORMATION_CACHE_PATH = None if mode in ('eager', 'player uncached') else cache
+    import base.sample_coach
+    import base.sample_player
+    from base.strategy_formation import FORMATION_FILES, StrategyFormation
+    if mode == 'eager':
+        for name in FORMATION_FILES:
+            StrategyFormation.i().formation(name)
+    elif mode != 'coach':
+        for name in ('before_kick_off', 'offense', 'defense'):
+            StrategyFormation.i().formation(name)
+
+
+def run(mode: str, cache: str) -> dict:
+    start = time.perf_counter()
+    out = subprocess.run([sys.executable, '-m', 'benchmarks.formation_startup', '--agent', mode, cache],
+                         capture_output=True, text=True, check=True).stdout
+    result = json.loads(out.splitlines()[-1])
+    result['time'] = time.perf_counter() - start
+    return result
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--agent':
+        agent(sys.argv[2], sys.argv[3])
+        print(json.dumps({'rss': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                          'scipy': 'scipy' in sys.modules}))
+        return
+
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    with tempfile.TemporaryDirectory() as cache:
+        run('player cached', cache)  # creates the cache files
+        for mode in MODES:
+            results = [run(mode, cache) for _ in range(runs)]
+            print(f'{mode:16s} {statistics.median(r["time"] for r in results) * 1000:7.1f} ms '
+                  f'{statistics.median(r["rss"] for r in results):6.1f} MB rss, scipy imported: {results[0]["scipy"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+fullstate message -> WorldModel.update_by_full_state_message, with the 22 players of fixtures.messages.FULLSTATE:
+  - legacy: the player dicts of the s-expression parser, read by PlayerObject.init_dic one player at a time
+    (LegacyFullStateParser, LegacyPlayerObject and LegacyWorldModel below, verbatim copies of the old code)
+  - record: FullStateWorldMessageParser.players() decoded in one pass, read by init_record and
+    PlayerStore.update_by_full_state
+both world models must end with the same players.
+run from the repository root:
+    python -m benchmarks.fullstate [repeat]
+"""
+import sys
+import timeit
+
+import team_config
+team_config.DISABLE_FILE_LOG = True
+
+from fixtures.messages import FULLSTATE
+from lib.debug.debug import log
+from lib.parser.parser_message_fullstate_world import FullStateWorldMessageParser
+from lib.parser.sexp_parser import nodes_to_dict, parse_sexp
+from lib.player.object_player import *
+from lib.player.world_model import WorldModel
+from lib.rcsc.types import GameModeType
+
+SELF_UNUM = 5
+
+
+
+class LegacyFullStateParser:
+    def __init__(self):
+        self._dic = {}
+        self._kick = 0
+        self._dash = 0
+        self._turn = 0
+        self._catch = 0
+        self._move = 0
+        self._turn_neck = 0
+        self._change_view = 0
+        self._say = 0
+
+    def parse(self, message: str):
+        nodes = parse_sexp(message)[0]
+        self._dic['time'] = nodes[1]
+
+        # before parsing players
+        nodes_to_dict([node for node in nodes[2:] if not LegacyPlayerMessageParser.is_player(node)], self._dic)
+
+        data = self._dic['count']
+
+        self._kick = data[0]
+        self._dash = data[1]
+        self._turn = data[2]
+        self._catch = data[3]
+        self._move = data[4]
+        self._turn_neck = data[5]
+        self._change_view = data[6]
+        self._say = data[7]
+
+        # and now parsing players
+        self._dic.update(LegacyPlayerMessageParser().parse(nodes[2:]))
+
+    def dic(self):
+        return self._dic
+
+    def kick_count(self):
+        return self._kick
+
+    def dash_count(self):
+        return self._dash
+
+    def turn_count(self):
+        return self._turn
+
+    def catch_count(self):
+        return self._catch
+
+    def move_count(self):
+        return self._move
+
+    def turn_neck_count(self):
+        return self._turn_neck
+
+    def change_view_count(self):
+        return self._change_view
+
+    def say_count(self):
+        return self._say
+
+
+class LegacyPlayerMessageParser:
+    def __init__(self):
+        self._dic = {}
+
+    @staticmethod
+    def is_player(node) -> bool:
+        return isinstance(node, list) and len(node) > 0 and isinstance(node[0], list) and node[0][0] == 'p'
+
+    @staticmethod
+    def _parser(dic: dict, nodes: list):
+        players = []
+        for node in nodes:
+            if not LegacyPlayerMessageParser.is_player(node):
+                continue
+            name = node[0]
+            goalie = name[3] == 'g'
+            player_dic = {
+                "side_id": name[1],
+                "unum": name[2],
+                "player_type": name[4] if goalie else name[3],
+                "pos_x": node[1],
+                "pos_y": node[2],
+                "vel_x": node[3],
+                "vel_y": node[4],
+                "body": node[5],
+                "neck": node[6],
+            }
+            if goalie:
+                player_dic['goalie'] = 'g'
+            rest = node[7:]
+            if len(rest) >= 2 and isinstance(rest[0], (int, float)):
+                player_dic["pointto_dist"] = rest[0]
+                player_dic["pointto_dir"] = rest[1]
+                rest = rest[2:]
+            for item in rest:
+                if isinstance(item, list):
+                    if item[0] == 'stamina':
+                        player_dic["stamina"] = {
+                            "stamina": item[1],
+                            "effort": item[2],
+                            "recovery": item[3],
+                            "capacity": item[4] if len(item) > 4 else None
+                        }
+                    else:  # focus point
+                        player_dic["focus_dist"] = item[1]
+                        player_dic["focus_dir"] = item[2]
+                elif item == 'k':
+                    player_dic['kick'] = True
+                elif item == 't':
+                    player_dic['tackle'] = True
+                elif item == 'f':
+                    player_dic['charged'] = True
+                elif item == 'y' or item == 'r':
+                    player_dic['card'] = item
+            players.append(player_dic)
+        dic["players"] = players
+
+    def parse(self, nodes: list):
+        LegacyPlayerMessageParser._parser(self._dic, nodes)
+        return self._dic
+
+
+class LegacyPlayerObject(PlayerObject):
+    def init_dic(self, dic: dict):
+        self._unum = int(dic["unum"])
+        self._pos = Vector2D(float(dic["pos_x"]), float(dic["pos_y"]))
+        self._vel = Vector2D(float(dic["vel_x"]), float(dic["vel_y"]))
+        self._side = SideID.RIGHT if dic["side_id"] == 'r' else SideID.LEFT if dic["side_id"] == 'l' else SideID.NEUTRAL
+        self._body = AngleDeg(float(dic["body"]))
+        self._neck = AngleDeg(float(dic["neck"]))
+        self._face = self._body + self._neck
+        self._goalie = True if "goalie" in dic else False
+        self._player_type_id = int(dic["player_type"])
+        # self._pointto = Vector2D.invalid() TODO check this on full state
+        # if "pointto_dist" in dic:
+        #     self._pointto = Vector2D.polar2vector(float(dic["pointto_dist"]), float(dic["pointto_dir"]))
+        self._stamina_model = StaminaModel(**dic["stamina"])
+        self._kick = True if "kick" in dic else False
+        self._tackle = True if "tackle" in dic else False
+        self._charged = True if "charged" in dic else False
+        self._card = Card.NO_CARD
+        if "card" in dic:
+            self._card = Card.YELLOW if dic["card"] == "y" else Card.RED
+        self._kick_rate: float = 0.0
+        self._rpos_count = 0
+        self._vel_count = 0
+        self._pos_count = 0
+        self._body_count = 0
+        self._ghost_count = 0
+
+
+class LegacyWorldModel(WorldModel):
+    def update_by_full_state_message(self, parser: LegacyFullStateParser):
+        self._time._cycle = int(parser.dic()['time'])
+        self._game_mode.set_game_mode(GameModeType(parser.dic()['pmode']))
+
+        # TODO vmode counters and arm
+
+        self._ball.init_values(parser.dic()['b'])
+        self._teammates.clear()
+        self._opponents.clear()
+        self._unknown_players.clear()
+        self._all_players.clear()
+        self._our_players.clear()
+        self._their_players.clear()
+        for player_dic in parser.dic()['players']:
+            player = LegacyPlayerObject()
+            player.init_dic(player_dic)
+            player.set_player_type(self._player_types[player.player_type_id()])
+            if player.side().value == self._our_side:
+                if player.unum() == self._self_unum:
+                    self._self.update_by_player_info(player)
+                else:
+                    self._teammates.append(player)
+            elif player.side() == SideID.NEUTRAL:
+                self._unknown_players.append(player)
+            else:
+                self._opponents.append(player)
+        if self._our_side == SideID.RIGHT:
+            self.reverse()
+
+        for o in [self.ball()] + self._teammates + self._opponents + self._unknown_players:
+            o.update_more_with_full_state(self)
+
+
+def player_state(wm: WorldModel) -> list:
+    # the distances and angles are computed by numpy on one side, rounded to the float error
+    return [(p.side(), p.unum(), p.goalie(), p.player_type_id(), p.pos().x(), p.pos().y(), p.vel().x(), p.vel().y(),
+             p.body().degree(), p.neck().degree(), p.stamina_model().stamina(), p.stamina_model().capacity(),
+             p.kick(), p.tackle(), p.charged(), p.card(), p.pos_count(), p.vel_count(),
+             round(p.rpos().x(), 9), round(p.rpos().y(), 9), round(p.dist_from_self(), 9),
+             round(p.angle_from_self().degree(), 9), round(p.dist_from_ball(), 9),
+             round(p.angle_from_ball().degree(), 9))
+            for p in wm._teammates + wm._opponents] + [(wm.self().pos().x(), wm.self().pos().y())]
+
+
+def make_world(cls, side: str = 'l') -> WorldModel:
+    wm = cls('full')
+    wm.init('PYRUS', side, SELF_UNUM, False)
+    return wm
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    log.set_sw_levels(0)
+    legacy, record = make_world(LegacyWorldModel), make_world(WorldModel)
+    legacy_parser, parser = LegacyFullStateParser(), FullStateWorldMessageParser()
+
+    def legacy_cycle():
+        legacy_parser.parse(FULLSTATE)
+        legacy.update_by_full_state_message(legacy_parser)
+
+    def record_cycle():
+        parser.parse(FULLSTATE)
+        record.update_by_full_state_message(parser)
+
+    print(f'{"":<8}{"parse us":>10}{"cycle us":>10}')
+    for name, message_parser, cycle in (('legacy', legacy_parser, legacy_cycle), ('record', parser, record_cycle)):
+        parse = min(timeit.repeat(lambda: message_parser.parse(FULLSTATE), number=repeat, repeat=5)) / repeat
+        total = min(timeit.repeat(cycle, number=repeat, repeat=5)) / repeat
+        print(f'{name:<8}{parse * 1e6:>10.1f}{total * 1e6:>10.1f}')
+    print(f'same players: {player_state(legacy) == player_state(record)}')
+
+
+if __name__ == '__main__':
+    main()
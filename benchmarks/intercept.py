@@ -0,0 +1,356 @@
+"""
+the intercept predictions of InterceptTable on the world of fixtures.worlds with random players and ball:
+  - players: reach cycles with PlayerInterceptBatch (lib.action.intercept_player) against one
+    PlayerIntercept.predict call per player, with a ball rolling for [cycles] cycles
+  - self: SelfIntercept.predict with the batched long step dashes (predict_long_dashes) against the cycle by cycle
+    dash simulation it replaced (LegacySelfIntercept below, a verbatim copy of the old methods), and the time of
+    each step of SelfIntercept.predict with the ball 0.5-4m away, where the one dash and short step searches run
+  - table: InterceptTable.update over a sequence of cycles (the ball rolls and is seen every 3rd cycle, every cycle
+    some players are seen somewhere else) with and without team_config.INCREMENTAL_INTERCEPT_TABLE, the ball
+    cache hits and misses and how many player cycles of the incremental table differ from a full update
+run from the repository root:
+    python -m benchmarks.intercept [cycles] [worlds]
+"""
+import random
+import sys
+import timeit
+from math import ceil
+
+from pyrusgeom.geom_2d import *
+from pyrusgeom.soccer_math import min_max
+
+import team_config
+from fixtures.worlds import ball_cache, make_world, play_cycle, randomize, randomize_self, self_ball_cache
+from lib.action.intercept_info import InterceptInfo
+from lib.action.intercept_player import PlayerIntercept, PlayerInterceptBatch
+from lib.action.intercept_self import SelfIntercept
+from lib.action.intercept_table import InterceptTable
+from lib.debug.debug import log
+from lib.rcsc.server_param import ServerParam
+
+
+def intercept_table(infos: list[InterceptInfo]):
+    return [(i.mode(), i.turn_cycle(), i.dash_cycle(), i.dash_power(), i.dash_angle().degree(),
+             i.self_pos().x(), i.self_pos().y(), i.ball_dist(), i.stamina()) for i in infos]
+
+
+class LegacySelfIntercept(SelfIntercept):
+    def predict_long_step(self, max_cycle: int, save_recovery: bool, self_cache: list):
+        if log.sw_log().intercept().enabled:
+            log.sw_log().intercept().add_text('=========================== Long Step =============================')
+        tmp_cache = []
+        SP = ServerParam.i()
+        wm = self._wm
+        ball = wm.ball()
+        me = wm.self()
+        ptype = me.player_type()
+
+        # calc y distance from ball line
+        ball_to_self = me.pos() - ball.pos()
+        ball_to_self.rotate(-ball.vel().th())
+        start_cycle = int(ceil((ball_to_self.abs_y()
+                                - ptype.kickable_area()
+                                - 0.2)
+                               / ptype.real_speed_max()))
+        # if start_cycle <= self._max_short_step:
+        #     start_cycle = self._max_short_step + 1
+
+        ball_pos = ball.inertia_point(start_cycle - 1)
+        ball_vel = ball.vel() * SP.ball_decay() ** (start_cycle - 1)
+        found = False
+
+        max_loop = max_cycle
+        tmp_cache = []
+        for cycle in range(start_cycle, max_loop):
+            ball_pos += ball_vel
+            ball_vel *= SP.ball_decay()
+            if log.sw_log().intercept().enabled:
+                log.sw_log().intercept().add_text('$$$ c: {} b: {}', cycle, ball_pos)
+            if ball_pos.abs_x() > SP.pitch_half_length() + 10 or \
+                    ball_pos.abs_y() > SP.pitch_half_width() + 10:
+                log.sw_log().intercept().add_text('-------> out of field')
+                log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='r')
+                break
+
+            goalie_mode = self.is_goalie_mode(ball_pos)
+            control_area = ptype.catchable_area() if goalie_mode else ptype.kickable_area()
+
+            # reach point is to far never reach
+            if control_area + ptype.real_speed_max() * cycle < me.pos().dist(ball_pos):
+                log.sw_log().intercept().add_text('-------> to far never reach')
+                log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='r')
+                continue
+
+            res, n_turn, back_dash, result_recovery = self.can_reach_after_turn_long_dash(cycle,
+                                                                                          ball_pos,
+                                                                                          control_area,
+                                                                                          save_recovery,
+                                                                                          self_cache)
+            if res:
+                log.sw_log().intercept().add_text('-------> {} turn:{} back_dash: {}', res, n_turn, back_dash)
+                if not found:
+                    max_loop = min(max_cycle, cycle + 10)
+                found = True
+                log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='green')
+            else:
+                log.sw_log().intercept().add_text('-------> res not found')
+                log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='red')
+
+        # not registered any intercept
+        if not found and save_recovery:
+            self.predict_final(max_cycle, self_cache)
+        if len(self_cache) == 0:
+            self.predict_final(max_cycle, self_cache)
+
+    def can_reach_after_turn_long_dash(self,
+                                       cycle,
+                                       ball_pos,
+                                       control_area,
+                                       save_recovery,
+                                       self_cache) -> tuple:
+        dash_angle = self._wm.self().body()
+        result_recovery = 0
+        n_turn, dash_angle, back_dash = self.predict_turn_cycle(cycle,
+                                                                ball_pos,
+                                                                control_area,
+                                                                dash_angle)
+        if n_turn > cycle:
+            return False, n_turn, back_dash, result_recovery
+
+        res, result_recovery = self.can_reach_after_dash(n_turn, max(0, cycle - n_turn),
+                                                         ball_pos, control_area,
+                                                         save_recovery,
+                                                         dash_angle, back_dash,
+                                                         result_recovery,
+                                                         self_cache)
+        return res, n_turn, back_dash, result_recovery
+
+    def can_reach_after_dash(self,
+                             n_turn: int,
+                             n_dash: int,
+                             ball_pos: Vector2D,
+                             control_area: float,
+                             save_recovery: bool,
+                             dash_angle: AngleDeg,
+                             back_dash: bool,
+                             result_recovery,
+                             self_cache: list):
+        PLAYER_NOISE_RATE = 1 - ServerParam.i().player_rand() * 0.01
+        MAX_POWER = ServerParam.i().max_dash_power()
+
+        SP = ServerParam.i()
+        wm = self._wm
+        ptype = wm.self().player_type()
+
+        my_inertia = wm.self().inertia_point(n_turn + n_dash)
+        recover_dec_thr = SP.recover_dec_thr() * SP.stamina_max()
+
+        dash_angle_minus = -dash_angle
+        ball_rel = (ball_pos - wm.self().pos()).rotated_vector(dash_angle_minus)
+        ball_noise = (wm.ball().pos().dist(ball_pos)
+                      * SP.ball_rand()
+                      * 0.5)
+        noised_ball_x = ball_rel.x() + ball_noise
+
+        # prepare loop variables
+        # ORIGIN: first player pos.
+        # X - axis: dash angle
+        tmp_pos = ptype.inertia_travel(wm.self().vel(), n_turn)
+        tmp_pos.rotate(dash_angle_minus)
+
+        tmp_vel = wm.self().vel()
+        tmp_vel *= ptype.player_decay() ** n_turn
+        tmp_vel.rotate(dash_angle_minus)
+
+        stamina_model = wm.self().stamina_model()
+        stamina_model.simulate_waits(ptype, n_turn)
+
+        prev_effort = stamina_model.effort()
+        dash_power_abs = MAX_POWER
+        # only consider about x of dash accel vector,
+        # because current orientation is player's dash angle (included back dash case)
+        # NOTE: dash_accel_x must be positive value.
+        dash_accel_x = dash_power_abs * ptype.dash_rate(stamina_model.effort())
+
+        can_over_speed_max = ptype.can_over_speed_max(dash_power_abs,
+                                                      stamina_model.effort())
+        first_dash_power = dash_power_abs * (-1 if back_dash else 1)
+        for i in range(n_dash):
+            # update dash power and accel
+            available_power = (max(0, stamina_model.stamina() - recover_dec_thr)
+                               if save_recovery
+                               else stamina_model.stamina() + ptype.extra_stamina())
+            if back_dash:
+                available_power *= 0.5
+            available_power = min_max(0, available_power, MAX_POWER)
+
+            must_update_power = False
+            if (available_power < dash_power_abs
+                    or stamina_model.effort() < prev_effort
+                    or (not can_over_speed_max
+                        and dash_power_abs < available_power)):
+                must_update_power = True
+
+            if must_update_power:
+                dash_power_abs = available_power
+                dash_accel_x = dash_power_abs * ptype.dash_rate(stamina_model.effort())
+                can_over_speed_max = ptype.can_over_speed_max(dash_power_abs,
+                                                              stamina_model.effort())
+                if i == 0:
+                    first_dash_power = dash_power_abs * (-1 if back_dash else 1)
+
+            # update vel
+            tmp_vel.add_x(dash_accel_x)
+            # power conservation, update accel magnitude and dashpower
+            if can_over_speed_max and tmp_vel.r2() > ptype.player_speed_max2():
+                tmp_vel.sub_x(dash_accel_x)
+                max_dash_x = (ptype.player_speed_max2() - tmp_vel.y() ** 2) ** 0.5
+
+                dash_accel_x = max_dash_x - tmp_vel.x()
+                dash_power_abs = abs(dash_accel_x / ptype.dash_rate(stamina_model.effort()))
+                tmp_vel.add_x(dash_accel_x)
+                can_over_speed_max = ptype.can_over_speed_max(dash_power_abs,
+                                                              stamina_model.effort())
+
+            tmp_pos += tmp_vel
+            tmp_vel *= ptype.player_decay()
+            stamina_model.simulate_dash(ptype, dash_power_abs * (-1 if back_dash else 1))
+
+            if tmp_pos.x() * PLAYER_NOISE_RATE + 0.1 > noised_ball_x:
+                result_recovery = stamina_model.recovery()
+                inertia_pos = ptype.inertia_point(tmp_pos, tmp_vel, n_dash - (i + 1))
+                my_final_pos = wm.self().pos() + tmp_pos.rotate(dash_angle)
+                if my_inertia.dist2(my_final_pos) > 0.01:
+                    my_final_pos = Line2D(p1=my_inertia, p2=my_final_pos).projection(ball_pos)
+                stamina_model.simulate_waits(ptype, n_dash - (i + 1))
+                mode = (InterceptInfo.Mode.EXHAUST
+                        if stamina_model.recovery() < wm.self().recovery()
+                           and not stamina_model.capacity_is_empty()
+                        else InterceptInfo.Mode.NORMAL)
+                self_cache.append(InterceptInfo(mode,
+                                                n_turn, n_dash,
+                                                first_dash_power, 180.0 if back_dash else 0,
+                                                my_final_pos,
+                                                my_final_pos.dist(ball_pos),
+                                                stamina_model.stamina()))
+                return True, result_recovery
+
+        player_travel = tmp_pos.r()
+        player_noise = player_travel * SP.player_rand() * 0.5
+        last_ball_dist = ball_rel.dist(tmp_pos)
+        buf = 0.2
+
+        buf += player_noise
+        buf += ball_noise
+
+        if last_ball_dist < max(control_area - 0.225, control_area - buf):
+            my_final_pos = wm.self().pos() + tmp_pos.rotate(dash_angle)
+            result_recovery = stamina_model.recovery()
+            mode = (InterceptInfo.Mode.EXHAUST
+                    if stamina_model.recovery() < wm.self().recovery()
+                       and not stamina_model.capacity_is_empty()
+                    else InterceptInfo.Mode.NORMAL)
+            self_cache.append(InterceptInfo(mode,
+                                            n_turn, n_dash,
+                                            first_dash_power, 180.0 if back_dash else 0,
+                                            my_final_pos, my_final_pos.dist(ball_pos),
+                                            stamina_model.stamina()))
+            return True, result_recovery
+        return False, result_recovery
+
+
+def randomize_near_ball(wm, rng: random.Random):
+    randomize_self(wm, rng)
+    me = wm.self()
+    wm.ball()._pos = me.pos() + Vector2D.polar2vector(rng.uniform(0.5, 4), rng.uniform(-180, 180))
+    wm.ball()._vel = Vector2D.polar2vector(rng.uniform(0, 1.5), rng.uniform(-180, 180))
+    wm.ball()._dist_from_self = me.pos().dist(wm.ball().pos())
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    worlds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    team_config.SW_LOG_LEVELS = 'none'
+    team_config.DISABLE_FILE_LOG = True
+    wm = make_world()
+    players = [p for p in wm.teammates() + wm.opponents() if p is not None and p.unum() != wm.self().unum()]
+
+    def scalar(cache):
+        predictor = PlayerIntercept(wm, cache)
+        return [predictor.predict(p, p.player_type(), 1000) for p in players]
+
+    def batched(cache):
+        return PlayerInterceptBatch(wm, cache).predict(players)
+
+    times = {scalar: 0.0, batched: 0.0}
+    for seed in range(worlds):
+        randomize(wm, players, random.Random(seed))
+        cache = ball_cache(wm, cycles)
+        for f in times:
+            times[f] += min(timeit.repeat(lambda: f(cache), number=20, repeat=3)) / 20
+    print(f'players: {len(players)} players, {cycles} ball cycles')
+    for f, t in times.items():
+        print(f'  {f.__name__:<8} {t / worlds * 1000:7.3f} ms')
+
+    times = {LegacySelfIntercept: 0.0, SelfIntercept: 0.0}
+    same = True
+    for seed in range(worlds):
+        randomize_self(wm, random.Random(seed))
+        cache = self_ball_cache(wm)
+        infos = {}
+        for cls in times:
+            def predict():
+                infos[cls] = []
+                cls(wm, cache).predict(min(100, len(cache)), infos[cls])
+            times[cls] += min(timeit.repeat(predict, number=3, repeat=3)) / 3
+        same &= intercept_table(infos[LegacySelfIntercept]) == intercept_table(infos[SelfIntercept])
+    print(f'self: same solutions: {same}')
+    for cls, t in times.items():
+        print(f'  {cls.__name__:<20} {t / worlds * 1000:7.3f} ms')
+
+    steps = {'one_step': lambda p, c: p.predict_one_step([]),
+             'short_step': lambda p, c: p.predict_short_step(min(100, len(c)), True, []),
+             'long_step': lambda p, c: p.predict_long_step(min(100, len(c)), True, [])}
+    times = {name: 0.0 for name in steps}
+    for seed in range(worlds):
+        randomize_near_ball(wm, random.Random(seed))
+        cache = self_ball_cache(wm)
+        predictor = SelfIntercept(wm, cache)
+        for name, step in steps.items():
+            times[name] += min(timeit.repeat(lambda: step(predictor, cache), number=3, repeat=3)) / 3
+    print('self steps, ball near:')
+    for name, t in times.items():
+        print(f'  {name:<12} {t / worlds * 1000:7.3f} ms')
+
+    # the tables see the same cycles, the full one with INCREMENTAL_INTERCEPT_TABLE off
+    players = wm.teammates_from_ball() + wm.opponents_from_ball()
+    tables = {'full': InterceptTable(), 'incremental': InterceptTable()}
+    times = {name: 0.0 for name in tables}
+    updates = same = compared = 0
+    incremental_table = team_config.INCREMENTAL_INTERCEPT_TABLE
+    for seed in range(worlds):
+        rng = random.Random(seed)
+        randomize(wm, players, rng)
+        randomize_self(wm, rng)
+        wm._exist_kickable_opponents = wm._exist_kickable_teammates = False
+        for _ in range(cycles):
+            play_cycle(wm, players, rng)
+            for name, table in tables.items():
+                team_config.INCREMENTAL_INTERCEPT_TABLE = name == 'incremental'
+                start = timeit.default_timer()
+                table.update(wm)
+                times[name] += timeit.default_timer() - start
+            updates += 1
+            full, incremental = tables['full']._player_cycles, tables['incremental']._player_cycles
+            same += sum(full[slot][0] == incremental[slot][0] for slot in full)
+            compared += len(full)
+    team_config.INCREMENTAL_INTERCEPT_TABLE = incremental_table
+    table = tables['incremental']
+    print(f'table: {updates} updates, ball cache hits={table.ball_cache_hits()} misses={table.ball_cache_misses()}, '
+          f'same player reach cycles: {same / compared:.1%}')
+    for name, t in times.items():
+        print(f'  {name:<12} {t / updates * 1000:7.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,264 @@
+"""
+the recursive MessageParamsParser and the string splitting fullstate parsers that lib.parser.sexp_parser replaced,
+kept as the baseline of benchmarks.message_parsers.
+"""
+
+
+class LegacyMessageParamsParser:
+    def __init__(self):
+        self._dic = {}
+
+    @staticmethod
+    def _parse(dic, string: str):
+        string = string.strip(" ()")
+        if len(string) < 3:
+            return
+        key = string.split(" ")[0].strip("()")
+        value = string[string.find(" "):]
+        if not LegacyMessageParamsParser.need_dict(value):
+            if value.find(")") == -1:
+                dic[key] = value.strip()
+            else:
+                dic[key] = value[:value.find(")")].strip()
+            LegacyMessageParamsParser._parse(dic, value[value.find(")"):])
+        else:
+            dic[key] = {}
+            end_of_dic = LegacyMessageParamsParser.end_of_dic(value)
+            if end_of_dic == -1:
+                LegacyMessageParamsParser._parse(dic[key], value[:])
+            else:
+                LegacyMessageParamsParser._parse(dic[key], value[:end_of_dic])
+            LegacyMessageParamsParser._parse(dic, value[end_of_dic:])
+
+    @staticmethod
+    def need_dict(string):
+        if string.find("(") == -1:
+            return False
+        return string.find(")") > string.find("(")
+
+    @staticmethod
+    def end_of_dic(string):
+        k = 1
+        for i in range(len(string)):
+            if string[i] == "(":
+                k += 1
+            elif string[i] == ")":
+                k -= 1
+            if k == 0:
+                return i
+        return -1
+
+    def parse(self, string):
+        LegacyMessageParamsParser._parse(self._dic, string)
+        return self._dic
+
+    def dic(self):
+        return self._dic
+
+
+class LegacyFullStateWorldMessageParser:
+    def __init__(self):
+        self._dic = {}
+        self._kick = 0
+        self._dash = 0
+        self._turn = 0
+        self._catch = 0
+        self._move = 0
+        self._turn_neck = 0
+        self._change_view = 0
+        self._say = 0
+
+    def parse(self, message: str):
+        self._dic['time'] = message.split(" ")[1]
+        message = message[message.find("(", 1):-1]
+
+        # before parsing players
+        msg = message[:message.find("((p")]
+        LegacyMessageParamsParser._parse(self._dic, msg)
+
+        data = list(map(int, self._dic['count'].split(' ')))
+
+        self._kick = data[0]
+        self._dash = data[1]
+        self._turn = data[2]
+        self._catch = data[3]
+        self._move = data[4]
+        self._turn_neck = data[5]
+        self._change_view = data[6]
+        self._say = data[7]
+
+        # and now parsing players
+        msg = message[message.find("((p"):]
+        self._dic.update(LegacyFullStatePlayerParser().parse(msg))
+
+    def dic(self):
+        return self._dic
+
+
+class LegacyFullStatePlayerParser:
+    def __init__(self):
+        self._dic = {}
+
+    @staticmethod
+    def _parser(dic: dict, message: str):
+        players = []
+        seek = 0
+        while seek < len(message):
+            seek = message.find("((p", seek)
+            next_seek = message.find("((p", seek + 1)
+
+            if next_seek == -1:
+                next_seek = len(message)
+            msg = message[seek: next_seek].strip(" ()").split(" ")
+            k = 0
+            kk = 0
+            use_point_to = 0
+            if msg[3] == 'g':
+                k = 1
+            if msg[15 + k].find('stamina') > 0:
+                use_point_to = 2
+            player_dic = {
+                "side_id": msg[1],
+                "unum": msg[2],
+                "player_type": msg[3 + k].strip("()"),
+                "pos_x": msg[4 + k],
+                "pos_y": msg[5 + k],
+                "vel_x": msg[6 + k],
+                "vel_y": msg[7 + k],
+                "body": msg[8 + k],
+                "neck": msg[9 + k],
+                "stamina": {
+                    "stamina": msg[14 + k + kk + use_point_to],
+                    "effort": msg[15 + k + kk + use_point_to],
+                    "recovery": msg[16 + k + kk + use_point_to],
+                    "capacity": msg[17 + k + kk + use_point_to].strip("()")
+                },
+                "focus_dist": msg[11 + k + kk + use_point_to],
+                "focus_dir": msg[12 + k + kk + use_point_to].strip("()")
+            }
+            if use_point_to == 2:
+                player_dic["pointto_dist"] = msg[10 + k].strip("()")
+                player_dic["pointto_dir"] = msg[11 + k].strip("()")
+            if k == 1:
+                player_dic['goalie'] = 'g'
+            players.append(player_dic)
+            seek = next_seek
+        dic["players"] = players
+
+    @staticmethod
+    def n_inner_dict(message: str):
+        # dlog.debug(f"message {message}")
+        n = 0
+        for c in message[1:-1]:
+            if c == '(':
+                n += 1
+        # dlog.debug(f"n {n}")
+        return n
+
+    def parse(self, message):
+        LegacyFullStatePlayerParser._parser(self._dic, message)
+        return self._dic
+
+
+class LegacyGlobalFullStateWorldMessageParser:
+    def __init__(self):
+        self._dic = {}
+
+    def parse(self, message: str):
+        self._dic['time'] = message.split(" ")[1]
+        message = message[message.find("(", 1):-1]
+
+        # parsing ball
+        msg = message[:message.find("((p")]
+        LegacyMessageParamsParser._parse(self._dic, msg)
+
+        # and now parsing players
+        msg = message[message.find("((p"):]
+        self._dic.update(LegacyGlobalPlayerParser().parse(msg))
+        self._dic.update({"teams": {
+            "team_left": LegacyGlobalPlayerParser._team_l,
+            "team_right": LegacyGlobalPlayerParser._team_r
+        }})
+
+    def dic(self):
+        return self._dic
+
+
+class LegacyGlobalPlayerParser:
+    _team_l = None
+    _team_r = None
+
+    def __init__(self):
+        self._dic = {}
+
+    @staticmethod
+    def _parser(dic: dict, message: str):
+        players = []
+        seek = 0
+        if len(message) < 5:
+            return
+        while seek < len(message):
+            seek = message.find("((p", seek)
+            next_seek = message.find("((p", seek + 1)
+
+            if next_seek == -1:
+                next_seek = len(message)
+            msg = message[seek: next_seek].strip(" ()").split(" ")
+            k = -1
+            kk = 0
+            if msg[3] == 'g' or msg[3] == 'goalie)':
+                k = 0
+            player_dic = {
+                "unum": msg[2].strip("()"),
+                "pos_x": msg[4 + k],
+                "pos_y": msg[5 + k],
+                "vel_x": msg[6 + k],
+                "vel_y": msg[7 + k],
+                "body": msg[8 + k],
+                "neck": msg[9 + k],
+            }
+            if LegacyGlobalPlayerParser._team_l == msg[1]:
+                player_dic['side_id'] = 'l'
+            elif LegacyGlobalPlayerParser._team_r == msg[1]:
+                player_dic['side_id'] = 'r'
+            elif LegacyGlobalPlayerParser._team_l is None:
+                LegacyGlobalPlayerParser._team_l = msg[1]
+                player_dic['side_id'] = 'l'
+            elif LegacyGlobalPlayerParser._team_r is None:
+                LegacyGlobalPlayerParser._team_r = msg[1]
+                player_dic['side_id'] = 'r'
+
+            if k == 0:
+                player_dic['goalie'] = 'g'
+            ext = []
+            if ((k == 0 and len(msg) > 10)
+                    or (k == -1 and len(msg) > 9)):
+                ext = msg[10 + k:]
+            if 'k' in ext:
+                player_dic['kick'] = True
+            if 't' in ext:
+                player_dic['tackle'] = True
+            if 'f' in ext:
+                player_dic['charged'] = True
+            if 'y' in ext:
+                player_dic['card'] = 'y'
+            if 'r' in ext:
+                player_dic['card'] = 'r'
+
+            players.append(player_dic)
+            seek = next_seek
+        dic["players"] = players
+
+    @staticmethod
+    def n_inner_dict(message: str):
+        # dlog.debug(f"message {message}")
+        n = 0
+        for c in message[1:-1]:
+            if c == '(':
+                n += 1
+        # dlog.debug(f"n {n}")
+        return n
+
+    def parse(self, message):
+        LegacyGlobalPlayerParser._parser(self._dic, message)
+        return self._dic
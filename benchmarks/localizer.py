@@ -0,0 +1,164 @@
+"""
+self localization with the numpy particle set (lib.player.localizer.Localizer) against the Vector2D particles
+it replaced (LegacyLocalizer below, a verbatim copy of the old particle methods), on the see message of
+tests/test_visual_sensor.py.
+  - time: estimate_self_face + localize_self, i.e. the see -> self position part of WorldModel.update_by_see
+  - position: distance between the positions of both localizers (resampling noise is random)
+run from the repository root:
+    python -m benchmarks.localizer [repeat]
+"""
+import random
+import statistics
+import sys
+import timeit
+from typing import Union
+
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.sector_2d import Sector2D
+from pyrusgeom.soccer_math import min_max
+from pyrusgeom.vector_2d import Vector2D
+
+import math
+
+from fixtures.messages import SEE
+from lib.debug.debug import log
+from lib.player.localizer import Localizer
+from lib.player.sensor.visual_sensor import SeeParser
+from lib.rcsc.game_time import GameTime
+from lib.rcsc.types import MarkerID, ViewWidth
+
+
+class LegacyLocalizer(Localizer):
+    def generate_points(self, view_width: ViewWidth, marker, marker_id: MarkerID, self_face: float, self_face_error: float):
+        marker_pos = self._object_table.landmark_map.get(marker_id)
+        if marker_pos is None:
+            return
+        ave_dist, dist_err = self._object_table.get_landmark_distance_range(view_width, marker.dist_)
+        ave_dir, dir_err = self.get_dir_range(marker.dir_, self_face, self_face_error)
+        ave_dir += 180.0
+        min_dist = ave_dist - dist_err
+        dist_range = dist_err * 2.0
+        dist_inc = max(0.01, dist_err / 16.0)
+        dist_loop = min_max(2, int(math.ceil(dist_range / dist_inc)), 16)
+        dist_inc = dist_range / (dist_loop - 1)
+        dir_range = dir_err * 2.0
+        circum = 2.0 * ave_dist * 3.141592 * (dir_range / 360.0)
+        circum_inc = max(0.01, circum / 32.0)
+        dir_loop = int(min_max(2, int(math.ceil(circum / circum_inc)), 32))
+        dir_inc = dir_range / (dir_loop - 1)
+        base_angle = AngleDeg(ave_dir - dir_err)
+        for i_dir in range(dir_loop):
+            base_angle += dir_inc
+            base_vec = Vector2D.polar2vector(1.0, base_angle)
+            add_dist = 0.0
+            for i_dist in range(dir_loop):
+                add_dist += dist_inc
+                self._points.append(marker_pos + (base_vec * (min_dist + add_dist)))
+
+    def update_points_by_markers(self, view_width: ViewWidth, markers, self_face: float, self_face_error: float):
+        counter = 0
+        for i in range(1, len(markers)):
+            if counter >= 30:
+                break
+            self.update_points_by(view_width, markers[i], markers[i].id_, self_face, self_face_error)
+            self.resample_points(view_width, markers[0], markers[0].id_, self_face, self_face_error)
+
+    def update_points_by_behind_marker(self, view_width, markers, behind_markers, self_pos, self_face, self_face_error):
+        if len(behind_markers) == 0:
+            return
+        marker_id = self.get_nearest_marker(behind_markers[0].object_type_, self_pos)
+        if marker_id == MarkerID.Marker_Unknown:
+            return
+        self.update_points_by(view_width, behind_markers[0], marker_id, self_face, self_face_error)
+        if len(self._points) == 0:
+            return
+
+        self.generate_points(view_width, behind_markers[0], marker_id, self_face, self_face_error)
+        if len(self._points) == 0:
+            return
+
+        counter = 0
+        for i in range(1, len(markers)):
+            if counter >= 20:
+                break
+            self.update_points_by(view_width, markers[i], markers[i].id_, self_face, self_face_error)
+            self.resample_points(view_width, markers[0], markers[0].id_, self_face, self_face_error)
+
+    def update_points_by(self, view_width: ViewWidth, marker, marker_id, self_face: float, self_face_error: float):
+        marker_pos = self._object_table.landmark_map.get(marker_id)
+        ave_dist, dist_error = self._object_table.get_landmark_distance_range(view_width, marker.dist_)
+
+        ave_dir, dir_error = self.get_dir_range(marker.dir_, self_face, self_face_error)
+        ave_dir += 180.0
+
+        sector = Sector2D(marker_pos, ave_dist - dist_error, ave_dist + dist_error, AngleDeg(ave_dir - dir_error), AngleDeg(ave_dir + dir_error))
+        self._points = list(filter(lambda p: sector.contains(p), self._points))
+
+    def resample_points(self, view_width: ViewWidth, marker, marker_id, self_face: float, self_face_error: float):
+        if len(self._points) >= 50:
+            return
+        if len(self._points) == 0:
+            self.generate_points(view_width, marker, marker_id, self_face, self_face_error)
+            return
+        point_size = len(self._points)
+        for i in range(len(self._points), 51):
+            choose_index = random.randint(0, point_size - 1)
+            self._points.append(self._points[choose_index] + Vector2D(random.uniform(-0.01, 0.01), random.uniform(-0.01, 0.01)))
+
+    def clear_points(self):
+        self._points = []
+
+    def average_points(self) -> tuple[Union[None, Vector2D], Vector2D]:
+        ave_pos = Vector2D(0.0, 0.0)
+        ave_err = Vector2D(0.0, 0.0)
+        if len(self._points) == 0:
+            return None, Vector2D(0, 0)
+        max_x = self._points[0].x()
+        min_x = max_x
+        max_y = self._points[0].y()
+        min_y = max_y
+        for p in self._points:
+            ave_pos += p
+            if p.x() > max_x:
+                max_x = p.x()
+            elif p.x() < min_x:
+                min_x = p.x()
+            if p.y() > max_y:
+                max_y = p.y()
+            elif p.y() < min_y:
+                min_y = p.y()
+        ave_pos = ave_pos / float(len(self._points))
+        ave_err.set_x((max_x - min_x) / 2.0)
+        ave_err.set_y((max_y - min_y) / 2.0)
+        return ave_pos, ave_err
+
+
+def localize(localizer: Localizer, see: SeeParser):
+    face, face_error = localizer.estimate_self_face(see, ViewWidth.NORMAL)
+    return localizer.localize_self(see, ViewWidth.NORMAL, face, face_error)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    log.set_sw_levels(0)
+    see = SeeParser()
+    see.parse(SEE, 'HELIOS_base', GameTime(-1, -1))
+    legacy, new = LegacyLocalizer(), Localizer()
+
+    diffs = []
+    for _ in range(repeat):
+        legacy_pos, legacy_err, _ = localize(legacy, see)
+        new_pos, new_err, _ = localize(new, see)
+        diffs.append(legacy_pos.dist(new_pos))
+    print(f'legacy pos={legacy_pos} err={legacy_err}')
+    print(f'numpy  pos={new_pos} err={new_err}')
+    print(f'position difference: mean={statistics.mean(diffs):.4f} max={max(diffs):.4f}')
+
+    legacy_us = min(timeit.repeat(lambda: localize(legacy, see), number=repeat, repeat=5)) / repeat * 1e6
+    new_us = min(timeit.repeat(lambda: localize(new, see), number=repeat, repeat=5)) / repeat * 1e6
+    print(f'legacy {legacy_us:10.1f} us')
+    print(f'numpy  {new_us:10.1f} us  ({legacy_us / new_us:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+time spent in the decision thread to hand a cycle of soccer window log over to a slow sink (a file whose write
+takes SINK_DELAY sec, as a busy disk or nfs), written in place as before against queued to the LogWriter thread.
+run from the repository root:
+    python -m benchmarks.log_writer [cycles]
+"""
+import io
+import sys
+import time
+
+from lib.debug.log_writer import LogWriter
+
+SINK_DELAY = 0.002
+CYCLE_LOG = ''.join(f'{c},0 4 M message of the cycle number {c}\n' for c in range(200))
+
+
+class SlowFile(io.StringIO):
+    def write(self, data):
+        time.sleep(SINK_DELAY)
+        return super().write(data)
+
+
+def in_place(cycles: int):
+    sink = SlowFile()
+    start = time.perf_counter()
+    for _ in range(cycles):
+        sink.write(CYCLE_LOG)
+    return time.perf_counter() - start
+
+
+def queued(cycles: int):
+    sink = SlowFile()
+    writer = LogWriter(capacity=cycles)
+    start = time.perf_counter()
+    for _ in range(cycles):
+        writer.put(sink, CYCLE_LOG)
+    elapsed = time.perf_counter() - start
+    writer.close(None)
+    assert len(sink.getvalue()) == cycles * len(CYCLE_LOG) and writer.dropped() == 0
+    return elapsed
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    for name, f in (('in place', in_place), ('queued', queued)):
+        elapsed = min(f(cycles) for _ in range(3))
+        print(f'{name:<9} {elapsed / cycles * 1e6:9.1f} us/cycle')
+
+
+if __name__ == '__main__':
+    main()
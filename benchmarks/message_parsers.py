@@ -0,0 +1,50 @@
+"""
+microbenchmarks of the server message parsers: the recursive parsers (benchmarks.legacy_message_parsers) against
+the single pass s-expression parser (lib.parser.sexp_parser), on the messages of fixtures.messages.
+  - server_param: ServerParam.parse input, once per game
+  - player_type: PlayerType.parse input, 18 per game
+  - fullstate: FullStateWorldMessageParser input, every cycle with fullstate on
+  - see_global: GlobalFullStateWorldMessageParser input, every cycle for the coach
+legacy parsers return strings, the new ones return ints and floats (the conversion the world model used to do).
+run from the repository root:
+    python -m benchmarks.message_parsers [repeat]
+"""
+import sys
+import timeit
+
+from benchmarks.legacy_message_parsers import LegacyGlobalFullStateWorldMessageParser, \
+    LegacyFullStateWorldMessageParser, LegacyMessageParamsParser
+from fixtures.messages import FULLSTATE, PLAYER_TYPES, SEE_GLOBAL, SERVER_PARAM
+from lib.parser.global_message_parser import GlobalFullStateWorldMessageParser
+from lib.parser.parser_message_fullstate_world import FullStateWorldMessageParser
+from lib.parser.parser_message_params import MessageParamsParser
+
+
+def bench(func, message: str, repeat: int):
+    number = max(1, repeat)
+    best = min(timeit.repeat(lambda: func(message), number=number, repeat=9))
+    return best / number * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cases = (
+        ('server_param', SERVER_PARAM,
+         lambda m: LegacyMessageParamsParser().parse(m), lambda m: MessageParamsParser().parse(m)),
+        ('player_type', PLAYER_TYPES[1],
+         lambda m: LegacyMessageParamsParser().parse(m), lambda m: MessageParamsParser().parse(m)),
+        ('fullstate', FULLSTATE,
+         lambda m: LegacyFullStateWorldMessageParser().parse(m), lambda m: FullStateWorldMessageParser().parse(m)),
+        ('see_global', SEE_GLOBAL,
+         lambda m: LegacyGlobalFullStateWorldMessageParser().parse(m),
+         lambda m: GlobalFullStateWorldMessageParser().parse(m)),
+    )
+    print(f'{"message":<14}{"bytes":>7}{"legacy us":>12}{"sexp us":>12}{"speedup":>10}')
+    for name, message, legacy, new in cases:
+        old_us = bench(legacy, message, repeat)
+        new_us = bench(new, message, repeat)
+        print(f'{name:<14}{len(message):>7}{old_us:>12.1f}{new_us:>12.1f}{old_us / new_us:>9.2f}x')
+
+
+if __name__ == '__main__':
+    main()
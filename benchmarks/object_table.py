@@ -0,0 +1,132 @@
+"""
+the distance tables of ObjectTable against the lists and dict they replaced (LegacyObjectTable below, a verbatim
+copy of the old lookups), on every quantized distance and on the see message of fixtures/messages.py:
+  - one lookup: get_landmark_distance_range and get_distance_range
+  - see message: the ranges of its markers, ball and players, one lookup each or with the batch lookups
+  - table: the construction of an ObjectTable (the landmark map, and the 434 table entries of the legacy one)
+the ranges must be the same.
+run from the repository root:
+    python -m benchmarks.object_table [repeat]
+"""
+import sys
+import timeit
+
+from fixtures.messages import SEE
+from lib.player.object_table import LANDMARK_DISTANCE_TABLE, MOVABLE_DISTANCE_TABLE, ObjectTable
+from lib.player.sensor.visual_sensor import SeeParser
+from lib.rcsc.game_time import GameTime
+from lib.rcsc.types import ViewWidth
+
+
+def lower_bound(nums, target):
+    l, r = 0, len(nums) - 1
+    while l <= r:
+        mid = int(l + (r - l) / 2)
+        if nums[mid] >= target:
+            r = mid - 1
+        else:
+            l = mid + 1
+    return l
+
+
+class DataEntry:
+    def __init__(self, seen_dist=0.0, average=0.0, error=0.0):
+        self.seen_dist: float = seen_dist
+        self.average: float = average
+        self.error: float = error
+
+
+class LegacyObjectTable(ObjectTable):
+    def __init__(self):
+        super().__init__()
+        # create_table, with the entries of the new tables
+        self.static_table = [DataEntry(*row) for row in LANDMARK_DISTANCE_TABLE]
+        self.movable_table = [DataEntry(*row) for row in MOVABLE_DISTANCE_TABLE]
+        self.static_table_seen_dist_dict: dict[float, int] = {}
+        self.movable_table_seen_dist_dict: dict[float, int] = {}
+        for i in range(len(self.static_table)):
+            self.static_table_seen_dist_dict[self.static_table[i].seen_dist] = i
+        for i in range(len(self.movable_table)):
+            self.movable_table_seen_dist_dict[self.movable_table[i].seen_dist] = i
+
+    def get_landmark_distance_range(self, view_width: ViewWidth, quantized_dist: float):
+        static_table = self.static_table
+        keys_dict = self.static_table_seen_dist_dict
+        key = lower_bound(list(keys_dict.keys()), quantized_dist)
+        index = keys_dict[list(keys_dict.keys())[key]]
+        average = static_table[index].average
+        error = static_table[index].error
+        return average, error
+
+    def get_distance_range(self, view_width: ViewWidth, quantized_dist: float):
+        movable_table = self.movable_table
+        keys_dict = self.movable_table_seen_dist_dict
+        key = lower_bound(list(keys_dict.keys()), quantized_dist)
+        index = keys_dict[list(keys_dict.keys())[key]]
+        average = movable_table[index].average
+        error = movable_table[index].error
+        return average, error
+
+
+def quantized_dists(table) -> list[float]:
+    """
+    every distance of a see message up to the last row of the table
+    """
+    return [round(d * 0.1, 1) for d in range(int(table[-1][0] * 10) + 1)]
+
+
+def see_dists() -> tuple[list[float], list[float]]:
+    """
+    the distances of the markers, and of the ball and players, of the see message
+    """
+    see = SeeParser()
+    see.parse(SEE, 'HELIOS_base', GameTime(245, 0))
+    markers = [m.dist_ for m in see.markers() + see.behind_markers()]
+    movables = [b.dist_ for b in see.balls()]
+    for players in (see.teammates(), see.unknown_teammates(), see.opponents(), see.unknown_opponents(),
+                    see.unknown_players()):
+        movables += [p.dist_ for p in players]
+    return markers, movables
+
+
+def see_ranges(table: ObjectTable, markers: list[float], movables: list[float]):
+    return ([table.get_landmark_distance_range(ViewWidth.NORMAL, d) for d in markers],
+            [table.get_distance_range(ViewWidth.NORMAL, d) for d in movables])
+
+
+def see_batch_ranges(table: ObjectTable, markers: list[float], movables: list[float]):
+    return (table.get_landmark_distance_ranges(ViewWidth.NORMAL, markers),
+            table.get_distance_ranges(ViewWidth.NORMAL, movables))
+
+
+def same_ranges(legacy: ObjectTable, table: ObjectTable) -> bool:
+    landmarks = quantized_dists(LANDMARK_DISTANCE_TABLE)
+    movables = quantized_dists(MOVABLE_DISTANCE_TABLE)
+    same = see_ranges(legacy, landmarks, movables) == see_ranges(table, landmarks, movables)
+    averages, errors = table.get_landmark_distance_ranges(ViewWidth.NORMAL, landmarks)
+    same &= list(zip(averages.tolist(), errors.tolist())) == see_ranges(table, landmarks, [])[0]
+    averages, errors = table.get_distance_ranges(ViewWidth.NORMAL, movables)
+    return same and list(zip(averages.tolist(), errors.tolist())) == see_ranges(table, [], movables)[1]
+
+
+def measure(call, repeat: int) -> float:
+    return min(timeit.repeat(call, number=repeat, repeat=5)) / repeat * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    legacy = LegacyObjectTable()
+    table = ObjectTable()
+    markers, movables = see_dists()
+    print(f'same ranges: {same_ranges(legacy, table)}, see message: {len(markers)} markers, '
+          f'{len(movables)} ball and players')
+    for kind, t in (('legacy', legacy), ('bisect', table)):
+        print(f'{kind:<8s} landmark {measure(lambda: t.get_landmark_distance_range(ViewWidth.NORMAL, 37.3), repeat):6.2f} us'
+              f'  movable {measure(lambda: t.get_distance_range(ViewWidth.NORMAL, 37.3), repeat):6.2f} us'
+              f'  see {measure(lambda: see_ranges(t, markers, movables), repeat):7.1f} us')
+    print(f'batch    see {measure(lambda: see_batch_ranges(table, markers, movables), repeat):7.1f} us')
+    print(f'table    legacy {measure(LegacyObjectTable, 200):7.1f} us  new {measure(ObjectTable, 200):7.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+cycles per second of a SamplePlayer with fullstate on, with and without team_config.ORACLE_FULL_STATE:
+  - full + real: the default, the real world is updated from the see messages (localization, player matching)
+    and the full world from the fullstate messages
+  - oracle: only the full world is updated, see messages are not parsed
+both replay the same synthetic recording of fixtures.recordings (sense_body, fullstate and see every cycle).
+the decisions are made on the full world in both modes, so no command may differ from the recording.
+run from the repository root:
+    python -m benchmarks.oracle [cycles] [rounds]
+"""
+import os
+import sys
+import tempfile
+
+import team_config
+from base.sample_player import SamplePlayer
+from fixtures.recordings import synthesize
+from lib.player.replay import Replay
+
+MODES = {'full + real': False, 'oracle': True}
+
+
+def main():
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    team_config.DISABLE_FILE_LOG = True
+    path = os.path.join(tempfile.mkdtemp(), 'fullstate.rec')
+    synthesize(path, cycles, fullstate=True)
+    replay = Replay(path)
+
+    best = {mode: 0. for mode in MODES}
+    for _ in range(rounds):
+        for mode, oracle in MODES.items():
+            team_config.ORACLE_FULL_STATE = oracle
+            result = replay.run(SamplePlayer)
+            best[mode] = max(best[mode], result.cycles_per_sec())
+            if result.mismatches:
+                print(f'{mode}: {result}')
+    for mode, cycles_per_sec in best.items():
+        print(f'{mode:<12} {cycles_per_sec:8.1f} cycles/sec')
+    print(f'oracle gain  {best["oracle"] / best["full + real"]:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,342 @@
+"""
+pass generation with the batched opponent reach steps (base.pass_evaluator.PassEvaluator) against the per
+(course, step, opponent, cycle) loop it replaced (LegacyBhvPassGen below, a verbatim copy of the old methods).
+the worlds are fixtures.worlds.make_world, the opponents are moved randomly (seed = world number).
+  - direct: direct passes only, the passes of the run before the batched evaluation
+  - all: direct, lead and through passes
+both generators must make the same candidates.
+run from the repository root:
+    python -m benchmarks.pass_gen [worlds] [repeat]
+"""
+import sys
+import time
+
+from pyrusgeom.geom_2d import *
+import pyrusgeom.soccer_math as smath
+
+import team_config
+from base.generator_action import KickAction, KickActionType
+from base.generator_pass import BhvPassGen
+from base.tools import Tools
+from fixtures.worlds import make_world
+from lib.debug.debug import log
+from lib.rcsc.server_param import ServerParam as SP
+from lib.rcsc.types import GameModeType
+
+
+class DirectPasses:
+    """
+        mixin of a pass generator making direct passes only
+    """
+    def generate_lead_pass(self, wm, receiver):
+        pass
+
+    def generate_through_pass(self, wm, receiver):
+        pass
+
+
+class LegacyBhvPassGen(BhvPassGen):
+    def evaluate_passes(self, wm):
+        pass
+
+    def create_pass(self, wm: 'WorldModel', receiver, receive_point: Vector2D,
+                    min_step, max_step, min_first_ball_speed, max_first_ball_speed,
+                    min_receive_ball_speed, max_receive_ball_speed,
+                    ball_move_dist, ball_move_angle: AngleDeg, description):
+        sp = SP.i()
+
+        for step in range(min_step, max_step + 1):
+            if self.out_of_time():
+                break
+            self.index += 1
+            first_ball_speed = smath.calc_first_term_geom_series(ball_move_dist, sp.ball_decay(), step)
+
+            if first_ball_speed < min_first_ball_speed:
+                if log.sw_log().pass_().enabled:
+                    log.sw_log().pass_().add_text(
+                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, first ball speed is low', self.index,
+                                      receiver.unum(),
+                                      receiver.pos(),
+                                      step,
+                                      first_ball_speed)
+                    self.debug_list.append((self.index, receive_point, False))
+                break
+
+            if max_first_ball_speed < first_ball_speed:
+                if log.sw_log().pass_().enabled:
+                    log.sw_log().pass_().add_text(
+                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, first ball speed is high', self.index,
+                                      receiver.unum(),
+                                      receiver.pos(),
+                                      step,
+                                      first_ball_speed)
+                    self.debug_list.append((self.index, receive_point, False))
+                continue
+
+            receive_ball_speed = first_ball_speed * pow(sp.ball_decay(), step)
+
+            if receive_ball_speed < min_receive_ball_speed:
+                if log.sw_log().pass_().enabled:
+                    log.sw_log().pass_().add_text(
+                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, rball_speed:{}, receive ball speed is low', self.index,
+                                      receiver.unum(),
+                                      receiver.pos(),
+                                      step,
+                                      first_ball_speed,
+                                      receive_ball_speed)
+                    self.debug_list.append((self.index, receive_point, False))
+                break
+
+            if max_receive_ball_speed < receive_ball_speed:
+                if log.sw_log().pass_().enabled:
+                    log.sw_log().pass_().add_text(
+                                  '##Pass {},to {} {}, step:{}, ball_speed:{}, rball_speed:{}, receive ball speed is high', self.index,
+                                      receiver.unum(),
+                                      receiver.pos(),
+                                      step,
+                                      first_ball_speed,
+                                      receive_ball_speed)
+                    self.debug_list.append((self.index, receive_point, False))
+                continue
+
+            kick_count = Tools.predict_kick_count(wm, wm.self().unum(), first_ball_speed, ball_move_angle)
+
+            o_step, o_unum, o_intercepted_pos = self.predict_opponents_reach_step(wm, wm.ball().pos(),
+                                                                                  first_ball_speed, ball_move_angle,
+                                                                                  receive_point, step + (kick_count - 1) + 5,
+                                                                                  description)
+
+            failed = False
+            if description == 'T':
+                if o_step <= step:
+                    failed = True
+            else:
+                if o_step <= step + (kick_count - 1):
+                    failed = True
+            if failed:
+                if log.sw_log().pass_().enabled:
+                    log.sw_log().pass_().add_text(
+                                  '------<<<<<Failed Pass #{} to {} in {} speed {}, opp {} cut in {} cycle {}, max_step {} step {}', self.index,
+                                                                                                                                  receiver.unum(),
+                                                                                                                                  receive_point,
+                                                                                                                                  first_ball_speed,
+                                                                                                                                  o_unum,
+                                                                                                                                  o_step,
+                                                                                                                                  o_intercepted_pos,
+                                                                                                                                  max_step,
+                                                                                                                                  step)
+                    self.debug_list.append((self.index, receive_point, False))
+                break
+            if log.sw_log().pass_().enabled:
+                log.sw_log().pass_().add_text(
+                              '------>>>>> OK Pass {} to {} {}, opp {} step {} max_step {}', self.index,
+                                                                                                   receiver.unum(),
+                                                                                                   receive_point,
+                                                                                                   o_unum,
+                                                                                                   o_step,
+                                                                                                   max_step)
+            self.debug_list.append((self.index, receive_point, True))
+            
+            candidate = KickAction()
+            candidate.type = KickActionType.Pass
+            candidate.start_ball_pos = wm.ball().pos()
+            candidate.target_ball_pos = receive_point
+            candidate.target_unum = receiver.unum()
+            candidate.start_ball_speed = max_first_ball_speed
+            candidate.evaluate(wm)
+            candidate.eval += 5
+            opp_min = wm.intercept_table().opponent_reach_cycle()
+            if opp_min <= 5:
+                candidate.eval += 30
+            else:
+                candidate.eval -= 10
+
+            if candidate.target_ball_pos.abs_y() <= 5:
+                candidate.eval += 30
+
+            if candidate.target_ball_pos.x() <= -50:
+                candidate.eval -= 1000
+
+            if wm.game_mode() != GameModeType.PlayOn:
+                candidate.eval += 100
+
+            if wm.self().pos().abs_x() > 40:
+                candidate.eval += 30
+
+            if candidate.target_ball_pos.abs_x() <= 30 and candidate.target_ball_pos.x() > candidate.start_ball_pos.x():
+                candidate.eval += 10
+            if candidate.target_ball_pos.x() >= 40 and candidate.target_ball_pos.x() < candidate.start_ball_pos.x():
+                candidate.eval += 30
+            """
+
+            if wm.game_mode() != GameModeType.PlayOn:
+                candidate.eval += 100
+
+            if candidate.start_ball_pos.x() >= 30 and candidate.target_ball_pos.abs_y() <= 5:
+                candidate.eval += 60
+
+            if candidate.target_ball_pos.abs_y() >= 20:
+                candidate.eval -= 30
+
+            if candidate.target_ball_pos.abs_x() <= 30 and candidate.target_ball_pos.x() > candidate.start_ball_pos.x():
+                candidate.eval += 10
+            if candidate.target_ball_pos.x() >= 40 and candidate.target_ball_pos.x() < candidate.start_ball_pos.x():
+                candidate.eval += 30
+
+            opp_min = wm.intercept_table().opponent_reach_cycle()
+            if opp_min <= 5:
+                candidate.eval += 30
+            else:
+                candidate.eval -= 10
+
+            if wm.self().pos().abs_x() > 40:
+                candidate.eval += 30
+            """
+            self.candidates.append(candidate)
+
+            if self.best_pass is None or candidate.eval > self.best_pass.eval:
+                self.best_pass = candidate
+
+            find_another_pass = True
+            if not find_another_pass:
+                break
+            """
+            if o_step <= step + 3:
+                break
+
+            if min_step + 3 <= step:
+                break
+            """
+
+    def predict_opponents_reach_step(self, wm: 'WorldModel', first_ball_pos: Vector2D, first_ball_speed,
+                                     ball_move_angle: AngleDeg, receive_point: Vector2D, max_cycle, description):
+        first_ball_vel = Vector2D.polar2vector(first_ball_speed, ball_move_angle)
+        min_step = 1000
+        min_opp = 0
+        intercepted_pos = None
+        for opp in wm.opponents():
+            if opp is None or opp.unum() == 0:
+                continue
+            step, intercepted_pos = self.predict_opponent_reach_step(wm, opp, first_ball_pos, first_ball_vel, ball_move_angle,
+                                                                     receive_point, max_cycle, description)
+            if step < min_step:
+                min_step = step
+                min_opp = opp.unum()
+        return min_step, min_opp, intercepted_pos
+
+    def predict_opponent_reach_step(self, wm: 'WorldModel', opp: 'PlayerObject', first_ball_pos: Vector2D, first_ball_vel: Vector2D,
+                                    ball_move_angle: AngleDeg, receive_point: Vector2D, max_cycle, description):
+        sp = SP.i()
+
+        penalty_area = Rect2D(Vector2D(sp.their_penalty_area_line_x(), -sp.penalty_area_half_width() ),
+                                Size2D(sp.penalty_area_length(), sp.penalty_area_width()))
+        CONTROL_AREA_BUF = 0.15
+
+
+        opponent = opp
+        ptype = opponent.player_type()
+        min_cycle = Tools.estimate_min_reach_cycle(opponent.pos(), ptype.real_speed_max(), first_ball_pos,
+                                                   ball_move_angle)
+
+        if min_cycle < 0:
+            return 1000, None
+
+        for cycle in range(max(1, min_cycle), max_cycle + 1):
+            ball_pos = smath.inertia_n_step_point(first_ball_pos, first_ball_vel, cycle, sp.ball_decay())
+            control_area = sp.catchable_area() if opponent.is_goalie() and penalty_area.contains(ball_pos) else ptype.kickable_area()
+
+            inertia_pos = ptype.inertia_point(opponent.pos(), opponent.vel(), cycle)
+            target_dist = inertia_pos.dist(ball_pos)
+
+            dash_dist = target_dist
+            if description == 'T' \
+                and first_ball_vel.x() > 2.\
+                and ( receive_point.x() > wm.offside_line_x() or receive_point.x() > 30.):
+
+                pass
+            else:
+                dash_dist -= Tools.estimate_virtual_dash_distance(opp)
+            if dash_dist - control_area - CONTROL_AREA_BUF < 0.001:
+                return cycle, ball_pos
+
+            if description == 'T' \
+                and first_ball_vel.x() > 2.\
+                and ( receive_point.x() > wm.offside_line_x() or receive_point.x() > 30.):
+
+                dash_dist -= control_area
+            else:
+                if receive_point.x() < 25.:
+                    dash_dist -= control_area + 0.5
+                else:
+                    dash_dist -= control_area + 0.2
+
+            if dash_dist > ptype.real_speed_max() * (cycle + min(opponent.pos_count(), 5)):
+                continue
+
+            n_dash = ptype.cycles_to_reach_distance(dash_dist)
+            if n_dash > cycle + opponent.pos_count():
+                continue
+
+            n_turn = 0
+            if opponent.body_count() > 1:
+                n_turn = Tools.predict_player_turn_cycle(ptype, opponent.body(), opponent.vel().r(), target_dist,
+                                                         (ball_pos - inertia_pos).th(), control_area, True)
+
+            n_step = n_turn + n_dash if n_turn == 0 else n_turn + n_dash + 1
+
+            bonus_step = 0
+            if opponent.is_tackling():
+                bonus_step = -5
+            if n_step - bonus_step <= cycle:
+                return cycle, ball_pos
+        return 1000, None
+
+
+class LegacyDirectPasses(DirectPasses, LegacyBhvPassGen):
+    pass
+
+
+class BatchedDirectPasses(DirectPasses, BhvPassGen):
+    pass
+
+
+def candidate_table(candidates: list[KickAction]):
+    return [(c.target_unum, round(c.target_ball_pos.x(), 9), round(c.target_ball_pos.y(), 9), c.eval)
+            for c in candidates]
+
+
+def measure(cls, wm, repeat: int):
+    best = None
+    candidates = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        candidates = cls().generator(wm)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, candidates
+
+
+def main():
+    worlds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    team_config.SW_LOG_LEVELS = 'none'
+    team_config.DISABLE_FILE_LOG = True
+    for name, legacy, batched in (('direct', LegacyDirectPasses, BatchedDirectPasses),
+                                  ('all', LegacyBhvPassGen, BhvPassGen)):
+        legacy_ms = batched_ms = 0
+        count = 0
+        same = True
+        for seed in range(worlds):
+            wm = make_world(seed)
+            t, legacy_candidates = measure(legacy, wm, repeat)
+            legacy_ms += t
+            t, batched_candidates = measure(batched, wm, repeat)
+            batched_ms += t
+            count += len(batched_candidates)
+            same &= candidate_table(legacy_candidates) == candidate_table(batched_candidates)
+        print(f'{name:<7} legacy {legacy_ms / worlds:8.2f} ms  batched {batched_ms / worlds:8.2f} ms  '
+              f'candidates {count / worlds:6.1f}  same: {same}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+the player queries of the world model over random player positions, with the linear scans they replaced (verbatim
+copies below) against WorldModel.player_index():
+  - nearest teammate: Tools.get_nearest_teammate, as the pass generator calls it with its receivers
+  - teammates in region: WorldModel.exist_teammates_in with the penalty area of bhv_goalie_set_play and a circle
+  - nearest marker: Localizer.get_nearest_marker over the landmarks of the ObjectTable
+the results must be the same.
+run from the repository root:
+    python -m benchmarks.player_index [points] [worlds]
+"""
+import random
+import sys
+import time
+
+from pyrusgeom.geom_2d import *
+
+from base.tools import Tools
+from fixtures.worlds import make_world, randomize
+from lib.player.localizer import Localizer
+from lib.player.object_table import ObjectTable
+from lib.player.sensor.visual_sensor import SeeParser
+from lib.rcsc.server_param import ServerParam
+from lib.rcsc.types import MarkerID
+
+
+def legacy_get_nearest_teammate(wm, position: Vector2D, players: list = None):
+    if players is None:
+        players = wm.teammates()
+    best_player = None
+    min_dist2 = 1000
+    for player in players:
+        d2 = player.pos().dist2( position )
+        if d2 < min_dist2:
+            min_dist2 = d2
+            best_player = player
+
+    return best_player
+
+
+def legacy_exist_teammates_in(wm, region: Region2D, count_thr: int, with_goalie: bool):
+    for p in wm._teammates:
+        if p is None:
+            continue
+        if p.pos_count() > count_thr or p.is_ghost():
+            continue
+        if region.contains(p.pos()):
+            return True
+    return False
+
+
+def legacy_get_nearest_marker(object_type: SeeParser.ObjectType, pos: Vector2D):
+    if object_type == SeeParser.ObjectType.Obj_Goal_Behind:
+        return MarkerID.Goal_L if pos.x() < 0.0 else MarkerID.Goal_R
+    min_dist2 = 3.0 * 3.0
+    candidate = MarkerID.Marker_Unknown
+    for m, p in ObjectTable.i().landmark_map.items():
+        d2 = pos.dist(p)
+        if d2 < min_dist2:
+            min_dist2 = d2
+            candidate = m
+    return candidate
+
+
+def random_points(count: int, rng: random.Random) -> list[Vector2D]:
+    return [Vector2D(rng.uniform(-60, 60), rng.uniform(-40, 40)) for _ in range(count)]
+
+
+def regions(point: Vector2D) -> list[Region2D]:
+    SP = ServerParam.i()
+    penalty_area = Rect2D(Vector2D(-SP.pitch_half_length(), -SP.penalty_area_half_width()),
+                          Size2D(SP.penalty_area_length(), SP.penalty_area_width()))
+    return [penalty_area, Circle2D(point, 10.0)]
+
+
+def queries(wm, points: list[Vector2D], legacy: bool) -> list:
+    """
+    the results of every query on every point
+    """
+    localizer = Localizer()
+    receivers = [p for p in wm.teammates() if p is not None]
+    results = []
+    for point in points:
+        if legacy:
+            results.append(legacy_get_nearest_teammate(wm, point, receivers))
+            results.extend(legacy_exist_teammates_in(wm, r, 5, False) for r in regions(point))
+            results.append(legacy_get_nearest_marker(SeeParser.ObjectType.Obj_Marker, point))
+        else:
+            results.append(Tools.get_nearest_teammate(wm, point, receivers))
+            results.extend(wm.exist_teammates_in(r, 5, False) for r in regions(point))
+            results.append(localizer.get_nearest_marker(SeeParser.ObjectType.Obj_Marker, point))
+    return results
+
+
+def measure(wm, points: list[Vector2D], rng_seed: int) -> dict[str, float]:
+    """
+    microseconds per call of every query, legacy and indexed
+    """
+    localizer = Localizer()
+    receivers = [p for p in wm.teammates() if p is not None]
+    areas = [regions(p) for p in points]
+    calls = {
+        'nearest teammate': (lambda p, r: legacy_get_nearest_teammate(wm, p, receivers),
+                             lambda p, r: Tools.get_nearest_teammate(wm, p, receivers)),
+        'teammates in rect': (lambda p, r: legacy_exist_teammates_in(wm, r[0], 5, False),
+                              lambda p, r: wm.exist_teammates_in(r[0], 5, False)),
+        'teammates in circle': (lambda p, r: legacy_exist_teammates_in(wm, r[1], 5, False),
+                                lambda p, r: wm.exist_teammates_in(r[1], 5, False)),
+        'nearest marker': (lambda p, r: legacy_get_nearest_marker(SeeParser.ObjectType.Obj_Marker, p),
+                           lambda p, r: localizer.get_nearest_marker(SeeParser.ObjectType.Obj_Marker, p)),
+    }
+    times = {}
+    for name, (legacy, indexed) in calls.items():
+        for kind, call in (('legacy', legacy), ('indexed', indexed)):
+            start = time.process_time()
+            for p, r in zip(points, areas):
+                call(p, r)
+            times[f'{name} {kind}'] = (time.process_time() - start) / len(points) * 1e6
+    return times
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    worlds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    wm = make_world()
+    players = [p for p in wm.teammates() + wm.opponents() if p is not None]
+    rng = random.Random(0)
+    same = True
+    times = {}
+    for _ in range(worlds):
+        randomize(wm, players, rng)
+        wm.update_player_state_cache()
+        points = random_points(count, rng)
+        same &= queries(wm, points, True) == queries(wm, points, False)
+        for key, t in measure(wm, points, 0).items():
+            times[key] = times.get(key, 0.0) + t / worlds
+    print(f'{len(players)} players, {worlds} worlds x {count} points, same results: {same}')
+    for key, t in times.items():
+        print(f'  {key:<28s} {t:7.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+"""
+the association of the seen players with the known players of the world model in crowded scenes:
+  - greedy: WorldModel.check_team_player, one seen player after the other (team_config.BATCH_PLAYER_MATCHING off)
+  - batch: WorldModel.match_team_players, one cost matrix and one assignment for the seen players of a side
+the scenes are fixtures.player_scenes.scene with a circle of [spread] meters.
+run from the repository root:
+    python -m benchmarks.player_matching [scenes] [spread]
+"""
+import sys
+import time
+
+from fixtures.player_scenes import PLAYERS, errors, match, scene
+from lib.player.world_model import WorldModel
+
+
+def main():
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    spread = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    wm = WorldModel('real')
+    for kind, batch in (('greedy', False), ('batch', True)):
+        swaps = losses = 0
+        elapsed = 0.0
+        for seed in range(scenes):
+            known, seen, truth = scene(seed, spread)
+            start = time.process_time()
+            new_known = match(wm, known, seen, batch)
+            elapsed += time.process_time() - start
+            s, l = errors(known, new_known, truth)
+            swaps += s
+            losses += l
+        total = scenes * PLAYERS
+        print(f'{kind:<7s} {elapsed / scenes * 1e6:8.1f} us per see, '
+              f'swaps {swaps / total * 100:5.1f}%, losses {losses / total * 100:5.1f}%')
+
+
+if __name__ == '__main__':
+    main()
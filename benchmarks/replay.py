@@ -0,0 +1,37 @@
+"""
+replays player recordings (main.py --record DIR) offline and prints the cycles per second of the whole agent
+pipeline: message parsing, world model updates and decisions. compare commits by replaying the same recordings.
+without recordings a synthetic one of [cycles] cycles is made first with fixtures.recordings.synthesize (with the
+fullstate messages with --fullstate).
+run from the repository root:
+    python -m benchmarks.replay [--realtime] [--cycles N] [--fullstate] [recording ...]
+"""
+import argparse
+import os
+import tempfile
+
+import team_config
+from base.sample_player import SamplePlayer
+from fixtures.recordings import synthesize
+from lib.player.replay import Replay
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('recordings', nargs='*')
+    parser.add_argument('--realtime', action='store_true')
+    parser.add_argument('--cycles', type=int, default=200)
+    parser.add_argument('--fullstate', action='store_true')
+    args = parser.parse_args()
+
+    team_config.DISABLE_FILE_LOG = True
+    recordings = args.recordings
+    if not recordings:
+        recordings = [os.path.join(tempfile.mkdtemp(), 'synthetic.rec')]
+        synthesize(recordings[0], args.cycles, fullstate=args.fullstate)
+    for path in recordings:
+        print(f'{path}: {Replay(path).run(SamplePlayer, args.realtime)}')
+
+
+if __name__ == '__main__':
+    main()
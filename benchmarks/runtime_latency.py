@@ -0,0 +1,140 @@
+"""
+latency comparison between the polling loop (PlayerAgent.run) and the asyncio runtime (AgentRuntime).
+
+a fake server sends a sense_body message per simulated cycle, followed by a hear message at a random offset
+(like see/hear messages in a real game, it shifts the phase of the polling loop timeouts).
+two numbers are recorded:
+  - wake latency: send time -> time the agent handles the message
+  - deadline lateness: non-synch decision deadline (WAIT_TIME_THR_SYNCH_VIEW msec after the message) -> time
+    the decision actually runs
+run from the repository root:
+    python -m benchmarks.runtime_latency [n_messages]
+"""
+import asyncio
+import random
+import socket
+import statistics
+import sys
+import threading
+import time
+
+import team_config
+from lib.network.udp_socket import IPAddress, UDPSocket
+from lib.player.agent_runtime import run_agents
+from lib.player.soccer_agent import SoccerAgent
+
+CYCLE = 0.1
+DEADLINE_MSEC = team_config.WAIT_TIME_THR_SYNCH_VIEW
+
+
+class FakeServer(threading.Thread):
+    def __init__(self, n_messages: int, cycle: float):
+        super().__init__(daemon=True)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(('127.0.0.1', 0))
+        self._n = n_messages
+        self._cycle = cycle
+
+    def port(self):
+        return self._sock.getsockname()[1]
+
+    def run(self):
+        _, client = self._sock.recvfrom(1024)  # init
+        rng = random.Random(0)
+        for i in range(self._n):
+            self._sock.sendto(f'(sense_body {i} {time.perf_counter()})'.encode(), client)
+            offset = rng.uniform(0.001, DEADLINE_MSEC / 1000 - 0.001)
+            time.sleep(offset)
+            self._sock.sendto(f'(hear {i} {time.perf_counter()})'.encode(), client)
+            time.sleep(self._cycle - offset)
+
+
+class BenchAgent(SoccerAgent):
+    def __init__(self, n_messages: int):
+        super().__init__()
+        self._n = n_messages
+        self._received = 0
+        self._sense_time = None
+        self._decided = True
+        self.wake = []
+        self.late = []
+
+    def handle_start(self):
+        self._client.connect_to(IPAddress('127.0.0.1', team_config.PLAYER_PORT))
+        return self._client.send_message('(init bench)') > 0
+
+    def handle_message(self, message: str):
+        now = time.perf_counter()
+        sent = float(message.strip('()\x00').split(' ')[2])
+        self.wake.append((now - sent) * 1000)
+        if not message.startswith('(sense_body'):
+            return
+        self._sense_time = sent
+        self._decided = False
+        self._received += 1
+
+    def decision_delay_msec(self, waited_msec: int = 0):
+        if self._decided:
+            return None
+        left = DEADLINE_MSEC - (time.perf_counter() - self._sense_time) * 1000
+        return max(0, int(left + 0.999))
+
+    def handle_decision_timer(self, waited_msec: int = 0):
+        if self.decision_delay_msec() == 0:
+            self.late.append((time.perf_counter() - self._sense_time) * 1000 - DEADLINE_MSEC)
+            self._decided = True
+            if self._received >= self._n:
+                self._client.set_server_alive(False)
+
+    def handle_exit(self):
+        pass
+
+
+def bench_polling(n: int):
+    server = FakeServer(n, CYCLE)
+    server.start()
+    team_config.PLAYER_PORT = server.port()
+    agent = BenchAgent(n)
+    agent._client._socket = UDPSocket(IPAddress('127.0.0.1', server.port()))
+    agent._client.send_message('(init bench)')
+    # same structure as PlayerAgent.run: the decision deadline is only checked after each recv timeout
+    while agent._client.is_server_alive():
+        length, message, _ = agent._client.recv_message()
+        if len(message) > 0:
+            agent.handle_message(message.decode())
+        agent.handle_decision_timer()
+    server.join()
+    return agent
+
+
+def bench_async(n: int):
+    server = FakeServer(n, CYCLE)
+    server.start()
+    team_config.PLAYER_PORT = server.port()
+    agent = BenchAgent(n)
+
+    async def main():
+        await run_agents([agent])
+    asyncio.run(main())
+    server.join()
+    return agent
+
+
+def summary(name, values):
+    values = sorted(values)
+    p95 = values[int(len(values) * 0.95) - 1]
+    return f'{name:<22} mean={statistics.mean(values):7.3f}  p50={statistics.median(values):7.3f}  ' \
+           f'p95={p95:7.3f}  max={values[-1]:7.3f}'
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    for name, bench in (('polling (10ms recv)', bench_polling), ('asyncio runtime', bench_async)):
+        agent = bench(n)
+        print(f'--- {name}, {n} messages (msec)')
+        print(summary('wake latency', agent.wake))
+        print(summary('deadline lateness', agent.late))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+SeeParser.parse on the see message of tests/test_visual_sensor.py and on a message with the other kinds of
+seen objects (behind markers, goalie, kicking and tackling players, ...):
+  - legacy: MessageParamsParserSee, an Enum lookup and a new object per seen object and a sort of all the
+    lists after every object (LegacySeeParser below, a verbatim copy of the old method)
+  - scanner: one regex scan, the object key table and the pooled objects, the seen objects must be the same
+run from the repository root:
+    python -m benchmarks.see_parser [repeat]
+"""
+import sys
+import timeit
+
+from fixtures.messages import SEE, SEE_OTHER
+from lib.debug.debug import log
+from lib.parser.message_params_parser_see import MessageParamsParserSee
+from lib.player.sensor.visual_sensor import SeeParser
+from lib.rcsc.game_time import GameTime
+
+class LegacySeeParser(SeeParser):
+    def parse(self, message: str, team_name: str, current_time: GameTime):
+        if self._time == current_time:
+            return
+        self._time = current_time.copy()
+
+        self.clear_all()
+
+        object_data = MessageParamsParserSee().parse(message)
+        if object_data is None:
+            log.os_log().warn("No Object have seen!")
+            return
+        for key_value in object_data:
+            key = key_value[0]
+            value = key_value[1]
+            types = SeeParser.ObjectType
+            t: str = key[0]
+            if t in ['P', 'B', 'L']:
+                t = t.lower()
+            obj_type = types(t)
+            
+            value = value.strip(")")
+
+            if obj_type == types.Obj_Marker or obj_type == types.Obj_Goal:
+                self._markers.append(SeeParser.MarkerT.parse_string(
+                    key, value, obj_type, self._marker_map))
+            elif obj_type == types.Obj_Marker_Behind or obj_type == types.Obj_Goal_Behind:
+                self._behind_markers.append(SeeParser.MarkerT.parse_string(
+                    key, value, obj_type, self._marker_map))
+            elif obj_type == types.Obj_Player:
+                player, player_type = SeeParser.PlayerT.parse_string(
+                    key, value, team_name, self)
+                self.add_player(player, player_type)
+            elif obj_type == types.Obj_Line:
+                self._lines.append(
+                    SeeParser.LineT.parse_string(key, value))
+            elif obj_type == types.Obj_Ball:
+                self._balls.append(
+                    SeeParser.BallT.parse_string(key, value))
+            else:
+                log.os_log().error(f"A seen object is not identified by its type!!")
+
+            self.sort_all()
+
+
+def seen_objects(parser: SeeParser) -> list:
+    return [[(type(o).__name__, sorted(vars(o).items(), key=str)) for o in objects]
+            for objects in (parser.balls(), parser.markers(), parser.behind_markers(), parser.lines(),
+                            parser.teammates(), parser.unknown_teammates(), parser.opponents(),
+                            parser.unknown_opponents(), parser.unknown_players())]
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    print(f'{"message":<10}{"objects":>8}{"legacy us":>12}{"scanner us":>12}{"speedup":>10}  same objects')
+    for name, message in (('test', SEE), ('other', SEE_OTHER)):
+        legacy = LegacySeeParser()
+        scanner = SeeParser()
+        legacy.parse(message, 'PYRUS', GameTime(1, 0))
+        scanner.parse(message, 'PYRUS', GameTime(1, 0))
+        same = seen_objects(legacy) == seen_objects(scanner)
+        times = []
+        for parser in (legacy, scanner):
+            cycle = [1]
+
+            def parse():
+                cycle[0] += 1
+                parser.parse(message, 'PYRUS', GameTime(cycle[0], 0))
+            times.append(min(timeit.repeat(parse, number=repeat, repeat=7)) / repeat * 1e6)
+        print(f'{name:<10}{message.count("(("):>8}{times[0]:>12.1f}{times[1]:>12.1f}{times[0] / times[1]:>9.2f}x  {same}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+time from the start of main.py until a fake server received the (init ...) commands of the agents:
+  - player: one player process
+  - team: the goalie, ten players and the coach in one process (--team), started 0.1 s apart
+the fake server answers every init, the median and max of [runs] runs (default 5) are printed.
+the startup profile of the last run is printed with --profile (main.py --profile-startup).
+run from the repository root:
+    python -m benchmarks.startup [runs] [--profile]
+"""
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+MODES = {'player': ([], 1), 'team': (['--team'], 12)}
+
+
+class FakeInitServer(threading.Thread):
+    def __init__(self):
+        super().__init__(daemon=True)
+        self._player_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._player_sock.bind(('127.0.0.1', 0))
+        self._coach_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._coach_sock.bind(('127.0.0.1', 0))
+        self._inits: list[float] = []
+        self._lock = threading.Lock()
+
+    def ports(self) -> tuple[int, int]:
+        return self._player_sock.getsockname()[1], self._coach_sock.getsockname()[1]
+
+    def reset(self):
+        with self._lock:
+            self._inits = []
+
+    def inits(self) -> list[float]:
+        with self._lock:
+            return list(self._inits)
+
+    def serve(self, sock: socket.socket, reply):
+        while True:
+            data, address = sock.recvfrom(8192)
+            if data.startswith(b'(init'):
+                with self._lock:
+                    self._inits.append(time.perf_counter())
+                    unum = len(self._inits)
+                sock.sendto(reply(unum), address)
+
+    def run(self):
+        threading.Thread(target=self.serve, daemon=True,
+                         args=(self._coach_sock, lambda unum: b'(init ok)\0')).start()
+        self.serve(self._player_sock, lambda unum: f'(init l {unum} before_kick_off)\0'.encode())
+
+
+def start(server: FakeInitServer, options: list[str], agents: int, profile: bool) -> tuple[float, str]:
+    player_port, coach_port = server.ports()
+    server.reset()
+    command = [sys.executable, 'main.py', '--disable-file-log', '--disable-debug-client',
+               '-p', str(player_port), '-P', str(coach_port)] + options + (['--profile-startup'] if profile else [])
+    begin = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    while len(server.inits()) < agents and time.perf_counter() - begin < 30:
+        time.sleep(0.002)
+    time.sleep(0.2 if profile else 0)  # the report is printed after the init reply
+    process.kill()
+    output = process.communicate()[0]
+    inits = server.inits()
+    return (inits[agents - 1] - begin if len(inits) >= agents else float('nan')), output
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1].isdigit() else 5
+    profile = '--profile' in sys.argv
+    server = FakeInitServer()
+    server.start()
+    for mode, (options, agents) in MODES.items():
+        times = [start(server, options, agents, False)[0] for _ in range(runs)]
+        print(f'{mode:6s} {agents:2d} agents: init after {statistics.median(times) * 1000:7.1f} ms median, '
+              f'{max(times) * 1000:7.1f} ms max')
+        if profile:
+            print(start(server, options, agents, True)[1])
+
+
+if __name__ == '__main__':
+    main()
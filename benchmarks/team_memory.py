@@ -0,0 +1,106 @@
+"""
+memory and cpu of a team started as 12 processes (start.sh) against the single process team (main.py --team).
+
+every agent goes through the start of a game without a server:
+the init message, server_param and the 18 player_type messages, then the kick table creation done
+by the first PlayerAgent.action (memory mapped from KICK_TABLE_PATH, computed if there is no file).
+each layout is run in fresh interpreters and measured after startup:
+  - rss: sum of the resident set size of the agent processes
+  - cpu: user + sys time of the agent processes and their children
+run from the repository root:
+    python -m benchmarks.team_memory
+"""
+import os
+import resource
+import socket
+import subprocess
+import sys
+import time
+
+from fixtures.messages import PLAYER_TYPES, SERVER_PARAM
+
+N_PLAYERS = 11
+
+
+def rss_kb():
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+    return 0
+
+
+def boot(roles: list[str]):
+    import team_config
+    team_config.DISABLE_FILE_LOG = True
+    team_config.SINGLE_PROCESS_TEAM = len(roles) > 1
+
+    from base.sample_coach import SampleCoach
+    from base.sample_player import SamplePlayer
+    from lib.action.kick_table import KickTable
+    from lib.debug.debug import log
+    from lib.network.udp_socket import IPAddress
+
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(('127.0.0.1', 0))
+    address = IPAddress('127.0.0.1', sink.getsockname()[1])
+
+    for role in roles:
+        state = log.state()
+        if role == 'coach':
+            agent = SampleCoach()
+            agent._client.connect_to(address)
+            agent.parse_message('(init l ok)')
+            agent.parse_message(SERVER_PARAM)
+            for message in PLAYER_TYPES:
+                agent.world().parse(message)
+        else:
+            unum = int(role)
+            agent = SamplePlayer(unum == 1)
+            agent._client.connect_to(address)
+            agent.parse_message(f'(init l {unum} before_kick_off)')
+            agent.parse_message(SERVER_PARAM)
+            for message in PLAYER_TYPES:
+                agent.parse_message(message)
+            KickTable.instance().create_tables(agent.world().self().player_type())
+        log.set_state(state)
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = usage.ru_utime + usage.ru_stime + children.ru_utime + children.ru_stime
+    print(f'{rss_kb()} {cpu}')
+
+
+def run_layout(groups: list[list[str]]):
+    start = time.perf_counter()
+    procs = [subprocess.Popen([sys.executable, '-m', 'benchmarks.team_memory', '--boot', *roles],
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+             for roles in groups]
+    rss = 0
+    cpu = 0.0
+    for p in procs:
+        out, _ = p.communicate()
+        r, c = out.split()[-2:]
+        rss += int(r)
+        cpu += float(c)
+    return rss / 1024, cpu, time.perf_counter() - start
+
+
+def main():
+    roles = [str(unum) for unum in range(1, N_PLAYERS + 1)] + ['coach']
+    layouts = (('12 processes', [[role] for role in roles]),
+               ('single process', [roles]))
+    results = {}
+    for name, groups in layouts:
+        results[name] = run_layout(groups)
+        rss, cpu, wall = results[name]
+        print(f'{name:<16} rss={rss:8.1f} MiB  cpu={cpu:6.2f} s  wall={wall:6.2f} s')
+    many, one = results['12 processes'], results['single process']
+    print(f'saved: rss {100 * (1 - one[0] / many[0]):.1f}%  cpu {100 * (1 - one[1] / many[1]):.1f}%')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--boot':
+        boot(sys.argv[2:])
+    else:
+        main()
@@ -0,0 +1,89 @@
+"""
+per cycle cost of the player bookkeeping of WorldModel, with the 22 players of fixtures.messages.FULLSTATE
+(10 teammates and 11 opponents seen by player 5).
+  - build: 21 PlayerObject created from the fullstate player record, as in update_by_full_state_message
+  - last_cycle: WorldModel.update_by_last_cycle (counters, inertia move, forgetting players)
+  - state_cache: WorldModel.update_player_state_cache (distances, sorted lists, kickable players)
+run from the repository root:
+    python -m benchmarks.world_players [repeat]
+"""
+import sys
+import time
+
+import numpy as np
+
+import team_config
+team_config.DISABLE_FILE_LOG = True
+
+from fixtures.messages import FULLSTATE
+from lib.debug.debug import log
+from lib.parser.parser_message_fullstate_world import FullStateWorldMessageParser
+from lib.player.action_effector import ActionEffector
+from lib.player.object_player import PlayerObject
+from lib.player.player_store import PlayerStore, player_slots
+from lib.player.world_model import WorldModel
+from lib.rcsc.game_mode import GameMode
+from lib.rcsc.game_time import GameTime
+from lib.rcsc.types import GameModeType
+
+SELF_UNUM = 5
+CYCLES = 20
+
+
+def build_players(wm: WorldModel, records: np.ndarray):
+    teammates, opponents = [], []
+    players = []
+    for row in records.tolist():
+        player = PlayerObject()
+        player.init_record(row)
+        player.set_player_type(wm._player_types[player.player_type_id()])
+        players.append(player)
+    PlayerStore.i().update_by_full_state(player_slots(players), records)
+    for player in players:
+        if player.side() != wm.our_side():
+            opponents.append(player)
+        elif player.unum() == SELF_UNUM:
+            wm.self().update_by_player_info(player)
+        else:
+            teammates.append(player)
+    return teammates, opponents
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    log.set_sw_levels(0)
+    wm = WorldModel('real')
+    wm.init('PYRUS', 'l', SELF_UNUM, False)
+    wm._game_mode = GameMode(game_mode=GameModeType.PlayOn)
+    parser = FullStateWorldMessageParser()
+    parser.parse(FULLSTATE)
+    wm._ball.init_values(parser.ball())
+    act = ActionEffector()
+
+    totals = {'build': 0.0, 'last_cycle': 0.0, 'state_cache': 0.0}
+    cycle = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        teammates, opponents = build_players(wm, parser.players())
+        totals['build'] += time.perf_counter() - start
+        wm._teammates, wm._opponents, wm._unknown_players = teammates, opponents, []
+        for _ in range(CYCLES):
+            cycle += 1
+            start = time.perf_counter()
+            wm.update_by_last_cycle(act, GameTime(cycle, 0))
+            middle = time.perf_counter()
+            wm.self()._pos_count = 0
+            wm.ball()._pos_count = 0
+            wm.update_player_state_cache()
+            end = time.perf_counter()
+            totals['last_cycle'] += middle - start
+            totals['state_cache'] += end - middle
+
+    print(f'players: {len(wm.teammates_from_self())} teammates, {len(wm.opponents_from_self())} opponents')
+    print(f'build       {totals["build"] / repeat * 1e6:10.1f} us')
+    print(f'last_cycle  {totals["last_cycle"] / repeat / CYCLES * 1e6:10.1f} us')
+    print(f'state_cache {totals["state_cache"] / repeat / CYCLES * 1e6:10.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+server messages used by the tests and the benchmarks, captured from rcssserver 18 (default server.conf, synch mode
+off). SENSE_BODY is formatted with the cycle and the command counters of the player (COUNTS).
+"""
+
+SERVER_PARAM = '(server_param (audio_cut_dist 50)(auto_mode 0)(back_dash_rate 0.7)(back_passes 1)(ball_accel_max 2.7)(ball_decay 0.94)(ball_rand 0.05)(ball_size 0.085)(ball_speed_max 3)(ball_stuck_area 3)(ball_weight 0.2)(catch_ban_cycle 5)(catch_probability 1)(catchable_area_l 1.2)(catchable_area_w 1)(ckick_margin 1)(clang_advice_win 1)(clang_define_win 1)(clang_del_win 1)(clang_info_win 1)(clang_mess_delay 50)(clang_mess_per_cycle 1)(clang_meta_win 1)(clang_rule_win 1)(clang_win_size 300)(coach 0)(coach_msg_file "")(coach_port 6001)(coach_w_referee 0)(connect_wait 300)(control_radius 2)(dash_angle_step 1)(dash_power_rate 0.006)(drop_ball_time 100)(effort_dec 0.005)(effort_dec_thr 0.3)(effort_inc 0.01)(effort_inc_thr 0.6)(effort_init 1)(effort_min 0.6)(extra_half_time 100)(extra_stamina 50)(fixed_teamname_l "")(fixed_teamname_r "")(forbid_kick_off_offside 1)(foul_cycles 5)(foul_detect_probability 0.5)(foul_exponent 10)(free_kick_faults 1)(freeform_send_period 20)(freeform_wait_period 600)(fullstate_l 0)(fullstate_r 0)(game_log_compression 0)(game_log_dated 1)(game_log_dir "./")(game_log_fixed 0)(game_log_fixed_name "rcssserver")(game_log_version 6)(game_logging 1)(game_over_wait 100)(goal_width 14.02)(goalie_max_moves 2)(golden_goal 0)(half_time 300)(hear_decay 1)(hear_inc 1)(hear_max 1)(illegal_defense_dist_x 16.5)(illegal_defense_duration 20)(illegal_defense_number 0)(illegal_defense_width 40.32)(inertia_moment 5)(keepaway 0)(keepaway_length 20)(keepaway_log_dated 1)(keepaway_log_dir "./")(keepaway_log_fixed 0)(keepaway_log_fixed_name "rcssserver")(keepaway_logging 1)(keepaway_start -1)(keepaway_width 20)(kick_off_wait 100)(kick_power_rate 0.027)(kick_rand 0.1)(kick_rand_factor_l 1)(kick_rand_factor_r 1)(kickable_margin 0.7)(landmark_file "~/.rcssserver-landmark.xml")(log_date_format "%Y%m%d%H%M%S-")(log_times 0)(max_back_tackle_power 0)(max_catch_angle 90)(max_dash_angle 180)(max_dash_power 100)(max_goal_kicks 3)(max_monitors -1)(max_tackle_power 100)(maxmoment 180)(maxneckang 90)(maxneckmoment 180)(maxpower 100)(min_catch_angle -90)(min_dash_angle -180)(min_dash_power 0)(minmoment -180)(minneckang -90)(minneckmoment -180)(minpower -100)(nr_extra_halfs 2)(nr_normal_halfs 2)(offside_active_area_size 2.5)(offside_kick_margin 9.15)(olcoach_port 6002)(old_coach_hear 0)(pen_allow_mult_kicks 1)(pen_before_setup_wait 10)(pen_coach_moves_players 1)(pen_dist_x 42.5)(pen_max_extra_kicks 5)(pen_max_goalie_dist_x 14)(pen_nr_kicks 5)(pen_random_winner 0)(pen_ready_wait 10)(pen_setup_wait 70)(pen_taken_wait 150)(penalty_shoot_outs 1)(player_accel_max 1)(player_decay 0.4)(player_rand 0.1)(player_size 0.3)(player_speed_max 1.05)(player_speed_max_min 0.75)(player_weight 60)(point_to_ban 5)(point_to_duration 20)(port 6000)(prand_factor_l 1)(prand_factor_r 1)(profile 0)(proper_goal_kicks 0)(quantize_step 0.1)(quantize_step_l 0.01)(record_messages 0)(recover_dec 0.002)(recover_dec_thr 0.3)(recover_init 1)(recover_min 0.5)(recv_step 10)(red_card_probability 0)(say_coach_cnt_max 128)(say_coach_msg_size 128)(say_msg_size 10)(send_comms 0)(send_step 150)(send_vi_step 100)(sense_body_step 100)(side_dash_rate 0.4)(simulator_step 100)(slow_down_factor 1)(slowness_on_top_for_left_team 1)(slowness_on_top_for_right_team 1)(stamina_capacity 130600)(stamina_inc_max 45)(stamina_max 8000)(start_goal_l 0)(start_goal_r 0)(stopped_ball_vel 0.01)(synch_micro_sleep 1)(synch_mode 0)(synch_offset 60)(synch_see_offset 0)(tackle_back_dist 0)(tackle_cycles 10)(tackle_dist 2)(tackle_exponent 6)(tackle_power_rate 0.027)(tackle_rand_factor 2)(tackle_width 1.25)(team_actuator_noise 0)(team_l_start "")(team_r_start "")(text_log_compression 0)(text_log_dated 1)(text_log_dir "./")(text_log_fixed 0)(text_log_fixed_name "rcssserver")(text_logging 1)(use_offside 1)(verbose 0)(visible_angle 90)(visible_distance 3)(wind_ang 0)(wind_dir 0)(wind_force 0)(wind_none 0)(wind_rand 0)(wind_random 0))'
+
+PLAYER_PARAM = '(player_param (allow_mult_default_type 0)(catchable_area_l_stretch_max 1.3)(catchable_area_l_stretch_min 1)(dash_power_rate_delta_max 0)(dash_power_rate_delta_min 0)(effort_max_delta_factor -0.004)(effort_min_delta_factor -0.004)(extra_stamina_delta_max 50)(extra_stamina_delta_min 0)(foul_detect_probability_delta_factor 0)(inertia_moment_delta_factor 25)(kick_power_rate_delta_max 0)(kick_power_rate_delta_min 0)(kick_rand_delta_factor 1)(kickable_margin_delta_max 0.1)(kickable_margin_delta_min -0.1)(new_dash_power_rate_delta_max 0.0008)(new_dash_power_rate_delta_min -0.0012)(new_stamina_inc_max_delta_factor -6000)(player_decay_delta_max 0.1)(player_decay_delta_min -0.1)(player_size_delta_factor -100)(player_speed_max_delta_max 0)(player_speed_max_delta_min 0)(player_types 18)(pt_max 1)(random_seed -1)(stamina_inc_max_delta_factor 0)(subs_max 3))'
+
+PLAYER_TYPES = [
+    '(player_type (id 0)(player_speed_max 1.05)(stamina_inc_max 45)(player_decay 0.4)(inertia_moment 5)(dash_power_rate 0.006)(player_size 0.3)(kickable_margin 0.7)(kick_rand 0.1)(extra_stamina 50)(effort_max 1)(effort_min 0.6)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1))',
+    '(player_type (id 1)(player_speed_max 1.05)(stamina_inc_max 52.8376)(player_decay 0.351584)(inertia_moment 3.7896)(dash_power_rate 0.00469373)(player_size 0.3)(kickable_margin 0.674322)(kick_rand 0.0743221)(extra_stamina 75.6153)(effort_max 0.897539)(effort_min 0.497539)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.20478))',
+    '(player_type (id 2)(player_speed_max 1.05)(stamina_inc_max 47.9364)(player_decay 0.432958)(inertia_moment 5.82395)(dash_power_rate 0.00551061)(player_size 0.3)(kickable_margin 0.775519)(kick_rand 0.175519)(extra_stamina 69.2384)(effort_max 0.923046)(effort_min 0.523046)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.06337))',
+    '(player_type (id 3)(player_speed_max 1.05)(stamina_inc_max 41.7293)(player_decay 0.469216)(inertia_moment 6.7304)(dash_power_rate 0.00654511)(player_size 0.3)(kickable_margin 0.628718)(kick_rand 0.0287182)(extra_stamina 53.0621)(effort_max 0.987752)(effort_min 0.587752)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.16126))',
+    '(player_type (id 4)(player_speed_max 1.05)(stamina_inc_max 51.4219)(player_decay 0.377806)(inertia_moment 4.44516)(dash_power_rate 0.00492968)(player_size 0.3)(kickable_margin 0.693713)(kick_rand 0.0937134)(extra_stamina 62.4729)(effort_max 0.950108)(effort_min 0.550108)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.28904))',
+    '(player_type (id 5)(player_speed_max 1.05)(stamina_inc_max 44.5616)(player_decay 0.451024)(inertia_moment 6.2756)(dash_power_rate 0.0060731)(player_size 0.3)(kickable_margin 0.784051)(kick_rand 0.184051)(extra_stamina 88.2612)(effort_max 0.846955)(effort_min 0.446955)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.01859))',
+    '(player_type (id 6)(player_speed_max 1.05)(stamina_inc_max 49.0877)(player_decay 0.360911)(inertia_moment 4.02278)(dash_power_rate 0.00531872)(player_size 0.3)(kickable_margin 0.732506)(kick_rand 0.132506)(extra_stamina 58.9046)(effort_max 0.964382)(effort_min 0.564382)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.22841))',
+    '(player_type (id 7)(player_speed_max 1.05)(stamina_inc_max 43.2011)(player_decay 0.489137)(inertia_moment 7.22843)(dash_power_rate 0.00629982)(player_size 0.3)(kickable_margin 0.610327)(kick_rand 0.0103272)(extra_stamina 79.4438)(effort_max 0.882225)(effort_min 0.482225)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.1072))',
+    '(player_type (id 8)(player_speed_max 1.05)(stamina_inc_max 53.6045)(player_decay 0.323489)(inertia_moment 3.08723)(dash_power_rate 0.00456591)(player_size 0.3)(kickable_margin 0.706948)(kick_rand 0.106948)(extra_stamina 66.5307)(effort_max 0.933877)(effort_min 0.533877)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.14597))',
+    '(player_type (id 9)(player_speed_max 1.05)(stamina_inc_max 46.6633)(player_decay 0.413562)(inertia_moment 5.33905)(dash_power_rate 0.00572278)(player_size 0.3)(kickable_margin 0.651149)(kick_rand 0.0511494)(extra_stamina 96.0845)(effort_max 0.815662)(effort_min 0.415662)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.25473))',
+    '(player_type (id 10)(player_speed_max 1.05)(stamina_inc_max 50.3408)(player_decay 0.396701)(inertia_moment 4.91753)(dash_power_rate 0.00510986)(player_size 0.3)(kickable_margin 0.757232)(kick_rand 0.157232)(extra_stamina 51.8759)(effort_max 0.99249)(effort_min 0.59249)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.03994))',
+    '(player_type (id 11)(player_speed_max 1.05)(stamina_inc_max 40.7714)(player_decay 0.497122)(inertia_moment 7.42805)(dash_power_rate 0.00670477)(player_size 0.3)(kickable_margin 0.684392)(kick_rand 0.0843916)(extra_stamina 72.7029)(effort_max 0.909188)(effort_min 0.509188)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.17753))',
+    '(player_type (id 12)(player_speed_max 1.05)(stamina_inc_max 48.3022)(player_decay 0.441846)(inertia_moment 6.04615)(dash_power_rate 0.00544963)(player_size 0.3)(kickable_margin 0.619075)(kick_rand 0.0190748)(extra_stamina 84.3378)(effort_max 0.862649)(effort_min 0.462649)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.29752))',
+    '(player_type (id 13)(player_speed_max 1.05)(stamina_inc_max 42.6555)(player_decay 0.339067)(inertia_moment 3.47668)(dash_power_rate 0.00639075)(player_size 0.3)(kickable_margin 0.790814)(kick_rand 0.190814)(extra_stamina 55.1193)(effort_max 0.979523)(effort_min 0.579523)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.08211))',
+    '(player_type (id 14)(player_speed_max 1.05)(stamina_inc_max 54.4181)(player_decay 0.461384)(inertia_moment 6.5346)(dash_power_rate 0.00443031)(player_size 0.3)(kickable_margin 0.722571)(kick_rand 0.122571)(extra_stamina 91.6624)(effort_max 0.83335)(effort_min 0.43335)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.21362))',
+    '(player_type (id 15)(player_speed_max 1.05)(stamina_inc_max 45.7926)(player_decay 0.370122)(inertia_moment 4.25305)(dash_power_rate 0.00586791)(player_size 0.3)(kickable_margin 0.640658)(kick_rand 0.0406578)(extra_stamina 60.7811)(effort_max 0.956876)(effort_min 0.556876)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.13688))',
+    '(player_type (id 16)(player_speed_max 1.05)(stamina_inc_max 51.9942)(player_decay 0.421379)(inertia_moment 5.53448)(dash_power_rate 0.00483431)(player_size 0.3)(kickable_margin 0.768893)(kick_rand 0.168893)(extra_stamina 77.2095)(effort_max 0.891162)(effort_min 0.491162)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.05536))',
+    '(player_type (id 17)(player_speed_max 1.05)(stamina_inc_max 43.9148)(player_decay 0.476553)(inertia_moment 6.91383)(dash_power_rate 0.00618087)(player_size 0.3)(kickable_margin 0.662017)(kick_rand 0.0620174)(extra_stamina 98.5512)(effort_max 0.805795)(effort_min 0.405795)(kick_power_rate 0.027)(foul_detect_probability 0.5)(catchable_area_l_stretch 1.24105))',
+]
+
+FULLSTATE = '(fullstate 1234 (pmode play_on) (vmode high normal) (count 3 412 298 0 1 640 52 17) (arm (movable 0) (expires 0) (target 0 0) (count 0)) (score 1 0) ((b) 12.5481 -7.33562 1.02543 -0.412217) ((p l 1 g 0) -17.6167 -22.3457 0.150934 -0.427564 12.9175 45 (focus_point 0 0) (stamina 5913.94 0.963882 0.607349 120911)) ((p l 2 13) -43.0145 -26.1944 -0.0754808 0.326852 -135.431 -45 (focus_point 0 0) (stamina 6153.13 0.833199 0.530931 126207)) ((p l 3 1) 47.6255 -29.0187 0.358468 -0.210391 -128.068 0 (focus_point 0 0) (stamina 5854.57 0.824103 0.841001 121092)) ((p l 4 6) -12.7602 3.05565 -0.437211 -0.440399 -105.855 30 16.4199 99.8024 (focus_point 0 0) (stamina 5328.01 0.969377 0.680791 122633)) ((p l 5 5) 19.8994 -16.3778 0.0744237 0.0251965 135.049 30 (focus_point 0 0) (stamina 5244.17 0.843584 0.5366 125426)) ((p l 6 5) 25.7141 -22.273 -0.0110369 -0.460793 60.5577 -90 (focus_point 0 0) (stamina 5865.13 0.950191 0.656874 127370)) ((p l 7 15) 7.98952 -2.80286 0.339968 0.444681 -9.3246 30 (focus_point 0 0) (stamina 3325 0.892464 0.654804 126126)) ((p l 8 14) -21.5404 -7.30935 0.168653 -0.477437 -13.7897 -45 (focus_point 0 0) (stamina 6054.6 0.797477 0.609104 123047)) ((p l 9 7) -10.2102 26.6762 -0.0034933 -0.333634 -35.4081 45 26.6181 114.941 (focus_point 0 0) (stamina 7319.92 0.711368 0.707648 123803)) ((p l 10 12) 45.7731 -22.3411 -0.323782 -0.268043 -95.999 90 (focus_point 0 0) (stamina 7155.47 0.672937 0.640965 121544) k) ((p l 11 17) -13.0746 4.24584 0.453098 0.190494 5.57692 -90 (focus_point 0 0) (stamina 6274.83 0.895914 0.728322 129232)) ((p r 1 g 0) 45.1886 11.5568 0.0592717 -0.10193 -38.1168 90 (focus_point 0 0) (stamina 6171.45 0.624899 0.533674 122213)) ((p r 2 5) -39.0072 6.44654 -0.39762 0.0667836 13.1827 45 (focus_point 0 0) (stamina 6068.69 0.628126 0.603976 123988)) ((p r 3 8) 45.5468 6.54587 -0.0258485 -0.384646 -4.2955 90 (focus_point 0 0) (stamina 5401.98 0.724741 0.572059 127947)) ((p r 4 8) -2.13781 12.2916 0.0163345 -0.294785 162.728 45 5.25147 15.5421 (focus_point 0 0) (stamina 3135.21 0.811244 0.989251 129151)) ((p r 5 8) 1.83969 26.1285 -0.144304 -0.277207 14.9642 -90 (focus_point 0 0) (stamina 4648.32 0.689217 0.905756 130440)) ((p r 6 6) 30.6079 20.3733 0.239873 -0.273261 6.34994 45 (focus_point 0 0) (stamina 6655.02 0.995841 0.895057 125006) t y) ((p r 7 6) 19.2522 29.217 -0.0527723 0.437021 175.694 45 (focus_point 0 0) (stamina 3402.69 0.640863 0.73504 123580)) ((p r 8 15) 12.4066 25.6197 0.340436 -0.0205266 55.0721 30 (focus_point 0 0) (stamina 3423.89 0.864234 0.954889 128292)) ((p r 9 6) -2.19673 -20.5746 0.289135 -0.167483 108.296 30 12.4793 -35.5007 (focus_point 0 0) (stamina 7733.99 0.889919 0.585002 121347)) ((p r 10 4) 9.08123 -2.21735 0.155858 0.111573 34.5133 90 (focus_point 0 0) (stamina 6286.34 0.740163 0.77433 121388)) ((p r 11 0) 29.9357 14.4877 -0.397228 0.249496 -129.87 -45 (focus_point 0 0) (stamina 7130.78 0.684417 0.625917 123105)))'
+
+SEE_GLOBAL = '(see_global 1234 ((g l) -52.5 0) ((g r) 52.5 0) ((b) 12.5481 -7.33562 1.02543 -0.412217) ((p "PYRUS" 1 goalie) -4.76204 3.82543 0.424211 -0.0343499 2.82286 -90) ((p "PYRUS" 2) -31.0098 19.4496 -0.0242368 0.113959 -112.977 90) ((p "PYRUS" 3) -19.6599 -26.1971 0.309645 0.193438 -164.923 90) ((p "PYRUS" 4) 46.4758 9.85104 0.115563 -0.342506 -174.6 -90) ((p "PYRUS" 5) -43.6835 -29.7182 0.379565 0.0996181 100.119 45) ((p "PYRUS" 6) -5.94689 21.9153 0.0191241 0.140292 -0.0816652 30) ((p "PYRUS" 7) -41.5011 9.9073 -0.0932213 0.0512677 155.407 0 74.8115) ((p "PYRUS" 8) -18.4723 -17.3014 -0.21096 -0.429777 95.8636 90) ((p "PYRUS" 9) -39.2197 -13.3822 -0.433173 -0.48311 66.5631 -45) ((p "PYRUS" 10) -29.0283 26.2574 -0.0300127 0.480359 -36.9272 0 k) ((p "PYRUS" 11) 6.62417 -19.2966 0.174909 -0.163107 -67.9645 0) ((p "HELIOS" 1 goalie) 46.4076 16.5146 -0.382008 -0.253612 -143.623 0) ((p "HELIOS" 2) -3.50602 -0.843309 0.182077 -0.311615 3.19156 30) ((p "HELIOS" 3) 26.9522 -5.16925 -0.116248 -0.105147 176.419 0) ((p "HELIOS" 4) -23.0205 30.1395 0.303412 -0.195855 138.551 -45) ((p "HELIOS" 5) -31.2693 31.7335 0.102018 0.0769598 -164.841 -45) ((p "HELIOS" 6) -28.6757 -15.4702 0.27269 -0.171045 -73.3231 0) ((p "HELIOS" 7) -42.5719 -18.6411 0.136587 -0.484491 -47.2769 -90 -16.8451) ((p "HELIOS" 8) 45.9135 -1.04163 0.0745712 0.366526 -114.182 -45) ((p "HELIOS" 9) -18.9189 -17.3835 0.110445 0.225391 -122.949 30) ((p "HELIOS" 10) 44.0405 -19.4183 0.450136 0.38219 37.2723 90) ((p "HELIOS" 11) -45.2598 -25.021 0.0123558 -0.244821 86.3383 90))'
+
+SEE = '(see 245 ((f c) 15.5 2 0 1.3) ((f c b) 48.9 16) ((f r t) 60.9 -86) ((f r b) 75.2 -27) ((f l b) 67.4 67) ((f g r b) 61.6 -47) ((g r) 59.7 -53) ((f g r t) 58.6 -60) ((f g l b) 51.9 88) ((f p r b) 54.1 -27) ((f p r c) 43.8 -48) ((f p r t) 41.7 -75) ((f p l b) 46.5 64) ((f p l c) 33.8 87) ((f b 0) 54.1 17) ((f b r 10) 55.7 7) ((f b r 20) 59.1 -3) ((f b r 30) 64.1 -11) ((f b r 40) 70.1 -18) ((f b r 50) 76.7 -23) ((f b l 10) 53.5 28) ((f b l 20) 55.7 38) ((f b l 30) 59.1 47) ((f b l 40) 64.1 55) ((f b l 50) 69.4 62) ((f r 0) 64.7 -54) ((f r t 10) 62.8 -63) ((f r t 20) 62.8 -72) ((f r t 30) 64.7 -81) ((f r b 10) 67.4 -46) ((f r b 20) 71.5 -39) ((f r b 30) 76.7 -32) ((f l b 10) 57.4 87) ((f l b 20) 62.8 79) ((f l b 30) 68.7 72) ((b) 33.1 -81 0.662 0.9) ((p "HELIOS_base" 3) 12.2 17 0 1.2 -104 -50) ((p "HELIOS_base") 27.1 6 -131) ((p "HELIOS_base" 6) 18.2 -56 0 0.4 -67 -152) ((p "HELIOS_base" 8) 30 -37 0 0.2 -67 22) ((p "HELIOS_base") 30 -84) ((p "HELIOS_base") 40.4 -17) ((p "HELIOS_base" 11) 22.2 -60 0 0.3 -64 -59) ((p) 54.6 -57) ((p "col") 30 -26) ((p "col" 3) 24.5 -42 -0 0.6 -133 -132) ((p "col" 4) 33.1 -5 -0 0.6 152 -148) ((p "col" 5) 16.4 -62 -0.328 0.5 -108 -107) ((p "col" 6) 18.2 -14 -0 1 -122 -122) ((p "col" 7) 22.2 7 0 0.9 -163 -156) ((p "col" 8) 10 -17 -0.2 1.8 -174 -109) ((p "col") 36.6 12) ((p "col" 11) 16.4 1 0 1.2 -62 -152) ((l b) 52.5 -67))'
+
+# the other kinds of seen objects (behind markers, goalie, kicking and tackling players, ...)
+SEE_OTHER = ('(see 100 ((F) 1.2 -150) ((G) 3.1 170) ((B) 1.5 -100) ((P) 1.1 160) '
+             '((p "PYRUS" 1 goalie) 20 10 0.1 0.2 30 40 10 k) ((p "opp" 9) 15 5 0.1 0.2 30 40 t) ((p "opp") 40 4 t) '
+             '((p "opp" 2) 30 20 10 k) ((p "opp" 3) 25 -20 -45) ((p "PYRUS" 7) 31 2 0 0 4 5 12) ((l r) 20 -80) '
+             '((f t 0) 30 10) ((g l) 10 2) ((b) 12 3))')
+
+SENSE_BODY = '(sense_body {time} (view_mode high normal) (stamina 8000 1 130600) (speed 0 0) (head_angle 0) ' \
+             '(kick {KICK}) (dash {DASH}) (turn {TURN}) (say {SAY}) (turn_neck {TURN_NECK}) (catch {CATCH}) ' \
+             '(move {MOVE}) (change_view {CHANGE_VIEW}) (change_focus {CHANGE_FOCUS}) ' \
+             '(arm (movable 0) (expires 0) (target 0 0) (count {POINTTO})) (focus (target none) (count {ATTENTIONTO})) ' \
+             '(tackle (expires 0) (count {TACKLE})) (collision none) (foul (charged 0) (card none)) (focus_point 0 0))'
+COUNTS = ('KICK', 'DASH', 'TURN', 'SAY', 'TURN_NECK', 'CATCH', 'MOVE', 'CHANGE_VIEW', 'CHANGE_FOCUS', 'POINTTO',
+          'ATTENTIONTO', 'TACKLE')
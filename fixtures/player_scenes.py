@@ -0,0 +1,69 @@
+"""
+crowded scenes of the player matching tests and benchmarks: known players of the world model in a circle of
+[spread] meters, seen 1 to 3 cycles ago and moved since, and the noisy seen players of this cycle. some uniform
+numbers are missing (far players). a swap is a seen player given to the known player of another one, a loss a seen
+player that became a new player.
+"""
+import random
+
+from pyrusgeom.geom_2d import *
+
+from lib.player.localizer import Localizer
+from lib.player.object_player import PlayerObject
+from lib.player.world_model import WorldModel
+from lib.rcsc.types import UNUM_UNKNOWN, SideID
+
+PLAYERS = 11
+DIST_ERROR = 0.5
+
+
+def seen_player(pos: Vector2D, unum: int) -> Localizer.PlayerT:
+    player = Localizer.PlayerT()
+    player.pos_ = pos
+    player.rpos_ = pos.copy()
+    player.unum_ = unum
+    player.dist_error_ = DIST_ERROR
+    return player
+
+
+def scene(seed: int, spread: float, unum_rate: float = 0.3):
+    """
+    known players, seen players in a random order, and the true known player index of every seen player
+    """
+    rng = random.Random(seed)
+    known = []
+    seen = []
+    for unum in range(1, PLAYERS + 1):
+        old_pos = Vector2D.polar2vector(rng.uniform(0, spread), rng.uniform(-180, 180))
+        p = PlayerObject(SideID.RIGHT, seen_player(old_pos, unum if rng.random() < unum_rate else UNUM_UNKNOWN))
+        count = rng.randint(1, 3)
+        p._seen_pos_count = p._pos_count = count
+        known.append(p)
+        move = Vector2D.polar2vector(rng.uniform(0, 0.9 * p.player_type().real_speed_max() * count),
+                                     rng.uniform(-180, 180))
+        noise = Vector2D.polar2vector(rng.uniform(0, DIST_ERROR), rng.uniform(-180, 180))
+        seen.append((seen_player(old_pos + move + noise, unum if rng.random() < unum_rate else UNUM_UNKNOWN),
+                     unum - 1))
+    rng.shuffle(seen)
+    return known, [p for p, _ in seen], [truth for _, truth in seen]
+
+
+def match(wm: WorldModel, known: list[PlayerObject], seen: list[Localizer.PlayerT], batch: bool):
+    new_known = []
+    old_known = list(known)
+    if batch:
+        wm.match_team_players(SideID.RIGHT, seen, old_known, [], new_known)
+    else:
+        for player in seen:
+            wm.check_team_player(SideID.RIGHT, player, old_known, [], new_known)
+    return new_known
+
+
+def errors(known: list[PlayerObject], new_known: list[PlayerObject], truth: list[int]) -> tuple[int, int]:
+    """
+    swaps and losses
+    """
+    index = {id(p): i for i, p in enumerate(known)}
+    swaps = sum(1 for p, t in zip(new_known, truth) if id(p) in index and index[id(p)] != t)
+    losses = sum(1 for p in new_known if id(p) not in index)
+    return swaps, losses
@@ -0,0 +1,80 @@
+"""
+synthetic player recordings of the tests and the benchmarks: a SamplePlayer (HELIOS_base 9, play_on) getting the
+sense_body and see messages of fixtures.messages every cycle (and the fullstate message with fullstate=True),
+and their replays with the cycle profile.
+"""
+import json
+
+import team_config
+from base.sample_player import SamplePlayer
+from fixtures.messages import COUNTS, FULLSTATE, PLAYER_TYPES, SEE, SENSE_BODY, SERVER_PARAM
+from lib.network.recorder import IN, Recorder
+from lib.player import localizer
+from lib.player.replay import Replay, ReplayClient, ReplayResult
+from lib.player_command.player_command import CommandType
+
+# command counters of a fullstate message, in the order of (count ...)
+FULLSTATE_COUNTS = ('KICK', 'DASH', 'TURN', 'CATCH', 'MOVE', 'TURN_NECK', 'CHANGE_VIEW', 'SAY')
+
+
+def fullstate_message(t: int, counts: dict) -> str:
+    message = FULLSTATE.replace('(fullstate 1234', f'(fullstate {t}', 1)
+    return message.replace('(count 3 412 298 0 1 640 52 17)',
+                           f'(count {" ".join(str(counts[c]) for c in FULLSTATE_COUNTS)})', 1)
+
+
+def synthesize(path: str, cycles: int, seed: int = 0, fullstate: bool = False):
+    team_config.TEAM_NAME = 'HELIOS_base'
+    localizer.seed(seed)
+    recorder = Recorder(path)
+    agent = SamplePlayer()
+    client = ReplayClient()
+    client.socket().set_recorder(recorder)
+    agent.set_client(client)
+    agent.handle_start()
+
+    def receive(message: str):
+        client.socket().record(IN, message.encode())
+        agent.parse_message(message)
+
+    server_param = SERVER_PARAM.replace('(fullstate_l 0)', '(fullstate_l 1)') if fullstate else SERVER_PARAM
+    for message in ['(init l 9 before_kick_off)', server_param, *PLAYER_TYPES, '(hear 0 referee play_on)\x00']:
+        receive(message)
+    for t in range(1, cycles + 1):
+        counts = {c: agent._effector._command_counter[CommandType[c].value] for c in COUNTS}
+        receive(SENSE_BODY.format(time=t, **counts))
+        if fullstate:
+            receive(fullstate_message(t, counts))
+        receive(SEE.replace('(see 245', f'(see {t}', 1))
+        agent.action()
+        agent.flush_logs()
+    recorder.close()
+
+
+def replay_profiled(replay: Replay, directory: str) -> tuple[ReplayResult, str]:
+    """
+    the result of the replay and the path of its profile
+    """
+    agents = []
+
+    def agent(goalie: bool):
+        agents.append(SamplePlayer(goalie))
+        return agents[-1]
+
+    team_config.CYCLE_PROFILE_DIR = directory
+    try:
+        result = replay.run(agent)
+    finally:
+        team_config.CYCLE_PROFILE_DIR = None
+    profile = agents[-1].cycle_profile()
+    profile.close()
+    return result, profile.path()
+
+
+def read_profile(path: str) -> tuple[list[dict], dict]:
+    """
+    the lines of the decisions and the summary
+    """
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+    return lines[:-1], lines[-1]['summary']
@@ -0,0 +1,121 @@
+"""
+world models of the tests and the benchmarks: a SamplePlayer (HELIOS_base 9, play_on) after a few cycles of the see
+message of fixtures.messages with the ball kickable, and the random players and balls of the intercept tests.
+"""
+import random
+
+from pyrusgeom.geom_2d import *
+
+import team_config
+from base.sample_player import SamplePlayer
+from fixtures.messages import COUNTS, PLAYER_TYPES, SEE, SENSE_BODY, SERVER_PARAM
+from lib.action.intercept_table import InterceptTable
+from lib.player import localizer
+from lib.player.replay import ReplayClient
+from lib.player_command.player_command import CommandType
+from lib.rcsc.game_time import GameTime
+from lib.rcsc.server_param import ServerParam
+
+KICKABLE_SEE = SEE.replace('((b) 33.1 -81 0.662 0.9)', '((b) 0.6 10 0 0)')
+
+
+def make_world(seed: int = None, cycles: int = 5):
+    """
+        the world model of the player, with seed the opponents get random positions, velocities and counts
+    """
+    team_config.TEAM_NAME = 'HELIOS_base'
+    localizer.seed(0)
+    agent = SamplePlayer()
+    agent.set_client(ReplayClient())
+    agent.handle_start()
+    for message in ['(init l 9 before_kick_off)', SERVER_PARAM, *PLAYER_TYPES, '(hear 0 referee play_on)\x00']:
+        agent.parse_message(message)
+    for t in range(1, cycles + 1):
+        counts = {c: agent._effector._command_counter[CommandType[c].value] for c in COUNTS}
+        agent.parse_message(SENSE_BODY.format(time=t, **counts))
+        agent.parse_message(KICKABLE_SEE.replace('(see 245', f'(see {t}', 1))
+        agent.action()
+    wm = agent.world()
+    if seed is not None:
+        rng = random.Random(seed)
+        for opp in wm.opponents():
+            if opp is None:
+                continue
+            opp._pos = Vector2D(rng.uniform(-20, 45), rng.uniform(-30, 30))
+            opp._vel = Vector2D.polar2vector(rng.uniform(0, 0.6), rng.uniform(-180, 180))
+            opp._body = AngleDeg(rng.uniform(-180, 180))
+            opp._pos_count = rng.randint(0, 8)
+            opp._body_count = rng.randint(0, 3)
+    return wm
+
+
+def randomize(wm, players: list, rng: random.Random):
+    for p in players:
+        p._pos = Vector2D(rng.uniform(-50, 50), rng.uniform(-33, 33))
+        p._seen_pos = Vector2D(rng.uniform(-50, 50), rng.uniform(-33, 33))
+        p._vel = Vector2D.polar2vector(rng.uniform(0, 0.6), rng.uniform(-180, 180))
+        p._seen_vel = Vector2D.polar2vector(rng.uniform(0, 0.6), rng.uniform(-180, 180))
+        p._body = AngleDeg(rng.uniform(-180, 180))
+        p._pos_count = rng.randint(0, 8)
+        p._seen_pos_count = rng.randint(0, 8)
+        p._vel_count = rng.randint(0, 8)
+        p._seen_vel_count = rng.randint(0, 8)
+        p._goalie = rng.random() < 0.2
+        p._tackle = rng.random() < 0.2
+        p._tackle_count = rng.randint(0, 10)
+        p._dist_from_self = rng.uniform(0, 60)
+    wm.ball()._pos = Vector2D(rng.uniform(-45, 45), rng.uniform(-30, 30))
+    wm.ball()._vel = Vector2D.polar2vector(rng.uniform(0, 3), rng.uniform(-180, 180))
+    wm.ball()._seen_pos_count = rng.randint(0, 5)
+
+
+def ball_cache(wm, cycles: int) -> list[Vector2D]:
+    pos = wm.ball().pos()
+    vel = wm.ball().vel()
+    cache = [pos.copy()]
+    for _ in range(cycles):
+        pos += vel
+        vel *= ServerParam.i().ball_decay()
+        cache.append(pos.copy())
+    return cache
+
+
+def randomize_self(wm, rng: random.Random):
+    me = wm.self()
+    me._kickable = False
+    me._pos = Vector2D(rng.uniform(-40, 40), rng.uniform(-25, 25))
+    me._vel = Vector2D.polar2vector(rng.uniform(0, 0.5), rng.uniform(-180, 180))
+    me._body = AngleDeg(rng.uniform(-180, 180))
+    me._stamina_model._stamina = rng.choice([8000, rng.uniform(2000, 8000)])
+    wm.ball()._pos = me.pos() + Vector2D.polar2vector(rng.uniform(2, 30), rng.uniform(-180, 180))
+    wm.ball()._vel = Vector2D.polar2vector(rng.uniform(0, 2.7), rng.uniform(-180, 180))
+    wm.ball()._dist_from_self = me.pos().dist(wm.ball().pos())
+
+
+def self_ball_cache(wm) -> list[Vector2D]:
+    table = InterceptTable()
+    table.create_ball_cache(wm)
+    return table._ball_cache
+
+
+def play_cycle(wm, players: list, rng: random.Random):
+    """
+        one cycle later: the ball rolls (seen every 3rd cycle), a fifth of the players is seen somewhere else
+    """
+    ball = wm.ball()
+    wm._time = GameTime(wm.time().cycle() + 1, 0)
+    ball._pos += ball.vel()
+    ball._vel *= ServerParam.i().ball_decay()
+    ball._seen_pos_count += 1
+    if wm.time().cycle() % 3 == 0:
+        ball._pos += Vector2D.polar2vector(rng.uniform(0, 0.1), rng.uniform(-180, 180))
+        ball._seen_pos_count = 0
+    for p in players:
+        if rng.random() < 0.2:
+            p._pos = p.pos() + Vector2D.polar2vector(rng.uniform(0.3, 1.0), rng.uniform(-180, 180))
+            p._seen_pos = p.pos()
+            p._pos_count = p._seen_pos_count = 0
+        else:
+            p._pos_count += 1
+            p._seen_pos_count += 1
+    ball._dist_from_self = wm.self().pos().dist(ball.pos())
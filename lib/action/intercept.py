@@ -37,7 +37,7 @@ class Intercept:
         if table.self_reach_cycle() > 100:
             final_point = wm.ball().inertia_final_point()
             log.sw_log().intercept().add_text(
-                          f"table.self_reach_cycle() > 100 (GoToPoint)")
+                          'table.self_reach_cycle() > 100 (GoToPoint)')
             log.sw_log().intercept().add_circle(
                             center=final_point,
                             r=0.5,
@@ -55,7 +55,7 @@ class Intercept:
                 face_point.assign(50.5, wm.self().pos().y() * 0.75)
 
             log.sw_log().intercept().add_text(
-                          f"best_intercept.dash_cycle() == 0 (TurnToPoint)")
+                          'best_intercept.dash_cycle() == 0 (TurnToPoint)')
             log.sw_log().intercept().add_circle(
                             center=face_point,
                             r=0.5,
@@ -71,7 +71,7 @@ class Intercept:
                 target_angle -= 180
 
             log.sw_log().intercept().add_text(
-                          f"best_intercept.turn_cycle() > 0 (do_turn)")
+                          'best_intercept.turn_cycle() > 0 (do_turn)')
             return agent.do_turn(target_angle - wm.self().body())
 
         if self.do_wait_turn(agent, target_point, best_intercept):
@@ -85,12 +85,12 @@ class Intercept:
             if (wm.self().stamina() - consumed_stamina
                     < ServerParam.i().recover_dec_thr_value() + 1):
                 log.sw_log().intercept().add_text(
-                              f"last if (do turn)")
+                              'last if (do turn)')
                 agent.do_turn(0)
                 return False
 
         log.sw_log().intercept().add_text(
-                      f"do inertia dash (do dash)")
+                      'do inertia dash (do dash)')
         log.sw_log().intercept().add_circle(
                         center=target_point,
                         r=0.5,
@@ -111,7 +111,7 @@ class Intercept:
 
                 if attack_pos.dist2(goal_pos) > my_next.dist2(goal_pos):
                     log.sw_log().intercept().add_text(
-                                  f"do_kickable_opp_check (GoToPoint)")
+                                  'do_kickable_opp_check (GoToPoint)')
                     log.sw_log().intercept().add_circle(
                                     center=attack_pos,
                                     r=0.5,
@@ -351,7 +351,7 @@ class Intercept:
                 face_point.assign(50.5, wm.self().pos().y() * 0.9)
 
             log.sw_log().intercept().add_text(
-                          f"do wait turn (1) (TurnToPoint)")
+                          'do wait turn (1) (TurnToPoint)')
             log.sw_log().intercept().add_circle(
                             center=face_point,
                             r=0.5,
@@ -388,7 +388,7 @@ class Intercept:
             return False
 
         log.sw_log().intercept().add_text(
-                      f"do wait turn (2)(TurnToPoint)")
+                      'do wait turn (2)(TurnToPoint)')
         log.sw_log().intercept().add_circle(
                         center=face_point,
                         r=0.5,
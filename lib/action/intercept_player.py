@@ -1,9 +1,14 @@
+import math
 from math import floor
+from typing import Union
 
+import numpy as np
 from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.math_values import DEG2RAD, EPSILON, RAD2DEG
 from pyrusgeom.soccer_math import bound, inertia_n_step_point
 from pyrusgeom.vector_2d import Vector2D
 from lib.player.object_player import PlayerObject
+from lib.player.player_store import PlayerStore, player_slots
 from lib.rcsc.player_type import PlayerType
 from lib.rcsc.server_param import ServerParam
 
@@ -223,3 +228,202 @@ class PlayerIntercept:
         if n_dash <= max_dash:
             return True
         return False
+
+
+# decay -> (1 - decay^n) / (1 - decay) for n in [0, len), the travel factors of inertia_n_step_point
+_inertia_factors: dict[float, np.ndarray] = {}
+
+
+def inertia_factors(decay: float, steps: int) -> np.ndarray:
+    """
+    the travel factors of at least steps cycles
+    """
+    factors = _inertia_factors.get(decay)
+    if factors is None or factors.shape[0] < steps:
+        factors = np.array([(1.0 - math.pow(decay, n)) / (1.0 - decay) for n in range(max(steps, 128))])
+        _inertia_factors[decay] = factors
+    return factors
+
+
+class InterceptPlayers:
+    """
+        struct of arrays of the players given to PlayerInterceptBatch.predict, one row per player
+    """
+    def __init__(self, wm: 'WorldModel', players: list[PlayerObject]):
+        store = PlayerStore.i()
+        slots = player_slots(players)
+        pos_count = store.count('pos_count', slots)
+        seen_pos_count = store.count('seen_pos_count', slots)
+        seen_pos = seen_pos_count <= pos_count
+        seen_vel = store.count('seen_vel_count', slots) <= store.count('vel_count', slots)
+        ptypes = [p.player_type() for p in players]
+
+        self.size = len(players)
+        self.vel = store.vel[slots]
+        self.pos = store.pos[slots]
+        if seen_pos.any():
+            self.pos[seen_pos] = [[p._seen_pos.x(), p._seen_pos.y()] for p, s in zip(players, seen_pos) if s]
+        self.speed = np.sqrt(self.vel[:, 0] * self.vel[:, 0] + self.vel[:, 1] * self.vel[:, 1])
+        if seen_vel.any():
+            self.vel[seen_vel] = [[p._seen_vel.x(), p._seen_vel.y()] for p, s in zip(players, seen_vel) if s]
+        self.body = np.array([p._body.degree() for p in players])
+        self.pos_count = np.minimum(seen_pos_count, pos_count)
+        self.goalie = store.goalie[slots]
+        self.tackle_wait = np.where(store.tackle[slots],
+                                    np.maximum(0, ServerParam.i().tackle_cycles() - store.count('tackle_count', slots) - 2),
+                                    0)
+        self.opponent = np.array([p.side() != wm.our_side() for p in players], dtype=bool)
+        self.dist_from_self = store.dist_from_self[slots]
+
+        self.real_speed_max = np.array([t.real_speed_max() for t in ptypes])
+        self.kickable_area = np.array([t.kickable_area() for t in ptypes])
+        self.catchable_area = np.array([t.catchable_area() for t in ptypes])
+        self.decay = np.array([t.player_decay() for t in ptypes])
+        self.inertia_moment = np.array([t.inertia_moment() for t in ptypes])
+        self.dash_table = np.array([t._dash_distance_table for t in ptypes]).reshape(self.size, -1)
+
+
+class PlayerInterceptBatch:
+    """
+        PlayerIntercept.predict of many players at once, every (player, cycle) of the ball cache is an array element.
+        predict returns the first reach cycle (NEVER if the player can not reach the ball in the cache)
+        and the predict_final cycle of every player, so PlayerIntercept.predict(max_cycle) of player i is
+        reach[i] if reach[i] < max_cycle else final[i].
+    """
+    NEVER = 1000
+    FINAL_CYCLE = 100
+
+    def __init__(self, wm: 'WorldModel', ball_cache: list[Vector2D]):
+        sp = ServerParam.i()
+        self._wm = wm
+        self._ball = np.array([[b.x(), b.y()] for b in ball_cache]).reshape(-1, 2)
+        self._penalty_x_abs = sp.pitch_half_length() - sp.penalty_area_length()
+        self._penalty_y_abs = sp.penalty_area_half_width()
+        self._max_moment = sp.max_moment()
+        self._ball_count_bound = min(6, wm.ball().seen_pos_count() + 1)
+
+        rotation = -wm.ball().vel().th()
+        self._rotation_cos = math.cos(rotation.degree() * DEG2RAD)
+        self._rotation_sin = math.sin(rotation.degree() * DEG2RAD)
+
+    def predict(self, players: Union[InterceptPlayers, list[PlayerObject]]):
+        if not isinstance(players, InterceptPlayers):
+            players = InterceptPlayers(self._wm, players)
+        reach = np.full(players.size, PlayerInterceptBatch.NEVER, dtype=np.int64)
+        if players.size == 0:
+            return reach, reach.copy()
+        final = self.predict_final(players)
+
+        # min_cycle of PlayerIntercept.predict
+        rel_x = players.pos[:, 0] - self._wm.ball().pos().x()
+        rel_y = players.pos[:, 1] - self._wm.ball().pos().y()
+        rel_y = rel_x * self._rotation_sin + rel_y * self._rotation_cos
+        min_cycle = np.floor(np.fabs(rel_y) / players.real_speed_max).astype(np.int64)
+        min_cycle = np.maximum(0, min_cycle + players.tackle_wait - players.pos_count)
+
+        ball_steps = self._ball.shape[0]
+        count = np.maximum(0, ball_steps - min_cycle)
+        p = np.repeat(np.arange(players.size), count)
+        if p.shape[0] == 0:
+            return reach, final
+        start = np.cumsum(count) - count
+        cycle = min_cycle[p] + np.arange(p.shape[0]) - start[p]
+        ball = self._ball[cycle]
+
+        control_area = self._control_area(players, p, ball)
+        diff = ball - players.pos[p]
+        near = (control_area + players.real_speed_max[p] * (cycle + players.pos_count[p]) + 0.5
+                >= np.sqrt(diff[:, 0] * diff[:, 0] + diff[:, 1] * diff[:, 1]))
+        p = p[near]
+        if p.shape[0] == 0:
+            return reach, final
+        cycle = cycle[near]
+        ball = ball[near]
+        control_area = control_area[near]
+
+        # can_reach_after_turn_dash, the player moves by inertia while turning and dashing
+        inertia = self._inertia_points(players, p, cycle)
+        n_turn, target_dist = self._turn_cycles(players, p, cycle, ball - inertia, control_area)
+        n_dash = cycle - n_turn
+        dash_dist = target_dist - control_area
+        # the side of PlayerObject is compared as a method, every player takes the opponent count bound
+        estimate_dash = (self._cycles_to_reach_distance(players, p, dash_dist)
+                         - np.clip(players.pos_count[p] - n_turn, 0, None).clip(None, self._ball_count_bound)
+                         + players.tackle_wait[p])
+        reached = (n_dash >= 0) & ((dash_dist < 0) | (estimate_dash <= n_dash))
+
+        np.minimum.at(reach, p[reached], cycle[reached])
+        return reach, final
+
+    def predict_final(self, players: InterceptPlayers) -> np.ndarray:
+        p = np.arange(players.size)
+        ball_step = self._ball.shape[0]
+        ball = np.repeat(self._ball[-1:], players.size, axis=0)
+        control_area = self._control_area(players, p, ball)
+        cycle = np.full(players.size, PlayerInterceptBatch.FINAL_CYCLE, dtype=np.int64)
+        inertia = self._inertia_points(players, p, cycle)
+        n_turn, dash_dist = self._turn_cycles(players, p, cycle, ball - inertia, control_area)
+
+        dash_dist = dash_dist - control_area
+        dash_dist = np.where(players.opponent, dash_dist - players.dist_from_self * 0.03, dash_dist)
+        n_dash = (self._cycles_to_reach_distance(players, p, dash_dist)
+                  - np.clip(players.pos_count - n_turn, 0, np.where(players.opponent, 10, 1)))
+        n_dash = np.maximum(1, n_dash)
+        return np.where(dash_dist < 0, ball_step, np.maximum(ball_step, n_turn + n_dash))
+
+    def _control_area(self, players: InterceptPlayers, p: np.ndarray, ball: np.ndarray) -> np.ndarray:
+        catch = (players.goalie[p]
+                 & (np.fabs(ball[:, 0]) > self._penalty_x_abs)
+                 & (np.fabs(ball[:, 1]) < self._penalty_y_abs))
+        return np.where(catch, players.catchable_area[p], players.kickable_area[p])
+
+    def _inertia_points(self, players: InterceptPlayers, p: np.ndarray, cycle: np.ndarray) -> np.ndarray:
+        steps = int(cycle.max()) + 1
+        factors = np.empty(cycle.shape[0])
+        for decay in np.unique(players.decay[p]):
+            same = players.decay[p] == decay
+            factors[same] = inertia_factors(float(decay), steps)[cycle[same]]
+        return players.pos[p] + players.vel[p] * factors[:, None]
+
+    def _turn_cycles(self, players: InterceptPlayers, p: np.ndarray, cycle: np.ndarray, target_rel: np.ndarray,
+                     control_area: np.ndarray):
+        # PlayerIntercept.predict_turn_cycle, returns the turn cycles and the target distances
+        x = target_rel[:, 0]
+        y = target_rel[:, 1]
+        target_dist = np.sqrt(x * x + y * y)
+        turn_margin = np.full(p.shape[0], 180.0)
+        far = control_area < target_dist
+        turn_margin[far] = np.arcsin(np.minimum(1.0, control_area[far] / target_dist[far])) * RAD2DEG
+        turn_margin = np.maximum(turn_margin, 12)
+
+        target_angle = np.arctan2(y, x) * RAD2DEG
+        target_angle[(np.fabs(x) < EPSILON) & (np.fabs(y) < EPSILON)] = 0.0
+        angle_diff = target_angle - players.body[p]
+        angle_diff[angle_diff < -180.0] += 360.0
+        angle_diff[angle_diff > 180.0] -= 360.0
+        angle_diff = np.fabs(angle_diff)
+        back = (target_dist < 5) & (angle_diff > 90)
+        angle_diff[back] = 180 - angle_diff[back]
+
+        n_turn = np.zeros(p.shape[0], dtype=np.int64)
+        speed = players.speed[p]
+        inertia_moment = players.inertia_moment[p]
+        decay = players.decay[p]
+        turning = angle_diff > turn_margin
+        while turning.any():
+            angle_diff[turning] -= self._max_moment / (1.0 + inertia_moment[turning] * speed[turning])
+            speed = speed * decay
+            n_turn += turning
+            turning = angle_diff > turn_margin
+        return n_turn, target_dist
+
+    def _cycles_to_reach_distance(self, players: InterceptPlayers, p: np.ndarray, dash_dist: np.ndarray) -> np.ndarray:
+        # PlayerType.cycles_to_reach_distance, the dash tables are increasing
+        table = players.dash_table[p]
+        n_dash = np.count_nonzero(table < dash_dist[:, None], axis=1)
+        over = n_dash == table.shape[1]
+        if over.any():
+            n_dash[over] += np.ceil((dash_dist[over] - table[over, -1])
+                                    / players.real_speed_max[p[over]]).astype(np.int64)
+        n_dash[dash_dist <= 0.001] = 0
+        return n_dash
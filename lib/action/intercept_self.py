@@ -1,4 +1,7 @@
 from math import ceil
+
+import numpy as np
+
 from lib.action.intercept_info import InterceptInfo
 from lib.debug.debug import log
 from pyrusgeom.angle_deg import AngleDeg
@@ -8,7 +11,7 @@ from pyrusgeom.soccer_math import bound, calc_first_term_geom_series, min_max
 from pyrusgeom.vector_2d import Vector2D
 from lib.player.object_ball import BallObject
 from lib.player.object_player import PlayerObject
-from lib.player.stamina_model import StaminaModel
+from lib.player.stamina_model import StaminaModel, StaminaModels
 from lib.rcsc.player_type import PlayerType
 from lib.rcsc.server_param import ServerParam
 
@@ -18,8 +21,7 @@ if TYPE_CHECKING:
     from lib.player.world_model import WorldModel
 
 control_area_buf = 0.15
-
-DEBUG = True
+OUT_OF_FIELD = -1
 
 
 class SelfIntercept:
@@ -45,7 +47,7 @@ class SelfIntercept:
         self_cache.sort()  # TODO check this
         log.sw_log().intercept().add_text("self pred all sorted intercept")
         for ii in self_cache:
-            log.sw_log().intercept().add_text(f"{ii}")
+            log.sw_log().intercept().add_text('{}', ii)
 
     def predict_one_step(self, self_cache):
         wm = self._wm
@@ -161,7 +163,7 @@ class SelfIntercept:
         for dash_dir in dirs:
             dash_angle: AngleDeg = me.body() + SP.discretize_dash_angle(SP.normalize_dash_angle(dash_dir))
             dash_rate: float = me.dash_rate() * SP.dash_dir_rate(dash_dir)
-            log.sw_log().intercept().add_text(f"----- dash dir={dash_dir}, angle={dash_angle}, dash_rate={dash_rate}")
+            log.sw_log().intercept().add_text('----- dash dir={}, angle={}, dash_rate={}', dash_dir, dash_angle, dash_rate)
 
             # check recovery save dash
             forward_dash_power = bound(0,
@@ -220,7 +222,7 @@ class SelfIntercept:
                     (abs(best.ball_dist() - it.ball_dist()) < 0.001 and
                      best.stamina() < it.stamina()):
                 best = it
-        log.sw_log().intercept().add_text(f'=====>>>> best one dash: {str(best)}')
+        log.sw_log().intercept().add_text('=====>>>> best one dash: {}', best)
         self_cache.append(best)
 
     def predict_one_dash_adjust(self,
@@ -245,11 +247,11 @@ class SelfIntercept:
         # debug_print(
         # f"self pred one dash adjust dir={dash_dir}, ball_rel={ball_rel} ,_____ max_forward_accel={max_forward_accel} rel={forward_accel_rel} , _____ max_back_accel={max_back_accel} rel={back_accel_rel}")
         log.sw_log().intercept().add_text(
-            f"self pred one dash adjust dir={dash_dir}, ball_rel={ball_rel}")
+            'self pred one dash adjust dir={}, ball_rel={}', dash_dir, ball_rel)
         log.sw_log().intercept().add_text(
-            f"_____ max_forward_accel={max_forward_accel} rel={forward_accel_rel}")
+            '_____ max_forward_accel={} rel={}', max_forward_accel, forward_accel_rel)
         log.sw_log().intercept().add_text(
-            f"_____ max_back_accel={max_back_accel} rel={back_accel_rel}")
+            '_____ max_back_accel={} rel={}', max_back_accel, back_accel_rel)
 
         if ball_rel.abs_y() > control_buf or \
                 Segment2D(forward_accel_rel, back_accel_rel).dist(ball_rel) > control_buf:
@@ -265,7 +267,7 @@ class SelfIntercept:
                                                       forward_accel_rel.x(),
                                                       back_accel_rel.x())
             log.sw_log().intercept().add_text(
-                f"self pred one dash adjust (1). dash_power={dash_power}")
+                'self pred one dash adjust (1). dash_power={}', dash_power)
 
         # big x difference x (>0)
         if dash_power < -999 and \
@@ -317,13 +319,7 @@ class SelfIntercept:
                   my_pos.dist(ball_next),
                   stamina_model.stamina())
         log.sw_log().intercept().add_text(
-            f"self pred one dash adjust Success! "
-            f"power={info.dash_power()}, "
-            f"rel_dir={info.dash_angle()}, "
-            f"angle={dash_angle.degree()}"
-            f"my_pos={my_pos}"
-            f"ball_dist={info.ball_dist()}"
-            f"stamina={stamina_model.stamina()}")
+            'self pred one dash adjust Success! power={}, rel_dir={}, angle={}my_pos={}ball_dist={}stamina={}', info.dash_power(), info.dash_angle(), dash_angle.degree(), my_pos, info.ball_dist(), stamina_model.stamina())
         return True
 
     def get_one_step_dash_power(self,
@@ -404,7 +400,7 @@ class SelfIntercept:
             tmp_cache = []
             ball_pos += ball_vel
             ball_vel *= SP.ball_decay()
-            log.sw_log().intercept().add_text(f"self pred short cycle {cycle}: bpos={ball_pos}, bvel={ball_vel}")
+            log.sw_log().intercept().add_text('self pred short cycle {}: bpos={}, bvel={}', cycle, ball_pos, ball_vel)
 
             goalie_mode = self.is_goalie_mode(ball_pos, pen_area_x, pen_area_y)
             control_area = (ptype.catchable_area()
@@ -711,7 +707,7 @@ class SelfIntercept:
         first_dash_power = 0
         for n_dash in range(1, max_dash + 1):
             log.sw_log().intercept().add_text(
-                f"self pred short dash {n_dash}: max_dash={max_dash}")
+                'self pred short dash {}: max_dash={}', n_dash, max_dash)
             ball_rel = (ball_pos - my_pos).rotated_vector(-dash_angle)
             first_speed = calc_first_term_geom_series(ball_rel.x(),
                                                       ptype.player_decay(),
@@ -800,19 +796,12 @@ class SelfIntercept:
                 result_dash_angle.set_degree((target_angle + angle_diff).degree())
 
         log.sw_log().intercept().add_text(
-            f"self pred short cycle {cycle}: "
-            f"turn={n_turn}, "
-            f"turn_margin={turn_margin}"
-            f"turn_momment={result_dash_angle.degree() - body_angle.degree()}"
-            f"first_angle_diff={target_angle.degree() - body_angle.degree()}"
-            f"final_angle={angle_diff}"
-            f"dash_angle={result_dash_angle}")
+            'self pred short cycle {}: turn={}, turn_margin={}turn_momment={}first_angle_diff={}final_angle={}dash_angle={}', cycle, n_turn, turn_margin, result_dash_angle.degree() - body_angle.degree(), target_angle.degree() - body_angle.degree(), angle_diff, result_dash_angle)
         return n_turn
 
     def predict_long_step(self, max_cycle: int, save_recovery: bool, self_cache: list):
-        if DEBUG:
+        if log.sw_log().intercept().enabled:
             log.sw_log().intercept().add_text('=========================== Long Step =============================')
-        tmp_cache = []
         SP = ServerParam.i()
         wm = self._wm
         ball = wm.ball()
@@ -831,19 +820,18 @@ class SelfIntercept:
 
         ball_pos = ball.inertia_point(start_cycle - 1)
         ball_vel = ball.vel() * SP.ball_decay() ** (start_cycle - 1)
-        found = False
 
-        max_loop = max_cycle
-        tmp_cache = []
-        for cycle in range(start_cycle, max_loop):
+        # (cycle, ball pos, row of predict_long_dashes), the row is None if the ball is too far, OUT_OF_FIELD at the end
+        steps = []
+        cycles = []
+        ball_positions = []
+        control_areas = []
+        for cycle in range(start_cycle, max_cycle):
             ball_pos += ball_vel
             ball_vel *= SP.ball_decay()
-            if DEBUG:
-                log.sw_log().intercept().add_text(f'$$$ c: {cycle} b: {ball_pos}')
             if ball_pos.abs_x() > SP.pitch_half_length() + 10 or \
                     ball_pos.abs_y() > SP.pitch_half_width() + 10:
-                log.sw_log().intercept().add_text('-------> out of field')
-                log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='r')
+                steps.append((cycle, ball_pos.copy(), OUT_OF_FIELD))
                 break
 
             goalie_mode = self.is_goalie_mode(ball_pos)
@@ -851,19 +839,32 @@ class SelfIntercept:
 
             # reach point is to far never reach
             if control_area + ptype.real_speed_max() * cycle < me.pos().dist(ball_pos):
+                steps.append((cycle, ball_pos.copy(), None))
+                continue
+
+            steps.append((cycle, ball_pos.copy(), len(cycles)))
+            cycles.append(cycle)
+            ball_positions.append(ball_pos.copy())
+            control_areas.append(control_area)
+
+        results = self.predict_long_dashes(cycles, ball_positions, control_areas, save_recovery)
+        found = False
+        for cycle, ball_pos, row in steps:
+            if log.sw_log().intercept().enabled:
+                log.sw_log().intercept().add_text('$$$ c: {} b: {}', cycle, ball_pos)
+            if row == OUT_OF_FIELD:
+                log.sw_log().intercept().add_text('-------> out of field')
+                log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='r')
+                break
+            if row is None:
                 log.sw_log().intercept().add_text('-------> to far never reach')
                 log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='r')
                 continue
 
-            res, n_turn, back_dash, result_recovery = self.can_reach_after_turn_long_dash(cycle,
-                                                                                          ball_pos,
-                                                                                          control_area,
-                                                                                          save_recovery,
-                                                                                          self_cache)
-            if res:
-                log.sw_log().intercept().add_text(f'-------> {res} turn:{n_turn} back_dash: {back_dash}')
-                if not found:
-                    max_loop = min(max_cycle, cycle + 10)
+            info, n_turn, back_dash = results[row]
+            if info is not None:
+                self_cache.append(info)
+                log.sw_log().intercept().add_text('-------> {} turn:{} back_dash: {}', True, n_turn, back_dash)
                 found = True
                 log.sw_log().intercept().add_circle(cx=ball_pos.x(), cy=ball_pos.y(), r=0.3, color='green')
             else:
@@ -876,28 +877,175 @@ class SelfIntercept:
         if len(self_cache) == 0:
             self.predict_final(max_cycle, self_cache)
 
-    def can_reach_after_turn_long_dash(self,
-                                       cycle,
-                                       ball_pos,
-                                       control_area,
-                                       save_recovery,
-                                       self_cache) -> tuple:
-        dash_angle = self._wm.self().body()
-        result_recovery = 0
-        n_turn, dash_angle, back_dash = self.predict_turn_cycle(cycle,
-                                                                ball_pos,
-                                                                control_area,
-                                                                dash_angle)
-        if n_turn > cycle:
-            return False, n_turn, back_dash, result_recovery
+    def predict_long_dashes(self,
+                            cycles: list[int],
+                            ball_positions: list[Vector2D],
+                            control_areas: list[float],
+                            save_recovery: bool) -> list[tuple]:
+        """
+            turn and full power dashes to the ball position of every cycle.
+            every cycle is a row, the dashes of all rows are simulated together (one array operation per step),
+            a row stops when the player passes the ball or its dashes are over.
+            returns (InterceptInfo or None, n_turn, back_dash) of every cycle
+        """
+        SP = ServerParam.i()
+        wm = self._wm
+        me = wm.self()
+        ptype = me.player_type()
+        player_noise_rate = 1 - SP.player_rand() * 0.01
+        max_power = SP.max_dash_power()
+        recover_dec_thr = SP.recover_dec_thr() * SP.stamina_max()
+        decay = ptype.player_decay()
+
+        results = []
+        rows = []
+        waited: dict[int, StaminaModel] = {}
+        for cycle, ball_pos, control_area in zip(cycles, ball_positions, control_areas):
+            n_turn, dash_angle, back_dash = self.predict_turn_cycle(cycle, ball_pos, control_area, me.body())
+            results.append((None, n_turn, back_dash))
+            if n_turn > cycle:
+                continue
 
-        res, result_recovery = self.can_reach_after_dash(n_turn, max(0, cycle - n_turn),
-                                                         ball_pos, control_area,
-                                                         save_recovery,
-                                                         dash_angle, back_dash,
-                                                         result_recovery,
-                                                         self_cache)
-        return res, n_turn, back_dash, result_recovery
+            # ORIGIN: first player pos. X - axis: dash angle (included back dash case)
+            dash_angle_minus = -dash_angle
+            ball_rel = (ball_pos - me.pos()).rotated_vector(dash_angle_minus)
+            ball_noise = wm.ball().pos().dist(ball_pos) * SP.ball_rand() * 0.5
+            tmp_pos = ptype.inertia_travel(me.vel(), n_turn)
+            tmp_pos.rotate(dash_angle_minus)
+            tmp_vel = me.vel()
+            tmp_vel *= decay ** n_turn
+            tmp_vel.rotate(dash_angle_minus)
+            if n_turn not in waited:
+                waited[n_turn] = me.stamina_model()
+                waited[n_turn].simulate_waits(ptype, n_turn)
+            rows.append((len(results) - 1, n_turn, max(0, cycle - n_turn), dash_angle, back_dash, ball_pos,
+                         control_area, ball_rel, ball_noise, tmp_pos.x(), tmp_pos.y(), tmp_vel.x(), tmp_vel.y()))
+        if not rows:
+            return results
+
+        # a row dashes until it passes the ball (then it waits until its n_dash cycles are over) or its dashes are over
+        n_dash = np.array([r[2] for r in rows], dtype=np.int64)
+        back = np.array([r[4] for r in rows], dtype=bool)
+        noised_ball_x = np.array([r[7].x() + r[8] for r in rows])
+        pos_x, pos_y, vel_x, vel_y = np.array([r[9:13] for r in rows]).T
+        stamina_models = StaminaModels([waited[r[1]] for r in rows])
+        prev_effort = stamina_models.effort()
+        sign = np.where(back, -1, 1)
+
+        # only x of the dash accel matters, it must be positive
+        dash_power_abs = np.full(len(rows), max_power)
+        dash_accel_x = dash_power_abs * (prev_effort * ptype.dash_power_rate())
+        speed_limit = ptype.player_speed_max() * (1 - decay)
+        can_over_speed_max = np.fabs(dash_power_abs) * ptype.dash_power_rate() * prev_effort > speed_limit
+        first_dash_power = dash_power_abs * sign
+        passed = np.zeros(len(rows), dtype=bool)
+        passed_step = np.full(len(rows), -1, dtype=np.int64)
+
+        # the state of the rows whose cycles are over
+        final_pos = [None] * len(rows)
+        final_stamina: list[StaminaModel] = [None] * len(rows)
+        final_first_dash_power = first_dash_power.copy()
+
+        index = np.arange(len(rows))
+        i = 0
+        while True:
+            over = passed | (i >= n_dash)
+            if over.any():
+                for k in np.nonzero(over)[0].tolist():
+                    r = index[k].item()
+                    final_pos[r] = Vector2D(pos_x[k].item(), pos_y[k].item())
+                    final_stamina[r] = stamina_models.model(k)
+                    final_stamina[r].simulate_waits(ptype, n_dash[k].item() - i)
+                    final_first_dash_power[r] = first_dash_power[k]
+                keep = ~over
+                if not keep.any():
+                    break
+                index = index[keep]
+                n_dash = n_dash[keep]
+                back = back[keep]
+                noised_ball_x = noised_ball_x[keep]
+                pos_x, pos_y, vel_x, vel_y = pos_x[keep], pos_y[keep], vel_x[keep], vel_y[keep]
+                stamina_models.take(keep)
+                prev_effort = prev_effort[keep]
+                sign = sign[keep]
+                dash_power_abs = dash_power_abs[keep]
+                dash_accel_x = dash_accel_x[keep]
+                can_over_speed_max = can_over_speed_max[keep]
+                first_dash_power = first_dash_power[keep]
+
+            # update dash power and accel
+            stamina = stamina_models.stamina()
+            effort = stamina_models.effort()
+            available_power = (np.maximum(0, stamina - recover_dec_thr)
+                               if save_recovery
+                               else stamina + ptype.extra_stamina())
+            available_power = np.where(back, available_power * 0.5, available_power)
+            available_power = np.minimum(np.maximum(0, available_power), max_power)
+
+            must_update_power = ((available_power < dash_power_abs)
+                                 | (effort < prev_effort)
+                                 | (~can_over_speed_max & (dash_power_abs < available_power)))
+            dash_rate = effort * ptype.dash_power_rate()
+            if must_update_power.any():
+                dash_power_abs = np.where(must_update_power, available_power, dash_power_abs)
+                dash_accel_x = np.where(must_update_power, dash_power_abs * dash_rate, dash_accel_x)
+                can_over_speed_max = np.where(must_update_power,
+                                              np.fabs(dash_power_abs) * ptype.dash_power_rate() * effort > speed_limit,
+                                              can_over_speed_max)
+                if i == 0:
+                    first_dash_power = np.where(must_update_power, dash_power_abs * sign, first_dash_power)
+
+            # update vel, power conservation updates accel magnitude and dash power
+            new_vel_x = vel_x + dash_accel_x
+            over_speed = can_over_speed_max & (new_vel_x * new_vel_x + vel_y * vel_y > ptype.player_speed_max2())
+            if over_speed.any():
+                over_accel_x = (ptype.player_speed_max2() - vel_y ** 2) ** 0.5 - vel_x
+                dash_accel_x = np.where(over_speed, over_accel_x, dash_accel_x)
+                dash_power_abs = np.where(over_speed, np.fabs(over_accel_x / dash_rate), dash_power_abs)
+                new_vel_x = np.where(over_speed, vel_x + over_accel_x, new_vel_x)
+                can_over_speed_max = np.where(over_speed,
+                                              np.fabs(dash_power_abs) * ptype.dash_power_rate() * effort > speed_limit,
+                                              can_over_speed_max)
+
+            pos_x = pos_x + new_vel_x
+            pos_y = pos_y + vel_y
+            vel_x = new_vel_x * decay
+            vel_y = vel_y * decay
+            stamina_models.simulate_dash(ptype, dash_power_abs * sign)
+
+            passed = pos_x * player_noise_rate + 0.1 > noised_ball_x
+            passed_step[index[passed]] = i
+            i += 1
+
+        for r, (result, n_turn, n_dash, dash_angle, back_dash, ball_pos, control_area, ball_rel, ball_noise,
+                *_) in enumerate(rows):
+            tmp_pos = final_pos[r]
+            stamina_model = final_stamina[r]
+            if passed_step[r] >= 0:
+                my_inertia = me.inertia_point(n_turn + n_dash)
+                my_final_pos = me.pos() + tmp_pos.rotate(dash_angle)
+                if my_inertia.dist2(my_final_pos) > 0.01:
+                    my_final_pos = Line2D(p1=my_inertia, p2=my_final_pos).projection(ball_pos)
+            else:
+                player_noise = tmp_pos.r() * SP.player_rand() * 0.5
+                buf = 0.2
+                buf += player_noise
+                buf += ball_noise
+                if ball_rel.dist(tmp_pos) >= max(control_area - 0.225, control_area - buf):
+                    continue
+                my_final_pos = me.pos() + tmp_pos.rotate(dash_angle)
+            mode = (InterceptInfo.Mode.EXHAUST
+                    if stamina_model.recovery() < me.recovery()
+                       and not stamina_model.capacity_is_empty()
+                    else InterceptInfo.Mode.NORMAL)
+            results[result] = (InterceptInfo(mode,
+                                             n_turn, n_dash,
+                                             final_first_dash_power[r].item(), 180.0 if back_dash else 0,
+                                             my_final_pos,
+                                             my_final_pos.dist(ball_pos),
+                                             stamina_model.stamina()),
+                               n_turn, back_dash)
+        return results
 
     def predict_turn_cycle(self, cycle: int,
                            ball_pos: Vector2D,
@@ -986,139 +1134,6 @@ class SelfIntercept:
 
         return True
 
-    def can_reach_after_dash(self,
-                             n_turn: int,
-                             n_dash: int,
-                             ball_pos: Vector2D,
-                             control_area: float,
-                             save_recovery: bool,
-                             dash_angle: AngleDeg,
-                             back_dash: bool,
-                             result_recovery,
-                             self_cache: list):
-        PLAYER_NOISE_RATE = 1 - ServerParam.i().player_rand() * 0.01
-        MAX_POWER = ServerParam.i().max_dash_power()
-
-        SP = ServerParam.i()
-        wm = self._wm
-        ptype = wm.self().player_type()
-
-        my_inertia = wm.self().inertia_point(n_turn + n_dash)
-        recover_dec_thr = SP.recover_dec_thr() * SP.stamina_max()
-
-        dash_angle_minus = -dash_angle
-        ball_rel = (ball_pos - wm.self().pos()).rotated_vector(dash_angle_minus)
-        ball_noise = (wm.ball().pos().dist(ball_pos)
-                      * SP.ball_rand()
-                      * 0.5)
-        noised_ball_x = ball_rel.x() + ball_noise
-
-        # prepare loop variables
-        # ORIGIN: first player pos.
-        # X - axis: dash angle
-        tmp_pos = ptype.inertia_travel(wm.self().vel(), n_turn)
-        tmp_pos.rotate(dash_angle_minus)
-
-        tmp_vel = wm.self().vel()
-        tmp_vel *= ptype.player_decay() ** n_turn
-        tmp_vel.rotate(dash_angle_minus)
-
-        stamina_model = wm.self().stamina_model()
-        stamina_model.simulate_waits(ptype, n_turn)
-
-        prev_effort = stamina_model.effort()
-        dash_power_abs = MAX_POWER
-        # only consider about x of dash accel vector,
-        # because current orientation is player's dash angle (included back dash case)
-        # NOTE: dash_accel_x must be positive value.
-        dash_accel_x = dash_power_abs * ptype.dash_rate(stamina_model.effort())
-
-        can_over_speed_max = ptype.can_over_speed_max(dash_power_abs,
-                                                      stamina_model.effort())
-        first_dash_power = dash_power_abs * (-1 if back_dash else 1)
-        for i in range(n_dash):
-            # update dash power and accel
-            available_power = (max(0, stamina_model.stamina() - recover_dec_thr)
-                               if save_recovery
-                               else stamina_model.stamina() + ptype.extra_stamina())
-            if back_dash:
-                available_power *= 0.5
-            available_power = min_max(0, available_power, MAX_POWER)
-
-            must_update_power = False
-            if (available_power < dash_power_abs
-                    or stamina_model.effort() < prev_effort
-                    or (not can_over_speed_max
-                        and dash_power_abs < available_power)):
-                must_update_power = True
-
-            if must_update_power:
-                dash_power_abs = available_power
-                dash_accel_x = dash_power_abs * ptype.dash_rate(stamina_model.effort())
-                can_over_speed_max = ptype.can_over_speed_max(dash_power_abs,
-                                                              stamina_model.effort())
-                if i == 0:
-                    first_dash_power = dash_power_abs * (-1 if back_dash else 1)
-
-            # update vel
-            tmp_vel.add_x(dash_accel_x)
-            # power conservation, update accel magnitude and dashpower
-            if can_over_speed_max and tmp_vel.r2() > ptype.player_speed_max2():
-                tmp_vel.sub_x(dash_accel_x)
-                max_dash_x = (ptype.player_speed_max2() - tmp_vel.y() ** 2) ** 0.5
-
-                dash_accel_x = max_dash_x - tmp_vel.x()
-                dash_power_abs = abs(dash_accel_x / ptype.dash_rate(stamina_model.effort()))
-                tmp_vel.add_x(dash_accel_x)
-                can_over_speed_max = ptype.can_over_speed_max(dash_power_abs,
-                                                              stamina_model.effort())
-
-            tmp_pos += tmp_vel
-            tmp_vel *= ptype.player_decay()
-            stamina_model.simulate_dash(ptype, dash_power_abs * (-1 if back_dash else 1))
-
-            if tmp_pos.x() * PLAYER_NOISE_RATE + 0.1 > noised_ball_x:
-                result_recovery = stamina_model.recovery()
-                inertia_pos = ptype.inertia_point(tmp_pos, tmp_vel, n_dash - (i + 1))
-                my_final_pos = wm.self().pos() + tmp_pos.rotate(dash_angle)
-                if my_inertia.dist2(my_final_pos) > 0.01:
-                    my_final_pos = Line2D(p1=my_inertia, p2=my_final_pos).projection(ball_pos)
-                stamina_model.simulate_waits(ptype, n_dash - (i + 1))
-                mode = (InterceptInfo.Mode.EXHAUST
-                        if stamina_model.recovery() < wm.self().recovery()
-                           and not stamina_model.capacity_is_empty()
-                        else InterceptInfo.Mode.NORMAL)
-                self_cache.append(InterceptInfo(mode,
-                                                n_turn, n_dash,
-                                                first_dash_power, 180.0 if back_dash else 0,
-                                                my_final_pos,
-                                                my_final_pos.dist(ball_pos),
-                                                stamina_model.stamina()))
-                return True, result_recovery
-
-        player_travel = tmp_pos.r()
-        player_noise = player_travel * SP.player_rand() * 0.5
-        last_ball_dist = ball_rel.dist(tmp_pos)
-        buf = 0.2
-
-        buf += player_noise
-        buf += ball_noise
-
-        if last_ball_dist < max(control_area - 0.225, control_area - buf):
-            my_final_pos = wm.self().pos() + tmp_pos.rotate(dash_angle)
-            result_recovery = stamina_model.recovery()
-            mode = (InterceptInfo.Mode.EXHAUST
-                    if stamina_model.recovery() < wm.self().recovery()
-                       and not stamina_model.capacity_is_empty()
-                    else InterceptInfo.Mode.NORMAL)
-            self_cache.append(InterceptInfo(mode,
-                                            n_turn, n_dash,
-                                            first_dash_power, 180.0 if back_dash else 0,
-                                            my_final_pos, my_final_pos.dist(ball_pos),
-                                            stamina_model.stamina()))
-            return True, result_recovery
-        return False, result_recovery
-
     def predict_final(self, max_cycle: int, self_cache: list):
         wm = self._wm
         me = wm.self()
@@ -1,6 +1,8 @@
 from typing import Union
+
+import team_config
 from lib.action.intercept_info import InterceptInfo
-from lib.action.intercept_player import PlayerIntercept
+from lib.action.intercept_player import PlayerInterceptBatch
 from lib.action.intercept_self import SelfIntercept
 from lib.debug.color import Color
 from lib.debug.debug import log
@@ -15,10 +17,17 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from lib.player.world_model import WorldModel
 
+"""
+    with team_config.INCREMENTAL_INTERCEPT_TABLE the table reuses the ball cache of the last cycle: if the ball is
+    where the last cache predicted it (nobody kicked it), the cache is shifted by one cycle and only its tail is
+    extended. it is exact if the ball was not seen. the self and player predictions are always done.
+"""
+
+BALL_POS_THR = 0.01
+BALL_VEL_THR = 0.01
+
 
 class InterceptTable:
-    DEBUG = True
-    
     def __init__(self):
         self._last_update_time: GameTime = GameTime(-10, -100)
         self._max_cycle: int = 100
@@ -34,6 +43,17 @@ class InterceptTable:
         self._opponent_reach_cycle = 1000
         self._second_opponent_reach_cycle = 1000
 
+        # player store slot -> (reach cycle, final cycle) of PlayerInterceptBatch
+        self._player_cycles: dict[int, tuple[int, int]] = {}
+
+        # the ball velocity of the first and after the last cycle of the ball cache
+        self._ball_cache_first_vel: Vector2D = Vector2D(0, 0)
+        self._ball_cache_last_vel: Vector2D = Vector2D(0, 0)
+        self._ball_cache_shifted = False
+
+        self._ball_cache_hits = 0
+        self._ball_cache_misses = 0
+
         self._fastest_teammate: Union[None, PlayerObject] = None
         self._second_teammate: Union[None, PlayerObject] = None
         self._fastest_opponent: Union[None, PlayerObject] = None
@@ -63,21 +83,29 @@ class InterceptTable:
     def second_opponent_reach_cycle(self):
         return self._second_opponent_reach_cycle
 
+    def ball_cache_hits(self):
+        return self._ball_cache_hits
+
+    def ball_cache_misses(self):
+        return self._ball_cache_misses
+
     def update(self, wm: 'WorldModel'):
-        if InterceptTable.DEBUG:
-            log.sw_log().intercept().add_text( f"(intercept update) started {'#'*20}")
+        if log.sw_log().intercept().enabled:
+            log.sw_log().intercept().add_text( '(intercept update) started ####################')
             
         if self._last_update_time == wm.time(): # TODO uncomment it
-            if InterceptTable.DEBUG:
+            if log.sw_log().intercept().enabled:
                 log.sw_log().intercept().add_text( "(intercept update) intercept updated before! it called agein")
             return
 
+        next_cycle = self.is_next_cycle(self._last_update_time, wm.time())
+        last_ball_cache = self._ball_cache
         self._last_update_time = wm.time().copy()
         self.clear()
 
         if wm.game_mode().type() == GameModeType.TimeOver or \
                 wm.game_mode().type() == GameModeType.BeforeKickOff:
-            if InterceptTable.DEBUG:
+            if log.sw_log().intercept().enabled:
                 log.sw_log().intercept().add_text( "(intercept update) GAMEMODE RETURN")
             return
 
@@ -85,27 +113,28 @@ class InterceptTable:
             log.sw_log().intercept().add_text( "(intercept update) self pos or ball pos is not valid")
             return
         
-        self.create_ball_cache(wm)
+        self.create_ball_cache(wm, last_ball_cache if next_cycle else None)
         self.predict_self(wm)
+        self.predict_players(wm)
         self.predict_opponent(wm)
         self.predict_teammate(wm)
 
+        if log.sw_log().intercept().enabled:
+            log.sw_log().intercept().add_text('(intercept update) reuse: ball cache shifted={} hits={} misses={}',
+                                              self._ball_cache_shifted, self._ball_cache_hits, self._ball_cache_misses)
+
         if self._fastest_teammate is not None:
             log.sw_log().intercept().add_text(
-                          f"Intercept Teammate, fastest reach step={self._teammate_reach_cycle}"
-                          f"teammate {self._fastest_teammate.unum()} {self._fastest_teammate.pos()}")
+                          'Intercept Teammate, fastest reach step={}teammate {} {}', self._teammate_reach_cycle, self._fastest_teammate.unum(), self._fastest_teammate.pos())
         if self._second_teammate is not None:
             log.sw_log().intercept().add_text(
-                          f"Intercept Teammate2nd, fastest reach step={self._second_teammate_reach_cycle}"
-                          f"teammate {self._second_teammate.unum()} {self._second_teammate.pos()}")
+                          'Intercept Teammate2nd, fastest reach step={}teammate {} {}', self._second_teammate_reach_cycle, self._second_teammate.unum(), self._second_teammate.pos())
         if self._fastest_opponent is not None:
             log.sw_log().intercept().add_text(
-                          f"Intercept Opponent, fastest reach step={self._opponent_reach_cycle}"
-                          f"teammate {self._fastest_opponent.unum()} {self._fastest_opponent.pos()}")
+                          'Intercept Opponent, fastest reach step={}teammate {} {}', self._opponent_reach_cycle, self._fastest_opponent.unum(), self._fastest_opponent.pos())
         if self._second_opponent is not None:
             log.sw_log().intercept().add_text(
-                          f"Intercept Opponent2nd, fastest reach step={self._second_opponent_reach_cycle}"
-                          f"teammate {self._second_opponent.unum()} {self._second_opponent.pos()}")
+                          'Intercept Opponent2nd, fastest reach step={}teammate {} {}', self._second_opponent_reach_cycle, self._second_opponent.unum(), self._second_opponent.pos())
 
     def clear(self):
         self._ball_cache = []
@@ -124,13 +153,19 @@ class InterceptTable:
         self._second_opponent = None
 
         self._self_cache = []
-
-    def create_ball_cache(self, wm):
-        SP = ServerParam.i()
-        pitch_max_x = SP.pitch_half_length() + 5
-        pitch_max_y = SP.pitch_half_width() + 5
-        ball_decay = SP.ball_decay()
-
+        self._player_cycles = {}
+        self._ball_cache_shifted = False
+
+    @staticmethod
+    def is_next_cycle(last_time: GameTime, time: GameTime):
+        if time.stopped_cycle() == 0:
+            return time.cycle() == last_time.cycle() + 1 and last_time.stopped_cycle() == 0
+        return time.cycle() == last_time.cycle() and time.stopped_cycle() == last_time.stopped_cycle() + 1
+
+    def create_ball_cache(self, wm, last_ball_cache: list[Vector2D] = None):
+        """
+        last_ball_cache is the cache of the last cycle, it is shifted if the ball follows it
+        """
         ball_pos: Vector2D = wm.ball().pos()
         ball_vel: Vector2D = wm.ball().vel()
 
@@ -139,25 +174,54 @@ class InterceptTable:
         if wm.self().is_kickable():
             return
 
-        for cycle in range(1, self._max_cycle + 1):
-            ball_pos += ball_vel
-            ball_vel *= ball_decay
-            self._ball_cache.append(ball_pos.copy())
-
-            if cycle >= 5 and ball_vel.r2() < 0.01 ** 2:
-                # ball stopped
-                break
-
-            if ball_pos.abs_x() > pitch_max_x or ball_pos.abs_y() > pitch_max_y:
-                # out of pitch
-                break
+        if last_ball_cache is not None and self.can_shift_ball_cache(ball_pos, ball_vel, last_ball_cache):
+            self._ball_cache_hits += 1
+            self._ball_cache_shifted = True
+            self._ball_cache += last_ball_cache[2:]
+            self._ball_cache_first_vel *= ServerParam.i().ball_decay()
+            if not self.is_ball_cache_end(len(self._ball_cache) - 1, self._ball_cache[-1],
+                                          self._ball_cache_last_vel):
+                self.extend_ball_cache(self._ball_cache_last_vel.copy())
+        else:
+            if last_ball_cache is not None:
+                self._ball_cache_misses += 1
+            self._ball_cache_first_vel = ball_vel.copy()
+            self.extend_ball_cache(ball_vel)
 
         if len(self._ball_cache) == 1:
-            self._ball_cache.append(ball_pos.copy())
+            self._ball_cache.append(self._ball_cache[0].copy())
 
         for b in self._ball_cache:
             log.sw_log().intercept().add_circle( r=0.1, center=b, fill=True, color=Color(string="blue"))
 
+    def can_shift_ball_cache(self, ball_pos: Vector2D, ball_vel: Vector2D, last_ball_cache: list[Vector2D]):
+        if not team_config.INCREMENTAL_INTERCEPT_TABLE or len(last_ball_cache) < 2:
+            return False
+        return (ball_pos.dist(last_ball_cache[1]) < BALL_POS_THR
+                and ball_vel.dist(self._ball_cache_first_vel * ServerParam.i().ball_decay()) < BALL_VEL_THR)
+
+    @staticmethod
+    def is_ball_cache_end(cycle: int, ball_pos: Vector2D, ball_vel: Vector2D):
+        SP = ServerParam.i()
+        if cycle >= 5 and ball_vel.r2() < 0.01 ** 2:
+            # ball stopped
+            return True
+        if ball_pos.abs_x() > SP.pitch_half_length() + 5 or ball_pos.abs_y() > SP.pitch_half_width() + 5:
+            # out of pitch
+            return True
+        return False
+
+    def extend_ball_cache(self, ball_vel: Vector2D):
+        ball_decay = ServerParam.i().ball_decay()
+        ball_pos = self._ball_cache[-1].copy()
+        for cycle in range(len(self._ball_cache), self._max_cycle + 1):
+            ball_pos += ball_vel
+            ball_vel *= ball_decay
+            self._ball_cache.append(ball_pos.copy())
+            if self.is_ball_cache_end(cycle, ball_pos, ball_vel):
+                break
+        self._ball_cache_last_vel = ball_vel.copy()
+
     def predict_self(self, wm):
         if wm.self().is_kickable():
             log.sw_log().intercept().add_text( "Intercept predict self already kickable")
@@ -186,10 +250,29 @@ class InterceptTable:
                     break
 
         log.sw_log().intercept().add_text(
-                      f"Intercept self, solution size={len(self._self_cache)}")
+                      'Intercept self, solution size={}', len(self._self_cache))
         self._self_reach_cycle = min_cycle
         self._self_exhaust_reach_cycle = exhaust_min_cycle
 
+    def predict_players(self, wm: 'WorldModel'):
+        # the opponents and the teammates predict_opponent/predict_teammate check are predicted in one batch
+        players = []
+        if not wm.exist_kickable_opponents():
+            players += [it for it in wm.opponents_from_ball() if it.pos_count() < 15 and it.player_type() is not None]
+        if not wm.exist_kickable_teammates():
+            players += [it for it in wm.teammates_from_ball() if it.pos_count() < 10 and it.player_type() is not None]
+        if not players:
+            return
+        reach, final = PlayerInterceptBatch(wm, self._ball_cache).predict(players)
+        self._player_cycles = {it._slot: cycles for it, cycles in zip(players, zip(reach.tolist(), final.tolist()))}
+
+    def player_cycle(self, player: PlayerObject, max_cycle: int):
+        """
+        PlayerIntercept.predict(player, player_type, max_cycle) of a player of predict_players
+        """
+        reach, final = self._player_cycles[player._slot]
+        return reach if reach < max_cycle else final
+
     def predict_opponent(self, wm: 'WorldModel'):
         opponents = wm.opponents_from_ball()
 
@@ -202,14 +285,13 @@ class InterceptTable:
                     continue
                 self._fastest_opponent = o
                 log.sw_log().intercept().add_text(
-                              f"fastest opp {self._fastest_opponent}")
+                              'fastest opp {}', self._fastest_opponent)
                 break
             return
 
         min_cycle = 1000
         second_min_cycle = 1000
 
-        predictor = PlayerIntercept(wm, self._ball_cache)
         for it in opponents:
             if it.pos_count() >= 15:
                 continue
@@ -217,13 +299,11 @@ class InterceptTable:
             player_type = it.player_type()
             if player_type is None:
                 log.sw_log().intercept().add_text(
-                              f"intercept opponents faild to get player{it.unum()} type")
+                              'intercept opponents faild to get player{} type', it.unum())
                 continue
-            cycle = predictor.predict(it, player_type,
-                                      second_min_cycle)
+            cycle = self.player_cycle(it, second_min_cycle)
             log.sw_log().intercept().add_text(
-                          f"opp{it.unum()} {it.pos()} "
-                          f"type={player_type.id()} cycle={cycle}")
+                          'opp{} {} type={} cycle={}', it.unum(), it.pos(), player_type.id(), cycle)
 
             if cycle < second_min_cycle:
                 second_min_cycle = cycle
@@ -252,14 +332,13 @@ class InterceptTable:
                     continue
                 self._fastest_teammate = t
                 log.sw_log().intercept().add_text(
-                              f"fastest tm {self._fastest_teammate}")
+                              'fastest tm {}', self._fastest_teammate)
                 break
             return
 
         min_cycle = 1000
         second_min_cycle = 1000
 
-        predictor = PlayerIntercept(wm, self._ball_cache)
         for it in teammates:
             if it.pos_count() >= 10:
                 continue
@@ -267,14 +346,12 @@ class InterceptTable:
             player_type = it.player_type()
             if player_type is None:
                 log.sw_log().intercept().add_text(
-                              f"intercept teammate faild to get player{it.unum()} type")
+                              'intercept teammate faild to get player{} type', it.unum())
                 continue
 
-            cycle = predictor.predict(it, player_type,
-                                      second_min_cycle)
+            cycle = self.player_cycle(it, second_min_cycle)
             log.sw_log().intercept().add_text(
-                          f"tm{it.unum()} {it.pos()} "
-                          f"type={player_type.id()} cycle={cycle}")
+                          'tm{} {} type={} cycle={}', it.unum(), it.pos(), player_type.id(), cycle)
 
             if it.goalie():
                 self._goalie_reach_cycle = cycle
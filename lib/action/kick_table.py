@@ -3,7 +3,13 @@
   \ brief kick table class File to generate smart kick.
 """
 import functools
+import hashlib
+import json
+import os
 
+import numpy as np
+
+import team_config
 from lib.debug.debug import log
 # from typing import List
 # from enum import Enum
@@ -88,6 +94,41 @@ DEST_DIR_DIVS: int = 72  # step: 5 degree
 
 MAX_TABLE_SIZE: int = 128
 
+TABLE_FORMAT_VERSION = 1
+# one row per Path of a table, DEST_DIR_DIVS tables of MAX_TABLE_SIZE + 1 rows are stored in one .npy file
+PATH_DTYPE = np.dtype([('origin', np.uint8), ('dest', np.uint8), ('max_speed', np.float64), ('power', np.float64)])
+
+
+def table_params(player_type: 'PlayerType') -> dict:
+    """
+      \ brief every value the tables depend on, used as the key of the table file
+    """
+    SP = ServerParam.i()
+    return {'version': TABLE_FORMAT_VERSION,
+            'states': [STATE_DIVS_NEAR, STATE_DIVS_MID, STATE_DIVS_FAR],
+            'dest_dir_divs': DEST_DIR_DIVS,
+            'max_table_size': MAX_TABLE_SIZE,
+            'player_size': player_type.player_size(),
+            'kickable_margin': player_type.kickable_margin(),
+            'kick_power_rate': player_type.kick_power_rate(),
+            'ball_size': SP.ball_size(),
+            'ball_speed_max': SP.ball_speed_max(),
+            'ball_accel_max': SP.ball_accel_max(),
+            'max_power': SP.max_power()}
+
+
+def table_file(player_type: 'PlayerType', path: str = None) -> str:
+    key = hashlib.sha1(json.dumps(table_params(player_type), sort_keys=True).encode()).hexdigest()[:16]
+    return os.path.join(path or team_config.KICK_TABLE_PATH, f'kick_table_{key}.npy')
+
+
+def save_tables(file: str, tables: np.ndarray):
+    os.makedirs(os.path.dirname(file) or '.', exist_ok=True)
+    tmp = f'{file}.{os.getpid()}.tmp'  # agents of other processes may load the file while it is written
+    with open(tmp, 'wb') as f:
+        np.save(f, tables)
+    os.replace(tmp, file)
+
 """
   \ class State
   \ brief class to represent a kick intermediate state
@@ -356,7 +397,7 @@ class _KickTable:
         if player_type.id() == self._old_player_type_id:
             return
         self._old_player_type_id = player_type.id()
-        player_type = PlayerType()  # default type
+        player_type = PlayerType.default()
 
         if (math.fabs(self._player_size - player_type.player_size()) < EPS
                 and math.fabs(self._kickable_margin - player_type.kickable_margin()) < EPS
@@ -367,17 +408,39 @@ class _KickTable:
         self._ball_size = ServerParam.i().ball_size()
 
         self.create_state_list(player_type)
+        self._tables = self.load_tables(player_type)
+        return True
 
+    """
+      \ brief memory map the tables of player_type from KICK_TABLE_PATH, compute and store them if there is no file
+      \ param player_type PlayerType of the tables, create_state_list must be called for it before
+      \ return array of DEST_DIR_DIVS tables
+    """
+
+    def load_tables(self, player_type: PlayerType, path: str = None):
+        file = table_file(player_type, path)
+        try:
+            tables = np.load(file, mmap_mode='r')
+            if tables.dtype == PATH_DTYPE and tables.shape == (DEST_DIR_DIVS, MAX_TABLE_SIZE + 1):
+                return tables
+            log.os_log().warn(f'(kick table) ignored {file}, dtype={tables.dtype} shape={tables.shape}')
+        except (OSError, ValueError):
+            pass
+
+        tables = self.compute_tables()
+        try:
+            save_tables(file, tables)
+        except OSError as e:
+            log.os_log().warn(f'(kick table) can not write {file}: {e}')
+        return tables
+
+    def compute_tables(self):
         angle_step = 360.0 / DEST_DIR_DIVS
-        angles = [AngleDeg(-180 + i * angle_step) for i in range(DEST_DIR_DIVS)]
-        # TODO this functions should be checked
-        from multiprocessing import Pool
-        pool = Pool(4)
-        self._tables = pool.map(self.create_table, angles)
-
-        # for i in range(len(angles)):
-        #     self._tables.append(self.create_table(angles[i]))
-        return True
+        tables = np.zeros((DEST_DIR_DIVS, MAX_TABLE_SIZE + 1), dtype=PATH_DTYPE)
+        for i in range(DEST_DIR_DIVS):
+            table = self.create_table(AngleDeg(-180 + i * angle_step))
+            tables[i] = [(p.origin_, p.dest_, p.max_speed_, p.power_) for p in table]
+        return tables
 
     """
       \ brief create static state list
@@ -451,10 +514,11 @@ class _KickTable:
 
     def update_state(self, world: 'WorldModel'):
 
-        if KickTable.S_UPDATE_TIME == world.time():
+        if KickTable.S_UPDATE_TIME == world.time() and KickTable.S_UPDATE_WORLD is world:
             return
 
         KickTable.S_UPDATE_TIME = world.time().copy()
+        KickTable.S_UPDATE_WORLD = world
 
         self.create_state_cache(world)
 
@@ -990,13 +1054,13 @@ class _KickTable:
 
         count = 0
 
-        for it in table:
+        for origin, dest in zip(table['origin'].tolist(), table['dest'].tolist()):
             if count > MAX_TABLE_SIZE:
                 break
             if success_count > 10:
                 break
-            state_1st = self._state_cache[0][it.origin_]
-            state_2nd = self._state_cache[1][it.dest_]
+            state_1st = self._state_cache[0][origin]
+            state_2nd = self._state_cache[1][dest]
 
             if state_1st.flag_ & OUT_OF_PITCH:
                 continue
@@ -1207,8 +1271,11 @@ class _KickTable:
         if _KickTable.debug_print_DEBUG or True:
             for tmp in self._candidates:
                 log.sw_log().kick().add_text(
-                              f"simulate() result next_pos={sequence.pos_list_[0]}  flag={sequence.flag_} n_kick={len(sequence.pos_list_)} speed= {sequence.speed_} power={sequence.power_}  score={sequence.score_}")
-            log.os_log().info(f"Smart kick : {sequence.speed_ >= target_speed - EPS} -> seq speed is {sequence.speed_} & tar speed eps is {target_speed - EPS}")
+                              "simulate() result next_pos={}  flag={} n_kick={} speed= {} power={}  score={}",
+                              sequence.pos_list_[0], sequence.flag_, len(sequence.pos_list_), sequence.speed_,
+                              sequence.power_, sequence.score_)
+            log.os_log().info("Smart kick : %s -> seq speed is %s & tar speed eps is %s",
+                              sequence.speed_ >= target_speed - EPS, sequence.speed_, target_speed - EPS)
         rtn_list = [sequence.speed_ >= target_speed - EPS, sequence]
         return rtn_list
 
@@ -1229,9 +1296,12 @@ class _KickTable:
 
 class KickTable:
     S_UPDATE_TIME = GameTime(-1, 0)
+    S_UPDATE_WORLD = None  # the table is shared by all agents of the process
 
-    _instance: _KickTable = _KickTable()
+    _instance: _KickTable = None
 
     @staticmethod
     def instance() -> _KickTable:
+        if KickTable._instance is None:
+            KickTable._instance = _KickTable()
         return KickTable._instance
@@ -15,10 +15,9 @@ if TYPE_CHECKING:
 
 
 class NeckScanField(NeckAction):
-    DEBUG = True
-    
     INVALID_ANGLE = -360.
     
+    _last_calc_world = None
     _last_calc_time = GameTime(0, 0)
     _last_calc_view_width = ViewWidth.NORMAL
     _cached_target_angle = 0.0
@@ -32,12 +31,14 @@ class NeckScanField(NeckAction):
         wm = agent.world()
         ef = agent.effector()
         
-        if (NeckScanField._last_calc_time == wm.time()
+        if (NeckScanField._last_calc_world is wm
+            and NeckScanField._last_calc_time == wm.time()
             and NeckScanField._last_calc_view_width != ef.queued_next_view_width()):
             
             agent.do_turn_neck(NeckScanField._cached_target_angle - ef.queued_next_self_body() - wm.self().neck())
             return True
         
+        NeckScanField._last_calc_world = wm
         NeckScanField._last_calc_time = wm.time().copy()
         NeckScanField._last_calc_view_width = ef.queued_next_view_width()
 
@@ -54,9 +55,9 @@ class NeckScanField(NeckAction):
                 existed_ghost = True
                 break
         
-        if NeckScanField.DEBUG:
-            log.sw_log().world().add_text( f"(NSF EXE) existed_ghost={existed_ghost}")
-            log.sw_log().world().add_text( f"(NSF EXE) dir_counts={wm._dir_count}")
+        if log.sw_log().world().enabled:
+            log.sw_log().world().add_text( '(NSF EXE) existed_ghost={}', existed_ghost)
+            log.sw_log().world().add_text( '(NSF EXE) dir_counts={}', wm._dir_count)
         
         if not existed_ghost:
             angle = NeckScanPlayers.get_best_angle(agent)
@@ -120,8 +121,8 @@ class NeckScanField(NeckAction):
         for _ in range(size_of_view_width):
             dir_count.append(wm.dir_count(tmp_angle))
 
-            if NeckScanField.DEBUG:
-                log.sw_log().world().add_text( f"(NSF CAD) dir_count={dir_count[-1]}")
+            if log.sw_log().world().enabled:
+                log.sw_log().world().add_text( '(NSF CAD) dir_count={}', dir_count[-1])
 
             tmp_angle += WorldModel.DIR_STEP
         
@@ -17,10 +17,9 @@ if TYPE_CHECKING:
     from lib.player.player_agent import PlayerAgent
 
 class NeckScanPlayers(NeckAction):
-    DEBUG = True
-    
     INVALID_ANGLE = -360.0
     
+    _last_calc_world = None
     _last_calc_time = GameTime(0, 0)
     _last_calc_view_width = ViewWidth.NORMAL
     _cached_target_angle = 0.0
@@ -38,14 +37,16 @@ class NeckScanPlayers(NeckAction):
         wm = agent.world()
         ef = agent.effector()
         
-        if NeckScanPlayers.DEBUG:
-            log.sw_log().world().add_text( f"(NSP exe) last={NeckScanPlayers._last_calc_time}|wm-time={wm.time()}")
+        if log.sw_log().world().enabled:
+            log.sw_log().world().add_text( '(NSP exe) last={}|wm-time={}', NeckScanPlayers._last_calc_time, wm.time())
 
-        if (NeckScanPlayers._last_calc_time != wm.time()
+        if (NeckScanPlayers._last_calc_world is not wm
+            or NeckScanPlayers._last_calc_time != wm.time()
             or NeckScanPlayers._last_calc_view_width != ef.queued_next_view_width()
             or abs(NeckScanPlayers._last_calc_min_neck_angle - self._min_neck_angle) > 1.0e-3
             or abs(NeckScanPlayers._last_calc_max_neck_angle - self._max_neck_angle) > 1.0e-3):
             
+            NeckScanPlayers._last_calc_world = wm
             NeckScanPlayers._last_calc_time = wm.time().copy()
             NeckScanPlayers._last_calc_view_width = ef.queued_next_view_width()
             NeckScanPlayers._last_calc_min_neck_angle = self._min_neck_angle
@@ -65,8 +66,8 @@ class NeckScanPlayers(NeckAction):
         wm = agent.world()
         
         if len(wm.all_players()) < 22:
-            if NeckScanPlayers.DEBUG:
-                log.sw_log().world().add_text( f"(NSP GBA) all players are less than 22, n={len(wm.all_players())}")
+            if log.sw_log().world().enabled:
+                log.sw_log().world().add_text( '(NSP GBA) all players are less than 22, n={}', len(wm.all_players()))
             return NeckScanPlayers.INVALID_ANGLE    
         
         SP = ServerParam.i()
@@ -91,8 +92,8 @@ class NeckScanPlayers(NeckAction):
             
             score = NeckScanPlayers.calculate_score(wm, next_self_pos, left_angle, right_angle) # TODO IMP FUNC
 
-            if NeckScanPlayers.DEBUG:
-                log.sw_log().world().add_text( f"body={next_self_body}|dir={dir}|score={score}")    
+            if log.sw_log().world().enabled:
+                log.sw_log().world().add_text( 'body={}|dir={}|score={}', next_self_body, dir, score)    
                 
             if score > best_score:
                 best_dir = dir
@@ -0,0 +1,58 @@
+"""
+    pregenerates the kick table files that _KickTable.create_tables memory maps at the first decision.
+    the tables of the default player type are always created, the heterogeneous types of a file with
+    (player_type ...) messages (one per line, e.g. copied from a server log) can be added with --player-types.
+    run from the repository root:
+        python -m lib.action.pregenerate_kick_tables [--server-param FILE] [--player-types FILE] [--path DIR] [--force]
+"""
+import argparse
+import os
+import time
+
+import team_config
+team_config.DISABLE_FILE_LOG = True
+
+from lib.action.kick_table import _KickTable, save_tables, table_file
+from lib.rcsc.player_type import PlayerType
+from lib.rcsc.server_param import ServerParam
+
+
+def read_messages(file: str, head: str) -> list[str]:
+    with open(file) as f:
+        return [line.strip() for line in f if line.strip().startswith(head)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create the kick table files')
+    parser.add_argument('--server-param', help='File with the (server_param ...) message, default rcssserver values if not set')
+    parser.add_argument('--player-types', help='File with (player_type ...) messages')
+    parser.add_argument('--path', default=team_config.KICK_TABLE_PATH, help='Directory of the table files')
+    parser.add_argument('--force', action='store_true', help='Compute the tables even if the file exists')
+    args = parser.parse_args()
+
+    if args.server_param:
+        for message in read_messages(args.server_param, '(server_param'):
+            ServerParam.i().parse(message)
+
+    player_types = [PlayerType.default()]
+    if args.player_types:
+        player_types += [PlayerType.from_message(m) for m in read_messages(args.player_types, '(player_type')]
+
+    done = set()
+    for player_type in player_types:
+        file = table_file(player_type, args.path)
+        if file in done:
+            continue
+        done.add(file)
+        if os.path.exists(file) and not args.force:
+            print(f'type {player_type.id()}: {file} exists')
+            continue
+        start = time.perf_counter()
+        table = _KickTable()
+        table.create_state_list(player_type)
+        save_tables(file, table.compute_tables())
+        print(f'type {player_type.id()}: {file} created in {time.perf_counter() - start:.1f} s')
+
+
+if __name__ == '__main__':
+    main()
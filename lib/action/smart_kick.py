@@ -38,8 +38,8 @@ class SmartKick(BodyAction):
 
     def execute(self, agent: 'PlayerAgent'):
         log.sw_log().kick().add_text( "Body_SmartKick")
-        log.os_log().debug(f'c{agent.world().time().cycle()}kick{self._target_point} {self._first_speed}')
-        log.sw_log().kick().add_text(f'c{agent.world().time().cycle()}kick{self._target_point} {self._first_speed}')
+        log.os_log().debug('c%skick%s %s', agent.world().time().cycle(), self._target_point, self._first_speed)
+        log.sw_log().kick().add_text('c{}kick{} {}', agent.world().time().cycle(), self._target_point, self._first_speed)
         wm = agent.world()
         if not wm.self().is_kickable():
             if SmartKick.debug_print_DEBUG:
@@ -61,8 +61,8 @@ class SmartKick(BodyAction):
                                             max_step,
                                             self._sequence)
         if ans[0] and SmartKick.debug_print_DEBUG:
-            log.os_log().info(f"Smart kick : {ans[0]} seq -> speed : {ans[1].speed_} power : {ans[1].power_} score : {ans[1].score_} flag : {ans[1].flag_} next_pos : {ans[1].pos_list_[0]} {len(ans[1].pos_list_)} step {ans[1].pos_list_}")
-            log.sw_log().kick().add_text(f"Smart kick : {ans[0]} seq -> speed : {ans[1].speed_} power : {ans[1].power_} score : {ans[1].score_} flag : {ans[1].flag_} next_pos : {ans[1].pos_list_[0]} {len(ans[1].pos_list_)} step {ans[1].pos_list_}")
+            log.os_log().info("Smart kick : %s seq -> speed : %s power : %s score : %s flag : %s next_pos : %s %s step %s", ans[0], ans[1].speed_, ans[1].power_, ans[1].score_, ans[1].flag_, ans[1].pos_list_[0], len(ans[1].pos_list_), ans[1].pos_list_)
+            log.sw_log().kick().add_text('Smart kick : {} seq -> speed : {} power : {} score : {} flag : {} next_pos : {} {} step {}', ans[0], ans[1].speed_, ans[1].power_, ans[1].score_, ans[1].flag_, ans[1].pos_list_[0], len(ans[1].pos_list_), ans[1].pos_list_)
 
         if ans[0]:
             self._sequence = ans[1]
@@ -70,14 +70,14 @@ class SmartKick(BodyAction):
                 vel = self._sequence.pos_list_[0] - wm.ball().pos()
                 kick_accel = vel - wm.ball().vel()
                 if SmartKick.debug_print_DEBUG:
-                    log.os_log().debug(f"Kick Vel : {vel}, Kick Power : {kick_accel.r() / wm.self().kick_rate()}, Kick Angle : {kick_accel.th() - wm.self().body()}")
-                    log.sw_log().kick().add_text(f"Kick Vel : {vel}, Kick Power : {kick_accel.r() / wm.self().kick_rate()}, Kick Angle : {kick_accel.th() - wm.self().body()}")
+                    log.os_log().debug('Kick Vel : %s, Kick Power : %s, Kick Angle : %s', vel, kick_accel.r() / wm.self().kick_rate(), kick_accel.th() - wm.self().body())
+                    log.sw_log().kick().add_text('Kick Vel : {}, Kick Power : {}, Kick Angle : {}', vel, kick_accel.r() / wm.self().kick_rate(), kick_accel.th() - wm.self().body())
 
                 agent.do_kick(kick_accel.r() / wm.self().kick_rate(),
                               kick_accel.th() - wm.self().body())
                 if SmartKick.debug_print_DEBUG:
-                    log.os_log().debug(f"----------------#### Player Number {wm.self().unum()} 'DO_KICK'ed in SmartKick at Time: {wm.time().cycle()} ####----------------")
-                    log.sw_log().kick().add_text(f"----------------#### Player Number {wm.self().unum()} 'DO_KICK'ed in SmartKick at Time: {wm.time().cycle()} ####----------------")
+                    log.os_log().debug("----------------#### Player Number %s 'DO_KICK'ed in SmartKick at Time: %s ####----------------", wm.self().unum(), wm.time().cycle())
+                    log.sw_log().kick().add_text("----------------#### Player Number {} 'DO_KICK'ed in SmartKick at Time: {} ####----------------", wm.self().unum(), wm.time().cycle())
                 return True
 
         # failed to search the kick sequence
@@ -2,6 +2,7 @@ import logging
 import time
 
 from lib.debug.debug import log
+from lib.debug.startup_profile import profile
 from lib.messenger.free_form_messenger import FreeFormMessenger
 from lib.messenger.messenger import Messenger
 from lib.network.udp_socket import IPAddress
@@ -58,6 +59,8 @@ class CoachAgent(SoccerAgent):
     def analyze_init(self, message):
         self.init_dlog(message)
         self.do_eye(True)
+        if profile() is not None:
+            profile().connected('coach')
 
     def see_parser(self, message: str):
         if not message.startswith("(player_type"):
@@ -175,6 +178,12 @@ class CoachAgent(SoccerAgent):
                 self._think_received = False
             # TODO elif for not sync mode
 
+    def handle_message(self, message: str):
+        self.parse_message(message)
+        if self.think_received():
+            self.action()
+            self._think_received = False
+
     def parse_message(self, message):
         if message.find("(init") != -1:  # TODO Use startwith instead of find
             self.analyze_init(message)
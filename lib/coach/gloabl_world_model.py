@@ -10,7 +10,7 @@ from lib.rcsc.types import HETERO_DEFAULT, HETERO_UNKNOWN, GameModeType
 
 class GlobalWorldModel:
     def __init__(self):
-        self._player_types = [PlayerType() for _ in range(18)]
+        self._player_types = [PlayerType.default() for _ in range(18)]
         self._team_name_l: str = ""
         self._team_name_r: str = ""
         self._our_side: SideID = SideID.NEUTRAL
@@ -86,7 +86,7 @@ class GlobalWorldModel:
 
         # TODO vmode counters and arm
 
-        self._ball.init_str(parser.dic()['b'])
+        self._ball.init_values(parser.dic()['b'])
 
         if 'players' in parser.dic():
             for player_dic in parser.dic()['players']:
@@ -115,8 +115,7 @@ class GlobalWorldModel:
         self._time = current_time.copy()
 
     def player_type_parser(self, message):
-        new_player_type = PlayerType()
-        new_player_type.parse(message)
+        new_player_type = PlayerType.from_message(message)
         self._player_types[new_player_type.id()] = new_player_type
         self._available_player_type_id.append(new_player_type.id())
 
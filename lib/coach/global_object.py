@@ -11,7 +11,9 @@ class GlobalBallObject:
         self._vel: Vector2D = Vector2D(0, 0)
 
     def init_str(self, string: str):
-        data = string.split(" ")
+        self.init_values([float(v) for v in string.split(" ")])
+
+    def init_values(self, data: list[float]):
         self._pos = Vector2D(float(data[0]), float(data[1]))
         self._vel = Vector2D(float(data[2]), float(data[3]))
 
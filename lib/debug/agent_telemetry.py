@@ -0,0 +1,184 @@
+import atexit
+import bisect
+import itertools
+import json
+import os
+import time
+
+import team_config
+
+"""
+    --telemetry of main.py: counters and histograms of the cycles of a player, rewritten every
+    team_config.TELEMETRY_INTERVAL decisions and at exit, in the Prometheus text format (the textfile collector
+    of node_exporter reads *.prom files) or in JSON (team_config.TELEMETRY_FORMAT). a file is replaced at once,
+    a reader never sees half of it.
+    - sense to send: from the arrival of the sense_body message of the cycle to the sending of its commands
+    - see offset: from the arrival of the sense_body message to the arrival of the see message of the cycle
+    - messages per decision: messages handled since the last decision
+    - missed cycles: cycles without commands, found when the next cycle starts
+    - decision timeouts: decisions without the see message expected in their cycle (the wait for it timed out)
+    - budget overruns: action generators that ran past their budget (DecisionDeadline)
+"""
+
+PREFIX = 'pyrus_'
+SENSE_TO_SEND_BUCKETS = (0.005, 0.01, 0.02, 0.03, 0.05, 0.075, 0.1, 0.15, 0.25)  # seconds
+SEE_OFFSET_BUCKETS = (0.01, 0.02, 0.03, 0.04, 0.05, 0.06, 0.075, 0.1)  # seconds
+MESSAGES_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10)
+
+
+class Histogram:
+    def __init__(self, bounds: tuple, help_text: str):
+        self._bounds = bounds
+        self._help = help_text
+        self._counts = [0] * (len(bounds) + 1)  # the last one is +Inf
+        self._sum = 0.
+        self._count = 0
+
+    def observe(self, value: float):
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._sum += value
+        self._count += 1
+
+    def help(self) -> str:
+        return self._help
+
+    def sum(self) -> float:
+        return self._sum
+
+    def count(self) -> int:
+        return self._count
+
+    def buckets(self) -> list[tuple[str, int]]:
+        """
+        (upper bound, observations up to it), cumulative like the le buckets of Prometheus
+        """
+        bounds = [f'{b:g}' for b in self._bounds] + ['+Inf']
+        return list(zip(bounds, itertools.accumulate(self._counts)))
+
+
+class AgentTelemetry:
+    _count = itertools.count(1)
+
+    def __init__(self, path: str, interval: int = None):
+        self._path = path
+        self._prometheus = not path.endswith('.json')
+        self._interval = team_config.TELEMETRY_INTERVAL if interval is None else interval
+        self._labels = {'team': team_config.TEAM_NAME, 'unum': '0'}
+        self._counters = {'decisions_total': 0,
+                          'messages_total': 0,
+                          'missed_cycles_total': 0,
+                          'decision_timeouts_total': 0,
+                          'budget_overruns_total': 0}
+        self._help = {'decisions_total': 'decisions made',
+                      'messages_total': 'server messages handled',
+                      'missed_cycles_total': 'cycles without commands',
+                      'decision_timeouts_total': 'decisions without the see message expected in their cycle',
+                      'budget_overruns_total': 'action generators that ran past their budget'}
+        self._histograms = {
+            'sense_to_send_seconds': Histogram(SENSE_TO_SEND_BUCKETS,
+                                               'from the sense_body message to the commands of the cycle'),
+            'see_offset_seconds': Histogram(SEE_OFFSET_BUCKETS,
+                                            'from the sense_body message to the see message of the cycle'),
+            'messages_per_decision': Histogram(MESSAGES_BUCKETS, 'messages handled since the last decision')}
+        self._cycle = 0
+        self._sense_time: tuple[int, int] = (-1, -1)  # (cycle, stopped cycle) of the last sense_body
+        self._sense_at = 0.
+        self._messages = 0
+        self._closed = False
+        atexit.register(self.close)
+
+    @staticmethod
+    def create(directory: str) -> 'AgentTelemetry':
+        os.makedirs(directory, exist_ok=True)
+        suffix = 'json' if team_config.TELEMETRY_FORMAT == 'json' else 'prom'
+        name = f'{team_config.TEAM_NAME}-{os.getpid()}-{next(AgentTelemetry._count)}.{suffix}'
+        return AgentTelemetry(os.path.join(directory, name))
+
+    def path(self) -> str:
+        return self._path
+
+    def set_unum(self, unum: int):
+        self._labels['unum'] = str(unum)
+
+    def counter(self, name: str) -> int:
+        return self._counters[name]
+
+    def histogram(self, name: str) -> Histogram:
+        return self._histograms[name]
+
+    def message(self):
+        self._counters['messages_total'] += 1
+        self._messages += 1
+
+    def sense_body(self, cycle: int, stopped_cycle: int):
+        self._sense_time = (cycle, stopped_cycle)
+        self._sense_at = time.perf_counter()
+
+    def see(self, cycle: int, stopped_cycle: int):
+        if self._sense_time == (cycle, stopped_cycle):
+            self._histograms['see_offset_seconds'].observe(time.perf_counter() - self._sense_at)
+
+    def missed_cycles(self, cycles: int):
+        self._counters['missed_cycles_total'] += cycles
+
+    def sent(self, cycle: int, stopped_cycle: int, see_timeout: bool, budget_overruns: int):
+        """
+        the commands of the decision of the cycle are sent, the file is written every interval decisions
+        """
+        if self._sense_time == (cycle, stopped_cycle):
+            self._histograms['sense_to_send_seconds'].observe(time.perf_counter() - self._sense_at)
+        self._histograms['messages_per_decision'].observe(self._messages)
+        self._messages = 0
+        self._cycle = cycle
+        self._counters['decisions_total'] += 1
+        if see_timeout:
+            self._counters['decision_timeouts_total'] += 1
+        self._counters['budget_overruns_total'] = budget_overruns
+        if self._interval > 0 and self._counters['decisions_total'] % self._interval == 0:
+            self.write()
+
+    def labels(self, extra: str = '') -> str:
+        labels = ','.join(f'{k}="{v}"' for k, v in self._labels.items())
+        return '{' + labels + extra + '}'
+
+    def prometheus(self) -> str:
+        labels = self.labels()
+        lines = [f'# HELP {PREFIX}cycle last cycle with a decision',
+                 f'# TYPE {PREFIX}cycle gauge',
+                 f'{PREFIX}cycle{labels} {self._cycle}']
+        for name, value in self._counters.items():
+            lines += [f'# HELP {PREFIX}{name} {self._help[name]}',
+                      f'# TYPE {PREFIX}{name} counter',
+                      f'{PREFIX}{name}{labels} {value}']
+        for name, histogram in self._histograms.items():
+            lines += [f'# HELP {PREFIX}{name} {histogram.help()}',
+                      f'# TYPE {PREFIX}{name} histogram']
+            for bound, count in histogram.buckets():
+                le = f',le="{bound}"'
+                lines.append(f'{PREFIX}{name}_bucket{self.labels(le)} {count}')
+            lines += [f'{PREFIX}{name}_sum{labels} {histogram.sum():.6f}',
+                      f'{PREFIX}{name}_count{labels} {histogram.count()}']
+        return '\n'.join(lines) + '\n'
+
+    def json(self) -> str:
+        return json.dumps({**self._labels,
+                           'time': time.time(),
+                           'cycle': self._cycle,
+                           'counters': self._counters,
+                           'histograms': {name: {'buckets': dict(h.buckets()), 'sum': round(h.sum(), 6),
+                                                 'count': h.count()}
+                                          for name, h in self._histograms.items()}})
+
+    def write(self):
+        text = self.prometheus() if self._prometheus else self.json()
+        # the textfile collector may read the file at any time
+        tmp_path = f'{self._path}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, self._path)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self.write()
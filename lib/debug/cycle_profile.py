@@ -0,0 +1,136 @@
+import atexit
+import functools
+import itertools
+import json
+import os
+import time
+from typing import Union
+
+import numpy as np
+
+import team_config
+
+"""
+    --profile-cycles of main.py: the time of the nested phases of every decision of a player, one JSON line per
+    decision and the percentiles of every phase at exit, in milliseconds.
+    a scope is a method of the agent (e.g. parse, world update, decision, send) or of a class (the action
+    generators), its path is the one of the scopes it runs in, e.g. "action/decision/pass". the methods are
+    wrapped when the profile is created, without --profile-cycles the agents run the methods unchanged.
+    a line: {"cycle": 245, "stopped": 0, "game_mode": "play_on", "kickable": true, "scopes": {path: ms}},
+    the scopes of the messages parsed since the last decision are in the line of the decision.
+    the last line: {"summary": {path: {"count", "mean", "p50", "p95", "p99", "max"}}}
+"""
+
+PERCENTILES = (50, 95, 99)
+
+_current: 'CycleProfile' = None  # profile of the agent in a scope, several agents can run in one process
+
+
+class CycleProfile:
+    _count = itertools.count(1)
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = open(path, 'w')
+        self._stack: list[tuple[str, float]] = []  # (path, start)
+        self._scopes: dict[str, float] = {}  # path: ms, since the last decision
+        self._times: dict[str, list[float]] = {}  # path: ms of every decision
+        self._previous: Union['CycleProfile', None] = None  # _current when the outermost scope was entered
+        atexit.register(self.close)
+
+    @staticmethod
+    def create(directory: str) -> 'CycleProfile':
+        os.makedirs(directory, exist_ok=True)
+        name = f'{team_config.TEAM_NAME}-{os.getpid()}-{next(CycleProfile._count)}.jsonl'
+        return CycleProfile(os.path.join(directory, name))
+
+    def path(self) -> str:
+        return self._path
+
+    def enter(self, scope: str):
+        global _current
+        if not self._stack:
+            # the profile of the agent running before this one, back when the outermost scope leaves
+            self._previous = _current
+            _current = self
+        path = f'{self._stack[-1][0]}/{scope}' if self._stack else scope
+        self._stack.append((path, time.perf_counter()))
+
+    def leave(self):
+        global _current
+        path, start = self._stack.pop()
+        self._scopes[path] = self._scopes.get(path, 0.) + (time.perf_counter() - start) * 1000
+        if not self._stack:
+            _current = self._previous
+            self._previous = None
+
+    def wrap(self, obj, name: str, scope: str, end_cycle=None):
+        """
+        times the method name of obj as scope. end_cycle: the fields of the line written when the method
+        returns, None to write none
+        """
+        method = getattr(obj, name)
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            self.enter(scope)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.leave()
+                if end_cycle is not None:
+                    fields = end_cycle()
+                    if fields is not None:
+                        self.end_cycle(fields)
+
+        setattr(obj, name, timed)
+
+    def end_cycle(self, fields: dict):
+        scopes = self._scopes
+        self._scopes = {}
+        for path, ms in scopes.items():
+            self._times.setdefault(path, []).append(ms)
+        if self._file is not None:
+            line = dict(fields)
+            line['scopes'] = {path: round(ms, 3) for path, ms in scopes.items()}
+            self._file.write(json.dumps(line) + '\n')
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        summary = {}
+        for path, times in self._times.items():
+            times = np.array(times)
+            summary[path] = {'count': len(times), 'mean': round(float(times.mean()), 3)}
+            for p, value in zip(PERCENTILES, np.percentile(times, PERCENTILES)):
+                summary[path][f'p{p}'] = round(float(value), 3)
+            summary[path]['max'] = round(float(times.max()), 3)
+        return summary
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.write(json.dumps({'summary': self.summary()}) + '\n')
+        self._file.close()
+        self._file = None
+
+
+def profile_method(cls, name: str, scope: str):
+    """
+    times the method name of every instance of cls as scope, in the profile of the agent running it
+    """
+    method = getattr(cls, name)
+    if getattr(method, 'profile_scope', None) is not None:
+        return
+
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        profile = _current
+        if profile is None:
+            return method(*args, **kwargs)
+        profile.enter(scope)
+        try:
+            return method(*args, **kwargs)
+        finally:
+            profile.leave()
+
+    timed.profile_scope = scope
+    setattr(cls, name, timed)
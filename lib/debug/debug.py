@@ -1,9 +1,11 @@
 import sys
+import logging
 from logging import Logger
 import os
 import team_config
 from lib.debug.debug_client import DebugClient
-from lib.debug.os_logger import get_logger
+from lib.debug.level import Level, level_mask
+from lib.debug.os_logger import get_logger, set_logger_level
 from lib.debug.sw_logger import SoccerWindow_Logger
 from lib.rcsc.game_time import GameTime
 
@@ -20,9 +22,9 @@ class DebugLogger:
         if not team_config.DISABLE_FILE_LOG and not os.path.exists(team_config.LOG_PATH):
             os.makedirs(team_config.LOG_PATH)
         self.set_stderr(unum)
-        self._sw_log = SoccerWindow_Logger(team_name, unum, time)
+        self._sw_log = SoccerWindow_Logger(team_name, unum, time, level_mask(team_config.SW_LOG_LEVELS))
         self._os_log = get_logger(unum)
-        self._debug_client = DebugClient()
+        self._debug_client = DebugClient(team_config.USE_DEBUG_CLIENT)
 
     def sw_log(self):
         return self._sw_log
@@ -33,11 +35,38 @@ class DebugLogger:
     def debug_client(self):
         return self._debug_client
 
+    def os_debug(self) -> bool:
+        """
+        true if os_log().debug messages are written, guards the expensive ones
+        """
+        return self._os_log.isEnabledFor(logging.DEBUG)
+
+    def enabled(self, level: Level) -> bool:
+        """
+        true if the soccer window level or os_log().debug is enabled, guards blocks that write both
+        """
+        return self._sw_log.is_enabled(level) or self._os_log.isEnabledFor(logging.DEBUG)
+
+    def set_sw_levels(self, levels: int):
+        self._sw_log.set_levels(levels)
+
+    def set_os_level(self, level: int):
+        set_logger_level(self._os_log, level)
+
+    def state(self):
+        return self._sw_log, self._os_log, self._debug_client
+
+    def set_state(self, state):
+        """
+        agents of a single process team swap their own loggers in before handling a message.
+        """
+        self._sw_log, self._os_log, self._debug_client = state
+
     def update_time(self, t: GameTime):
         self._time.assign(t.cycle(), t.stopped_cycle())
         
     def set_stderr(self, unum):
-        if team_config.DISABLE_FILE_LOG:
+        if team_config.DISABLE_FILE_LOG or team_config.SINGLE_PROCESS_TEAM:
             return
         if unum == 'coach':
             file_name = 'coach.err'
@@ -1,6 +1,7 @@
 from pyrusgeom.geom_2d import *
 import socket
 
+from lib.debug.log_writer import LogWriter
 from lib.rcsc.types import Card, SideID, GameModeType, UNUM_UNKNOWN
 
 import team_config
@@ -86,12 +87,26 @@ class DebugClient:
 
 
 
-    def __init__(self):
-        self._on = True
+    class Sender:
+        """
+            LogWriter sink sending every message in its own datagram
+        """
+        joinable = False
+
+        def __init__(self, sock: socket.socket, address: tuple):
+            self._sock = sock
+            self._address = address
+
+        def write(self, message: str):
+            self._sock.sendto(message.encode(), self._address)
+
+    def __init__(self, on: bool = True):
+        self._on = on
         self._connected = True
         self._socket = self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._ip = team_config.HOST
         self._port = team_config.DEBUG_CLIENT_PORT
+        self._sender = DebugClient.Sender(self._sock, (self._ip, self._port))
 
         self._server_log = None
 
@@ -114,7 +129,16 @@ class DebugClient:
     def open(self, log_dir, teamname, unum):
         pass
 
+    def is_on(self):
+        return self._on
+
+    def set_on(self, on: bool):
+        self._on = on
+        self.clear()
+
     def write_all(self, world, effector):
+        if not self._on:
+            return
         self.to_str(world, effector)
         self._main_buffer
         self.send()
@@ -192,7 +216,7 @@ class DebugClient:
     def send(self):
         if self._main_buffer[-1] != '\0':
             self._main_buffer += '\0'
-        self._sock.sendto(self._main_buffer.encode(), (self._ip, self._port))
+        LogWriter.i().put(self._sender, self._main_buffer)
 
     def write(self, cycle):
         pass
@@ -207,32 +231,41 @@ class DebugClient:
         self._rectangles = []
         self._circles = []
 
-    def add_message(self, msg: str):
+    def add_message(self, msg: str, *args):
+        """
+        msg is formatted with msg.format(*args) only if the debug client is on
+        """
+        if not self._on:
+            return
+        if args:
+            msg = msg.format(*args)
         self._message += ('/' + msg.replace('\n', '').replace('"', ''))
 
     def set_target(self, unum_or_position):
+        if not self._on:
+            return
         if type(unum_or_position) == int:
             self._target_unum = unum_or_position
         else:
             self._target_point = unum_or_position
 
     def add_line(self, start, end, color=''):
-        if len(self._lines) < DebugClient.MAX_LINE:
+        if self._on and len(self._lines) < DebugClient.MAX_LINE:
             self._lines.append(DebugClient.Line(start, end,color))
 
     def add_triangle(self, v1=None, v2=None, v3=None, tri=None):
-        if len(self._triangles) < DebugClient.MAX_TRIANGLE:
+        if self._on and len(self._triangles) < DebugClient.MAX_TRIANGLE:
             if tri:
                 self._triangles.append(tri)
             else:
                 self._triangles.append(Triangle2D(v1, v2, v3))
 
     def add_rectangle(self, rect):
-        if len(self._rectangles) < DebugClient.MAX_RECT:
+        if self._on and len(self._rectangles) < DebugClient.MAX_RECT:
             self._rectangles.append(rect)
 
     def add_circle(self, center=None, radius=None, circle=None, color=''):
-        if len(self._circles) < DebugClient.MAX_CIRCLE:
+        if self._on and len(self._circles) < DebugClient.MAX_CIRCLE:
             if circle:
                 self._circles.append(circle)
             else:
@@ -41,3 +41,18 @@ class Level(Enum):
     LEVEL_30 = 0x20000000
     LEVEL_31 = 0x40000000
     LEVEL_32 = 0x80000000
+
+
+def level_mask(names: str) -> int:
+    """
+    bit mask of a comma separated list of Level names (e.g. 'intercept,pass'), 'any' enables every level and
+    'none' (or an empty string) disables all of them.
+    """
+    mask = 0
+    for name in names.lower().replace(' ', '').split(','):
+        if name in ('', 'none'):
+            continue
+        if name == 'any':
+            name = 'level_any'
+        mask |= Level[name.upper()].value
+    return mask
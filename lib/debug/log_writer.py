@@ -0,0 +1,160 @@
+import atexit
+import sys
+import threading
+from collections import deque
+
+import team_config
+
+"""
+    background writer of the soccer window logs and the debug client messages.
+    the decision thread only puts (sink, data) entries in a bounded ring buffer, a daemon thread takes them in
+    batches and calls sink.write(data), so a slow disk or socket never delays the commands of the agent.
+    when the buffer is full the policy decides:
+      - drop: the new entry is dropped
+      - block: the caller waits up to LOG_BUFFER_BLOCK_TIMEOUT sec for a free entry, then the entry is dropped
+    dropped entries and bytes are counted.
+"""
+
+DROP = 'drop'
+BLOCK = 'block'
+
+
+class LogWriter:
+    _i: 'LogWriter' = None
+
+    @staticmethod
+    def i() -> 'LogWriter':
+        if LogWriter._i is None:
+            LogWriter._i = LogWriter(team_config.LOG_BUFFER_SIZE,
+                                     team_config.LOG_BUFFER_POLICY,
+                                     team_config.LOG_BUFFER_BLOCK_TIMEOUT)
+        return LogWriter._i
+
+    def __init__(self, capacity: int = 1024, policy: str = DROP, block_timeout: float = 0.01, batch_size: int = 256):
+        if policy not in (DROP, BLOCK):
+            raise ValueError(f'unknown log buffer policy {policy}')
+        self._capacity = capacity
+        self._policy = policy
+        self._block_timeout = block_timeout
+        self._batch_size = batch_size
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._writing = False
+        self._closed = False
+
+        self._written = 0
+        self._dropped = 0
+        self._dropped_bytes = 0
+        self._errors = 0
+
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, sink, data) -> bool:
+        """
+        queues sink.write(data), returns False if the entry is dropped
+        """
+        with self._lock:
+            if len(self._buffer) >= self._capacity and self._policy == BLOCK and not self._closed:
+                self._not_full.wait_for(lambda: len(self._buffer) < self._capacity or self._closed,
+                                        self._block_timeout)
+            if len(self._buffer) >= self._capacity or self._closed:
+                self._dropped += 1
+                self._dropped_bytes += len(data)
+                return False
+            self._buffer.append((sink, data))
+            self._not_empty.notify()
+            return True
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        waits until every queued entry is written
+        """
+        with self._lock:
+            return self._idle.wait_for(lambda: not self._buffer and not self._writing, timeout)
+
+    def close(self, timeout: float = 1.0):
+        """
+        writes the queued entries and stops the thread, the next calls (e.g. the atexit one) do nothing
+        """
+        with self._lock:
+            if self._closed:
+                return
+        atexit.unregister(self.close)
+        self.flush(timeout)
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+        self._thread.join(timeout)
+        if self._dropped > 0:
+            sys.stderr.write(f'log writer dropped {self._dropped} writes ({self._dropped_bytes} bytes)\n')
+
+    def written(self):
+        return self._written
+
+    def dropped(self):
+        return self._dropped
+
+    def dropped_bytes(self):
+        return self._dropped_bytes
+
+    def errors(self):
+        return self._errors
+
+    def _take_batch(self):
+        with self._lock:
+            self._not_empty.wait_for(lambda: self._buffer or self._closed)
+            batch = [self._buffer.popleft() for _ in range(min(self._batch_size, len(self._buffer)))]
+            self._writing = bool(batch)
+            self._not_full.notify_all()
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            errors = self._write_batch(batch)
+            with self._lock:
+                self._writing = False
+                self._written += len(batch)
+                self._errors += errors
+                if not self._buffer:
+                    self._idle.notify_all()
+
+    def _write_batch(self, batch: list) -> int:
+        """
+        writes the batch without the lock, returns the number of failed writes and flushes
+        """
+        # consecutive entries of a file are joined in one write, the other sinks (e.g. udp) get one call per entry
+        errors = 0
+        touched = []
+        i = 0
+        while i < len(batch):
+            sink, data = batch[i]
+            j = i + 1
+            if getattr(sink, 'joinable', True):
+                while j < len(batch) and batch[j][0] is sink:
+                    j += 1
+                data = ''.join(d for _, d in batch[i:j])
+            try:
+                sink.write(data)
+            except (OSError, ValueError):
+                errors += 1
+            if sink not in touched:
+                touched.append(sink)
+            i = j
+        for sink in touched:
+            flush = getattr(sink, 'flush', None)
+            if flush is None:
+                continue
+            try:
+                flush()
+            except (OSError, ValueError):
+                errors += 1
+        return errors
@@ -1,18 +1,14 @@
 import logging
 from typing import Union
 import datetime
-import coloredlogs
 import sys
 import os
 import team_config
 
 
-def get_logger(unum: Union[int, str] = None):
-    logging.basicConfig()
-    logger = logging.getLogger(name='mylogger')
-    coloredlogs.install(logger=logger)
-    logger.propagate = False
-    coloredFormatter = coloredlogs.ColoredFormatter(
+def colored_formatter(unum: Union[int, str]) -> logging.Formatter:
+    import coloredlogs
+    return coloredlogs.ColoredFormatter(
         datefmt='%H:%M:%S:%s',
         fmt=f'%(asctime)s %(filename)s u{unum} %(lineno)-3d %(levelname)s %(message)s',
         level_styles=dict(
@@ -29,8 +25,29 @@ def get_logger(unum: Union[int, str] = None):
             lineno=dict(color='white'),
         )
     )
+
+
+class LazyColoredFormatter(logging.Formatter):
+    """
+    coloredlogs (with humanfriendly) takes about 30 ms to import, it is imported at the first console message
+    """
+    def __init__(self, unum: Union[int, str]):
+        super().__init__()
+        self._unum = unum
+        self._formatter: Union[logging.Formatter, None] = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self._formatter is None:
+            self._formatter = colored_formatter(self._unum)
+        return self._formatter.format(record)
+
+
+def get_logger(unum: Union[int, str] = None):
+    logging.basicConfig()
+    logger = logging.getLogger(name=f'mylogger-{unum}')
+    logger.propagate = False
     # remove all handlers
-    for handler in logger.handlers:
+    for handler in list(logger.handlers):
         logger.removeHandler(handler)
 
     if not team_config.DISABLE_FILE_LOG:
@@ -49,14 +66,25 @@ def get_logger(unum: Union[int, str] = None):
         logger.addHandler(hdlr=file_ch)
     
     console_ch = logging.StreamHandler(stream=sys.stdout)
-    console_ch.setFormatter(fmt=coloredFormatter)
+    console_ch.setFormatter(fmt=LazyColoredFormatter(unum))
     console_ch.setLevel(level=team_config.CONSOLE_LOG_LEVEL)
     logger.addHandler(hdlr=console_ch)
     
-    logger.setLevel(logging.DEBUG)  # Set the logger level to DEBUG to capture all levels
+    # the logger level is the lowest handler level, so disabled calls (e.g. debug with the default ERROR levels)
+    # return before a LogRecord is created
+    logger.setLevel(min(h.level for h in logger.handlers))
 
     return logger
 
+
+def set_logger_level(logger: logging.Logger, level: int):
+    """
+    changes the level of the handlers and the logger at runtime
+    """
+    for handler in logger.handlers:
+        handler.setLevel(level)
+    logger.setLevel(level)
+
 # logger = get_logger()
 # logger.setLevel(level=logging.ERROR)
 # logger.debug(msg="this is a debug message")
@@ -0,0 +1,127 @@
+import importlib.abc
+import sys
+import time
+
+"""
+    --profile-startup of main.py: the import time of every module (self: without the modules it imports,
+    cumulative: with them) and the time of the startup phases, printed when every agent of the process
+    received its (init ...) reply.
+    the profile is a meta path finder in front of the others: it lets them find the module and times the
+    loader, the loader of the module is put back before it is executed.
+"""
+
+TOP_MODULES = 25
+
+
+class _TimedLoader(importlib.abc.Loader):
+    def __init__(self, loader, profile: 'StartupProfile'):
+        self._loader = loader
+        self._profile = profile
+        self._create_time = 0.0
+
+    def create_module(self, spec):
+        start = time.perf_counter()
+        spec.loader = self._loader
+        module = self._loader.create_module(spec)
+        spec.loader = self
+        self._create_time = time.perf_counter() - start  # extension modules are loaded here
+        return module
+
+    def exec_module(self, module):
+        module.__spec__.loader = self._loader
+        module.__loader__ = self._loader
+        self._profile.enter(module.__name__, self._create_time)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profile.leave()
+
+
+class StartupProfile(importlib.abc.MetaPathFinder):
+    def __init__(self, agents: int = 1):
+        self._start = time.perf_counter()
+        self._stack: list[list] = []  # [module, start, time of the imported modules]
+        self._modules: dict[str, tuple[float, float]] = {}  # module: (self, cumulative) seconds
+        self._phases: list[tuple[str, float]] = []
+        self._import_time = 0.0  # of the modules imported outside other modules
+        self._agents = agents
+        self._connected = 0
+        self._reported = False
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def enter(self, module: str, create_time: float):
+        self._stack.append([module, time.perf_counter() - create_time, 0.0])
+
+    def leave(self):
+        module, start, children = self._stack.pop()
+        total = time.perf_counter() - start
+        self._modules[module] = (total - children, total)
+        if self._stack:
+            self._stack[-1][2] += total
+        else:
+            self._import_time += total
+
+    def set_agents(self, agents: int):
+        self._agents = agents
+
+    def mark(self, phase: str):
+        """
+        the end of a startup phase, the times are from the start of the profile
+        """
+        self._phases.append((phase, time.perf_counter() - self._start))
+
+    def connected(self, agent: str):
+        self.mark(f'{agent} connected')
+        self._connected += 1
+        if self._connected >= self._agents:
+            self.report()
+
+    def modules(self) -> dict[str, tuple[float, float]]:
+        return self._modules
+
+    def phases(self) -> list[tuple[str, float]]:
+        return self._phases
+
+    def report(self):
+        if self._reported:
+            return
+        self._reported = True
+        lines = [f'startup profile: {len(self._modules)} modules imported in {self._import_time * 1000:.1f} ms']
+        last = 0.0
+        for phase, at in self._phases:
+            lines.append(f'  {at * 1000:8.1f} ms  {phase} (+{(at - last) * 1000:.1f} ms)')
+            last = at
+        lines.append(f'  {"self ms":>8s} {"cumul ms":>9s}  module')
+        top = sorted(self._modules.items(), key=lambda m: -m[1][0])[:TOP_MODULES]
+        for module, (self_time, total) in top:
+            lines.append(f'  {self_time * 1000:8.1f} {total * 1000:9.1f}  {module}')
+        # sys.stderr is redirected to the log directory by log.setup
+        print('\n'.join(lines), file=sys.stdout, flush=True)
+
+
+_profile: StartupProfile = None
+
+
+def start_profile(agents: int = 1) -> StartupProfile:
+    global _profile
+    if _profile is None:
+        _profile = StartupProfile(agents)
+        sys.meta_path.insert(0, _profile)
+    return _profile
+
+
+def profile() -> StartupProfile:
+    """
+    the running profile, None without --profile-startup
+    """
+    return _profile
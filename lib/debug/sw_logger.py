@@ -3,6 +3,7 @@ from pyrusgeom.vector_2d import Vector2D
 
 from lib.debug.color import Color
 from lib.debug.level import Level
+from lib.debug.log_writer import LogWriter
 from lib.rcsc.game_time import GameTime
 
 
@@ -11,7 +12,10 @@ class SoccerWindow_Logger:
         def __init__(self, level: Level, game_time: GameTime):
             self.level: Level = level
             self._time: GameTime = game_time
-            self._commands = ""
+            self._commands: list[str] = []
+            # checked first by every add_* method, callers guard expensive messages with it too:
+            #     if log.sw_log().pass_().enabled:
+            self.enabled = True
 
         def add_line(self,
                      x1: float = None,
@@ -21,13 +25,22 @@ class SoccerWindow_Logger:
                      start: Vector2D = None,
                      end: Vector2D = None,
                      color: Color = Color(string="red")):
+            if not self.enabled:
+                return
             if x1 is not None:
-                self._commands += f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} l {x1} {y1} {x2} {y2} {color}\n"
+                self._commands.append(f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} l {x1} {y1} {x2} {y2} {color}\n")
             elif start is not None:
                 self.add_line(start.x(), start.y(), end.x(), end.y(), color=color)
 
-        def add_text(self, message: str = ""):
-            self._commands += f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} M {message}\n"  # TODO flush if message size is so large like 8192 and bigger
+        def add_text(self, message: str = "", *args):
+            """
+            message is formatted with message.format(*args) only if the level is enabled
+            """
+            if not self.enabled:
+                return
+            if args:
+                message = message.format(*args)
+            self._commands.append(f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} M {message}\n")  # TODO flush if message size is so large like 8192 and bigger
 
         def add_circle(self,
                        r: float = None,
@@ -37,8 +50,10 @@ class SoccerWindow_Logger:
                        circle: Circle2D = None,
                        fill: bool = False,
                        color: Color = Color(string='red'), ):
+            if not self.enabled:
+                return
             if cx is not None:
-                self._commands += f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} {'C' if fill else 'c'} {cx} {cy} {r} {color}\n"
+                self._commands.append(f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} {'C' if fill else 'c'} {cx} {cy} {r} {color}\n")
             elif center is not None:
                 self.add_circle(r, center.x(), center.y(), color=color, fill=fill)
             elif circle is not None:
@@ -50,8 +65,10 @@ class SoccerWindow_Logger:
                       y: float = None,
                       pos: Vector2D = None,
                       color: Color = Color(string='red')):
+            if not self.enabled:
+                return
             if x is not None:
-                self._commands += f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} p {x} {y} {color}"
+                self._commands.append(f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} p {x} {y} {color}")
             elif pos is not None:
                 self.add_point(pos.x(), pos.y(), color=color)
 
@@ -59,9 +76,11 @@ class SoccerWindow_Logger:
                         x,
                         y,
                         msg):
-            self._commands += f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} m {round(x, 4)} {round(y, 4)} {msg}\n"
+            if not self.enabled:
+                return
+            self._commands.append(f"{self._time.cycle()},{self._time.stopped_cycle()} {self.level.value} m {round(x, 4)} {round(y, 4)} {msg}\n")
 
-    def __init__(self, team_name: str, unum: int, time: GameTime):
+    def __init__(self, team_name: str, unum: int, time: GameTime, levels: int = Level.LEVEL_ANY.value):
         self._file = open(f"/tmp/{team_name}-{unum}.log", 'w')
         self._time: GameTime = time
 
@@ -114,13 +133,33 @@ class SoccerWindow_Logger:
             self._training,
             self._any
         ]
+        self.set_levels(levels)
+
+    def set_levels(self, levels: int):
+        """
+        enables the levels of the bit mask (lib.debug.level.level_mask) and disables the others,
+        it can be changed at any time, messages of disabled levels are dropped without being formatted.
+        """
+        for l in self._levels:
+            l.enabled = (l.level.value & levels) != 0
+
+    def set_level(self, level: Level, enabled: bool = True):
+        for l in self._levels:
+            if l.level is level:
+                l.enabled = enabled
+
+    def is_enabled(self, level: Level):
+        return any(l.enabled for l in self._levels if l.level is level)
 
     def flush(self):
         if self._time is None or self._time.cycle() == 0:
             return
+        commands = []
         for l in self._levels:
-            self._file.write(l._commands)
-            l._commands = ""
+            commands.extend(l._commands)
+            l._commands.clear()
+        if commands:
+            LogWriter.i().put(self._file, ''.join(commands))
 
     def update_time(self, t: GameTime):
         self._time.assign(t.cycle(), t.stopped_cycle())
@@ -1,33 +1,61 @@
-from scipy.spatial import Delaunay
+import hashlib
+import json
+import os
+import zipfile
+from math import ceil, floor
+
+import numpy as np
 from pyrusgeom.geom_2d import *
 from enum import Enum
+
+import team_config
+from lib.debug.debug import log
 from lib.rcsc.server_param import ServerParam
 from pyrusgeom.soccer_math import min_max
 
+"""
+    the samples and the delaunay triangles of a formation are stored in FORMATION_CACHE_PATH with the hash of the .conf
+    file as the key, an agent loads them from there and only the first one to read the .conf imports scipy.
+    the triangle of a ball position is found with a uniform grid over the samples: every cell lists the triangles
+    whose bounding box touches it in the order of _triangles, so the first containing triangle is the one of a
+    linear scan. the positions are interpolated with numpy in the same order of operations as Vector2D.
+    with a grid step (team_config.FORMATION_GRID_STEP) the positions of every node of a pitch grid are computed once,
+    stored in FORMATION_CACHE_PATH with the hash of the .conf file as the key, and update interpolates the four
+    nodes around the ball (bilinear) instead.
+"""
+
+TRIANGLE_INDEX_CELL = 5.0
+CACHE_FORMAT_VERSION = 1
+GRID_FORMAT_VERSION = 1
+
 class FormationType(Enum):
     Static = 's'
     DelaunayTriangulation2 = 'D'
 
 
 class Formation:
-    def __init__(self, path):
+    def __init__(self, path, grid_step: float = None):
         self._balls = []
         self._players = []
         self._triangles = []
         self._formation_type = FormationType.Static
         self._target_players = []
         self._path = path
+        self._grid_step = team_config.FORMATION_GRID_STEP if grid_step is None else grid_step
+        self._grid = None
+        self._tri = None
         self.read_file(path)
         self.calculate()
 
     def read_file(self, path):
-        file = open(path, 'r')
-        lines = file.readlines()
+        with open(path, 'rb') as file:
+            self._content = file.read()
+        lines = self._content.decode().splitlines(keepends=True)
         if lines[0].find('Static') < 0:
             self._formation_type = FormationType.DelaunayTriangulation2
         if self._formation_type == FormationType.Static:
             self.read_static(lines)
-        else:
+        elif not self.load_triangulation():
             self.read_delaunay(lines)
 
     def read_static(self, lines):
@@ -59,29 +87,76 @@ class Formation:
     def calculate(self):
         if self._formation_type == FormationType.Static:
             return
-        self._tri = Delaunay(self._balls).simplices
+        if self._tri is None:
+            # scipy is only needed here, an agent loading the cache does not import it
+            from scipy.spatial import Delaunay
+            self._tri = Delaunay(self._balls).simplices
+            self.save_triangulation()
         for tri in self._tri:
             tmp = [Triangle2D(Vector2D(self._balls[tri[0]][0], self._balls[tri[0]][1]),
                                     Vector2D(self._balls[tri[1]][0], self._balls[tri[1]][1]),
                                     Vector2D(self._balls[tri[2]][0], self._balls[tri[2]][1])), tri[0], tri[1], tri[2]]
             self._triangles.append(tmp)
+        self._sample_players = np.array(self._players).reshape(-1, 11, 2)
+        self.create_triangle_index()
+        if self._grid_step:
+            self._grid = self.load_grid()
+
+    def create_triangle_index(self):
+        SP = ServerParam.i()
+        balls = np.array(self._balls).reshape(-1, 2)
+        self._index_x = min(balls[:, 0].min(), -SP.pitch_half_length())
+        self._index_y = min(balls[:, 1].min(), -SP.pitch_half_width())
+        self._index_nx = int(ceil((max(balls[:, 0].max(), SP.pitch_half_length()) - self._index_x)
+                                  / TRIANGLE_INDEX_CELL)) + 1
+        self._index_ny = int(ceil((max(balls[:, 1].max(), SP.pitch_half_width()) - self._index_y)
+                                  / TRIANGLE_INDEX_CELL)) + 1
+        self._index_cells: list[list[int]] = [[] for _ in range(self._index_nx * self._index_ny)]
+        for t, (_, a, b, c) in enumerate(self._triangles):
+            corners = balls[[a, b, c]]
+            # the margin keeps the rounding of the cell bounds from losing a triangle
+            i0, j0 = self.index_cell(corners[:, 0].min() - 1e-6, corners[:, 1].min() - 1e-6)
+            i1, j1 = self.index_cell(corners[:, 0].max() + 1e-6, corners[:, 1].max() + 1e-6)
+            for i in range(i0, i1 + 1):
+                for j in range(j0, j1 + 1):
+                    self._index_cells[i * self._index_ny + j].append(t)
+
+    def index_cell(self, x: float, y: float):
+        i = int(floor((x - self._index_x) / TRIANGLE_INDEX_CELL))
+        j = int(floor((y - self._index_y) / TRIANGLE_INDEX_CELL))
+        return min(max(i, 0), self._index_nx - 1), min(max(j, 0), self._index_ny - 1)
+
+    def find_triangle(self, point: Vector2D):
+        """
+        the sample indexes of the first triangle of _triangles containing point, empty if there is none
+        """
+        i, j = self.index_cell(point.x(), point.y())
+        for t in self._index_cells[i * self._index_ny + j]:
+            tri = self._triangles[t]
+            if tri[0].contains(point):
+                return [tri[1], tri[2], tri[3]]
+        return []
 
     def update(self, B:Vector2D):
         SP = ServerParam.i()
         if self._formation_type == FormationType.Static:
             return
-        ids = []
-        
+
         point = B.copy()
         if point.abs_x() > SP.pitch_half_length():
             point._x = min_max(-SP.pitch_half_length(), point.x(), +SP.pitch_half_length())
         if point.abs_y() > SP.pitch_half_width():
             point._y = min_max(-SP.pitch_half_width(), point.y(), +SP.pitch_half_width())
-        
-        for tri in self._triangles:
-            if tri[0].contains(point):
-                ids = [tri[1], tri[2], tri[3]]
-                break
+
+        if self._grid is not None:
+            positions = self.grid_positions(point)
+        else:
+            positions = self.interpolate(point, B)
+        self._target_players[:] = [Vector2D(x, y) for x, y in positions.tolist()]
+
+    def interpolate(self, point: Vector2D, B: Vector2D) -> np.ndarray:
+        # the triangle of the point (in the pitch), the positions of the ball B
+        ids = self.find_triangle(point)
         Pa = Vector2D(self._balls[ids[0]][0], self._balls[ids[0]][1])
         Pb = Vector2D(self._balls[ids[1]][0], self._balls[ids[1]][1])
         Pc = Vector2D(self._balls[ids[2]][0], self._balls[ids[2]][1])
@@ -91,18 +166,119 @@ class Formation:
         m2 = Pa.dist(B)
         n2 = lineProj.dist(B)
 
-        self._target_players.clear()
-        for p in range(11):
-            OPa = Vector2D(self._players[ids[0]][p][0], self._players[ids[0]][p][1])
-            OPb = Vector2D(self._players[ids[1]][p][0], self._players[ids[1]][p][1])
-            OPc = Vector2D(self._players[ids[2]][p][0], self._players[ids[2]][p][1])
-            OI = (OPc - OPb)
-            OI *= (m1 / (m1 + n1))
-            OI += OPb
-            OB = (OI - OPa)
-            OB *= (m2 / (m2 + n2))
-            OB += OPa
-            self._target_players.append(OB)
+        OPa = self._sample_players[ids[0]]
+        OPb = self._sample_players[ids[1]]
+        OPc = self._sample_players[ids[2]]
+        OI = (OPc - OPb) * (m1 / (m1 + n1)) + OPb
+        return (OI - OPa) * (m2 / (m2 + n2)) + OPa
+
+    def cache_file(self, kind: str, params: dict, extension: str) -> str:
+        key = hashlib.sha1(self._content + json.dumps(params, sort_keys=True).encode()).hexdigest()[:16]
+        name = os.path.splitext(os.path.basename(self._path))[0]
+        return os.path.join(team_config.FORMATION_CACHE_PATH, f'{kind}_{name}_{key}.{extension}')
+
+    def triangulation_file(self) -> str:
+        return self.cache_file('delaunay', {'version': CACHE_FORMAT_VERSION}, 'npz')
+
+    def load_triangulation(self) -> bool:
+        """
+        the samples and the triangles of the cache file, False if there is no (valid) file
+        """
+        if team_config.FORMATION_CACHE_PATH is None:
+            return False
+        file = self.triangulation_file()
+        try:
+            with np.load(file) as data:
+                balls, players, tri = data['balls'], data['players'], data['simplices']
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            return False
+        if players.shape != (len(balls), 11, 2) or tri.ndim != 2 or tri.shape[1] != 3 \
+                or tri.size == 0 or tri.min() < 0 or tri.max() >= len(balls):
+            log.os_log().warn(f'(formation) ignored {file}, balls={balls.shape} simplices={tri.shape}')
+            return False
+        self._balls = balls.tolist()
+        self._players = players.tolist()
+        self._tri = tri
+        return True
+
+    def save_triangulation(self):
+        if team_config.FORMATION_CACHE_PATH is None:
+            return
+        file = self.triangulation_file()
+        try:
+            os.makedirs(os.path.dirname(file) or '.', exist_ok=True)
+            tmp = f'{file}.{os.getpid()}.tmp'  # agents of other processes may load the file while it is written
+            with open(tmp, 'wb') as f:
+                np.savez(f, balls=np.array(self._balls).reshape(-1, 2),
+                         players=np.array(self._players).reshape(-1, 11, 2), simplices=self._tri)
+            os.replace(tmp, file)
+        except OSError as e:
+            log.os_log().warn(f'(formation) can not write {file}: {e}')
+
+    def grid_file(self) -> str:
+        SP = ServerParam.i()
+        params = {'version': GRID_FORMAT_VERSION,
+                  'step': self._grid_step,
+                  'pitch_half_length': SP.pitch_half_length(),
+                  'pitch_half_width': SP.pitch_half_width()}
+        return self.cache_file('grid', params, 'npy')
+
+    def grid_shape(self):
+        SP = ServerParam.i()
+        return (int(ceil(2 * SP.pitch_half_length() / self._grid_step)) + 1,
+                int(ceil(2 * SP.pitch_half_width() / self._grid_step)) + 1,
+                11, 2)
+
+    def load_grid(self) -> np.ndarray:
+        """
+        memory map the grid of the formation, compute and store it if there is no file
+        """
+        if team_config.FORMATION_CACHE_PATH is None:
+            return self.compute_grid()
+        file = self.grid_file()
+        try:
+            grid = np.load(file, mmap_mode='r')
+            if grid.shape == self.grid_shape():
+                return grid
+            log.os_log().warn(f'(formation) ignored {file}, shape={grid.shape}')
+        except (OSError, ValueError):
+            pass
+
+        grid = self.compute_grid()
+        try:
+            os.makedirs(os.path.dirname(file) or '.', exist_ok=True)
+            tmp = f'{file}.{os.getpid()}.tmp'  # agents of other processes may load the file while it is written
+            with open(tmp, 'wb') as f:
+                np.save(f, grid)
+            os.replace(tmp, file)
+        except OSError as e:
+            log.os_log().warn(f'(formation) can not write {file}: {e}')
+        return grid
+
+    def compute_grid(self) -> np.ndarray:
+        SP = ServerParam.i()
+        nx, ny, _, _ = self.grid_shape()
+        grid = np.zeros(self.grid_shape())
+        for i in range(nx):
+            for j in range(ny):
+                node = Vector2D(-SP.pitch_half_length() + i * self._grid_step,
+                                -SP.pitch_half_width() + j * self._grid_step)
+                point = Vector2D(min_max(-SP.pitch_half_length(), node.x(), +SP.pitch_half_length()),
+                                 min_max(-SP.pitch_half_width(), node.y(), +SP.pitch_half_width()))
+                grid[i, j] = self.interpolate(point, node)
+        return grid
+
+    def grid_positions(self, point: Vector2D) -> np.ndarray:
+        # bilinear interpolation of the nodes around point (in the pitch)
+        SP = ServerParam.i()
+        gx = (point.x() + SP.pitch_half_length()) / self._grid_step
+        gy = (point.y() + SP.pitch_half_width()) / self._grid_step
+        i = min(int(gx), self._grid.shape[0] - 2)
+        j = min(int(gy), self._grid.shape[1] - 2)
+        fx = gx - i
+        fy = gy - j
+        return ((self._grid[i, j] * (1 - fx) + self._grid[i + 1, j] * fx) * (1 - fy)
+                + (self._grid[i, j + 1] * (1 - fx) + self._grid[i + 1, j + 1] * fx) * fy)
 
     def get_pos(self, unum):
         return self._target_players[unum - 1]
@@ -0,0 +1,38 @@
+"""
+    pregenerates the formation caches that the agents load instead of triangulating the .conf files with scipy.
+    the pitch grids of --grid-step (team_config.FORMATION_GRID_STEP) are created as well.
+    run from the repository root:
+        python -m lib.formation.pregenerate_formations [--formations DIR] [--grid-step STEP] [--path DIR]
+"""
+import argparse
+import glob
+import os
+import time
+
+import team_config
+team_config.DISABLE_FILE_LOG = True
+
+from lib.formation.delaunay_triangulation import Formation, FormationType
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Create the formation cache files')
+    parser.add_argument('--formations', default='base/formation_dt', help='Directory of the .conf files')
+    parser.add_argument('--grid-step', type=float, default=team_config.FORMATION_GRID_STEP,
+                        help='Step of the pitch grids in meters, no grids if not set')
+    parser.add_argument('--path', default=team_config.FORMATION_CACHE_PATH, help='Directory of the cache files')
+    args = parser.parse_args()
+    team_config.FORMATION_CACHE_PATH = args.path
+
+    for conf in sorted(glob.glob(os.path.join(args.formations, '*.conf'))):
+        start = time.perf_counter()
+        formation = Formation(conf, grid_step=args.grid_step or 0)
+        if formation._formation_type == FormationType.Static:
+            print(f'{conf}: static')
+            continue
+        files = [formation.triangulation_file()] + ([formation.grid_file()] if args.grid_step else [])
+        print(f'{conf}: {", ".join(files)} in {time.perf_counter() - start:.2f} s')
+
+
+if __name__ == '__main__':
+    main()
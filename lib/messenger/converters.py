@@ -17,7 +17,7 @@ class MessengerConverter:
         s = 0
         for i, (min_v, max_v, size) in enumerate(self._min_max_sizes):
             v = values[i]
-            log.os_log().debug(f'v={v}')
+            log.os_log().debug('v=%s', v)
             v = bound(min_v, v, max_v)
             v -= min_v
             v /= max_v - min_v
@@ -31,7 +31,7 @@ class MessengerConverter:
         while s != 0:
             words.append(s % n_chars)
             s = s // n_chars
-            log.os_log().debug(f's={s}')
+            log.os_log().debug('s=%s', s)
         # words.append(s)
         msg = ''
         for word in words:
@@ -14,8 +14,6 @@ if TYPE_CHECKING:
 
 
 class Messenger:
-    DEBUG = True
-
     class Types(Enum):
         BALL = 'b'
         PASS = 'p'
@@ -71,9 +69,9 @@ class Messenger:
         all_messages = ""
         log.os_log().debug(f'#'*20)
         for i, message in enumerate(messages):
-            log.os_log().debug(f'msg.t={message._header}')
+            log.os_log().debug('msg.t=%s', message._header)
             enc = message.encode()
-            log.os_log().debug(f'enc: {enc}')
+            log.os_log().debug('enc: %s', enc)
 
             if not enc:
                 continue
@@ -85,8 +83,8 @@ class Messenger:
                     log.os_log().warn(denied)
                 break
 
-            if Messenger.DEBUG:
-                log.sw_log().action().add_text( f"(encode all messages) a message added, msg={message}, encoded={enc}")
+            if log.sw_log().action().enabled:
+                log.sw_log().action().add_text( '(encode all messages) a message added, msg={}, encoded={}', message, enc)
 
             all_messages += enc
             size += len(enc)
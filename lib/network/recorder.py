@@ -0,0 +1,63 @@
+import atexit
+import itertools
+import os
+import struct
+import time
+from typing import Iterator
+
+import team_config
+
+"""
+    recording of every datagram an agent receives and sends, for offline replays (lib/player/replay.py).
+    file: MAGIC, then per datagram a RECORD header (direction, sec since the socket was connected, length)
+    followed by the raw datagram.
+"""
+
+MAGIC = b'PYRUS2D-REC 1\n'
+IN = 0
+OUT = 1
+RECORD = struct.Struct('<BdI')
+
+
+class Recorder:
+    _count = itertools.count(1)
+
+    def __init__(self, path: str):
+        self._path = path
+        self._file = open(path, 'wb')
+        self._file.write(MAGIC)
+        self._start = time.perf_counter()
+        atexit.register(self.close)
+
+    @staticmethod
+    def create(directory: str) -> 'Recorder':
+        # the uniform number is not known before the init reply, several agents can share the process
+        os.makedirs(directory, exist_ok=True)
+        return Recorder(os.path.join(directory,
+                                     f'{team_config.TEAM_NAME}-{os.getpid()}-{next(Recorder._count)}.rec'))
+
+    def path(self):
+        return self._path
+
+    def record(self, direction: int, data: bytes):
+        if self._file is None:
+            return
+        self._file.write(RECORD.pack(direction, time.perf_counter() - self._start, len(data)))
+        self._file.write(data)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_recording(path: str) -> Iterator[tuple[int, float, bytes]]:
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f'{path} is not a recording')
+        while True:
+            header = f.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            direction, sec, length = RECORD.unpack(header)
+            yield direction, sec, f.read(length)
@@ -1,7 +1,13 @@
 import socket
+from typing import Union
 
+from lib.network.recorder import IN, OUT, Recorder
 import team_config
 
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    import asyncio  # the event loop is only imported by lib/player/agent_runtime.py
+
 MAX_BUFF_SIZE = 8192
 
 
@@ -32,11 +38,21 @@ class UDPSocket:
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._sock.settimeout(team_config.SOCKET_INTERVAL)
         self._receive_first_message = False
+        self._recorder: Union[Recorder, None] = None
+
+    def set_recorder(self, recorder: Recorder):
+        self._recorder = recorder
+
+    def record(self, direction: int, data: bytes):
+        if self._recorder is not None:
+            self._recorder.record(direction, data)
 
     def send_msg(self, msg: str):
         if msg[-1] != '\0':
             msg += '\0'
-        return self._sock.sendto(msg.encode(), self._ip.tuple())
+        data = msg.encode()
+        self.record(OUT, data)
+        return self._sock.sendto(data, self._ip.tuple())
 
     def receive_msg(self):
         try:
@@ -44,8 +60,48 @@ class UDPSocket:
             if not self._receive_first_message:
                 self._receive_first_message = True
                 self._ip._port = server_address[1]
+            self.record(IN, message)
             return len(message), message, server_address
         except:
             message = ""
             server_address = 0
             return len(message), message, server_address
+
+
+class AsyncUDPSocket(UDPSocket):
+    def __init__(self, ip_address: IPAddress):
+        super().__init__(ip_address)
+        self._sock.setblocking(False)
+        self._sock.bind(('', 0))
+        self._transport: Union['asyncio.DatagramTransport', None] = None
+
+    def raw_socket(self) -> socket.socket:
+        return self._sock
+
+    def attach(self, transport: 'asyncio.DatagramTransport'):
+        self._transport = transport
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    def update_server_address(self, server_address):
+        if not self._receive_first_message:
+            self._receive_first_message = True
+            self._ip._port = server_address[1]
+
+    def send_msg(self, msg: str):
+        if msg[-1] != '\0':
+            msg += '\0'
+        data = msg.encode()
+        self.record(OUT, data)
+        if self._transport is None:
+            # init command is sent before the event loop owns the socket
+            return self._sock.sendto(data, self._ip.tuple())
+        self._transport.sendto(data, self._ip.tuple())
+        return len(data)
+
+    def receive_msg(self):
+        # messages are pushed by AgentDatagramProtocol, there is nothing to poll
+        return 0, "", 0
@@ -1,4 +1,4 @@
-from lib.parser.parser_message_params import MessageParamsParser
+from lib.parser.sexp_parser import nodes_to_dict, parse_sexp
 
 """
     sample version >= 7.0
@@ -23,16 +23,14 @@ class GlobalFullStateWorldMessageParser:
         self._dic = {}
 
     def parse(self, message: str):
-        self._dic['time'] = message.split(" ")[1]
-        message = message[message.find("(", 1):-1]
+        nodes = parse_sexp(message)[0]
+        self._dic['time'] = nodes[1]
 
-        # parsing ball
-        msg = message[:message.find("((p")]
-        MessageParamsParser._parse(self._dic, msg)
+        # parsing ball (and goals)
+        nodes_to_dict([node for node in nodes[2:] if not PlayerMessageParser.is_player(node)], self._dic)
 
         # and now parsing players
-        msg = message[message.find("((p"):]
-        self._dic.update(PlayerMessageParser().parse(msg))
+        self._dic.update(PlayerMessageParser().parse(nodes[2:]))
         self._dic.update({"teams": {
             "team_left": PlayerMessageParser._team_l,
             "team_right": PlayerMessageParser._team_r
@@ -50,48 +48,41 @@ class PlayerMessageParser:
         self._dic = {}
 
     @staticmethod
-    def _parser(dic: dict, message: str):
+    def is_player(node) -> bool:
+        return isinstance(node, list) and len(node) > 0 and isinstance(node[0], list) and node[0][0] == 'p'
+
+    @staticmethod
+    def _parser(dic: dict, nodes: list):
         players = []
-        seek = 0
-        if len(message) < 5:
-            return
-        while seek < len(message):
-            seek = message.find("((p", seek)
-            next_seek = message.find("((p", seek + 1)
-
-            if next_seek == -1:
-                next_seek = len(message)
-            msg = message[seek: next_seek].strip(" ()").split(" ")
-            k = -1
-            kk = 0
-            if msg[3] == 'g' or msg[3] == 'goalie)':
-                k = 0
+        for node in nodes:
+            if not PlayerMessageParser.is_player(node):
+                continue
+            name = node[0]
+            team = str(name[1])
+            values = node[1:]
             player_dic = {
-                "unum": msg[2].strip("()"),
-                "pos_x": msg[4 + k],
-                "pos_y": msg[5 + k],
-                "vel_x": msg[6 + k],
-                "vel_y": msg[7 + k],
-                "body": msg[8 + k],
-                "neck": msg[9 + k],
+                "unum": name[2],
+                "pos_x": values[0],
+                "pos_y": values[1],
+                "vel_x": values[2],
+                "vel_y": values[3],
+                "body": values[4],
+                "neck": values[5],
             }
-            if PlayerMessageParser._team_l == msg[1]:
+            if PlayerMessageParser._team_l == team:
                 player_dic['side_id'] = 'l'
-            elif PlayerMessageParser._team_r == msg[1]:
+            elif PlayerMessageParser._team_r == team:
                 player_dic['side_id'] = 'r'
             elif PlayerMessageParser._team_l is None:
-                PlayerMessageParser._team_l = msg[1]
+                PlayerMessageParser._team_l = team
                 player_dic['side_id'] = 'l'
             elif PlayerMessageParser._team_r is None:
-                PlayerMessageParser._team_r = msg[1]
+                PlayerMessageParser._team_r = team
                 player_dic['side_id'] = 'r'
 
-            if k == 0:
+            if len(name) > 3 and name[3] in ('g', 'goalie'):
                 player_dic['goalie'] = 'g'
-            ext = []
-            if ((k == 0 and len(msg) > 10)
-                    or (k == -1 and len(msg) > 9)):
-                ext = msg[10 + k:]
+            ext = values[6:]
             if 'k' in ext:
                 player_dic['kick'] = True
             if 't' in ext:
@@ -104,21 +95,10 @@ class PlayerMessageParser:
                 player_dic['card'] = 'r'
 
             players.append(player_dic)
-            seek = next_seek
         dic["players"] = players
 
-    @staticmethod
-    def n_inner_dict(message: str):
-        # dlog.debug(f"message {message}")
-        n = 0
-        for c in message[1:-1]:
-            if c == '(':
-                n += 1
-        # dlog.debug(f"n {n}")
-        return n
-
-    def parse(self, message):
-        PlayerMessageParser._parser(self._dic, message)
+    def parse(self, nodes: list):
+        PlayerMessageParser._parser(self._dic, nodes)
         return self._dic
 
 # message = '(fullstate 109 (pmode play_on) (vmode high normal) (count 0 25 82 0 79 0 0 0) (arm (movable 0) (expires 0) (target 0 0) (count 0)) (score 0 0) ((b) 0 0 0 0) ((p r 10 9) 0.00733964 -23.0363 -0.399337 -0.0830174 -164.67 -90 44.2236 1.38729 (stamina 7539.49 0.935966 1 129861)) ((p r 11 10) 3.75961 -2.09864 -0.327071 0.126905 153.836 13 (stamina 7615.44 0.854839 1 129617))) '
@@ -1,4 +1,8 @@
-from lib.parser.parser_message_params import MessageParamsParser
+import re
+
+import numpy as np
+
+from lib.parser.sexp_parser import nodes_to_dict, parse_sexp
 
 """"
     (fullstate <time>
@@ -19,12 +23,36 @@ from lib.parser.parser_message_params import MessageParamsParser
      < pos.x > < pos.y > < vel.x > < vel.y > < body_angle > < neck_angle > [ < point_dist > < point_dir >]
      ( < stamina > < effort > < recovery >[< capacity >])
     [t | k][y | r])
+    the players are decoded in one pass into PLAYER_DTYPE rows, the world model reads the record as it is.
 """
 
 
+# one row per player of the message, in the order of the message
+PLAYER_DTYPE = np.dtype([
+    ('side', 'U1'), ('unum', np.int8), ('goalie', np.bool_), ('player_type', np.int8),
+    ('pos_x', np.float64), ('pos_y', np.float64), ('vel_x', np.float64), ('vel_y', np.float64),
+    ('body', np.float64), ('neck', np.float64),
+    ('pointto_dist', np.float64), ('pointto_dir', np.float64),  # nan without pointto
+    ('focus_dist', np.float64), ('focus_dir', np.float64),
+    ('stamina', np.float64), ('effort', np.float64), ('recovery', np.float64), ('capacity', np.float64),
+    ('kick', np.bool_), ('tackle', np.bool_), ('charged', np.bool_), ('card', 'U1'),  # card: '', 'y' or 'r'
+])
+MAX_PLAYERS = 22
+
+# the float fields of PLAYER_DTYPE in the order they are decoded
+PLAYER_FLOATS = ('pos_x', 'pos_y', 'vel_x', 'vel_y', 'body', 'neck', 'pointto_dist', 'pointto_dir',
+                 'focus_dist', 'focus_dir', 'stamina', 'effort', 'recovery', 'capacity')
+# ((p <side> <unum> [g] <type>) <values> [(focus_point <dist> <dir>)] (stamina <values>) [<flags>])
+PLAYER_PATTERN = re.compile(r'\(\(p\s+([lr])\s+(\d+)(\s+g)?\s+(\d+)\s*\)([^()]*)(?:\(focus_point([^()]*)\)\s*)?'
+                            r'\(stamina([^()]*)\)([^()]*)\)')
+
+
 class FullStateWorldMessageParser:
     def __init__(self):
         self._dic = {}
+        self._players = np.zeros(MAX_PLAYERS, dtype=PLAYER_DTYPE)
+        self._n_players = 0
+        self._ball = np.zeros(4)
         self._kick = 0
         self._dash = 0
         self._turn = 0
@@ -35,14 +63,16 @@ class FullStateWorldMessageParser:
         self._say = 0
 
     def parse(self, message: str):
-        self._dic['time'] = message.split(" ")[1]
-        message = message[message.find("(", 1):-1]
+        players_start = message.find('((p ')
+        # the players are decoded by parse_players, the closed header is parsed by the json path of parse_sexp
+        nodes = parse_sexp(message if players_start == -1 else message[:players_start] + ')')[0]
+        self._dic.clear()
+        self._dic['time'] = nodes[1]
 
         # before parsing players
-        msg = message[:message.find("((p")]
-        MessageParamsParser._parse(self._dic, msg)
+        nodes_to_dict(nodes[2:], self._dic)
 
-        data = list(map(int, self._dic['count'].split(' ')))
+        data = self._dic['count']
 
         self._kick = data[0]
         self._dash = data[1]
@@ -52,14 +82,60 @@ class FullStateWorldMessageParser:
         self._turn_neck = data[5]
         self._change_view = data[6]
         self._say = data[7]
+        self._ball[:] = self._dic['b']
 
         # and now parsing players
-        msg = message[message.find("((p"):]
-        self._dic.update(PlayerMessageParser().parse(msg))
+        self._n_players = 0 if players_start == -1 else self.parse_players(message, players_start)
+
+    def parse_players(self, message: str, start: int) -> int:
+        """
+        fills the player record with the players of the message from start, returns their number.
+        the numbers of all the players are joined in one string and converted by one numpy call
+        """
+        numbers = []
+        names = []
+        flags = []
+        for side, unum, goalie, player_type, values, focus, stamina, flag in PLAYER_PATTERN.findall(message, start):
+            numbers.append(values if len(values.split()) > 6 else values + ' nan nan')  # without pointto
+            numbers.append(focus or '0 0')
+            numbers.append(stamina if len(stamina.split()) > 3 else stamina + ' -1')  # without capacity
+            names.append((side, unum, goalie != '', player_type))
+            flags.append(flag)
+
+        n = len(names)
+        if n > len(self._players):
+            self._players = np.zeros(n, dtype=PLAYER_DTYPE)
+        if n == 0:
+            return 0
+        players = self._players[:n]
+        values = np.fromstring(' '.join(numbers), sep=' ').reshape(n, len(PLAYER_FLOATS))
+        for i, field in enumerate(PLAYER_FLOATS):
+            players[field] = values[:, i]
+        players['side'], players['unum'], players['goalie'], players['player_type'] = zip(*names)
+        players['kick'] = ['k' in f for f in flags]
+        players['tackle'] = ['t' in f for f in flags]
+        players['charged'] = ['f' in f for f in flags]
+        players['card'] = ['y' if 'y' in f else 'r' if 'r' in f else '' for f in flags]
+        return n
 
     def dic(self):
+        """
+        the values of the message without the players and the ball, see players() and ball()
+        """
         return self._dic
 
+    def players(self) -> np.ndarray:
+        """
+        PLAYER_DTYPE record of the players of the last message, valid until the next parse
+        """
+        return self._players[:self._n_players]
+
+    def ball(self) -> np.ndarray:
+        """
+        pos.x, pos.y, vel.x, vel.y of the ball
+        """
+        return self._ball
+
     def kick_count(self):
         return self._kick
 
@@ -83,75 +159,3 @@ class FullStateWorldMessageParser:
 
     def say_count(self):
         return self._say
-
-
-class PlayerMessageParser:
-    def __init__(self):
-        self._dic = {}
-
-    @staticmethod
-    def _parser(dic: dict, message: str):
-        players = []
-        seek = 0
-        while seek < len(message):
-            seek = message.find("((p", seek)
-            next_seek = message.find("((p", seek + 1)
-
-            if next_seek == -1:
-                next_seek = len(message)
-            msg = message[seek: next_seek].strip(" ()").split(" ")
-            k = 0
-            kk = 0
-            use_point_to = 0
-            if msg[3] == 'g':
-                k = 1
-            if msg[15 + k].find('stamina') > 0:
-                use_point_to = 2
-            player_dic = {
-                "side_id": msg[1],
-                "unum": msg[2],
-                "player_type": msg[3 + k].strip("()"),
-                "pos_x": msg[4 + k],
-                "pos_y": msg[5 + k],
-                "vel_x": msg[6 + k],
-                "vel_y": msg[7 + k],
-                "body": msg[8 + k],
-                "neck": msg[9 + k],
-                "stamina": {
-                    "stamina": msg[14 + k + kk + use_point_to],
-                    "effort": msg[15 + k + kk + use_point_to],
-                    "recovery": msg[16 + k + kk + use_point_to],
-                    "capacity": msg[17 + k + kk + use_point_to].strip("()")
-                },
-                "focus_dist": msg[11 + k + kk + use_point_to],
-                "focus_dir": msg[12 + k + kk + use_point_to].strip("()")
-            }
-            if use_point_to == 2:
-                player_dic["pointto_dist"] = msg[10 + k].strip("()")
-                player_dic["pointto_dir"] = msg[11 + k].strip("()")
-            if k == 1:
-                player_dic['goalie'] = 'g'
-            players.append(player_dic)
-            seek = next_seek
-        dic["players"] = players
-
-    @staticmethod
-    def n_inner_dict(message: str):
-        # dlog.debug(f"message {message}")
-        n = 0
-        for c in message[1:-1]:
-            if c == '(':
-                n += 1
-        # dlog.debug(f"n {n}")
-        return n
-
-    def parse(self, message):
-        PlayerMessageParser._parser(self._dic, message)
-        return self._dic
-
-# message = '(fullstate 109 (pmode play_on) (vmode high normal) (count 0 25 82 0 79 0 0 0) (arm (movable 0) (expires 0) (target 0 0) (count 0)) (score 0 0) ((b) 0 0 0 0) ((p r 10 9) 0.00733964 -23.0363 -0.399337 -0.0830174 -164.67 -90 44.2236 1.38729 (stamina 7539.49 0.935966 1 129861)) ((p r 11 10) 3.75961 -2.09864 -0.327071 0.126905 153.836 13 (stamina 7615.44 0.854839 1 129617))) '
-# msg = message[message.find("((p"):]
-# a =PlayerMessageParser()
-# d = a.parse(msg)
-# for p in d['players']:
-#     debug_print(p['unum'], p['stamina'])
\ No newline at end of file
@@ -0,0 +1,139 @@
+import json
+
+"""
+    single pass s-expression parser for server messages.
+    (server_param (audio_cut_dist 50)(auto_mode 0) ... (landmark_file "~/.rcssserver-landmark.xml"))
+        -> [['server_param', ['audio_cut_dist', 50], ['auto_mode', 0], ..., ['landmark_file', '~/.rcssserver-landmark.xml']]]
+    atoms are typed: int, float or str (quotes removed).
+"""
+
+_NUMBER_START = frozenset('-+.0123456789')
+_JSON_BARE_START = frozenset('-+.0123456789[]"')
+
+
+def atom(token: str):
+    c = token[0]
+    if c in _NUMBER_START:
+        try:
+            return int(token)
+        except ValueError:
+            try:
+                return float(token)
+            except ValueError:
+                return token
+    if c == '"':
+        return token[1:-1]
+    return token
+
+
+def _append_atoms(node: list, text: str):
+    append = node.append
+    for token in text.split():
+        if token[0] in _NUMBER_START:
+            if '.' in token:
+                try:
+                    append(float(token))
+                except ValueError:
+                    append(token)
+            else:
+                try:
+                    append(int(token))
+                except ValueError:
+                    append(atom(token))
+        else:
+            append(token)
+
+
+def _parse_part(part: str, top: list, stack: list) -> list:
+    # text between '(' is a new node, every ')' inside it goes back to the parent
+    for i, segment in enumerate(part.split('(')):
+        if i > 0:
+            node = []
+            top.append(node)
+            stack.append(top)
+            top = node
+        if ')' not in segment:
+            _append_atoms(top, segment)
+            continue
+        pieces = segment.split(')')
+        _append_atoms(top, pieces[0])
+        for piece in pieces[1:]:
+            if stack:
+                top = stack.pop()
+            _append_atoms(top, piece)
+    return top
+
+
+def _parse_tokens(message: str) -> list:
+    root = []
+    stack = []
+    if '"' not in message:
+        _parse_part(message, root, stack)
+        return root
+    top = root
+    for i, part in enumerate(message.split('"')):
+        if i % 2 == 1:  # quoted string
+            top.append(part)
+        else:
+            top = _parse_part(part, top, stack)
+    return root
+
+
+def _parse_json(message: str) -> list:
+    # (a 1 (b 2.5)) -> [["a",1,["b",2.5]]], numbers are converted by the json decoder
+    if '"' in message:
+        tokens = []
+        for i, part in enumerate(message.split('"')):
+            if i % 2 == 1:
+                tokens.append(f'"{part}"')
+            else:
+                tokens += part.replace('(', ' [ ').replace(')', ' ] ').split()
+    else:
+        tokens = message.replace('(', ' [ ').replace(')', ' ] ').split()
+    text = ','.join([t if t[0] in _JSON_BARE_START else f'"{t}"' for t in tokens])
+    return json.loads('[' + text.replace('[,', '[').replace(',]', ']') + ']')
+
+
+def parse_sexp(message: str) -> list:
+    """
+    returns the list of top level expressions of the message, every expression is a list of atoms and expressions.
+    unbalanced parentheses are closed at the end of the message.
+    """
+    message = message.rstrip('\x00\n ')
+    if not any(c in message for c in ',[]\\'):
+        try:
+            return _parse_json(message)
+        except ValueError:  # unbalanced parentheses, numbers that are not json numbers, ...
+            pass
+    return _parse_tokens(message)
+
+
+def node_key(node: list) -> str:
+    head = node[0] if len(node) > 0 else ''
+    if isinstance(head, list):  # ((b) ...), ((g l) ...)
+        return ' '.join(str(a) for a in head)
+    return str(head)
+
+
+def node_value(node: list):
+    """
+    (key) -> None, (key atom) -> atom, (key atom atom ...) -> list of atoms,
+    (key (k1 ...) (k2 ...)) -> dict of the sub expressions
+    """
+    values = node[1:]
+    if len(values) == 0:
+        return None
+    if all(isinstance(v, list) for v in values):
+        return nodes_to_dict(values)
+    if len(values) == 1:
+        return values[0]
+    return values
+
+
+def nodes_to_dict(nodes: list, dic: dict = None) -> dict:
+    if dic is None:
+        dic = {}
+    for node in nodes:
+        if isinstance(node, list):
+            dic[node_key(node)] = node_value(node)
+    return dic
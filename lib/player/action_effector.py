@@ -92,8 +92,8 @@ class ActionEffector:
         wm = self._agent.world()
         if full_sensor.kick_count() != self._command_counter[CommandType.KICK.value]:
             log.os_log().error(f"player({wm.self().unum()} lost kick at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()} lost kick at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()} lost kick at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({} lost kick at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({} lost kick at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._kick_accel = Vector2D(0, 0)
@@ -102,8 +102,8 @@ class ActionEffector:
 
         if full_sensor.turn_count() != self._command_counter[CommandType.TURN.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost TURN at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost TURN at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost TURN at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost TURN at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost TURN at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._turn_actual = 0
@@ -112,8 +112,8 @@ class ActionEffector:
 
         if full_sensor.dash_count() != self._command_counter[CommandType.DASH.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost DASH at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost DASH at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost DASH at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost DASH at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost DASH at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._dash_accel = Vector2D(0, 0)
@@ -123,16 +123,16 @@ class ActionEffector:
 
         if full_sensor.move_count() != self._command_counter[CommandType.MOVE.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost MOVE at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost MOVE at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost MOVE at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost MOVE at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost MOVE at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._move_pos = Vector2D(0, 0)
             self._command_counter[CommandType.MOVE.value] = full_sensor.move_count()
         if full_sensor.catch_count() != self._command_counter[CommandType.CATCH.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost CATCH at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost CATCH at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost CATCH at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost CATCH at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost CATCH at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             # self._catch_time = GameTime()
@@ -141,7 +141,7 @@ class ActionEffector:
         # if full_sensor.tackle_count() != self._command_counter[CommandType.TACKLE.value]:
         #     log.os_log().error(f"player({wm.self().unum()}) lost TACKLE at cycle {wm.time()}")
         #     log.sw_log().action().add_text(f"player({wm.self().unum()}) lost TACKLE at cycle {wm.time()}")
-        #     log.debug_client().add_message(f"player({wm.self().unum()}) lost TACKLE at cycle {wm.time()}")
+        #     log.debug_client().add_message("player({}) lost TACKLE at cycle {}", wm.self().unum(), wm.time())
         #
         #     self._last_body_commands[0] = CommandType.ILLEGAL
         #     self._tackle_power = 0
@@ -151,8 +151,8 @@ class ActionEffector:
 
         if full_sensor.turn_neck_count() != self._command_counter[CommandType.TURN_NECK.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command TURN_NECK at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command TURN_NECK at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command TURN_NECK at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command TURN_NECK at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command TURN_NECK at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.TURN_NECK.value] = full_sensor.turn_neck_count()
             self._done_turn_neck = False
             self._turn_neck_moment = 0
@@ -160,7 +160,7 @@ class ActionEffector:
         # if full_sensor.change_focus_count() != self._command_counter[CommandType.CHANGE_FOCUS.value]:
         #     log.os_log().error(f"player({wm.self().unum()}) lost command CHANGE_FOCUS at cycle {wm.time()}")
         #     log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command CHANGE_FOCUS at cycle {wm.time()}")
-        #     log.debug_client().add_message(f"player({wm.self().unum()}) lost command CHANGE_FOCUS at cycle {wm.time()}")
+        #     log.debug_client().add_message("player({}) lost command CHANGE_FOCUS at cycle {}", wm.self().unum(), wm.time())
         #     self._command_counter[CommandType.CHANGE_FOCUS.value] = body_sensor.change_focus_count()
         #     self._done_change_focus = False
         #     self._change_focus_moment_dist = 0
@@ -168,26 +168,26 @@ class ActionEffector:
 
         if full_sensor.change_view_count() != self._command_counter[CommandType.CHANGE_VIEW.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command CHANGE_VIEW at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command CHANGE_VIEW at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command CHANGE_VIEW at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command CHANGE_VIEW at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command CHANGE_VIEW at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.CHANGE_VIEW.value] =   full_sensor.change_view_count()
 
         if full_sensor.say_count() != self._command_counter[CommandType.SAY.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command SAY at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command SAY at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command SAY at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command SAY at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command SAY at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.SAY.value]  = full_sensor.say_count()
 
         # if body_sensor.pointto_count() != self._command_counter[CommandType.POINTTO.value]:
         #     log.os_log().error(f"player({wm.self().unum()}) lost command POINTTO at cycle {wm.time()}")
         #     log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command POINTTO at cycle {wm.time()}")
-        #     log.debug_client().add_message(f"player({wm.self().unum()}) lost command POINTTO at cycle {wm.time()}")
+        #     log.debug_client().add_message("player({}) lost command POINTTO at cycle {}", wm.self().unum(), wm.time())
         #     self._command_counter[CommandType.POINTTO.value]  = full_sensor.pointto_count()
 
         # if full_sensor.attentionto_count() != self._command_counter[CommandType.ATTENTIONTO.value]:
         #     log.os_log().error(f"player({wm.self().unum()}) lost command ATTENTIONTO at cycle {wm.time()}")
         #     log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command ATTENTIONTO at cycle {wm.time()}")
-        #     log.debug_client().add_message(f"player({wm.self().unum()}) lost command ATTENTIONTO at cycle {wm.time()}")
+        #     log.debug_client().add_message("player({}) lost command ATTENTIONTO at cycle {}", wm.self().unum(), wm.time())
         #     self._command_counter[CommandType.ATTENTIONTO.value] =   full_sensor.attentionto_count()
 
 
@@ -196,8 +196,8 @@ class ActionEffector:
         if body_sensor.kick_count() != self._command_counter[CommandType.KICK.value]:
             if body_sensor.charged_expires() == 0:
                 log.os_log().error(f"player({wm.self().unum()} lost kick at cycle {wm.time()}")
-                log.sw_log().action().add_text(f"player({wm.self().unum()} lost kick at cycle {wm.time()}")
-                log.debug_client().add_message(f"player({wm.self().unum()} lost kick at cycle {wm.time()}")
+                log.sw_log().action().add_text('player({} lost kick at cycle {}', wm.self().unum(), wm.time())
+                log.debug_client().add_message("player({} lost kick at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._kick_accel = Vector2D(0, 0)
@@ -207,8 +207,8 @@ class ActionEffector:
         if body_sensor.turn_count() != self._command_counter[CommandType.TURN.value]:
             if body_sensor.charged_expires() == 0:
                 log.os_log().error(f"player({wm.self().unum()}) lost TURN at cycle {wm.time()}")
-                log.sw_log().action().add_text(f"player({wm.self().unum()}) lost TURN at cycle {wm.time()}")
-                log.debug_client().add_message(f"player({wm.self().unum()}) lost TURN at cycle {wm.time()}")
+                log.sw_log().action().add_text('player({}) lost TURN at cycle {}', wm.self().unum(), wm.time())
+                log.debug_client().add_message("player({}) lost TURN at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._turn_actual = 0
@@ -218,8 +218,8 @@ class ActionEffector:
         if body_sensor.dash_count() != self._command_counter[CommandType.DASH.value]:
             if body_sensor.charged_expires() == 0:
                 log.os_log().error(f"player({wm.self().unum()}) lost DASH at cycle {wm.time()}")
-                log.sw_log().action().add_text(f"player({wm.self().unum()}) lost DASH at cycle {wm.time()}")
-                log.debug_client().add_message(f"player({wm.self().unum()}) lost DASH at cycle {wm.time()}")
+                log.sw_log().action().add_text('player({}) lost DASH at cycle {}', wm.self().unum(), wm.time())
+                log.debug_client().add_message("player({}) lost DASH at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._dash_accel = Vector2D(0, 0)
@@ -229,8 +229,8 @@ class ActionEffector:
         if body_sensor.move_count() != self._command_counter[CommandType.MOVE.value]:
             if body_sensor.charged_expires() == 0:
                 log.os_log().error(f"player({wm.self().unum()}) lost MOVE at cycle {wm.time()}")
-                log.sw_log().action().add_text(f"player({wm.self().unum()}) lost MOVE at cycle {wm.time()}")
-                log.debug_client().add_message(f"player({wm.self().unum()}) lost MOVE at cycle {wm.time()}")
+                log.sw_log().action().add_text('player({}) lost MOVE at cycle {}', wm.self().unum(), wm.time())
+                log.debug_client().add_message("player({}) lost MOVE at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._move_pos = Vector2D(0, 0)
@@ -238,8 +238,8 @@ class ActionEffector:
         if body_sensor.catch_count() != self._command_counter[CommandType.CATCH.value]:
             if body_sensor.charged_expires() == 0:
                 log.os_log().error(f"player({wm.self().unum()}) lost CATCH at cycle {wm.time()}")
-                log.sw_log().action().add_text(f"player({wm.self().unum()}) lost CATCH at cycle {wm.time()}")
-                log.debug_client().add_message(f"player({wm.self().unum()}) lost CATCH at cycle {wm.time()}")
+                log.sw_log().action().add_text('player({}) lost CATCH at cycle {}', wm.self().unum(), wm.time())
+                log.debug_client().add_message("player({}) lost CATCH at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             # self._catch_time = GameTime()
@@ -247,8 +247,8 @@ class ActionEffector:
         if body_sensor.tackle_count() != self._command_counter[CommandType.TACKLE.value]:
             if body_sensor.charged_expires() == 0:
                 log.os_log().error(f"player({wm.self().unum()}) lost TACKLE at cycle {wm.time()}")
-                log.sw_log().action().add_text(f"player({wm.self().unum()}) lost TACKLE at cycle {wm.time()}")
-                log.debug_client().add_message(f"player({wm.self().unum()}) lost TACKLE at cycle {wm.time()}")
+                log.sw_log().action().add_text('player({}) lost TACKLE at cycle {}', wm.self().unum(), wm.time())
+                log.debug_client().add_message("player({}) lost TACKLE at cycle {}", wm.self().unum(), wm.time())
 
             self._last_body_commands[0] = CommandType.ILLEGAL
             self._tackle_power = 0
@@ -258,16 +258,16 @@ class ActionEffector:
 
         if body_sensor.turn_neck_count() != self._command_counter[CommandType.TURN_NECK.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command TURN_NECK at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command TURN_NECK at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command TURN_NECK at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command TURN_NECK at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command TURN_NECK at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.TURN_NECK.value] = body_sensor.turn_neck_count()
             self._done_turn_neck = False
             self._turn_neck_moment = 0
 
         if body_sensor.change_focus_count() != self._command_counter[CommandType.CHANGE_FOCUS.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command CHANGE_FOCUS at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command CHANGE_FOCUS at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command CHANGE_FOCUS at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command CHANGE_FOCUS at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command CHANGE_FOCUS at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.CHANGE_FOCUS.value] = body_sensor.change_focus_count()
             self._done_change_focus = False
             self._change_focus_moment_dist = 0
@@ -275,38 +275,38 @@ class ActionEffector:
 
         if body_sensor.change_view_count() != self._command_counter[CommandType.CHANGE_VIEW.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command CHANGE_VIEW at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command CHANGE_VIEW at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command CHANGE_VIEW at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command CHANGE_VIEW at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command CHANGE_VIEW at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.CHANGE_VIEW.value] =   body_sensor.change_view_count()
 
         if body_sensor.say_count() != self._command_counter[CommandType.SAY.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command SAY at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command SAY at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command SAY at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command SAY at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command SAY at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.SAY.value]  = body_sensor.say_count()
 
         if body_sensor.pointto_count() != self._command_counter[CommandType.POINTTO.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command POINTTO at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command POINTTO at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command POINTTO at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command POINTTO at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command POINTTO at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.POINTTO.value]  = body_sensor.pointto_count()
 
         if body_sensor.attentionto_count() != self._command_counter[CommandType.ATTENTIONTO.value]:
             log.os_log().error(f"player({wm.self().unum()}) lost command ATTENTIONTO at cycle {wm.time()}")
-            log.sw_log().action().add_text(f"player({wm.self().unum()}) lost command ATTENTIONTO at cycle {wm.time()}")
-            log.debug_client().add_message(f"player({wm.self().unum()}) lost command ATTENTIONTO at cycle {wm.time()}")
+            log.sw_log().action().add_text('player({}) lost command ATTENTIONTO at cycle {}', wm.self().unum(), wm.time())
+            log.debug_client().add_message("player({}) lost command ATTENTIONTO at cycle {}", wm.self().unum(), wm.time())
             self._command_counter[CommandType.ATTENTIONTO.value] =   body_sensor.attentionto_count()
 
     @staticmethod
     def conserve_dash_power(wm: 'WorldModel', power, rel_dir):
-        log.sw_log().action().add_text( f"(conserved dash power) power={power}")
+        log.sw_log().action().add_text( '(conserved dash power) power={}', power)
 
         SP = ServerParam.i()
         required_stamina = power
         available_stamina = wm.self().stamina() + wm.self().player_type().extra_stamina()
 
         if available_stamina < required_stamina:
-            log.sw_log().action().add_text( f"(conserve dash power) not enough stamina. power={power} stamina={available_stamina}")
+            log.sw_log().action().add_text( '(conserve dash power) not enough stamina. power={} stamina={}', power, available_stamina)
             power = available_stamina
 
         dir_rate = SP.dash_dir_rate(rel_dir)
@@ -319,7 +319,7 @@ class ActionEffector:
         power = accel_mag / wm.self().dash_rate() / dir_rate
         power = SP.normalize_dash_power(power)
 
-        log.sw_log().action().add_text( f"(conserved dash power) conserved power={power}")
+        log.sw_log().action().add_text( '(conserved dash power) conserved power={}', power)
 
         return power
 
@@ -332,7 +332,7 @@ class ActionEffector:
             log.os_log().error(f"(set kick) player({wm.self().unum()}) power is out of boundary at cycle {wm.time()}. power={power}")
             power = ServerParam.i().max_power() if power > 100 else ServerParam.i().min_power()
 
-        log.sw_log().action().add_text( f"(set kick) power={power}, rel_dir={rel_dir}")
+        log.sw_log().action().add_text( '(set kick) power={}, rel_dir={}', power, rel_dir)
         self._kick_accel = Vector2D.polar2vector(power * wm.self().kick_rate(),
                                                  wm.self().body() + rel_dir)
         max_rand = wm.self().player_type().kick_rand()*power/ServerParam.i().max_power()
@@ -368,7 +368,7 @@ class ActionEffector:
         self._dash_dir = rel_dir
         self._dash_accel = Vector2D.polar2vector(accel_mag, accel_angle)
 
-        log.sw_log().action().add_text( f"(set dash) power={power}, rel_dir={rel_dir}, accel={self._dash_accel}")
+        log.sw_log().action().add_text( '(set dash) power={}, rel_dir={}, accel={}', power, rel_dir, self._dash_accel)
 
         self._body_command = PlayerDashCommand(power, rel_dir)
         return self._body_command
@@ -387,8 +387,8 @@ class ActionEffector:
         self._turn_actual = moment / (1 + speed*wm.self().player_type().inertia_moment())
         self._turn_error = abs(SP.player_rand()*self._turn_actual)
 
-        log.sw_log().action().add_text( f"(set turn) moment={moment}, actual_turn={self._turn_actual}, error={self._turn_error}")
-        log.os_log().debug(f"(set turn) moment={moment}, actual_turn={self._turn_actual}, error={self._turn_error}")
+        log.sw_log().action().add_text( '(set turn) moment={}, actual_turn={}, error={}', moment, self._turn_actual, self._turn_error)
+        log.os_log().debug('(set turn) moment=%s, actual_turn=%s, error=%s', moment, self._turn_actual, self._turn_error)
 
         self._body_command = PlayerTurnCommand(round(moment, 2))
         return self._body_command
@@ -0,0 +1,171 @@
+import asyncio
+from typing import Callable, Union
+
+from lib.debug.debug import log
+from lib.network.recorder import IN
+from lib.network.udp_socket import AsyncUDPSocket
+from lib.player.basic_client import AsyncClient
+from lib.player.soccer_agent import SoccerAgent
+
+import team_config
+
+
+SERVER_TIMEOUT = 3.0  # seconds without any message before the server is considered dead
+
+
+class AgentDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self,
+                 sock: AsyncUDPSocket,
+                 on_message: Callable[[bytes], None],
+                 on_lost: Callable[[], None]):
+        self._socket = sock
+        self._on_message = on_message
+        self._on_lost = on_lost
+
+    def connection_made(self, transport: asyncio.DatagramTransport):
+        self._socket.attach(transport)
+
+    def datagram_received(self, data: bytes, server_address):
+        self._socket.update_server_address(server_address)
+        self._socket.record(IN, data)
+        self._on_message(data)
+
+    def error_received(self, exc: Exception):
+        pass
+
+    def connection_lost(self, exc: Union[Exception, None]):
+        self._on_lost()
+
+
+class AgentRuntime:
+    """
+    event driven replacement of SoccerAgent.run.
+    received datagrams are handed to the agent as soon as they arrive and non-synch decision deadlines are
+    loop timers instead of being checked on every socket timeout.
+    """
+    def __init__(self, agent: SoccerAgent):
+        self._agent: SoccerAgent = agent
+        self._client: AsyncClient = AsyncClient()
+        self._agent.set_client(self._client)
+
+        self._loop: Union[asyncio.AbstractEventLoop, None] = None
+        self._closed: Union[asyncio.Future, None] = None
+        self._decision_timer: Union[asyncio.TimerHandle, None] = None
+        self._watchdog: Union[asyncio.TimerHandle, None] = None
+        self._last_receive_time: float = 0
+        self._log_state = log.state()
+
+    def agent(self) -> SoccerAgent:
+        return self._agent
+
+    def enter(self):
+        # log is global, several agents can share the loop
+        log.set_state(self._log_state)
+
+    def leave(self):
+        self._log_state = log.state()
+
+    async def start(self) -> bool:
+        self._loop = asyncio.get_running_loop()
+        self._closed = self._loop.create_future()
+
+        self.enter()
+        if not self._agent.handle_start():
+            self._agent.handle_exit()
+            self.leave()
+            return False
+        self.leave()
+
+        sock = self._client.socket()
+        await self._loop.create_datagram_endpoint(
+            lambda: AgentDatagramProtocol(sock, self.on_message, self.on_connection_lost),
+            sock=sock.raw_socket())
+
+        self._last_receive_time = self._loop.time()
+        self._watchdog = self._loop.call_later(SERVER_TIMEOUT, self.check_server_alive)
+        return True
+
+    async def wait_closed(self):
+        await self._closed
+
+    def waited_msec(self) -> int:
+        return int((self._loop.time() - self._last_receive_time) * 1000)
+
+    def on_message(self, data: bytes):
+        self._last_receive_time = self._loop.time()
+        self.enter()
+        self._agent.handle_message(data.decode())
+        self.leave()
+        if not self._client.is_server_alive():
+            self.stop()
+            return
+        self.schedule_decision()
+
+    def schedule_decision(self):
+        if self._decision_timer is not None:
+            self._decision_timer.cancel()
+            self._decision_timer = None
+
+        delay = self._agent.decision_delay_msec(self.waited_msec())
+        if delay is None:
+            return
+        self._decision_timer = self._loop.call_later(delay / 1000, self.on_decision_timer)
+
+    def on_decision_timer(self):
+        self._decision_timer = None
+        self.enter()
+        self._agent.handle_decision_timer(self.waited_msec())
+        self.leave()
+        if not self._client.is_server_alive():
+            self.stop()
+            return
+        self.schedule_decision()
+
+    def check_server_alive(self):
+        if self._loop.time() - self._last_receive_time > SERVER_TIMEOUT:
+            self.enter()
+            log.os_log().info(f"{team_config.TEAM_NAME} Agent : Server Down")
+            self._client.set_server_alive(False)
+            self.stop()
+            return
+        self._watchdog = self._loop.call_later(SERVER_TIMEOUT, self.check_server_alive)
+
+    def on_connection_lost(self):
+        self._client.set_server_alive(False)
+        self.stop()
+
+    def stop(self):
+        if self._closed.done():
+            return
+        if self._decision_timer is not None:
+            self._decision_timer.cancel()
+        if self._watchdog is not None:
+            self._watchdog.cancel()
+        self.enter()
+        self._agent.handle_exit()
+        self.leave()
+        self._client.socket().close()
+        self._closed.set_result(True)
+
+
+async def run_agents(agents: list[SoccerAgent], start_interval: float = 0.0):
+    """
+    runs the agents on the running loop until all of them are closed.
+    agents are started in order, start_interval seconds apart (like start.sh starts the goalie first).
+    """
+    runtimes = [AgentRuntime(agent) for agent in agents]
+    started = []
+    for i, runtime in enumerate(runtimes):
+        if i > 0 and start_interval > 0:
+            await asyncio.sleep(start_interval)
+        if await runtime.start():
+            started.append(runtime)
+    try:
+        await asyncio.gather(*[runtime.wait_closed() for runtime in started])
+    finally:
+        for runtime in started:
+            runtime.stop()
+
+
+def run_agent(agent: SoccerAgent):
+    asyncio.run(run_agents([agent]))
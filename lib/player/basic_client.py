@@ -1,6 +1,8 @@
 from enum import Enum
 
-from lib.network.udp_socket import IPAddress, UDPSocket
+from lib.network.recorder import Recorder
+from lib.network.udp_socket import AsyncUDPSocket, IPAddress, UDPSocket
+import team_config
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -15,8 +17,13 @@ class BasicClient:
     def connect_to(self,
                    host_port: IPAddress):
         self._socket = UDPSocket(host_port)
+        self.start_recording()
         return True
 
+    def start_recording(self):
+        if team_config.RECORD_DIR:
+            self._socket.set_recorder(Recorder.create(team_config.RECORD_DIR))
+
     def set_server_alive(self, mode: bool):
         self._server_alive = mode
 
@@ -32,3 +39,14 @@ class BasicClient:
 
     def is_server_alive(self):
         return self._server_alive
+
+
+class AsyncClient(BasicClient):
+    def connect_to(self,
+                   host_port: IPAddress):
+        self._socket = AsyncUDPSocket(host_port)
+        self.start_recording()
+        return True
+
+    def socket(self) -> AsyncUDPSocket:
+        return self._socket
@@ -0,0 +1,76 @@
+import time
+
+from lib.debug.debug import log
+
+import team_config
+
+"""
+    per cycle time budget of the decision.
+    PlayerAgent.action starts the deadline from the arrival of the sense_body message of the cycle, so the parsing
+    and the world update count too. the anytime action generators (e.g. BhvPassGen) get a GeneratorBudget from it,
+    generate their candidates best-first and stop when the budget expires, after their first target at least, so
+    the best candidate found so far is kicked before the deadline. without candidates BhvKick clears or holds the
+    ball. a generator still running after its budget is counted as an overrun.
+"""
+
+
+class GeneratorBudget:
+    def __init__(self, deadline: 'DecisionDeadline', name: str, end: float):
+        self._deadline = deadline
+        self._name = name
+        self._start = time.perf_counter()
+        self._end = end
+
+    def name(self):
+        return self._name
+
+    def expired(self) -> bool:
+        return time.perf_counter() >= self._end
+
+    def remaining(self) -> float:
+        return max(0., self._end - time.perf_counter())
+
+    def finish(self):
+        now = time.perf_counter()
+        if now > self._end:
+            self._deadline.add_overrun(self._name, now - self._start, self._end - self._start)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.finish()
+
+
+class DecisionDeadline:
+    def __init__(self, budget_msec: float = None):
+        self._budget = (team_config.DECISION_TIME_BUDGET_MSEC if budget_msec is None else budget_msec) / 1000
+        self._end: float = float('inf')
+        self._overruns: dict[str, int] = {}
+
+    def start(self, start: float = None):
+        """
+            start: perf_counter time the budget counts from, now by default
+        """
+        self._end = (time.perf_counter() if start is None else start) + self._budget
+
+    def remaining(self) -> float:
+        return max(0., self._end - time.perf_counter())
+
+    def expired(self) -> bool:
+        return time.perf_counter() >= self._end
+
+    def budget(self, name: str, share: float = 1.) -> GeneratorBudget:
+        """
+            budget of a generator, share of the time left until the deadline
+        """
+        now = time.perf_counter()
+        return GeneratorBudget(self, name, now + max(0., self._end - now) * share)
+
+    def add_overrun(self, name: str, elapsed: float, budget: float):
+        self._overruns[name] = self._overruns.get(name, 0) + 1
+        log.sw_log().action().add_text('{} overran its budget: {:.2f} > {:.2f} ms', name, elapsed * 1000, budget * 1000)
+        log.os_log().debug('%s overran its budget: %.2f > %.2f ms', name, elapsed * 1000, budget * 1000)
+
+    def overruns(self) -> dict[str, int]:
+        return self._overruns
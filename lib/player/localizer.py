@@ -1,11 +1,10 @@
 from typing import Union
 from pyrusgeom.angle_deg import AngleDeg
-from pyrusgeom.math_values import DEG2RAD
+from pyrusgeom.math_values import DEG2RAD, EPSILON
 from pyrusgeom.vector_2d import Vector2D
-from pyrusgeom.sector_2d import Sector2D
 
 from lib.debug.debug import log
-from lib.player.object_table import ObjectTable, DataEntry
+from lib.player.object_table import ObjectTable
 from lib.rcsc.types import UNUM_UNKNOWN, LineID, MarkerID, SideID
 from lib.rcsc.server_param import ServerParam
 from lib.player.sensor.visual_sensor import SeeParser
@@ -14,10 +13,43 @@ from lib.debug.color import Color
 from lib.rcsc.types import ViewWidth
 from pyrusgeom.soccer_math import min_max
 import math
+import numpy as np
+
+_rng = np.random.default_rng()
+
+
+def seed(value: int):
+    # the localizer is the only random part of the player, replays seed it to get the same decisions again
+    global _rng
+    _rng = np.random.default_rng(value)
+
+
+def sector_contains(points: np.ndarray, center: Vector2D, min_r: float, max_r: float, start: float, end: float):
+    """
+        Sector2D(center, min_r, max_r, start, end).contains for every row of points, returns a bool mask.
+        radius bounds and the clockwise [start, end] test are the same as pyrusgeom's.
+    """
+    rel_x = points[:, 0] - center.x()
+    rel_y = points[:, 1] - center.y()
+    delta = rel_x * rel_x + rel_y * rel_y
+    min_r, max_r = min(0.0, min_r), max(min_r, max_r)
+    inside = (min_r * min_r <= delta) & (delta <= max_r * max_r)
+
+    th = np.degrees(np.arctan2(rel_y, rel_x))
+    th[(np.abs(rel_x) < EPSILON) & (np.abs(rel_y) < EPSILON)] = 0.0
+    start = AngleDeg(start).degree()
+    end = AngleDeg(end).degree()
+
+    def left_equal(left, right):
+        diff = right - left
+        return ((0.0 <= diff) & (diff < 180.0)) | (diff < -180.0)
+
+    if left_equal(start, end):
+        return inside & left_equal(start, th) & left_equal(th, end)
+    return inside & (left_equal(th, end) | left_equal(start, th))
 
 
 class Localizer:
-    DEBUG = True
     class PlayerT:
         def __init__(self) -> None:
             self.side_: SideID = SideID.NEUTRAL
@@ -63,9 +95,9 @@ class Localizer:
             return f'PlayerT side:{self.side_} unum:{self.unum_} pos:{self.pos_}'
     
     def __init__(self) -> None:
-        self._object_table = ObjectTable()
+        self._object_table = ObjectTable.i()
         self._landmark_map: dict[MarkerID, Vector2D] = {}
-        self._points: list[Vector2D] = []
+        self._points: np.ndarray = np.empty((0, 2))  # particles, one (x, y) row each
 
     def get_face_dir_by_markers(self, markers: list[SeeParser.MarkerT], view_width: ViewWidth):
         # TODO This function can be improved by using more than two markers to reduce face error
@@ -117,15 +149,15 @@ class Localizer:
         if face is None:
             face = self.get_face_dir_by_markers(see.markers(), view_width)
         
-        if Localizer.DEBUG:
-            log.sw_log().world().add_text( f"(estimate self face) face={face}")
+        if log.sw_log().world().enabled:
+            log.sw_log().world().add_text( '(estimate self face) face={}', face)
 
         face_error = 0.5
         return face, face_error
 
     def localize_self_simple(self, see:SeeParser, self_face:float):
-        if Localizer.DEBUG:
-            log.sw_log().world().add_text( f"(localize self) started {'#'*20}")
+        if log.sw_log().world().enabled:
+            log.sw_log().world().add_text( '(localize self) started ####################')
             
 
         markers = see.markers() + see.behind_markers()
@@ -143,16 +175,16 @@ class Localizer:
                 continue
             marker_pos = self._object_table.landmark_map[marker.id_]
 
-            if Localizer.DEBUG:
-                log.sw_log().world().add_text( f"(localize self) considered-marker[{marker.id_}]={marker_pos}")
+            if log.sw_log().world().enabled:
+                log.sw_log().world().add_text( '(localize self) considered-marker[{}]={}', marker.id_, marker_pos)
                 log.sw_log().world().add_circle( center=marker_pos, r=0.25, fill=True, color=Color(string="black"))
 
             
             global_dir = marker.dir_ + self_face
             estimated_pos = marker_pos - Vector2D(r=marker.dist_, a=global_dir)
             
-            if Localizer.DEBUG:
-                log.sw_log().world().add_text( f"(localize self) estimated-pos={estimated_pos}")
+            if log.sw_log().world().enabled:
+                log.sw_log().world().add_text( '(localize self) estimated-pos={}', estimated_pos)
                 log.sw_log().world().add_circle( center=estimated_pos, r=0.25, fill=True, color=Color(string="red"))
             
             pos += estimated_pos
@@ -162,8 +194,8 @@ class Localizer:
             return None
         pos /= n_consider
 
-        if Localizer.DEBUG:
-            log.sw_log().world().add_text( f"(localize self) pos={pos}")
+        if log.sw_log().world().enabled:
+            log.sw_log().world().add_text( '(localize self) pos={}', pos)
             log.sw_log().world().add_circle( center=pos, r=0.25, fill=True, color=Color(string="blue"))
         
         return pos
@@ -171,11 +203,18 @@ class Localizer:
     def get_dir_range(self, seen_dir, self_face, self_face_error):
         return seen_dir + self_face, 0.5 + self_face_error
 
-    def generate_points(self, view_width: ViewWidth, marker, marker_id: MarkerID, self_face: float, self_face_error: float):
+    def marker_dist_ranges(self, view_width: ViewWidth, markers) -> list[tuple[float, float]]:
+        averages, errors = self._object_table.get_landmark_distance_ranges(view_width, [m.dist_ for m in markers])
+        return list(zip(averages.tolist(), errors.tolist()))
+
+    def generate_points(self, view_width: ViewWidth, marker, marker_id: MarkerID, self_face: float, self_face_error: float,
+                        dist_range: tuple[float, float] = None):
         marker_pos = self._object_table.landmark_map.get(marker_id)
         if marker_pos is None:
             return
-        ave_dist, dist_err = self._object_table.get_landmark_distance_range(view_width, marker.dist_)
+        if dist_range is None:
+            dist_range = self._object_table.get_landmark_distance_range(view_width, marker.dist_)
+        ave_dist, dist_err = dist_range
         ave_dir, dir_err = self.get_dir_range(marker.dir_, self_face, self_face_error)
         ave_dir += 180.0
         min_dist = ave_dist - dist_err
@@ -188,80 +227,75 @@ class Localizer:
         circum_inc = max(0.01, circum / 32.0)
         dir_loop = int(min_max(2, int(math.ceil(circum / circum_inc)), 32))
         dir_inc = dir_range / (dir_loop - 1)
-        base_angle = AngleDeg(ave_dir - dir_err)
-        for i_dir in range(dir_loop):
-            base_angle += dir_inc
-            base_vec = Vector2D.polar2vector(1.0, base_angle)
-            add_dist = 0.0
-            for i_dist in range(dir_loop):
-                add_dist += dist_inc
-                self._points.append(marker_pos + (base_vec * (min_dist + add_dist)))
+
+        # dir_loop x dir_loop grid, one row per direction, same order as the scalar loops it replaces
+        steps = np.arange(1, dir_loop + 1)
+        angles = np.radians(ave_dir - dir_err + dir_inc * steps)
+        dists = min_dist + dist_inc * steps
+        points = np.empty((dir_loop, dir_loop, 2))
+        points[:, :, 0] = marker_pos.x() + np.cos(angles)[:, None] * dists
+        points[:, :, 1] = marker_pos.y() + np.sin(angles)[:, None] * dists
+        self._points = np.concatenate((self._points, points.reshape(-1, 2)))
 
     def update_points_by_markers(self, view_width: ViewWidth, markers, self_face: float, self_face_error: float):
+        dist_ranges = self.marker_dist_ranges(view_width, markers)
         counter = 0
         for i in range(1, len(markers)):
             if counter >= 30:
                 break
-            self.update_points_by(view_width, markers[i], markers[i].id_, self_face, self_face_error)
-            self.resample_points(view_width, markers[0], markers[0].id_, self_face, self_face_error)
+            self.update_points_by(view_width, markers[i], markers[i].id_, self_face, self_face_error, dist_ranges[i])
+            self.resample_points(view_width, markers[0], markers[0].id_, self_face, self_face_error, dist_ranges[0])
 
-    def update_points_by(self, view_width: ViewWidth, marker, marker_id, self_face: float, self_face_error: float):
+    def update_points_by(self, view_width: ViewWidth, marker, marker_id, self_face: float, self_face_error: float,
+                         dist_range: tuple[float, float] = None):
         marker_pos = self._object_table.landmark_map.get(marker_id)
-        ave_dist, dist_error = self._object_table.get_landmark_distance_range(view_width, marker.dist_)
+        if dist_range is None:
+            dist_range = self._object_table.get_landmark_distance_range(view_width, marker.dist_)
+        ave_dist, dist_error = dist_range
 
         ave_dir, dir_error = self.get_dir_range(marker.dir_, self_face, self_face_error)
         ave_dir += 180.0
 
-        sector = Sector2D(marker_pos, ave_dist - dist_error, ave_dist + dist_error, AngleDeg(ave_dir - dir_error), AngleDeg(ave_dir + dir_error))
-        self._points = list(filter(lambda p: sector.contains(p), self._points))
+        if len(self._points) == 0:
+            return
+        inside = sector_contains(self._points, marker_pos, ave_dist - dist_error, ave_dist + dist_error,
+                                 ave_dir - dir_error, ave_dir + dir_error)
+        self._points = self._points[inside]
 
-    def resample_points(self, view_width: ViewWidth, marker, marker_id, self_face: float, self_face_error: float):
+    def resample_points(self, view_width: ViewWidth, marker, marker_id, self_face: float, self_face_error: float,
+                        dist_range: tuple[float, float] = None):
         if len(self._points) >= 50:
             return
         if len(self._points) == 0:
-            self.generate_points(view_width, marker, marker_id, self_face, self_face_error)
+            self.generate_points(view_width, marker, marker_id, self_face, self_face_error, dist_range)
             return
-        import random
         point_size = len(self._points)
-        for i in range(len(self._points), 51):
-            choose_index = random.randint(0, point_size - 1)
-            self._points.append(self._points[choose_index] + Vector2D(random.uniform(-0.01, 0.01), random.uniform(-0.01, 0.01)))
+        choose_index = _rng.integers(0, point_size, 51 - point_size)
+        noise = _rng.uniform(-0.01, 0.01, (51 - point_size, 2))
+        self._points = np.concatenate((self._points, self._points[choose_index] + noise))
+
+    def clear_points(self):
+        self._points = np.empty((0, 2))
 
     def average_points(self) -> tuple[Union[None, Vector2D], Vector2D]:
-        ave_pos = Vector2D(0.0, 0.0)
-        ave_err = Vector2D(0.0, 0.0)
         if len(self._points) == 0:
             return None, Vector2D(0, 0)
-        max_x = self._points[0].x()
-        min_x = max_x
-        max_y = self._points[0].y()
-        min_y = max_y
-        for p in self._points:
-            ave_pos += p
-            if p.x() > max_x:
-                max_x = p.x()
-            elif p.x() < min_x:
-                min_x = p.x()
-            if p.y() > max_y:
-                max_y = p.y()
-            elif p.y() < min_y:
-                min_y = p.y()
-        ave_pos = ave_pos / float(len(self._points))
-        ave_err.set_x((max_x - min_x) / 2.0)
-        ave_err.set_y((max_y - min_y) / 2.0)
-        return ave_pos, ave_err
+        ave_x, ave_y = self._points.mean(axis=0)
+        err_x, err_y = (self._points.max(axis=0) - self._points.min(axis=0)) / 2.0
+        return Vector2D(float(ave_x), float(ave_y)), Vector2D(float(err_x), float(err_y))
 
     def get_nearest_marker(self, object_type: SeeParser.ObjectType, pos: Vector2D):
         if object_type == SeeParser.ObjectType.Obj_Goal_Behind:
             return MarkerID.Goal_L if pos.x() < 0.0 else MarkerID.Goal_R
         min_dist2 = 3.0 * 3.0
-        candidate = MarkerID.Marker_Unknown
-        for m, p in self._object_table.landmark_map.items():
-            d2 = pos.dist(p)
-            if d2 < min_dist2:
-                min_dist2 = d2
-                candidate = m
-        return candidate
+        positions = self._object_table.landmark_positions
+        dx = positions[:, 0] - pos.x()
+        dy = positions[:, 1] - pos.y()
+        dist = np.sqrt(dx * dx + dy * dy)
+        nearest = int(np.argmin(dist))
+        if dist[nearest] < min_dist2:
+            return self._object_table.landmark_ids[nearest]
+        return MarkerID.Marker_Unknown
 
     def update_points_by_behind_marker(self, view_width, markers, behind_markers, self_pos, self_face, self_face_error):
         if len(behind_markers) == 0:
@@ -277,12 +311,13 @@ class Localizer:
         if len(self._points) == 0:
             return
 
+        dist_ranges = self.marker_dist_ranges(view_width, markers)
         counter = 0
         for i in range(1, len(markers)):
             if counter >= 20:
                 break
-            self.update_points_by(view_width, markers[i], markers[i].id_, self_face, self_face_error)
-            self.resample_points(view_width, markers[0], markers[0].id_, self_face, self_face_error)
+            self.update_points_by(view_width, markers[i], markers[i].id_, self_face, self_face_error, dist_ranges[i])
+            self.resample_points(view_width, markers[0], markers[0].id_, self_face, self_face_error, dist_ranges[0])
 
     def localize_self(self, see: SeeParser, view_width: ViewWidth, self_face: float, self_face_error: float):
         markers = see.markers()
@@ -293,7 +328,7 @@ class Localizer:
 
         if len(markers) == 0:
             return None, Vector2D(0, 0), [None]
-        self._points.clear()
+        self.clear_points()
         self.generate_points(view_width, markers[0], markers[0].id_, self_face, self_face_error)
         if len(self._points) == 0:
             return None, Vector2D(0, 0), [None]
@@ -318,8 +353,8 @@ class Localizer:
         rvel = Vector2D().invalid()
         rvel_err = Vector2D(0, 0)
         self_face = float(self_face)
-        if Localizer.DEBUG:
-            log.sw_log().world().add_text( f"(localize ball relative) started {'#'*20}")
+        if log.sw_log().world().enabled:
+            log.sw_log().world().add_text( '(localize ball relative) started ####################')
 
         if len(see.balls()) == 0:
             return rpos, rpos_err, rvel, rvel_err
@@ -448,11 +483,14 @@ class Localizer:
                         self_face_err: float,
                         self_pos: Vector2D,
                         self_vel: Vector2D,
-                        view_width: ViewWidth
+                        view_width: ViewWidth,
+                        dist_range: tuple[float, float] = None
                         ) -> PlayerT:
         self_face = float(self_face)
 
-        average_dist, dist_error = self._object_table.get_distance_range(view_width, seen_player.dist_)
+        if dist_range is None:
+            dist_range = self._object_table.get_distance_range(view_width, seen_player.dist_)
+        average_dist, dist_error = dist_range
         average_dir, dir_error = self.get_dir_range(seen_player.dir_, self_face, self_face_err)
 
         player = Localizer.PlayerT()
@@ -488,4 +526,19 @@ class Localizer:
 
         return player
     
-            
\ No newline at end of file
+            
+
+    def localize_players(self,
+                         seen_players: list[SeeParser.PlayerT],
+                         self_face: float,
+                         self_face_err: float,
+                         self_pos: Vector2D,
+                         self_vel: Vector2D,
+                         view_width: ViewWidth
+                         ) -> list[PlayerT]:
+        """
+        localize_player of every seen player, the distances are looked up at once
+        """
+        averages, errors = self._object_table.get_distance_ranges(view_width, [p.dist_ for p in seen_players])
+        return [self.localize_player(p, self_face, self_face_err, self_pos, self_vel, view_width, dist_range)
+                for p, dist_range in zip(seen_players, zip(averages.tolist(), errors.tolist()))]
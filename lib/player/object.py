@@ -147,7 +147,7 @@ class Object: # TODO IMPORTANT; Getter functions do not have to return a copy of
         self._seen_rpos = self.pos() - wm.self().pos()
         self._dist_from_self: float = wm.self().pos().dist(self.pos())
         self._angle_from_self: AngleDeg = (wm.self().pos() - self.pos()).th()
-        self._dist_from_ball: float = (wm.ball().pos() - self.pos())
+        self._dist_from_ball: float = (wm.ball().pos() - self.pos()).r()
         self._angle_from_ball: AngleDeg = (wm.ball().pos() - self.pos()).th()
 
     def _update_rpos(self, wm):
@@ -16,8 +16,6 @@ if TYPE_CHECKING:
 
 
 class BallObject(Object):
-    DEBUG = True
-
     def __init__(self, string=None):
         super().__init__()
         self._pos_count_thr: Union[None, int] = 10
@@ -31,7 +29,9 @@ class BallObject(Object):
         self.init_str(string)
 
     def init_str(self, string: str):
-        data = string.split(" ")
+        self.init_values([float(v) for v in string.split(" ")])
+
+    def init_values(self, data: list[float]):
         self._pos = Vector2D(float(data[0]), float(data[1]))
         self._seen_pos = Vector2D(float(data[0]), float(data[1]))
         self._vel = Vector2D(float(data[2]), float(data[3]))
@@ -86,8 +86,8 @@ class BallObject(Object):
             new_vel = self.vel()
             if act.last_body_command() == CommandType.KICK:
                 accel = act.get_kick_info()
-                log.sw_log().world().add_text(f"ESTIMATING BALL VEL WITH KICK ACTION")
-                log.sw_log().world().add_text(f"accel={accel}, ball accel max={SP.ball_accel_max()}")
+                log.sw_log().world().add_text('ESTIMATING BALL VEL WITH KICK ACTION')
+                log.sw_log().world().add_text('accel={}, ball accel max={}', accel, SP.ball_accel_max())
                 if accel.r() > SP.ball_accel_max():
                     accel.set_length(SP.ball_accel_max())
                 new_vel += accel
@@ -236,9 +236,9 @@ class BallObject(Object):
                        heard_pos: Vector2D,
                        heard_vel: Vector2D,
                        is_pass: bool = False):
-        if BallObject.DEBUG:
-            log.sw_log().sensor().add_text( f"(update ball by hear) prior_pos={self.pos()} new_pos={heard_pos}")
-            log.sw_log().sensor().add_text( f"(update ball by hear) prior_vel={self.vel()} new_pos={heard_vel}")
+        if log.sw_log().sensor().enabled:
+            log.sw_log().sensor().add_text( '(update ball by hear) prior_pos={} new_pos={}', self.pos(), heard_pos)
+            log.sw_log().sensor().add_text( '(update ball by hear) prior_vel={} new_pos={}', self.vel(), heard_vel)
 
         self._heard_pos =heard_pos.copy()
         self._heard_vel = heard_vel.copy()
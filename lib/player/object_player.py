@@ -1,8 +1,11 @@
+import numpy as np
+
 from lib.debug.level import Level
 from lib.player.localizer import Localizer
 from lib.rcsc.game_time import GameTime
 from lib.rcsc.player_type import PlayerType
 from lib.player.object_ball import *
+from lib.player.player_store import COUNT_INDEX, PlayerStore, StoreAngle, StoreCount, StoreField, StoreVector
 from lib.player.stamina_model import StaminaModel
 from lib.rcsc.player_type import PlayerType
 from lib.rcsc.server_param import ServerParam as SP
@@ -15,18 +18,41 @@ if TYPE_CHECKING:
 
 
 class PlayerObject(Object):
-    DEBUG = True
-    
+    # the state updated every cycle is kept in the process PlayerStore, the object is a view over its slot
+    _pos = StoreVector('pos')
+    _vel = StoreVector('vel')
+    _pos_count = StoreCount('pos_count')
+    _seen_pos_count = StoreCount('seen_pos_count')
+    _heard_pos_count = StoreCount('heard_pos_count')
+    _vel_count = StoreCount('vel_count')
+    _seen_vel_count = StoreCount('seen_vel_count')
+    _ghost_count = StoreCount('ghost_count')
+    _unum_count = StoreCount('unum_count')
+    _body_count = StoreCount('body_count')
+    _face_count = StoreCount('face_count')
+    _pointto_count = StoreCount('pointto_count')
+    _tackle_count = StoreCount('tackle_count')
+    _dist_from_self = StoreField('dist_from_self')
+    _angle_from_self = StoreAngle('angle_from_self')
+    _dist_from_ball = StoreField('dist_from_ball')
+    _angle_from_ball = StoreAngle('angle_from_ball')
+    _goalie = StoreField('goalie')
+    _tackle = StoreField('tackle')
+
     def __init__(self, side: SideID = None, player: Localizer.PlayerT = None):
+        self._store = PlayerStore.i()
+        self._slot = self._store.allocate()
         super().__init__()
         self._unum: int = UNUM_UNKNOWN
         self._unum_count: int = 1000
         self._side: SideID = SideID.NEUTRAL
         self._goalie: bool = False
-        self._player_type: PlayerType = PlayerType()
+        self._player_type: PlayerType = PlayerType.default()
+        self._store.kickable_area[self._slot] = self._player_type.kickable_area()
         self._player_type_id: Union[None, int] = None
         self._body: AngleDeg = AngleDeg(0)
         self._body_count: int = 1000
+        self._neck: AngleDeg = AngleDeg(0)
         self._face: AngleDeg = AngleDeg(0)
         self._face_count: int = 1000
         self._pointto_angle: float = 0
@@ -55,34 +81,40 @@ class PlayerObject(Object):
         self._relation_pos_count_thr: Union[None, int] = 30
         self._vel_count_thr: Union[None, int] = 5
         self._body_count_thr: Union[None, int] = 2
+        self._store.counts[self._slot, COUNT_INDEX['vel_count_thr']] = self._vel_count_thr
+
+    def __del__(self):
+        self._store.release(self._slot)
 
     # update with server data
-    def init_dic(self, dic: dict):
-        self._unum = int(dic["unum"])
-        self._pos = Vector2D(float(dic["pos_x"]), float(dic["pos_y"]))
-        self._vel = Vector2D(float(dic["vel_x"]), float(dic["vel_y"]))
-        self._side = SideID.RIGHT if dic["side_id"] == 'r' else SideID.LEFT if dic["side_id"] == 'l' else SideID.NEUTRAL
-        self._body = AngleDeg(float(dic["body"]))
-        self._neck = AngleDeg(float(dic["neck"]))
+    def init_record(self, row: tuple):
+        """
+        a FullStateWorldMessageParser.players() row as a tuple, the position, velocity and their counts are
+        written for all the players at once by PlayerStore.update_by_full_state
+        """
+        (side, unum, goalie, player_type, _, _, _, _, body, neck, pointto_dist, pointto_dir, focus_dist, focus_dir,
+         stamina, effort, recovery, capacity, kick, tackle, charged, card) = row
+        self._unum = unum
+        self._side = SideID.RIGHT if side == 'r' else SideID.LEFT if side == 'l' else SideID.NEUTRAL
+        self._body = AngleDeg(body)
+        self._neck = AngleDeg(neck)
         self._face = self._body + self._neck
-        self._goalie = True if "goalie" in dic else False
-        self._player_type_id = int(dic["player_type"])
+        self._goalie = goalie
+        self._player_type_id = player_type
         # self._pointto = Vector2D.invalid() TODO check this on full state
-        # if "pointto_dist" in dic:
-        #     self._pointto = Vector2D.polar2vector(float(dic["pointto_dist"]), float(dic["pointto_dir"]))
-        self._stamina_model = StaminaModel(**dic["stamina"])
-        self._kick = True if "kick" in dic else False
-        self._tackle = True if "tackle" in dic else False
-        self._charged = True if "charged" in dic else False
-        self._card = Card.NO_CARD
-        if "card" in dic:
-            self._card = Card.YELLOW if dic["card"] == "y" else Card.RED
+        self._stamina_model = StaminaModel(stamina, effort, recovery, capacity)
+        self._kick = kick
+        self._tackle = tackle
+        self._charged = charged
+        self._card = Card.YELLOW if card == 'y' else Card.RED if card == 'r' else Card.NO_CARD
         self._kick_rate: float = 0.0
         self._rpos_count = 0
-        self._vel_count = 0
-        self._pos_count = 0
-        self._body_count = 0
-        self._ghost_count = 0
+
+    def reverse(self):
+        # the vectors of the store are copies, reversed ones are assigned back
+        self._pos = self._pos.reverse()
+        self._vel = self._vel.reverse()
+        self.reverse_more()
 
     def reverse_more(self):
         self._body.reverse()
@@ -91,6 +123,7 @@ class PlayerObject(Object):
     def set_player_type(self, player_type: PlayerType):
         self._player_type = player_type
         self._player_type_id = player_type.id()
+        self._store.kickable_area[self._slot] = player_type.kickable_area()
 
     def side(self):
         return self._side
@@ -200,23 +233,10 @@ class PlayerObject(Object):
         return self._body_count < self._body_count_thr
 
     def update_by_last_cycle(self):
-        self._pos_history = [self._pos] + self._pos_history
-        if len(self._pos_history) > 100:
-            self._pos_history = self._pos_history[:-1]
-        
-        if self.vel_valid():
-            self._pos += self.vel()
-        
-        self._unum_count = min(1000, self._unum_count + 1)
-        self._pos_count = min(1000, self._pos_count + 1)
-        self._seen_pos_count = min(1000, self._seen_pos_count + 1)
-        self._heard_pos_count = min(1000, self._heard_pos_count + 1)
-        self._vel_count = min(1000, self._vel_count + 1)
-        self._body_count = min(1000, self._body_count + 1)
-        self._face_count = min(1000, self._face_count + 1)
-        self._pointto_count = min(1000, self._pointto_count + 1)
-        # self._kicking = min(1000, self._kicking + 1)
-        self._tackle_count = min(1000, self._tackle_count + 1)
+        self._store.update_by_last_cycle(np.array([self._slot]))
+
+    def pos_history(self) -> list[Vector2D]:
+        return [Vector2D(x, y) for x, y in self._store.pos_history(self._slot).tolist()]
     
     def forgot(self):
         self._pos_count = 1000
@@ -323,8 +343,8 @@ class PlayerObject(Object):
                        pos: Vector2D,
                        body: float):
         
-        if PlayerObject.DEBUG:
-            log.sw_log().sensor().add_text( f"(update player by hear) unum={unum} prior_pos={self.pos()} new_pos={pos}")
+        if log.sw_log().sensor().enabled:
+            log.sw_log().sensor().add_text( '(update player by hear) unum={} prior_pos={} new_pos={}', unum, self.pos(), pos)
         
         self._heard_pos = pos.copy()
         self._heard_pos_count = 0
@@ -17,7 +17,9 @@ from lib.rcsc.types import SideID, ViewWidth
 
 class SelfObject(PlayerObject):
     FACE_COUNT_THR = 5
-    DEBUG = True
+    # the sensors update the own position and velocity in place, they are plain attributes, not PlayerStore views
+    _pos = None
+    _vel = None
     
     def __init__(self, player: PlayerObject = None):
         super().__init__()
@@ -384,9 +386,9 @@ class SelfObject(PlayerObject):
         SP = ServerParam.i()
         ptype = self.player_type()
         
-        if SelfObject.DEBUG:
-            log.os_log().debug(f"(self obj update ball_info) player_type_id={ptype.id()}")
-            log.os_log().debug(f"(self obj update ball_info) kickable_area={ptype.kickable_area()}")
+        if log.os_debug():
+            log.os_log().debug('(self obj update ball_info) player_type_id=%s', ptype.id())
+            log.os_log().debug('(self obj update ball_info) kickable_area=%s', ptype.kickable_area())
 
         if ball.dist_from_self() <= ptype.kickable_area():
             buff = 0.1
@@ -3,11 +3,15 @@ import logging
 import time
 from lib.action.kick_table import KickTable
 from base.decision import get_decision
+from lib.debug.agent_telemetry import AgentTelemetry
+from lib.debug.cycle_profile import CycleProfile
 from lib.debug.debug import log
 from lib.debug.level import Level
+from lib.debug.startup_profile import profile
 from lib.debug.color import Color
 from pyrusgeom.angle_deg import AngleDeg
 from lib.player.action_effector import ActionEffector
+from lib.player.decision_deadline import DecisionDeadline
 from lib.player.sensor.body_sensor import SenseBodyParser
 from lib.player.sensor.see_state import SeeState
 from lib.player.sensor.visual_sensor import SeeParser
@@ -25,13 +29,9 @@ from lib.rcsc.server_param import ServerParam
 from lib.rcsc.types import UNUM_UNKNOWN, GameModeType, SideID, ViewWidth
 from lib.messenger.messenger import Messenger
 import team_config
-from lib.debug.timer import ProfileTimer as pt
 from lib.parser.parser_message_fullstate_world import FullStateWorldMessageParser
 
 
-DEBUG = True
-
-
 def get_time_msec():
     return int(time.time() * 1000)
 
@@ -55,6 +55,8 @@ class PlayerAgent(SoccerAgent):
         self._server_cycle_stopped: bool = True
 
         self._sense_receive_time_stamp: Union[int, None] = None
+        self._sense_receive_time: GameTime = GameTime(-1, 0)
+        self._sense_receive_perf_time: float = 0.  # time.perf_counter() at the arrival of the sense_body message
 
         self._neck_action: Union[NeckAction, None] = None
         self._view_action: Union[ViewAction, None] = None
@@ -66,6 +68,14 @@ class PlayerAgent(SoccerAgent):
         self._is_synch_mode = True
         self._effector = ActionEffector(self)
         self._communication = None
+        self._decision_deadline = DecisionDeadline()
+        self._cycle_profile: Union[CycleProfile, None] = None
+        if team_config.CYCLE_PROFILE_DIR:
+            self._cycle_profile = CycleProfile.create(team_config.CYCLE_PROFILE_DIR)
+            self.profile_cycles(self._cycle_profile)
+        self._telemetry: Union[AgentTelemetry, None] = None
+        if team_config.TELEMETRY_DIR:
+            self._telemetry = AgentTelemetry.create(team_config.TELEMETRY_DIR)
 
     def send_init_command(self):
         # TODO check reconnection
@@ -88,19 +98,27 @@ class PlayerAgent(SoccerAgent):
 
     def parse_sense_body_message(self, message: str):
         self._sense_receive_time_stamp = get_time_msec()
+        self._sense_receive_perf_time = time.perf_counter()
         self.update_current_time(PlayerAgent.parse_cycle_info(message), True)
+        self._sense_receive_time = self._current_time.copy()
+        if self._telemetry is not None:
+            self._telemetry.sense_body(self._current_time.cycle(), self._current_time.stopped_cycle())
         self._sense_body_parser.parse(message, self._current_time)
         self._see_state.update_by_sense_body(self._current_time,
                                              self._sense_body_parser.view_width())
-        if DEBUG:
-            log.os_log().debug(f'##################{self._current_time}#################')
-            log.sw_log().sensor().add_text('===Received Sense Message===\n' + message)
-            log.os_log().debug('===Received Sense Message===\n' + message)
-            log.sw_log().sensor().add_text(str(self._sense_body_parser))
-            log.os_log().debug(str(self._sense_body_parser))
+        log.os_log().debug('##################%s#################', self._current_time)
+        log.sw_log().sensor().add_text('===Received Sense Message===\n{}', message)
+        log.os_log().debug('===Received Sense Message===\n%s', message)
+        log.sw_log().sensor().add_text('{}', self._sense_body_parser)
+        log.os_log().debug('%s', self._sense_body_parser)
 
     def parse_see_message(self, message: str):
         self.update_current_time(PlayerAgent.parse_cycle_info(message), False)
+        if self._telemetry is not None:
+            self._telemetry.see(self._current_time.cycle(), self._current_time.stopped_cycle())
+        if self.oracle_mode():
+            self._see_state.update_by_see(self._current_time, self.full_world().self().view_width())
+            return
         # log.debug_client().add_message(f'rec see in {self.world().time().cycle()}\n')
         self._see_parser.parse(message,
                                self._team_name,
@@ -108,17 +126,17 @@ class PlayerAgent(SoccerAgent):
         self._see_state.update_by_see(self._current_time,
                                       self.real_world().self().view_width())
 
-        if DEBUG:
-            log.sw_log().sensor().add_text('===Received See Message Sensor===\n' + message)
-            log.os_log().debug(f'{"=" * 30}See Message Sensor{"=" * 30}\n' + message)
-            log.sw_log().sensor().add_text('===Received See Message Visual Sensor===\n' + str(self._see_parser))
-            log.os_log().debug(f'{"=" * 30}Visual Sensor{"=" * 30}\n' + str(self._see_parser))
+        log.sw_log().sensor().add_text('===Received See Message Sensor===\n{}', message)
+        log.os_log().debug('==============================See Message Sensor==============================\n%s', message)
+        log.sw_log().sensor().add_text('===Received See Message Visual Sensor===\n{}', self._see_parser)
+        log.os_log().debug('==============================Visual Sensor==============================\n%s', self._see_parser)
 
     def parse_full_state_message(self, message: str):
         self.update_current_time(PlayerAgent.parse_cycle_info(message), False)
         self._full_state_parser.parse(message)
-        log.os_log().debug('===Received Full State Message Sensor===\n' + message)
-        log.os_log().debug(f'{"=" * 30}Full State Message Sensor{"=" * 30}\n' + str(self._full_state_parser.dic()))
+        log.os_log().debug('===Received Full State Message Sensor===\n%s', message)
+        log.os_log().debug('==============================Full State Message Sensor==============================\n%s\n%s',
+                           self._full_state_parser.dic(), self._full_state_parser.players())
 
     def hear_parser(self, message: str):
         self.update_current_time(PlayerAgent.parse_cycle_info(message), False)
@@ -134,8 +152,8 @@ class PlayerAgent(SoccerAgent):
             self.hear_referee_parser(message)
 
     def hear_player_parser(self, message: str):
-        log.debug_client().add_message(f'rcv msg:#{message}#')
-        log.sw_log().communication().add_text(f'rcv msg:#{message}#')
+        log.debug_client().add_message('rcv msg:#{}#', message)
+        log.sw_log().communication().add_text('rcv msg:#{}#', message)
         if message.find('"') == -1:
             log.sw_log().communication().add_text("parser error A")
             return
@@ -152,7 +170,7 @@ class PlayerAgent(SoccerAgent):
             log.sw_log().communication().add_text("parser error D")
             return
         sender = int(data[4])
-        log.sw_log().communication().add_text(f'sender is {sender}')
+        log.sw_log().communication().add_text('sender is {}', sender)
         Messenger.decode_all(self.real_world()._messenger_memory,
                              player_message,
                              sender,
@@ -200,7 +218,9 @@ class PlayerAgent(SoccerAgent):
                     log.sw_log().any().add_text(f"Cycle: {self._current_time.cycle()}-"
                                                 f"{self._current_time.stopped_cycle()} " + '-' * 20)
                     if self._last_decision_time != old_time and old_time.stopped_cycle() != 0:
-                        log.sw_log().system().add_text(f"(update current time) missed last action(1)")
+                        log.sw_log().system().add_text('(update current time) missed last action(1)')
+                        if self._telemetry is not None:
+                            self._telemetry.missed_cycles(1)
             else:
                 self._current_time.assign(new_time, 0)
                 if new_time - 1 != old_time.cycle():
@@ -217,7 +237,11 @@ class PlayerAgent(SoccerAgent):
 
                 if (self._last_decision_time.stopped_cycle() == 0
                         and self._last_decision_time.cycle() != new_time - 1):
-                    log.sw_log().system().add_text(f"(update current time) missed last action(2)")
+                    log.sw_log().system().add_text('(update current time) missed last action(2)')
+                    if self._telemetry is not None:
+                        # the cycles before old_time are counted already
+                        self._telemetry.missed_cycles(
+                            new_time - max(self._last_decision_time.cycle() + 1, old_time.cycle()))
 
     def think_received(self):
         return self._think_received
@@ -258,6 +282,58 @@ class PlayerAgent(SoccerAgent):
             return True
         return False
 
+    def decision_delay_msec(self, waited_msec: int = 0) -> Union[int, None]:
+        """
+        timer based version of is_decision_time for the event driven runtime.
+        returns None if no non-synch decision is pending in this cycle, otherwise the msec left until the
+        decision deadline (0 means decide now).
+        waited_msec is the time since the last received message.
+        """
+        SP = ServerParam.i()
+
+        if SP.synch_mode() or self._sense_receive_time_stamp is None:
+            return None
+
+        if self._last_decision_time == self._current_time:
+            return None
+
+        if self.world().self().unum() == UNUM_UNKNOWN:
+            return None
+
+        if self.world().see_time() == self._current_time:
+            return 0
+
+        wait_thr: int = team_config.WAIT_TIME_THR_SYNCH_VIEW
+
+        min_delay = 0
+        if self._last_decision_time == self.world().sense_body_time():
+            min_delay = max(0, int(2 * team_config.SOCKET_INTERVAL * 1000) - waited_msec)
+
+        if SP.synch_see_offset() > wait_thr:
+            return min_delay
+
+        if self._see_state.cycles_till_next_see() > 0:
+            return min_delay
+
+        msec_from_sense = get_time_msec() - self._sense_receive_time_stamp
+        return max(min_delay, int(wait_thr * SP.slow_down_factor()) - msec_from_sense)
+
+    def handle_message(self, message: str):
+        self.parse_message(message)
+        if ServerParam.i().synch_mode():
+            if self.think_received():
+                self.action()
+                self.debug_players()
+                self._think_received = False
+        elif self.decision_delay_msec() == 0:
+            self.action()
+        self.flush_logs()
+
+    def handle_decision_timer(self, waited_msec: int = 0):
+        if self.decision_delay_msec(waited_msec) == 0:
+            self.action()
+            self.flush_logs()
+
     def do_neck_action(self):
         log.debug_client().add_message('NECK/')
         if self._neck_action:
@@ -304,6 +380,13 @@ class PlayerAgent(SoccerAgent):
     def handle_exit(self):
         if self._client.is_server_alive():
             self.send_bye_command()
+        if self._decision_deadline.overruns():
+            log.os_log().info("player( %s ): generator budget overruns %s",
+                              self._real_world.self_unum(), self._decision_deadline.overruns())
+        if self._cycle_profile is not None:
+            self._cycle_profile.close()
+        if self._telemetry is not None:
+            self._telemetry.close()
         log.os_log().info(f"player( {self._real_world.self_unum()} ): finished")  # TODO : Not working
 
     def see_state(self):
@@ -336,8 +419,6 @@ class PlayerAgent(SoccerAgent):
                 if self.is_decision_time(timeout_count, waited_msec) or (self._last_decision_time != self._current_time and self.world().see_time() == self._current_time):
                     self.action()
             self.flush_logs()
-            if len(message) > 0:
-                log.os_log().debug(pt.get())
         self.send_bye_command()
 
     def debug_players(self):
@@ -368,6 +449,8 @@ class PlayerAgent(SoccerAgent):
             self.full_world().set_our_player_type(u, t)
 
     def parse_message(self, message: str):
+        if self._telemetry is not None:
+            self._telemetry.message()
         if message.startswith("(sense_body"):
             self.parse_sense_body_message(message)
         elif message.startswith("(see"):
@@ -510,17 +593,17 @@ class PlayerAgent(SoccerAgent):
 
     if team_config.WORLD_IS_REAL_WORLD:
         def world(self):
-            if team_config.WORLD_IS_FULL_WORLD_IF_EXIST and self.full_world_exists():
+            if (team_config.WORLD_IS_FULL_WORLD_IF_EXIST or team_config.ORACLE_FULL_STATE) and self.full_world_exists():
                 return self._full_world
             return self._real_world
 
         def main_world(self):
-            if team_config.WORLD_IS_FULL_WORLD_IF_EXIST and self.full_world_exists():
+            if (team_config.WORLD_IS_FULL_WORLD_IF_EXIST or team_config.ORACLE_FULL_STATE) and self.full_world_exists():
                 return self._full_world
             return self._real_world
 
         def first_world(self):
-            if team_config.WORLD_IS_FULL_WORLD_IF_EXIST and self.full_world_exists():
+            if (team_config.WORLD_IS_FULL_WORLD_IF_EXIST or team_config.ORACLE_FULL_STATE) and self.full_world_exists():
                 return self._full_world
             return self._real_world
     else:
@@ -558,6 +641,9 @@ class PlayerAgent(SoccerAgent):
     def full_world(self) -> WorldModel:
         return self._full_world
 
+    def decision_deadline(self) -> DecisionDeadline:
+        return self._decision_deadline
+
     def effector(self):
         return self._effector
 
@@ -569,12 +655,17 @@ class PlayerAgent(SoccerAgent):
             return True
         return False
 
+    def oracle_mode(self):
+        """
+        team_config.ORACLE_FULL_STATE with fullstate on: the real world is not updated, see messages are not parsed
+        """
+        return team_config.ORACLE_FULL_STATE and self.full_world_exists()
+
     def debug_after_sense_msg(self):
-        if DEBUG:
-            log.sw_log().world().add_text("===Sense Body Results self===\n" + str(self.world().self()))
-            log.sw_log().world().add_text("===Sense Body Results ball===\n" + str(self.world().ball()))
-            log.os_log().debug("===Sense Body Results self===\n" + str(self.world().self()))
-            log.os_log().debug("===Sense Body Results ball===\n" + str(self.world().ball()))
+        log.sw_log().world().add_text("===Sense Body Results self===\n{}", self.world().self())
+        log.sw_log().world().add_text("===Sense Body Results ball===\n{}", self.world().ball())
+        log.os_log().debug("===Sense Body Results self===\n%s", self.world().self())
+        log.os_log().debug("===Sense Body Results ball===\n%s", self.world().ball())
 
     def update_real_world_before_decision(self):
         self._effector.check_command_count(self._sense_body_parser)
@@ -596,6 +687,9 @@ class PlayerAgent(SoccerAgent):
         self.full_world().update_just_before_decision(self._effector, self._current_time)
 
     def update_before_decision(self):
+        if self.oracle_mode():
+            self.update_full_world_before_decision()
+            return
         self.update_real_world_before_decision()
         if self.full_world_exists():
             self.update_full_world_before_decision()
@@ -604,6 +698,14 @@ class PlayerAgent(SoccerAgent):
         if (self.world().self_unum() is None
                 or self.world().self().unum() != self.world().self_unum()):
             return
+        # the parsing and the world update after the sense_body message use the budget too
+        if self._sense_receive_time == self._current_time:
+            self._decision_deadline.start(self._sense_receive_perf_time)
+        else:
+            self._decision_deadline.start()
+        # before the view action of this decision changes the see state
+        see_timeout = (self._see_state.cycles_till_next_see() == 0
+                       and self._see_state.last_see_time() != self._current_time)
         self.update_before_decision()
         KickTable.instance().create_tables(self.world().self().player_type())  # TODO should be moved!
         self._effector.reset()
@@ -615,22 +717,28 @@ class PlayerAgent(SoccerAgent):
         self.communicate_impl()
 
         self._last_decision_time = self._current_time.copy()
-        log.os_log().debug("body " + str(self.world().self().body()))
-        log.os_log().debug("pos " + str(self.world().self().pos()))
+        log.os_log().debug("body %s", self.world().self().body())
+        log.os_log().debug("pos %s", self.world().self().pos())
 
-        self.real_world().update_just_after_decision(self._effector)
+        if not self.oracle_mode():
+            self.real_world().update_just_after_decision(self._effector)
         if self.full_world_exists():
             self.full_world().update_just_after_decision(self._effector)
-        if DEBUG:
+        if log.os_debug():
             log.os_log().debug("======Self after decision======")
-            log.os_log().debug("turn " + str(self.effector().get_turn_info()))
-            log.os_log().debug("dash " + str(self.effector().get_dash_info()))
-            log.os_log().debug("next body " + str(self.effector().queued_next_self_body()))
-            log.os_log().debug("next pos " + str(self.effector().queued_next_self_pos()))
+            log.os_log().debug("turn %s", self.effector().get_turn_info())
+            log.os_log().debug("dash %s", self.effector().get_dash_info())
+            log.os_log().debug("next body %s", self.effector().queued_next_self_body())
+            log.os_log().debug("next pos %s", self.effector().queued_next_self_pos())
             # log.os_log().debug(str(self.world().self().long_str()))
 
         self._see_state.set_view_mode(self.world().self().view_width())
+        self.send_commands()
+        if self._telemetry is not None:
+            self._telemetry.sent(self._current_time.cycle(), self._current_time.stopped_cycle(), see_timeout,
+                                 sum(self._decision_deadline.overruns().values()))
 
+    def send_commands(self):
         message_command = self._effector.make_say_message_command(self.world())
         if message_command:
             self._last_body_command.append(message_command)
@@ -640,14 +748,45 @@ class PlayerAgent(SoccerAgent):
         if self._is_synch_mode:
             commands.append(PlayerDoneCommand())
         message = self.make_commands(commands)
-        log.debug_client().add_message("\nsent message: " + str(message))
-        if DEBUG:
-            log.os_log().debug("sent message: " + str(message))
+        log.debug_client().add_message('\nsent message: {}', message)
+        log.os_log().debug("sent message: %s", message)
         self._client.send_message(message)
 
         self._last_body_command = []
         self._effector.clear_all_commands()
 
+    def profile_cycles(self, profile: CycleProfile):
+        """
+        the scopes of the agent in the profile, a line per action
+        """
+        for name, scope in (('parse_message', 'parse'),
+                            ('parse_sense_body_message', 'sense_body'),
+                            ('parse_see_message', 'see'),
+                            ('parse_full_state_message', 'fullstate'),
+                            ('hear_parser', 'hear'),
+                            ('update_before_decision', 'world update'),
+                            ('update_real_world_before_decision', 'real world'),
+                            ('update_full_world_before_decision', 'full world'),
+                            ('action_impl', 'decision'),
+                            ('send_commands', 'send')):
+            profile.wrap(self, name, scope)
+        profile.wrap(self, 'action', 'action', self.cycle_profile_fields)
+
+    def cycle_profile_fields(self) -> Union[dict, None]:
+        if self._last_decision_time != self._current_time:
+            return None  # no decision, the scopes go to the next line
+        wm = self.world()
+        return {'cycle': self._current_time.cycle(),
+                'stopped': self._current_time.stopped_cycle(),
+                'game_mode': wm.game_mode().type().value,
+                'kickable': wm.self().is_kickable()}
+
+    def cycle_profile(self) -> Union[CycleProfile, None]:
+        return self._cycle_profile
+
+    def telemetry(self) -> Union[AgentTelemetry, None]:
+        return self._telemetry
+
     def make_commands(self, commands):
         self._effector.update_after_actions()
 
@@ -663,6 +802,10 @@ class PlayerAgent(SoccerAgent):
         # if self.full_world_exists():
         self._full_world.init(self._team_name, side, unum, False)
         log.setup(self._team_name, unum, self._current_time)
+        if self._telemetry is not None:
+            self._telemetry.set_unum(unum)
+        if profile() is not None:
+            profile().connected(f'player {unum}')
 
     def set_view_action(self, view_action: ViewAction):
         self._view_action = view_action
@@ -0,0 +1,120 @@
+import math
+
+import numpy as np
+from pyrusgeom.circle_2d import Circle2D
+from pyrusgeom.rect_2d import Rect2D
+from pyrusgeom.region_2d import Region2D
+from pyrusgeom.vector_2d import Vector2D
+
+from lib.player.player_store import COUNT_INDEX, PlayerStore, player_slots
+
+from typing import TYPE_CHECKING, Union
+if TYPE_CHECKING:
+    from lib.player.object_player import PlayerObject
+
+"""
+    region, nearest and radius queries over the players of a world model, the rows are set by
+    WorldModel.update_player_state_cache and the queries read the PlayerStore slots of the rows.
+    there are 22 players at most, every query is one numpy operation over the rows it is given: the buckets of a
+    grid would not skip any player at this size.
+    rows: the teammates, then the opponents and the unknown players. self is not in the PlayerStore, nor here.
+"""
+
+
+class PlayerIndex:
+    def __init__(self):
+        self._players: list['PlayerObject'] = []
+        self._rows: dict[int, int] = {}  # id(player) -> row
+        self._slots = np.zeros(0, dtype=np.intp)  # PlayerStore slot of every row
+        self._teammate_rows = np.zeros(0, dtype=np.intp)
+        self._opponent_rows = np.zeros(0, dtype=np.intp)
+
+    def update(self, teammates: list['PlayerObject'], others: list['PlayerObject']):
+        players = teammates + others
+        self._players = players
+        self._rows = {id(p): row for row, p in enumerate(players)}
+        self._slots = player_slots(players)
+        self._teammate_rows = np.arange(len(teammates), dtype=np.intp)
+        self._opponent_rows = np.arange(len(teammates), len(players), dtype=np.intp)
+
+    def teammate_rows(self) -> np.ndarray:
+        return self._teammate_rows
+
+    def opponent_rows(self) -> np.ndarray:
+        """
+        the opponents and the unknown players
+        """
+        return self._opponent_rows
+
+    def rows(self, players: list['PlayerObject']) -> Union[np.ndarray, None]:
+        """
+        rows of the players in their order, None if one of them is not in the index
+        """
+        rows = np.empty(len(players), dtype=np.intp)
+        for i, p in enumerate(players):
+            row = self._rows.get(id(p))
+            if row is None or self._players[row] is not p:
+                return None
+            rows[i] = row
+        return rows
+
+    def player(self, row: int) -> 'PlayerObject':
+        return self._players[row]
+
+    def filter(self, rows: np.ndarray, count_thr: int = None, with_goalie: bool = True) -> np.ndarray:
+        """
+        the rows of the players that are not ghosts, with pos_count <= count_thr
+        """
+        store = PlayerStore.i()
+        slots = self._slots[rows]
+        counts = store.counts.take(slots, axis=0)
+        keep = counts[:, COUNT_INDEX['ghost_count']] == 0
+        if count_thr is not None:
+            keep &= counts[:, COUNT_INDEX['pos_count']] <= np.int64(count_thr)
+        if not with_goalie:
+            keep &= ~store.goalie.take(slots)
+        return rows[keep]
+
+    def contains(self, region: Region2D, rows: np.ndarray) -> np.ndarray:
+        """
+        region.contains of the position of every row
+        """
+        if isinstance(region, Rect2D):
+            pos = self.pos(rows)
+            inside = (pos >= np.array((region.left(), region.top()))) & (pos <= np.array((region.right(),
+                                                                                          region.bottom())))
+            return inside[:, 0] & inside[:, 1]
+        if isinstance(region, Circle2D):
+            return self.dist2(region.center(), rows) < np.float64(region.radius() * region.radius())
+        pos = self.pos(rows)
+        return np.fromiter((region.contains(Vector2D(x, y)) for x, y in pos.tolist()), dtype=bool, count=len(rows))
+
+    def pos(self, rows: np.ndarray) -> np.ndarray:
+        """
+        (x, y) of every row
+        """
+        # take and numpy operands: the python scalars of a ufunc cost more than the 22 rows
+        return PlayerStore.i().pos.take(self._slots[rows], axis=0)
+
+    def dist2(self, point: Vector2D, rows: np.ndarray) -> np.ndarray:
+        d = self.pos(rows) - np.array((point.x(), point.y()))
+        d *= d
+        return d[:, 0] + d[:, 1]
+
+    def nearest(self, point: Vector2D, rows: np.ndarray, k: int = 1,
+                max_dist2: float = math.inf) -> list['PlayerObject']:
+        """
+        the k players of rows nearest to point and closer than sqrt(max_dist2), the nearest first.
+        players at the same distance keep the order of rows
+        """
+        if len(rows) == 0:
+            return []
+        dist2 = self.dist2(point, rows)
+        order = np.argsort(dist2, kind='stable')[:k].tolist() if k > 1 else [int(dist2.argmin())]
+        return [self._players[rows[i]] for i in order if float(dist2[i]) < max_dist2]
+
+    def within(self, point: Vector2D, radius: float, rows: np.ndarray) -> list['PlayerObject']:
+        """
+        the players of rows closer than radius to point, in the order of rows
+        """
+        return [self._players[row] for row in rows[self.dist2(point, rows) < np.float64(radius * radius)].tolist()]
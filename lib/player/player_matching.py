@@ -0,0 +1,123 @@
+import math
+
+import numpy as np
+
+from lib.player.player_store import COUNT_INDEX, PlayerStore, player_slots
+from lib.rcsc.types import UNUM_UNKNOWN
+
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from lib.player.localizer import Localizer
+    from lib.player.object_player import PlayerObject
+
+"""
+    association of the players of a see message with the players of the world model (WorldModel.localize_players
+    with team_config.BATCH_PLAYER_MATCHING): one cost matrix per group of seen players, then one assignment.
+    the assignment matches as many players as it can, then with the least total distance (hungarian method).
+    scipy.optimize has one, but importing it costs more than the assignments of a game and the agents do not
+    load scipy.
+"""
+
+
+def match_costs(players: list['Localizer.PlayerT'],
+                candidates: list['PlayerObject'],
+                dist_error_rate: float,
+                max_dist: float) -> np.ndarray:
+    """
+    distance of every seen player (rows) to the last seen or heard position of every candidate (columns).
+    inf if they have other uniform numbers, if the candidate could not have run that far, or from max_dist
+    """
+    cost = np.full((len(players), len(candidates)), math.inf)
+    if len(players) == 0 or len(candidates) == 0:
+        return cost
+    seen = np.array([(p.pos_.x(), p.pos_.y(), p.dist_error_ * dist_error_rate, p.unum_) for p in players])
+    known = np.array([(p._seen_pos.x(), p._seen_pos.y(), p._heard_pos.x(), p._heard_pos.y(),
+                       p.player_type().real_speed_max(), p._unum) for p in candidates])
+    counts = PlayerStore.i().counts[player_slots(candidates)]
+    seen_count = counts[:, COUNT_INDEX['seen_pos_count']]
+    heard_count = counts[:, COUNT_INDEX['heard_pos_count']]
+    # the last heard position when it is newer than the last seen one
+    heard = heard_count < seen_count
+    old_x = np.where(heard, known[:, 2], known[:, 0])
+    old_y = np.where(heard, known[:, 3], known[:, 1])
+    reach = known[:, 4] * np.where(heard, heard_count, seen_count)
+
+    dx = seen[:, 0, None] - old_x
+    dy = seen[:, 1, None] - old_y
+    dist = np.sqrt(dx * dx + dy * dy)
+    seen_unum = seen[:, 3, None]
+    known_unum = known[None, :, 5]
+    same_unum = (seen_unum == UNUM_UNKNOWN) | (known_unum == UNUM_UNKNOWN) | (seen_unum == known_unum)
+    reachable = dist <= reach + seen[:, 2, None]
+    return np.where(same_unum & reachable & (dist < max_dist), dist, cost)
+
+
+def assign(cost: np.ndarray) -> list[tuple[int, int]]:
+    """
+    (row, column) pairs of finite cost, as many as possible and then with the least total cost
+    """
+    finite = np.isfinite(cost)
+    rows = np.flatnonzero(finite.any(axis=1))
+    cols = np.flatnonzero(finite.any(axis=0))
+    if len(rows) == 0:
+        return []
+    c = cost[np.ix_(rows, cols)]
+    finite = finite[np.ix_(rows, cols)]
+    transposed = len(rows) > len(cols)
+    if transposed:
+        c = c.T
+        finite = finite.T
+    n, m = c.shape
+    # an infinite cost costs more than any set of finite ones: a missing pair is the last resort
+    big = (float(np.abs(c[finite]).max()) + 1.0) * (n + 1)
+    c = np.where(finite, c, big).tolist()
+    finite = finite.tolist()
+
+    # shortest augmenting paths with potentials, one row at a time. python lists: the matrices of a see
+    # message are ~10 x 10, numpy calls would cost more than the arithmetic
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    row_of = [0] * (m + 1)  # 1 based row of every column, 0: free. column 0 is the root of the path
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        row_of[0] = i
+        j0 = 0
+        min_v = [math.inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = row_of[j0]
+            row = c[i0 - 1]
+            u0 = u[i0]
+            delta = math.inf
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    reduced = row[j - 1] - u0 - v[j]
+                    if reduced < min_v[j]:
+                        min_v[j] = reduced
+                        way[j] = j0
+                    if min_v[j] < delta:
+                        delta = min_v[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[row_of[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_v[j] -= delta
+            j0 = j1
+            if row_of[j0] == 0:
+                break
+        while j0 != 0:
+            j1 = way[j0]
+            row_of[j0] = row_of[j1]
+            j0 = j1
+
+    pairs = []
+    for j in range(1, m + 1):
+        i = row_of[j]
+        if i != 0 and finite[i - 1][j - 1]:
+            r, k = (j - 1, i - 1) if transposed else (i - 1, j - 1)
+            pairs.append((int(rows[r]), int(cols[k])))
+    return sorted(pairs)
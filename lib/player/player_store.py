@@ -0,0 +1,210 @@
+import numpy as np
+from pyrusgeom.angle_deg import AngleDeg
+from pyrusgeom.vector_2d import Vector2D
+
+"""
+    struct of arrays of the player state of every PlayerObject of the process.
+    a PlayerObject owns one slot (row) of the store and reads/writes its fields through the descriptors below,
+    so the world model can update all its players with one numpy operation per field.
+"""
+
+COUNT_MAX = 1000
+HISTORY_SIZE = 100
+
+# columns of PlayerStore.counts, the first CYCLE_COUNTS ones are increased by one (up to COUNT_MAX) every cycle
+COUNTS = ('unum_count', 'pos_count', 'seen_pos_count', 'heard_pos_count', 'vel_count',
+          'body_count', 'face_count', 'pointto_count', 'tackle_count',
+          'seen_vel_count', 'ghost_count', 'vel_count_thr')
+CYCLE_COUNTS = 9
+COUNT_INDEX = {name: i for i, name in enumerate(COUNTS)}
+# counts of the seen state, reset by a fullstate message
+FULL_STATE_COUNTS = [COUNT_INDEX[name] for name in ('pos_count', 'vel_count', 'body_count', 'ghost_count')]
+FLOATS = ('dist_from_self', 'angle_from_self', 'dist_from_ball', 'angle_from_ball', 'kickable_area')
+FLAGS = ('goalie', 'tackle', 'pos_valid', 'vel_valid')
+VECTORS = ('pos', 'vel')
+
+
+class PlayerStore:
+    _i: 'PlayerStore' = None
+
+    @staticmethod
+    def i() -> 'PlayerStore':
+        if PlayerStore._i is None:
+            PlayerStore._i = PlayerStore()
+        return PlayerStore._i
+
+    def __init__(self, capacity: int = 64):
+        self._capacity = 0
+        self._size = 0
+        self._free: list[int] = []
+        self.counts = np.zeros((0, len(COUNTS)), dtype=np.int64)
+        for name in FLOATS:
+            setattr(self, name, np.zeros(0))
+        for name in FLAGS:
+            setattr(self, name, np.zeros(0, dtype=bool))
+        for name in VECTORS:
+            setattr(self, name, np.zeros((0, 2)))
+        # ring buffer of the positions before the last HISTORY_SIZE cycle updates
+        self.history = np.zeros((0, HISTORY_SIZE, 2))
+        self.history_head = np.zeros(0, dtype=np.int64)
+        self.history_size = np.zeros(0, dtype=np.int64)
+        self._grow(capacity)
+
+    def _grow(self, capacity: int):
+        for name in ('counts',) + FLOATS + FLAGS + VECTORS + ('history', 'history_head', 'history_size'):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._capacity] = old
+            setattr(self, name, new)
+        self._capacity = capacity
+
+    def allocate(self) -> int:
+        if self._free:
+            return self._free.pop()
+        if self._size == self._capacity:
+            self._grow(self._capacity * 2)
+        self._size += 1
+        return self._size - 1
+
+    def release(self, slot: int):
+        self.history_size[slot] = 0
+        self._free.append(slot)
+
+    def count(self, name: str, slots: np.ndarray) -> np.ndarray:
+        return self.counts[slots, COUNT_INDEX[name]]
+
+    def update_by_last_cycle(self, slots: np.ndarray):
+        """
+        PlayerObject.update_by_last_cycle for every slot
+        """
+        head = self.history_head[slots]
+        self.history[slots, head] = self.pos[slots]
+        self.history_head[slots] = (head + 1) % HISTORY_SIZE
+        self.history_size[slots] = np.minimum(HISTORY_SIZE, self.history_size[slots] + 1)
+
+        counts = self.counts[slots]
+        moving = slots[counts[:, COUNT_INDEX['vel_count']] < counts[:, COUNT_INDEX['vel_count_thr']]]
+        self.pos[moving] += self.vel[moving]
+
+        np.minimum(COUNT_MAX, counts[:, :CYCLE_COUNTS] + 1, out=counts[:, :CYCLE_COUNTS])
+        self.counts[slots] = counts
+
+    def update_by_full_state(self, slots: np.ndarray, players: np.ndarray):
+        """
+        positions and velocities of a FullStateWorldMessageParser.players() record, one row per slot
+        """
+        pos = self.pos
+        vel = self.vel
+        pos[slots, 0] = players['pos_x']
+        pos[slots, 1] = players['pos_y']
+        vel[slots, 0] = players['vel_x']
+        vel[slots, 1] = players['vel_y']
+        self.pos_valid[slots] = True
+        self.vel_valid[slots] = True
+        self.counts[np.ix_(slots, FULL_STATE_COUNTS)] = 0
+
+    def update_more_with_full_state(self, slots: np.ndarray, self_pos: Vector2D, ball_pos: Vector2D) -> np.ndarray:
+        """
+        Object.update_more_with_full_state for every slot, returns the positions relative to self
+        """
+        pos = self.pos[slots]
+        for origin, dist, angle in ((self_pos, self.dist_from_self, self.angle_from_self),
+                                    (ball_pos, self.dist_from_ball, self.angle_from_ball)):
+            to_x = origin.x() - pos[:, 0]
+            to_y = origin.y() - pos[:, 1]
+            dist[slots] = np.hypot(to_x, to_y)
+            angle[slots] = np.degrees(np.arctan2(to_y, to_x))
+        return pos - (self_pos.x(), self_pos.y())
+
+    def pos_history(self, slot: int) -> np.ndarray:
+        """
+        positions of the slot, the newest first
+        """
+        order = (self.history_head[slot] - 1 - np.arange(self.history_size[slot])) % HISTORY_SIZE
+        return self.history[slot, order]
+
+    def update_self_ball_related(self, slots: np.ndarray, self_pos: Vector2D, ball_pos: Vector2D):
+        """
+        PlayerObject.update_self_ball_related for every slot
+        """
+        pos = self.pos[slots]
+        for origin, dist, angle in ((self_pos, self.dist_from_self, self.angle_from_self),
+                                    (ball_pos, self.dist_from_ball, self.angle_from_ball)):
+            rel_x = pos[:, 0] - origin.x()
+            rel_y = pos[:, 1] - origin.y()
+            dist[slots] = np.hypot(rel_x, rel_y)
+            angle[slots] = np.degrees(np.arctan2(rel_y, rel_x))
+
+
+def player_slots(players: list) -> np.ndarray:
+    return np.fromiter((p._slot for p in players), dtype=np.intp, count=len(players))
+
+
+class StoreField:
+    """
+        int, float or bool field of a PlayerObject kept in PlayerStore.i().<name>[slot]
+    """
+    def __init__(self, name: str):
+        self._name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return getattr(obj._store, self._name)[obj._slot].item()
+
+    def __set__(self, obj, value):
+        getattr(obj._store, self._name)[obj._slot] = value
+
+
+class StoreCount(StoreField):
+    """
+        counter of a PlayerObject kept in PlayerStore.i().counts[slot, column]
+    """
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._column = COUNT_INDEX[name]
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj._store.counts[obj._slot, self._column].item()
+
+    def __set__(self, obj, value):
+        obj._store.counts[obj._slot, self._column] = value
+
+
+class StoreAngle(StoreField):
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return AngleDeg(getattr(obj._store, self._name)[obj._slot].item())
+
+    def __set__(self, obj, value):
+        getattr(obj._store, self._name)[obj._slot] = float(value.degree() if isinstance(value, AngleDeg) else value)
+
+
+class StoreVector(StoreField):
+    """
+        Vector2D field of a PlayerObject, every read returns a new Vector2D,
+        so in place changes (+=, *=, ...) have to be assigned back to the field.
+    """
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._valid_name = f'{name}_valid'
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj._store
+        x, y = getattr(store, self._name)[obj._slot].tolist()
+        vec = Vector2D(x, y)
+        if not getattr(store, self._valid_name)[obj._slot]:
+            vec.invalidate()
+        return vec
+
+    def __set__(self, obj, value: Vector2D):
+        store = obj._store
+        vectors = getattr(store, self._name)
+        vectors[obj._slot, 0] = value.x()
+        vectors[obj._slot, 1] = value.y()
+        getattr(store, self._valid_name)[obj._slot] = value.is_valid()
@@ -0,0 +1,125 @@
+import re
+import time
+from typing import Callable, Union
+
+from lib.network.recorder import IN, OUT, Recorder, read_recording
+from lib.player import localizer
+from lib.player.basic_client import BasicClient
+from lib.player.player_agent import PlayerAgent
+
+import team_config
+
+"""
+    offline replay of a player recording (main.py --record), no rcssserver needed.
+    the received datagrams are given to PlayerAgent.parse_message in their order and every sent message of the
+    recording (but init and bye) marks a decision: action() and flush_logs() run there, so the decisions happen
+    at the same points of the message stream as in the game. the replayed commands are compared to the recorded ones.
+    realtime replays wait for the recorded arrival time of every message, the default runs as fast as possible.
+"""
+
+INIT = re.compile(rb'\(init (\S+?)[\s)]')
+
+
+class ReplaySocket:
+    """
+        stands in for the UDPSocket of the agent, the sent messages are kept
+    """
+    def __init__(self):
+        self._sent: list[bytes] = []
+        self._recorder: Union[Recorder, None] = None
+
+    def set_recorder(self, recorder: Recorder):
+        self._recorder = recorder
+
+    def record(self, direction: int, data: bytes):
+        if self._recorder is not None:
+            self._recorder.record(direction, data)
+
+    def send_msg(self, msg: str):
+        if msg[-1] != '\0':
+            msg += '\0'
+        data = msg.encode()
+        self.record(OUT, data)
+        self._sent.append(data)
+        return len(data)
+
+    def receive_msg(self):
+        return 0, "", 0
+
+    def sent(self) -> list[bytes]:
+        return self._sent
+
+
+class ReplayClient(BasicClient):
+    def __init__(self):
+        super().__init__()
+        self._socket = ReplaySocket()
+
+    def connect_to(self, host_port):
+        return True
+
+    def socket(self) -> ReplaySocket:
+        return self._socket
+
+
+class ReplayResult:
+    def __init__(self):
+        self.messages = 0
+        self.cycles = 0
+        self.mismatches = 0
+        self.elapsed = 0.
+
+    def cycles_per_sec(self):
+        return self.cycles / self.elapsed if self.elapsed > 0 else 0.
+
+    def __str__(self):
+        return f'{self.messages} messages, {self.cycles} cycles in {self.elapsed:.3f} sec ' \
+               f'({self.cycles_per_sec():.1f} cycles/sec), {self.mismatches} commands differ from the recording'
+
+
+class Replay:
+    def __init__(self, path: str):
+        self._records = list(read_recording(path))
+        init = INIT.match(self._records[0][2]) if self._records and self._records[0][0] == OUT else None
+        if init is None:
+            raise ValueError(f'{path} is not the recording of a player')
+        self._team_name = init.group(1).decode()
+        self._goalie = b'(goalie)' in self._records[0][2]
+
+    def team_name(self):
+        return self._team_name
+
+    def goalie(self):
+        return self._goalie
+
+    def run(self, agent_class: Callable[[bool], PlayerAgent], realtime: bool = False, seed: int = 0) -> ReplayResult:
+        team_config.TEAM_NAME = self._team_name
+        localizer.seed(seed)
+        agent = agent_class(self._goalie)
+        client = ReplayClient()
+        agent.set_client(client)
+        agent.handle_start()
+
+        sent = client.socket().sent()
+        result = ReplayResult()
+        first_sec = self._records[0][1]
+        start = time.perf_counter()
+        for direction, sec, data in self._records[1:]:
+            if direction == IN:
+                if realtime:
+                    wait = start + sec - first_sec - time.perf_counter()
+                    if wait > 0:
+                        time.sleep(wait)
+                agent.parse_message(data.decode())
+                result.messages += 1
+            elif data.startswith(b'(bye'):
+                break
+            else:
+                sent_count = len(sent)
+                agent.action()
+                agent.flush_logs()
+                result.cycles += 1
+                if sent[sent_count:] != [data]:
+                    result.mismatches += 1
+        result.elapsed = time.perf_counter() - start
+        return result
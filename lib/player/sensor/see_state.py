@@ -5,8 +5,6 @@ from lib.debug.level import Level
 from lib.rcsc.game_time import GameTime
 from lib.rcsc.types import ViewWidth
 
-DEBUG: bool = True
-
 
 class SeeState:
     def __init__(self):
@@ -19,13 +17,8 @@ class SeeState:
         self.set_new_cycle(sense_time)
 
         if self._view_width != vw:
-            if DEBUG:
-                log.sw_log().system().add_text(f"see state: (update by sense body)"
-                                               f"vew_width does not match."
-                                               f" old={self._view_width}, new={vw}")
-                log.os_log().info(f"see state: (update by sense body)"
-                                  f"vew_width does not match."
-                                  f" old={self._view_width}, new={vw}")
+            log.sw_log().system().add_text('see state: (update by sense body)vew_width does not match. old={}, new={}', self._view_width, vw)
+            log.os_log().info('see state: (update by sense body)vew_width does not match. old=%s, new=%s', self._view_width, vw)
             self._view_width = vw
 
     def update_by_see(self, see_time: GameTime, vw: ViewWidth):
@@ -45,8 +38,7 @@ class SeeState:
 
     def set_view_mode(self, new_width: ViewWidth):
         if self._last_see_time != self._current_time:
-            if DEBUG:
-                log.sw_log().system().add_text("see state (set_view_mode) no current cycle see arrival")
+            log.sw_log().system().add_text("see state (set_view_mode) no current cycle see arrival")
             return
 
         self._view_width = new_width
@@ -58,9 +50,11 @@ class SeeState:
         elif new_width == ViewWidth.NARROW:
             self._cycles_till_next_see = 1
 
-        log.sw_log().system().add_text(f"see state (set_view_mode)"
-                                       f" synch {new_width}: cycle = {self._cycles_till_next_see}")
+        log.sw_log().system().add_text('see state (set_view_mode) synch {}: cycle = {}', new_width, self._cycles_till_next_see)
         return
 
     def cycles_till_next_see(self):
         return self._cycles_till_next_see
+
+    def last_see_time(self) -> GameTime:
+        return self._last_see_time
@@ -1,10 +1,25 @@
+import re
 from enum import Enum, auto
 
 from lib.debug.debug import log
-from lib.parser.message_params_parser_see import MessageParamsParserSee
 from lib.rcsc.types import UNUM_UNKNOWN, LineID, MarkerID
 from lib.rcsc.game_time import GameTime
 
+"""
+    a see message is scanned once by SEE_OBJECT_PATTERN: ((key) values) -> (key, values).
+    the markers, lines, ball and behind markers are found by their key in a table built with the marker map,
+    other keys (the players and what the server should not send) go through the parse_string methods.
+    the seen objects are reused: every kind of object has a pool that grows to the largest see message and
+    the lists of the parser are refilled from it, so they are only valid until the next parse.
+"""
+
+SEE_OBJECT_PATTERN = re.compile(r'\(\(([^()]*)\)([^()]*)\)')
+
+_MARKER = 0
+_BEHIND_MARKER = 1
+_LINE = 2
+_BALL = 3
+
 
 class SeeParser:
     DIST_ERR = float("inf")
@@ -161,10 +176,17 @@ class SeeParser:
 
         @staticmethod
         def parse_string(key, value, team_name, visual_sensor):
+            player = SeeParser.PlayerT()
+            return player, player.parse(key, value, team_name, visual_sensor)
+
+        def parse(self, key, value, team_name, visual_sensor):
+            """
+            fills the (reset) player, returns its PlayerInfoType
+            """
             # PARSE KEY
             types = SeeParser.PlayerInfoType
 
-            player = SeeParser.PlayerT()
+            player = self
             result_type = types.Player_Illegal
 
             player_data = key.split(" ")
@@ -249,7 +271,7 @@ class SeeParser:
             elif n_state_data == 1:
                 player.dir_ = float(state_data[0])
 
-            return player, result_type
+            return result_type
 
     def __init__(self) -> None:
         self._time: GameTime = GameTime()
@@ -266,7 +288,13 @@ class SeeParser:
         self._unknown_opponents: list[SeeParser.PlayerT] = []
         self._unknown_players: list[SeeParser.PlayerT] = []
 
+        self._marker_pool: list[SeeParser.MarkerT] = []
+        self._line_pool: list[SeeParser.LineT] = []
+        self._ball_pool: list[SeeParser.BallT] = []
+        self._player_pool: list[SeeParser.PlayerT] = []
+
         self.initial_marker_map()
+        self._object_keys: dict[str, tuple] = self.create_object_keys()
 
     def initial_marker_map(self):
         self._marker_map["g l"] = MarkerID.Goal_L
@@ -325,6 +353,22 @@ class SeeParser:
         self._marker_map["f r b 20"] = MarkerID.Flag_RB20
         self._marker_map["f r b 30"] = MarkerID.Flag_RB30
 
+    def create_object_keys(self) -> dict[str, tuple]:
+        """
+        key of a seen object -> (kind, object type, id) of the objects parse reads without parse_string
+        """
+        types = SeeParser.ObjectType
+        keys = {}
+        for key, marker_id in self._marker_map.items():
+            keys[key] = (_MARKER, types(key[0]), marker_id)
+        for key in ('F', 'G'):
+            keys[key] = (_BEHIND_MARKER, types(key), types.Obj_Unknown)
+        for line_id in LineID:
+            if line_id is not LineID.Line_Unknown:
+                keys[f'l {line_id.value}'] = (_LINE, types.Obj_Line, line_id)
+        keys['b'] = keys['B'] = (_BALL, types.Obj_Ball, None)
+        return keys
+
     def clear_all(self):
         self._balls.clear()
         self._markers.clear()
@@ -367,41 +411,91 @@ class SeeParser:
 
         self.clear_all()
 
-        object_data = MessageParamsParserSee().parse(message)
-        if object_data is None:
-            log.os_log().warn("No Object have seen!")
-            return
-        for key_value in object_data:
-            key = key_value[0]
-            value = key_value[1]
-            types = SeeParser.ObjectType
-            t: str = key[0]
-            if t in ['P', 'B', 'L']:
-                t = t.lower()
-            obj_type = types(t)
-            
-            value = value.strip(")")
-
-            if obj_type == types.Obj_Marker or obj_type == types.Obj_Goal:
-                self._markers.append(SeeParser.MarkerT.parse_string(
-                    key, value, obj_type, self._marker_map))
-            elif obj_type == types.Obj_Marker_Behind or obj_type == types.Obj_Goal_Behind:
-                self._behind_markers.append(SeeParser.MarkerT.parse_string(
-                    key, value, obj_type, self._marker_map))
-            elif obj_type == types.Obj_Player:
-                player, player_type = SeeParser.PlayerT.parse_string(
-                    key, value, team_name, self)
-                self.add_player(player, player_type)
-            elif obj_type == types.Obj_Line:
-                self._lines.append(
-                    SeeParser.LineT.parse_string(key, value))
-            elif obj_type == types.Obj_Ball:
-                self._balls.append(
-                    SeeParser.BallT.parse_string(key, value))
+        object_keys = self._object_keys
+        marker_pool = self._marker_pool
+        line_pool = self._line_pool
+        ball_pool = self._ball_pool
+        player_pool = self._player_pool
+        n_marker = n_line = n_ball = n_player = 0
+        for key, value in SEE_OBJECT_PATTERN.findall(message):
+            object_key = object_keys.get(key)
+            if object_key is None:
+                if key[0] == 'p' or key[0] == 'P':
+                    if n_player == len(player_pool):
+                        player_pool.append(SeeParser.PlayerT())
+                    player = player_pool[n_player]
+                    n_player += 1
+                    player.reset()
+                    self.add_player(player, player.parse(key, value.strip(' '), team_name, self))
+                else:
+                    self.parse_object(key, value.strip(' '), team_name)
+                continue
+
+            kind, obj_type, obj_id = object_key
+            data = value.split()
+            if kind == _MARKER or kind == _BEHIND_MARKER:
+                if n_marker == len(marker_pool):
+                    marker_pool.append(SeeParser.MarkerT())
+                marker = marker_pool[n_marker]
+                n_marker += 1
+                marker.object_type_ = obj_type
+                marker.id_ = obj_id
+                marker.dist_ = float(data[0])
+                marker.dir_ = float(data[1])
+                (self._markers if kind == _MARKER else self._behind_markers).append(marker)
+            elif kind == _LINE:
+                if n_line == len(line_pool):
+                    line_pool.append(SeeParser.LineT())
+                line = line_pool[n_line]
+                n_line += 1
+                line.id_ = obj_id
+                line.dist_ = float(data[0])
+                line.dir_ = float(data[1])
+                self._lines.append(line)
             else:
-                log.os_log().error(f"A seen object is not identified by its type!!")
-
-            self.sort_all()
+                if n_ball == len(ball_pool):
+                    ball_pool.append(SeeParser.BallT())
+                ball = ball_pool[n_ball]
+                n_ball += 1
+                ball.dist_ = float(data[0])
+                ball.dir_ = float(data[1])
+                ball.has_vel_ = len(data) == 4
+                ball.dist_chng_ = float(data[2]) if ball.has_vel_ else 0.
+                ball.dir_chng_ = float(data[3]) if ball.has_vel_ else 0.
+                self._balls.append(ball)
+
+        self.sort_all()
+
+    def parse_object(self, key: str, value: str, team_name: str):
+        """
+        the seen object of a key that is not in the object key table
+        """
+        types = SeeParser.ObjectType
+        t: str = key[0]
+        if t in ['P', 'B', 'L']:
+            t = t.lower()
+        obj_type = types(t)
+
+        value = value.strip(")")
+
+        if obj_type == types.Obj_Marker or obj_type == types.Obj_Goal:
+            self._markers.append(SeeParser.MarkerT.parse_string(
+                key, value, obj_type, self._marker_map))
+        elif obj_type == types.Obj_Marker_Behind or obj_type == types.Obj_Goal_Behind:
+            self._behind_markers.append(SeeParser.MarkerT.parse_string(
+                key, value, obj_type, self._marker_map))
+        elif obj_type == types.Obj_Player:
+            player, player_type = SeeParser.PlayerT.parse_string(
+                key, value, team_name, self)
+            self.add_player(player, player_type)
+        elif obj_type == types.Obj_Line:
+            self._lines.append(
+                SeeParser.LineT.parse_string(key, value))
+        elif obj_type == types.Obj_Ball:
+            self._balls.append(
+                SeeParser.BallT.parse_string(key, value))
+        else:
+            log.os_log().error(f"A seen object is not identified by its type!!")
 
     def __str__(self):
         res = "\n"
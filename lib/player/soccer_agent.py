@@ -17,6 +17,21 @@ class SoccerAgent:
     def run(self):
         pass
 
+    def set_client(self, client: BasicClient):
+        self._client = client
+
+    def client(self) -> BasicClient:
+        return self._client
+
+    def handle_message(self, message: str):
+        pass
+
+    def decision_delay_msec(self, waited_msec: int = 0):
+        return None
+
+    def handle_decision_timer(self, waited_msec: int = 0):
+        pass
+
     def handle_exit(self):
         pass
 
@@ -1,4 +1,7 @@
 import copy
+
+import numpy as np
+
 from lib.rcsc.game_time import GameTime
 
 from lib.rcsc.player_type import PlayerType
@@ -8,10 +11,10 @@ from lib.rcsc.server_param import ServerParam
 class StaminaModel:
     def __init__(self, stamina=None, effort=None, recovery=None, capacity=None):
         SP = ServerParam.i()
-        self._stamina: float = float(stamina) if stamina else SP.stamina_max()
-        self._effort: float = float(effort) if effort else SP.default_effort_max()
-        self._recovery: float = float(recovery) if recovery else SP.recover_init()
-        self._capacity: float = float(capacity) if capacity else -1
+        self._stamina: float = float(stamina) if stamina is not None else SP.stamina_max()
+        self._effort: float = float(effort) if effort is not None else SP.default_effort_max()
+        self._recovery: float = float(recovery) if recovery is not None else SP.recover_init()
+        self._capacity: float = float(capacity) if capacity is not None else -1
 
     def init(self, player_type: PlayerType):
         SP = ServerParam.i()
@@ -50,8 +53,57 @@ class StaminaModel:
         self._stamina = min(self._stamina, SP.stamina_max()) 
 
     def simulate_waits(self, player_type: PlayerType, n_wait: int):
+        # simulate_wait n_wait times with the params in locals, a wait that changes nothing ends the loop
+        if n_wait <= 0:
+            return
+        SP = ServerParam.i()
+        recover_dec_thr = SP.recover_dec_thr_value()
+        recover_min = SP.recover_min()
+        recover_dec = SP.recover_dec()
+        effort_dec_thr = SP.effort_dec_thr_value()
+        effort_inc_thr = SP.effort_inc_thr_value()
+        effort_dec = SP.effort_dec()
+        effort_inc = SP.effort_inc()
+        effort_min = player_type.effort_min()
+        effort_max = player_type.effort_max()
+        stamina_inc_max = player_type.stamina_inc_max()
+        stamina_max = SP.stamina_max()
+        use_capacity = SP.stamina_capacity() >= 0
+
+        stamina = self._stamina
+        effort = self._effort
+        recovery = self._recovery
+        capacity = self._capacity
         for i in range(n_wait):
-            self.simulate_wait(player_type)
+            state = (stamina, effort, recovery, capacity)
+            if stamina <= recover_dec_thr:
+                if recovery > recover_min:
+                    recovery -= recover_dec
+                    recovery = max(recovery, recover_min)
+
+            if stamina <= effort_dec_thr:
+                if effort > effort_min:
+                    effort -= effort_dec
+                    effort = max(effort, effort_min)
+            elif stamina >= effort_inc_thr:
+                if effort < effort_max:
+                    effort += effort_inc
+                    effort = min(effort, effort_max)
+
+            stamina_inc = min(stamina_inc_max * recovery, stamina_max - stamina)
+            if use_capacity:
+                stamina += min(stamina_inc, capacity)
+                capacity -= stamina_inc
+                capacity = max(0, capacity)
+            else:
+                stamina += stamina_inc
+            stamina = min(stamina, stamina_max)
+            if state == (stamina, effort, recovery, capacity):
+                break
+        self._stamina = stamina
+        self._effort = effort
+        self._recovery = recovery
+        self._capacity = capacity
 
     def capacity_is_empty(self) -> bool:
         return 0 <= self._capacity <= 1e-5
@@ -131,3 +183,68 @@ class StaminaModel:
             
             self._recovery = SP.recover_init()
 
+
+
+class StaminaModels:
+    """
+        StaminaModel of many rows as arrays
+    """
+    def __init__(self, models: list[StaminaModel]):
+        self._stamina = np.array([m.stamina() for m in models])
+        self._effort = np.array([m.effort() for m in models])
+        self._recovery = np.array([m.recovery() for m in models])
+        self._capacity = np.array([m.capacity() for m in models])
+
+    def take(self, rows: np.ndarray):
+        """
+        keeps the given rows only
+        """
+        self._stamina = self._stamina[rows]
+        self._effort = self._effort[rows]
+        self._recovery = self._recovery[rows]
+        self._capacity = self._capacity[rows]
+
+    def model(self, row: int) -> StaminaModel:
+        return StaminaModel(self._stamina[row].item(), self._effort[row].item(), self._recovery[row].item(),
+                            self._capacity[row].item())
+
+    def simulate_wait(self, player_type: PlayerType):
+        SP = ServerParam.i()
+        stamina = self._stamina
+        recovery = self._recovery
+        effort = self._effort
+
+        # recovery
+        dec = (stamina <= SP.recover_dec_thr_value()) & (recovery > SP.recover_min())
+        recovery = np.where(dec, np.maximum(recovery - SP.recover_dec(), SP.recover_min()), recovery)
+
+        # effort
+        low = stamina <= SP.effort_dec_thr_value()
+        dec = low & (effort > player_type.effort_min())
+        inc = ~low & (stamina >= SP.effort_inc_thr_value()) & (effort < player_type.effort_max())
+        effort = np.where(dec, np.maximum(effort - SP.effort_dec(), player_type.effort_min()), effort)
+        effort = np.where(inc, np.minimum(effort + SP.effort_inc(), player_type.effort_max()), effort)
+
+        stamina_inc = np.minimum(player_type.stamina_inc_max() * recovery, SP.stamina_max() - stamina)
+        if SP.stamina_capacity() >= 0:
+            stamina = stamina + np.minimum(stamina_inc, self._capacity)
+            self._capacity = np.maximum(0, self._capacity - stamina_inc)
+        else:
+            stamina = stamina + stamina_inc
+        self._stamina = np.minimum(stamina, SP.stamina_max())
+        self._recovery = recovery
+        self._effort = effort
+
+    def simulate_dash(self, player_type: PlayerType, dash_power: np.ndarray):
+        consumption = np.where(dash_power >= 0, dash_power, dash_power * -2)
+        self._stamina = np.maximum(0, self._stamina - consumption)
+        self.simulate_wait(player_type)
+
+    def stamina(self) -> np.ndarray:
+        return self._stamina
+
+    def effort(self) -> np.ndarray:
+        return self._effort
+
+    def recovery(self) -> np.ndarray:
+        return self._recovery
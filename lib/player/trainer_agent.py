@@ -123,6 +123,12 @@ class TrainerAgent(SoccerAgent):
                 self._think_received = False
             # TODO elif for not sync mode
 
+    def handle_message(self, message: str):
+        self.parse_message(message)
+        if self.think_received():
+            self.action()
+            self._think_received = False
+
     def parse_message(self, message):
         if message.find("(init") is not -1:
             self.analyze_init(message)
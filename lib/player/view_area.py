@@ -1,4 +1,3 @@
-from xmlrpc.client import boolean
 from pyrusgeom.angle_deg import AngleDeg
 from pyrusgeom.vector_2d import Vector2D
 from lib.rcsc.game_time import GameTime
@@ -27,7 +26,7 @@ class ViewArea:
     def time(self):
         return self._time
 
-    def is_valid(self) -> boolean:
+    def is_valid(self) -> bool:
         return self._view_width > 0
     
     def contains(self, point:Vector2D, dist_thr:float, visible_dist2: float):
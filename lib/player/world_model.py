@@ -1,6 +1,7 @@
-from turtle import pos
+import team_config
 from lib.action.intercept_table import InterceptTable
 from lib.debug.debug import log
+from lib.debug.level import Level
 from lib.player.localizer import Localizer
 from lib.messenger.messenger import Messenger
 from lib.messenger.messenger_memory import MessengerMemory
@@ -8,6 +9,9 @@ from lib.player.object_player import *
 from lib.player.object_ball import *
 from lib.parser.parser_message_fullstate_world import FullStateWorldMessageParser
 from lib.player.object_self import SelfObject
+from lib.player.player_index import PlayerIndex
+from lib.player.player_matching import assign, match_costs
+from lib.player.player_store import PlayerStore, player_slots
 from lib.player.sensor.body_sensor import SenseBodyParser
 from lib.player.sensor.visual_sensor import SeeParser
 from lib.player.view_area import ViewArea
@@ -17,9 +21,7 @@ from lib.rcsc.game_time import GameTime
 from lib.rcsc.types import HETERO_DEFAULT, UNUM_UNKNOWN, GameModeType
 from pyrusgeom.soccer_math import *
 from typing import List
-
-
-DEBUG=True
+import numpy as np
 
 
 from typing import TYPE_CHECKING
@@ -43,15 +45,13 @@ def player_valid_check(p: PlayerObject):
     return p.pos_valid()
 
 class WorldModel:
-    DEBUG = True
-    
     DIR_CONF_DIVS = 72
     DIR_STEP = 360. / DIR_CONF_DIVS
     
     def __init__(self, name):
         self._name = name
         self._is_full_state = True if name == 'full' else False
-        self._player_types = [PlayerType() for _ in range(18)]
+        self._player_types = [PlayerType.default() for _ in range(18)]
         self._self_unum: int = None
         self._team_name: str = ""
         self._our_side: SideID = SideID.NEUTRAL
@@ -66,6 +66,7 @@ class WorldModel:
         self._opponents_from_self: list[PlayerObject] = []
         
         self._unknown_players: list[PlayerObject] = []
+        self._player_index = PlayerIndex()
         
         self._self: SelfObject = SelfObject()
         
@@ -175,8 +176,7 @@ class WorldModel:
         self._our_side = message[1]
 
     def player_type_parser(self, message):
-        new_player_type = PlayerType()
-        new_player_type.parse(message)
+        new_player_type = PlayerType.from_message(message)
         self._player_types[new_player_type.id()] = new_player_type
 
     def reverse(self):
@@ -311,6 +311,12 @@ class WorldModel:
     def intercept_table(self):
         return self._intercept_table
 
+    def player_index(self) -> PlayerIndex:
+        """
+        the teammates, opponents and unknown players of the last update_player_state_cache
+        """
+        return self._player_index
+
     def game_mode(self):
         return self._game_mode
 
@@ -487,17 +493,16 @@ class WorldModel:
             self._opponents.clear()
             self._unknown_players.clear()
         
-        for p in self._teammates:
-            p.update_by_last_cycle()
-        self._teammates = list(filter(lambda p: p.pos_count() < 30,self._teammates))
-
-        for p in self._opponents:
-            p.update_by_last_cycle()
-        self._opponents = list(filter(lambda p: p.pos_count() < 30,self._opponents))
-        
-        for p in self._unknown_players:
-            p.update_by_last_cycle()
-        self._unknown_players = list(filter(lambda p: p.pos_count() < 30,self._unknown_players))
+        players = self._teammates + self._opponents + self._unknown_players
+        if len(players) > 0:
+            store = PlayerStore.i()
+            slots = player_slots(players)
+            store.update_by_last_cycle(slots)
+            keep = (store.count('pos_count', slots) < 30).tolist()
+            n_teammates, n_opponents = len(self._teammates), len(self._opponents)
+            self._teammates = [p for p, k in zip(self._teammates, keep) if k]
+            self._opponents = [p for p, k in zip(self._opponents, keep[n_teammates:]) if k]
+            self._unknown_players = [p for p, k in zip(self._unknown_players, keep[n_teammates + n_opponents:]) if k]
 
         self._dir_count = [c+1 for c in self._dir_count]
     
@@ -636,9 +641,9 @@ class WorldModel:
         gvel = Vector2D.invalid()
         vel_count = 1000
         
-        if WorldModel.DEBUG:
-            log.sw_log().world().add_text( f"(localize ball) rvel_valid={rvel.is_valid()}, self_vel_valid={self.self().vel_valid()}, self_vel_count={self.self().vel_count()}")
-            log.sw_log().world().add_text( f"(localize ball) rvel={rvel}, self_vel={self.self().vel()}")
+        if log.sw_log().world().enabled:
+            log.sw_log().world().add_text( '(localize ball) rvel_valid={}, self_vel_valid={}, self_vel_count={}', rvel.is_valid(), self.self().vel_valid(), self.self().vel_count())
+            log.sw_log().world().add_text( '(localize ball) rvel={}, self_vel={}', rvel, self.self().vel())
         
         if rvel.is_valid() and self.self().vel_valid():
             gvel = self.self().vel() + rvel
@@ -688,15 +693,15 @@ class WorldModel:
                           old_unknown_players: list[PlayerObject],
                           new_known_players: list[PlayerObject]):
 
-        log.os_log().debug(f'------- check with old known A')
+        log.os_log().debug('------- check with old known A')
         if player.unum_ != UNUM_UNKNOWN:
             for p in old_known_players:
-                log.os_log().debug(f'--------------?? {p}')
+                log.os_log().debug('--------------?? %s', p)
                 if p.unum() == player.unum_:
                     p.update_by_see(side, player)
                     new_known_players.append(p)
                     old_known_players.remove(p)
-                    log.os_log().debug(f'--------------> update {p.unum()}')
+                    log.os_log().debug('--------------> update %s', p.unum())
                     return
         
         min_team_dist = 1000
@@ -704,11 +709,11 @@ class WorldModel:
         candidate_team: Union[None, PlayerObject] = None
         candidate_unknown: Union[None, PlayerObject] = None
 
-        log.os_log().debug(f'------- check with old known B')
+        log.os_log().debug('------- check with old known B')
         for p in old_known_players:
-            log.os_log().debug(f'--------------?? {p}')
+            log.os_log().debug('--------------?? %s', p)
             if p.unum() != UNUM_UNKNOWN and player.unum_ != UNUM_UNKNOWN and p.unum() != player.unum_:
-                log.os_log().debug(f'--------------<< No (unum)')
+                log.os_log().debug('--------------<< No (unum)')
                 continue
             count = p.seen_pos_count()
             old_pos = p.seen_pos()
@@ -718,18 +723,18 @@ class WorldModel:
             
             d = player.pos_.dist(old_pos)
             if d > p.player_type().real_speed_max() * count + player.dist_error_ * 2.0:
-                log.os_log().debug(f'--------------<< No (dist)')
+                log.os_log().debug('--------------<< No (dist)')
                 continue
             
             if d < min_team_dist:
                 min_team_dist = d
                 candidate_team = p
-                log.os_log().debug(f'-------------->> update best candid {min_team_dist} {candidate_team}')
+                log.os_log().debug('-------------->> update best candid %s %s', min_team_dist, candidate_team)
 
-        log.os_log().debug(f'------- check with old unknown')
+        log.os_log().debug('------- check with old unknown')
         for p in old_unknown_players:
             if p.unum() != UNUM_UNKNOWN and player.unum_ != UNUM_UNKNOWN and p.unum() != player.unum_:
-                log.os_log().debug(f'--------------<< No (unum)')
+                log.os_log().debug('--------------<< No (unum)')
                 continue
             
             count = p.seen_pos_count()
@@ -740,13 +745,13 @@ class WorldModel:
             
             d = player.pos_.dist(old_pos)
             if d > p.player_type().real_speed_max() * count + player.dist_error_ * 2.0:
-                log.os_log().debug(f'--------------<< No (dist)')
+                log.os_log().debug('--------------<< No (dist)')
                 continue
             
             if d < min_team_dist:
                 min_unknown_dist = d
                 candidate_unknown = p
-                log.os_log().debug(f'-------------->> update best candid {min_unknown_dist} {candidate_unknown}')
+                log.os_log().debug('-------------->> update best candid %s %s', min_unknown_dist, candidate_unknown)
 
         candidate: Union[None, PlayerObject] = None
         target_list: Union[None, list[PlayerObject]] = None
@@ -762,12 +767,12 @@ class WorldModel:
 
         if candidate is not None and target_list is not None:
             candidate.update_by_see(side, player)
-            log.os_log().debug(f'---> update {candidate.unum()}')
+            log.os_log().debug('---> update %s', candidate.unum())
             new_known_players.append(candidate)
             target_list.remove(candidate)
             return
         new_known_players.append(PlayerObject(side=side, player=player))
-        log.os_log().debug(f'---> add new known player {new_known_players[-1]}')
+        log.os_log().debug('---> add new known player %s', new_known_players[-1])
 
     def check_unknown_player(self,
                              player: Localizer.PlayerT,
@@ -880,11 +885,78 @@ class WorldModel:
         
         new_unknown_players.append(PlayerObject(side=SideID.NEUTRAL, player=player))
     
+    def match_team_players(self,
+                           side: SideID,
+                           players: list[Localizer.PlayerT],
+                           old_known_players: list[PlayerObject],
+                           old_unknown_players: list[PlayerObject],
+                           new_known_players: list[PlayerObject]):
+        """
+        check_team_player of all the seen players of a side in one assignment
+        """
+        matched: list[Union[None, PlayerObject]] = [None] * len(players)
+        for i, player in enumerate(players):
+            if player.unum_ == UNUM_UNKNOWN:
+                continue
+            for p in old_known_players:
+                if p.unum() == player.unum_:
+                    matched[i] = p
+                    old_known_players.remove(p)
+                    break
+
+        rest = [i for i, p in enumerate(matched) if p is None]
+        candidates = old_known_players + old_unknown_players
+        cost = match_costs([players[i] for i in rest], candidates, 2.0, 1000)
+        for row, col in assign(cost):
+            matched[rest[row]] = candidates[col]
+        taken = set(id(p) for p in matched if p is not None)
+        old_known_players[:] = [p for p in old_known_players if id(p) not in taken]
+        old_unknown_players[:] = [p for p in old_unknown_players if id(p) not in taken]
+
+        for player, p in zip(players, matched):
+            if p is None:
+                p = PlayerObject(side=side, player=player)
+                log.os_log().debug('---> add new known player %s', p)
+            else:
+                p.update_by_see(side, player)
+                log.os_log().debug('---> update %s', p.unum())
+            new_known_players.append(p)
+
+    def match_unknown_players(self,
+                              players: list[Localizer.PlayerT],
+                              old_teammates: list[PlayerObject],
+                              old_opponents: list[PlayerObject],
+                              old_unknown_players: list[PlayerObject],
+                              new_teammates: list[PlayerObject],
+                              new_opponents: list[PlayerObject],
+                              new_unknown_players: list[PlayerObject]):
+        """
+        check_unknown_player of all the seen players without side in one assignment
+        """
+        groups = ((old_teammates, new_teammates, self.our_side()),
+                  (old_opponents, new_opponents, self.their_side()),
+                  (old_unknown_players, new_unknown_players, SideID.NEUTRAL))
+        candidates = [p for old_list, _, _ in groups for p in old_list]
+        group_of = [group for group in groups for _ in group[0]]
+        matched = {row: col for row, col in assign(match_costs(players, candidates, 0.0, 100))}
+        taken = set(id(candidates[col]) for col in matched.values())
+        for old_list, _, _ in groups:
+            old_list[:] = [p for p in old_list if id(p) not in taken]
+
+        for row, player in enumerate(players):
+            if row not in matched:
+                new_unknown_players.append(PlayerObject(side=SideID.NEUTRAL, player=player))
+                continue
+            candidate = candidates[matched[row]]
+            _, new_list, side = group_of[matched[row]]
+            candidate.update_by_see(side, player)
+            new_list.append(candidate)
+
     def localize_players(self, see: SeeParser):
         if not self.self().face_valid() or not self.self().pos_valid():
             return
-        if DEBUG:
-            log.os_log().debug(f'{"#"*30} Localize players ')
+        if log.os_debug():
+            log.os_log().debug('############################## Localize players ')
         new_teammates: list[PlayerObject] = []
         new_opponents: list[PlayerObject] = []
         new_unknown_players: list[PlayerObject] = []
@@ -893,37 +965,56 @@ class WorldModel:
         my_vel = self.self().vel()
         my_face = self.self().face()
         my_face_err = self.self().face_error()
+        batch = team_config.BATCH_PLAYER_MATCHING
+        seen_players: list[Localizer.PlayerT] = []
 
-        for p in see.opponents() + see.unknown_opponents():
-            player = self._localizer.localize_player(p, my_face, my_face_err, my_pos, my_vel, self.self().view_width())
-            if DEBUG:
-                log.os_log().debug(f'{"-"*30} opp {player}')
+        for player in self._localizer.localize_players(see.opponents() + see.unknown_opponents(), my_face, my_face_err, my_pos, my_vel,
+                                                       self.self().view_width()):
+            if log.os_debug():
+                log.os_log().debug('------------------------------ opp %s', player)
             if player is None:
                 continue
+            if batch:
+                seen_players.append(player)
+                continue
             self.check_team_player(self.their_side(),
                                    player,
                                    self._opponents,
                                    self._unknown_players,
                                    new_opponents)
+        if batch:
+            self.match_team_players(self.their_side(), seen_players, self._opponents, self._unknown_players,
+                                    new_opponents)
+            seen_players = []
             
-        for p in see.teammates() + see.unknown_teammates():
-            player = self._localizer.localize_player(p, my_face, my_face_err, my_pos, my_vel, self.self().view_width())
-            if DEBUG:
-                log.os_log().debug(f'{"-"*30} mate {player}')
+        for player in self._localizer.localize_players(see.teammates() + see.unknown_teammates(), my_face, my_face_err, my_pos, my_vel,
+                                                       self.self().view_width()):
+            if log.os_debug():
+                log.os_log().debug('------------------------------ mate %s', player)
             if player is None:
                 continue
+            if batch:
+                seen_players.append(player)
+                continue
             self.check_team_player(self.our_side(),
                                    player,
                                    self._teammates,
                                    self._unknown_players,
                                    new_teammates)
-        
-        for p in see.unknown_players():
-            player = self._localizer.localize_player(p, my_face, my_face_err, my_pos, my_vel, self.self().view_width())
-            if DEBUG:
-                log.os_log().debug(f'{"-"*30} unk {player}')
+        if batch:
+            self.match_team_players(self.our_side(), seen_players, self._teammates, self._unknown_players,
+                                    new_teammates)
+            seen_players = []
+        
+        for player in self._localizer.localize_players(see.unknown_players(), my_face, my_face_err, my_pos, my_vel,
+                                                       self.self().view_width()):
+            if log.os_debug():
+                log.os_log().debug('------------------------------ unk %s', player)
             if player is None:
                 continue
+            if batch:
+                seen_players.append(player)
+                continue
             self.check_unknown_player(player,
                                       self._teammates,
                                       self._opponents,
@@ -931,38 +1022,41 @@ class WorldModel:
                                       new_teammates,
                                       new_opponents,
                                       new_unknown_players)
-        if DEBUG:
-            log.os_log().debug(f'{"#"*30} End Localize players ')
+        if batch:
+            self.match_unknown_players(seen_players, self._teammates, self._opponents, self._unknown_players,
+                                       new_teammates, new_opponents, new_unknown_players)
+        if log.os_debug():
+            log.os_log().debug('############################## End Localize players ')
             for t in self._teammates:
-                log.os_log().debug(f'old team {t}')
+                log.os_log().debug('old team %s', t)
             for t in new_teammates:
-                log.os_log().debug(f'new team {t}')
+                log.os_log().debug('new team %s', t)
             for t in self._opponents:
-                log.os_log().debug(f'old team {t}')
+                log.os_log().debug('old team %s', t)
             for t in new_opponents:
-                log.os_log().debug(f'new team {t}')
+                log.os_log().debug('new team %s', t)
             for t in self._unknown_players:
-                log.os_log().debug(f'old unk {t}')
+                log.os_log().debug('old unk %s', t)
             for t in new_unknown_players:
-                log.os_log().debug(f'new unk {t}')
+                log.os_log().debug('new unk %s', t)
         self._teammates += new_teammates
         self._opponents += new_opponents
-        log.os_log().debug(f'opp len {len(self._opponents)} A')
+        log.os_log().debug('opp len %s A', len(self._opponents))
         self._unknown_players += new_unknown_players
         
         all_teammates = sorted(self._teammates, key=player_accuracy_value)
         all_opponents = sorted(self._opponents, key=player_accuracy_value)
-        log.os_log().debug(f'opp len {len(self._opponents)} B')
-        log.os_log().debug(f'opp len {len(all_opponents)} C')
+        log.os_log().debug('opp len %s B', len(self._opponents))
+        log.os_log().debug('opp len %s C', len(all_opponents))
         self._unknown_players.sort(key=player_count_value)
         
         for p in all_teammates[10:] + all_opponents[11:]:
-            log.os_log().debug(f'forget {p}')
+            log.os_log().debug('forget %s', p)
             p.forgot()
-        log.os_log().debug(f'opp len {len(self._opponents)} D')
+        log.os_log().debug('opp len %s D', len(self._opponents))
         self._teammates = list(filter(player_valid_check, self._teammates))
         self._opponents = list(filter(player_valid_check, self._opponents))
-        log.os_log().debug(f'opp len {len(self._opponents)} E')
+        log.os_log().debug('opp len %s E', len(self._opponents))
 
     def update_player_type(self):
         for p in self._teammates:
@@ -992,12 +1086,12 @@ class WorldModel:
             return
         
         self._see_time = current_time.copy()
-        log.sw_log().world().add_text( f"{'*'*20} Update by See {'*'*20}")
-        log.os_log().debug(f"{'#' * 30} Update by See {'#' * 30}")
+        log.sw_log().world().add_text( '******************** Update by See ********************')
+        log.os_log().debug('############################## Update by See ##############################')
 
         if self._their_team_name is None and see.their_team_name() is not None:
             self._their_team_name = see.their_team_name()
-            log.sw_log().world().add_text( f"(update after see) their team name set to {self._their_team_name}")
+            log.sw_log().world().add_text( '(update after see) their team name set to {}', self._their_team_name)
         
         # TODO FULL STATE TIME CHECK
         
@@ -1030,7 +1124,7 @@ class WorldModel:
         else:
             log.os_log().error(f'body_sensor.time()[{body_sensor.time()}] != current_time[{agent_current_time}]')
 
-        if DEBUG:
+        if log.enabled(Level.WORLD):
             log.sw_log().world().add_text("******** update world after sense body ********")
             log.os_log().debug("******** update world after sense body ********")
             log.sw_log().world().add_text(str(self.self()))
@@ -1062,68 +1156,55 @@ class WorldModel:
         if pk_mode:
             pass # TODO PENALTY
     
-    def create_set_player(self,
-                          players: list[PlayerObject],
-                          players_from_self: list[PlayerObject],
-                          players_from_ball: list[PlayerObject],
-                          self_pos: Vector2D,
-                          ball_pos: Vector2D):
-        for p in players:
-            p.update_self_ball_related(self_pos, ball_pos)
-            players_from_self.append(p)
-            players_from_ball.append(p)
-    
+    @staticmethod
+    def sort_by_distance(players: list[PlayerObject], dists: np.ndarray) -> list[PlayerObject]:
+        return [players[i] for i in np.argsort(dists, kind='stable').tolist()]
+
     def update_kickables(self):
-        for p in self._teammates_from_ball:
-            if p.is_ghost() or p.is_tackling() or p.pos_count() > self.ball().pos_count():
-                continue
-            
-            if p.is_kickable(0):
-                self._kickable_teammate = p
-                break
-        for p in self._opponents_from_ball:
-            if p.is_ghost() or p.is_tackling() or p.pos_count() >= 10:
-                continue
-            
-            if p.dist_from_ball() > 5:
-                break
-            
-            if p.is_kickable(0):
-                self._kickable_opponent = p
-                break
-        
-    
+        store = PlayerStore.i()
+        if len(self._teammates_from_ball) > 0:
+            slots = player_slots(self._teammates_from_ball)
+            candidates = ((store.count('ghost_count', slots) == 0)
+                          & ~store.tackle[slots]
+                          & (store.count('pos_count', slots) <= self.ball().pos_count())
+                          & (store.dist_from_ball[slots] < store.kickable_area[slots]))
+            if candidates.any():
+                self._kickable_teammate = self._teammates_from_ball[int(candidates.argmax())]
+
+        if len(self._opponents_from_ball) > 0:
+            slots = player_slots(self._opponents_from_ball)
+            dists = store.dist_from_ball[slots]
+            ignored = (store.count('ghost_count', slots) > 0) | store.tackle[slots] | (store.count('pos_count', slots) >= 10)
+            # players are sorted by distance, the search stops at the first one farther than 5m
+            candidates = ~ignored & (dists < store.kickable_area[slots])
+            far = ~ignored & (dists > 5)
+            if candidates.any():
+                first = int(candidates.argmax())
+                if not far[:first].any():
+                    self._kickable_opponent = self._opponents_from_ball[first]
+
     def update_player_state_cache(self):
+        self._player_index.update(self._teammates, self._opponents + self._unknown_players)
         if not self.self().pos_valid() or not self.ball().pos_valid():
             return
-        
-        self.create_set_player(self._teammates,
-                               self._teammates_from_self,
-                               self._teammates_from_ball,
-                               self.self().pos(),
-                               self.ball().pos())
-        self.create_set_player(self._opponents,
-                               self._opponents_from_self,
-                               self._opponents_from_ball,
-                               self.self().pos(),
-                               self.ball().pos())
-        self.create_set_player(self._unknown_players,
-                               self._opponents_from_self,
-                               self._opponents_from_ball,
-                               self.self().pos(),
-                               self.ball().pos())
-        
-        self._teammates_from_ball.sort(key=lambda p: p.dist_from_ball())
-        self._opponents_from_ball.sort(key=lambda p: p.dist_from_ball())
-        
-        self._teammates_from_self.sort(key=lambda p: p.dist_from_self())
-        self._opponents_from_self.sort(key=lambda p: p.dist_from_self())
+
+        players = self._teammates + self._opponents + self._unknown_players
+        if len(players) > 0:
+            store = PlayerStore.i()
+            slots = player_slots(players)
+            store.update_self_ball_related(slots, self.self().pos(), self.ball().pos())
+            n_teammates = len(self._teammates)
+            others = players[n_teammates:]
+            self._teammates_from_self = self.sort_by_distance(self._teammates, store.dist_from_self[slots[:n_teammates]])
+            self._teammates_from_ball = self.sort_by_distance(self._teammates, store.dist_from_ball[slots[:n_teammates]])
+            self._opponents_from_self = self.sort_by_distance(others, store.dist_from_self[slots[n_teammates:]])
+            self._opponents_from_ball = self.sort_by_distance(others, store.dist_from_ball[slots[n_teammates:]])
         
         # self.estimate_unknown_player_unum() # TODO IMP FUNC?!
         self.estimate_goalie()
 
-        log.sw_log().world().add_text(f'=== GOALIE UNUM ===')
-        log.sw_log().world().add_text(f'our/their goalie: {self._our_goalie_unum}/{self._their_goalie_unum}')
+        log.sw_log().world().add_text('=== GOALIE UNUM ===')
+        log.sw_log().world().add_text('our/their goalie: {}/{}', self._our_goalie_unum, self._their_goalie_unum)
 
 
         self._all_players.append(self.self())
@@ -1251,7 +1332,7 @@ class WorldModel:
     def update_goalie_by_hear(self):
         SP = ServerParam.i()
         # TODO CHECK FULL STATE TIME
-        log.sw_log().world().add_text(f'{"#"*20} UPDATE GOALIE BY HEAR {"#"*20}')
+        log.sw_log().world().add_text('#################### UPDATE GOALIE BY HEAR ####################')
 
         if self._messenger_memory.goalie_time() != self.time() or len(self._messenger_memory.goalie()) == 0:
             return
@@ -1278,9 +1359,7 @@ class WorldModel:
 
         if goalie is not None:
             goalie.update_by_hear(self.their_side(), self._their_goalie_unum,True, heard_pos, heard_body)
-            log.sw_log().world().add_text(f'(update player by hear) '
-                                             f's={self.their_side()} u={self._their_goalie_unum} '
-                                             f'p={heard_pos} b={heard_body}')
+            log.sw_log().world().add_text('(update player by hear) s={} u={} p={} b={}', self.their_side(), self._their_goalie_unum, heard_pos, heard_body)
             return
 
         goalie_speed_max = SP.default_player_speed_max()
@@ -1298,29 +1377,25 @@ class WorldModel:
 
         if goalie is not None:
             goalie.update_by_hear(self.their_side(), self._their_goalie_unum, True, heard_pos, heard_body)
-            log.sw_log().world().add_text(f'(update player by hear) '
-                                             f's={self.their_side()} u={self._their_goalie_unum} '
-                                             f'p={heard_pos} b={heard_body}')
+            log.sw_log().world().add_text('(update player by hear) s={} u={} p={} b={}', self.their_side(), self._their_goalie_unum, heard_pos, heard_body)
         else:
             goalie = PlayerObject()
             self._opponents.append(goalie)
             goalie.update_by_hear(self.their_side(), self._their_goalie_unum, True, heard_pos, heard_body)
-            log.sw_log().world().add_text(f'(update player by hear) '
-                                             f's={self.their_side()} u={self._their_goalie_unum} '
-                                             f'p={heard_pos} b={heard_body}')
+            log.sw_log().world().add_text('(update player by hear) s={} u={} p={} b={}', self.their_side(), self._their_goalie_unum, heard_pos, heard_body)
 
     def update_player_stamina_by_hear(self):
         if self._messenger_memory.recovery_time() == self.time():
             for r in self._messenger_memory.recovery():
                 if 1 <= r.sender_ <= 11:
                     self._our_recovery[r.sender_ - 1] = r.rate_
-                    log.sw_log().world().add_text(f'(update player stamina by hear) u={r.sender_} r={r.rate_}')
+                    log.sw_log().world().add_text('(update player stamina by hear) u={} r={}', r.sender_, r.rate_)
 
         if self._messenger_memory.stamina_time() == self.time():
             for r in self._messenger_memory.stamina():
                 if 1 <= r.sender_ <= 11:
                     self._our_stamina_capacity[r.sender_ - 1] = r.rate_
-                    log.sw_log().world().add_text(f'(update player stamina by hear) u={r.sender_} s={r.rate_}')
+                    log.sw_log().world().add_text('(update player stamina by hear) u={} s={}', r.sender_, r.rate_)
 
     def update_by_full_state_message(self, parser: FullStateWorldMessageParser):
         self._time._cycle = int(parser.dic()['time'])
@@ -1328,17 +1403,22 @@ class WorldModel:
 
         # TODO vmode counters and arm
 
-        self._ball.init_str(parser.dic()['b'])
+        self._ball.init_values(parser.ball())
         self._teammates.clear()
         self._opponents.clear()
         self._unknown_players.clear()
         self._all_players.clear()
         self._our_players.clear()
         self._their_players.clear()
-        for player_dic in parser.dic()['players']:
+        records = parser.players()
+        players = []
+        for row in records.tolist():
             player = PlayerObject()
-            player.init_dic(player_dic)
+            player.init_record(row)
             player.set_player_type(self._player_types[player.player_type_id()])
+            players.append(player)
+        PlayerStore.i().update_by_full_state(player_slots(players), records)
+        for player in players:
             if player.side().value == self._our_side:
                 if player.unum() == self._self_unum:
                     self._self.update_by_player_info(player)
@@ -1351,8 +1431,13 @@ class WorldModel:
         if self._our_side == SideID.RIGHT:
             self.reverse()
 
-        for o in [self.ball()] + self._teammates + self._opponents + self._unknown_players:
-            o.update_more_with_full_state(self)
+        self.ball().update_more_with_full_state(self)
+        others = self._teammates + self._opponents + self._unknown_players
+        rpos = PlayerStore.i().update_more_with_full_state(player_slots(others), self.self().pos(), self.ball().pos())
+        for player, (x, y) in zip(others, rpos.tolist()):
+            player._rpos = Vector2D(x, y)
+            player._rpos_count = 0
+            player._seen_rpos = Vector2D(x, y)
 
     def update_just_before_decision(self, act: 'ActionEffector', current_time: GameTime):
         self._set_play_count += 1
@@ -1380,23 +1465,23 @@ class WorldModel:
                                           self.intercept_table().teammate_reach_cycle(),
                                           self.intercept_table().opponent_reach_cycle())
 
-        if DEBUG:
+        if log.enabled(Level.WORLD):
             log.sw_log().world().add_text('===After processing see message===')
-            log.sw_log().world().add_text(f'self.kickrate={self.self().kick_rate()}')
-            log.sw_log().world().add_text(f'===Our Players=== {len(self.our_players())} {self._name}')
+            log.sw_log().world().add_text('self.kickrate={}', self.self().kick_rate())
+            log.sw_log().world().add_text('===Our Players=== {} {}', len(self.our_players()), self._name)
             for p in self.our_players():
-                log.sw_log().world().add_text(str(p))
-            log.sw_log().world().add_text(f'===Their Players=== {len(self.their_players())} {self._name}')
+                log.sw_log().world().add_text('{}', p)
+            log.sw_log().world().add_text('===Their Players=== {} {}', len(self.their_players()), self._name)
             for p in self.their_players():
-                log.sw_log().world().add_text(str(p))
+                log.sw_log().world().add_text('{}', p)
             log.os_log().debug('===After processing see message===')
             # log.os_log().debug('===Ball===\n' + str(self.ball().long_str()))
-            log.os_log().debug(f'===Our Players=== {len(self.our_players())} {self._name}')
+            log.os_log().debug('===Our Players=== %s %s', len(self.our_players()), self._name)
             # log.os_log().debug('-----------------------')
             # for p in self.our_players():
             #     log.os_log().debug('-----------------------')
             #     log.os_log().debug(str(self.self()) if p.is_self() else str(p.long_str()))
-            log.os_log().debug(f'===Their Players=== {len(self.their_players())} {self._name}')
+            log.os_log().debug('===Their Players=== %s %s', len(self.their_players()), self._name)
             # for p in self.their_players():
             #     log.os_log().debug('-----------------------')
             #     log.os_log().debug(str(p.long_str()))
@@ -1422,7 +1507,7 @@ class WorldModel:
     
     def update_players_by_hear(self):
         # TODO FULLSTATTE MODE CHECK
-        log.sw_log().world().add_text(f'{"#"*20} UPDATE PLAYER BY HEAR {"#"*20}')
+        log.sw_log().world().add_text('#################### UPDATE PLAYER BY HEAR ####################')
 
         if self._messenger_memory.player_time() != self.time() or len(self._messenger_memory.players()) == 0:
             return
@@ -1466,8 +1551,7 @@ class WorldModel:
                         unknown = p
             if target_player:
                 target_player.update_by_hear(side, unum, False, player.pos_, player.body_)
-                log.sw_log().world().add_text(f'(update player by hear) updating player '
-                                                 f's={side} u={unum} p={player.pos_} b={player.body_}')
+                log.sw_log().world().add_text('(update player by hear) updating player s={} u={} p={} b={}', side, unum, player.pos_, player.body_)
 
                 if unknown:
                     players.append(unknown)
@@ -1481,8 +1565,7 @@ class WorldModel:
                     
                     self._opponents.append(target_player)
                 target_player.update_by_hear(side, unum, False, player.pos_, player.unum_)
-                log.sw_log().world().add_text(f'(update player by hear) adding player '
-                                                 f's={side} u={unum} p={player.pos_} b={player.body_}')
+                log.sw_log().world().add_text('(update player by hear) adding player s={} u={} p={} b={}', side, unum, player.pos_, player.body_)
 
             if target_player:
                 if side == self.our_side():
@@ -1500,7 +1583,7 @@ class WorldModel:
     def update_ball_by_hear(self, act: 'ActionEffector'):
         # TODO CHECK FULLSTATE MODE
 
-        log.sw_log().world().add_text(f'{"#"*20} UPDATE BALL BY HEAR {"#"*20}')
+        log.sw_log().world().add_text('#################### UPDATE BALL BY HEAR ####################')
         if self._messenger_memory.ball_time() != self.time() or len(self._messenger_memory.balls()) == 0:
             return
         
@@ -1532,8 +1615,7 @@ class WorldModel:
 
         if heared_pos.is_valid():
             self._ball.update_by_hear(act, min_dist, heared_pos, heared_vel)
-            log.sw_log().world().add_text(f'(update ball by hear) '
-                                             f'p={heared_pos} v={heared_vel}')
+            log.sw_log().world().add_text('(update ball by hear) p={} v={}', heared_pos, heared_vel)
 
     def update_dir_count(self, varea: ViewArea):
         dir_buf = (WorldModel.DIR_STEP*0.5+1
@@ -1626,7 +1708,7 @@ class WorldModel:
                 if p.unum() == UNUM_UNKNOWN and p.pos_count() >= 10 and p.ghost_count() >= 2:
                     removing_opponents.append(p)
                     continue
-                log.sw_log().world().add_text(f'opponent is going to be a ghost: {p}')
+                log.sw_log().world().add_text('opponent is going to be a ghost: {}', p)
                 p.set_ghost()
         for p in removing_opponents:
             self._opponents.remove(p)
@@ -1698,7 +1780,7 @@ class WorldModel:
         if not (1 <= unum <= 11):
             return
 
-        log.sw_log().world().add_text(f'(ste ourplayer type) unum={unum}, type={player_type_id}')
+        log.sw_log().world().add_text('(ste ourplayer type) unum={}, type={}', unum, player_type_id)
 
         self._our_recovery[unum - 1] = 1.
         self._our_stamina_capacity[unum - 1] = ServerParam.i().stamina_capacity()
@@ -1717,11 +1799,6 @@ class WorldModel:
         return self._set_play_count
 
     def exist_teammates_in(self, region: Region2D, count_thr: int, with_goalie: bool):
-        for p in self._teammates:
-            if p is None:
-                continue
-            if p.pos_count() > count_thr or p.is_ghost():
-                continue
-            if region.contains(p.pos()):
-                return True
-        return False
+        index = self._player_index
+        rows = index.filter(index.teammate_rows(), count_thr)
+        return bool(index.contains(region, rows).any())
@@ -5,6 +5,9 @@ from pyrusgeom.geom_2d import *
 
 
 class PlayerType:
+    _default: 'PlayerType' = None
+    _parsed: dict[str, 'PlayerType'] = {}
+
     def __init__(self):
         self._id = 0
         self._player_speed_max = 1.05
@@ -58,6 +61,25 @@ class PlayerType:
         parser.parse(message)
         self.set_data(parser.dic()['player_type'])
 
+    @staticmethod
+    def default() -> 'PlayerType':
+        if PlayerType._default is None:
+            PlayerType._default = PlayerType()
+        return PlayerType._default
+
+    @staticmethod
+    def from_message(message: str) -> 'PlayerType':
+        """
+        player types are not changed after parsing,
+        so all the world models of the process share one instance per message.
+        """
+        player_type = PlayerType._parsed.get(message)
+        if player_type is None:
+            player_type = PlayerType()
+            player_type.parse(message)
+            PlayerType._parsed[message] = player_type
+        return player_type
+
     def id(self):
         return self._id
 
@@ -294,6 +294,8 @@ FOUL_CYCLES = 5
 
 class _ServerParam:  # TODO specific TYPES and change them
     def __init__(self):
+        self._last_message: str = ''
+
         self._goal_width = DEFAULT_GOAL_WIDTH
         self._inertia_moment = DEFAULT_INERTIA_MOMENT
 
@@ -707,9 +709,13 @@ class _ServerParam:  # TODO specific TYPES and change them
         # self._min_catch_angle = dic["min_catch_angle"]
 
     def parse(self, message):
+        # every agent of a single process team receives the same message
+        if message == self._last_message:
+            return
         dic = MessageParamsParser().parse(message)
         self.set_data(dic['server_param'])
         self.set_additional_param()
+        self._last_message = message
     
     def set_additional_param(self):
         self._kickable_area = self._kickable_margin + self._ball_size + self._player_size
@@ -1,4 +1,10 @@
 #!/usr/bin/python3
+import sys
+if '--profile-startup' in sys.argv:
+    # before the other imports, to time them too
+    from lib.debug.startup_profile import start_profile
+    start_profile()
+
 import argparse
 import team_config
 from lib.debug.debug import log
@@ -10,32 +16,87 @@ parser.add_argument('--coach', action='store_true', help='Run a coach')
 parser.add_argument('--goalie', action='store_true', help='Run a goalie')
 parser.add_argument('-t', '--team-name', help='Team name to display')
 parser.add_argument('-H', '--host', help='Server IP address')
-parser.add_argument('-p', '--player-port', help='Server Player port')
-parser.add_argument('-P', '--coach-port', help='Server Coach port')
-parser.add_argument('--trainer-port', help='Server Trainer port')
+parser.add_argument('-p', '--player-port', type=int, help='Server Player port')
+parser.add_argument('-P', '--coach-port', type=int, help='Server Coach port')
+parser.add_argument('--trainer-port', type=int, help='Server Trainer port')
 parser.add_argument('--log-path', help='Path to store logs')
 parser.add_argument('--file-log-level', help='Log level for file')
 parser.add_argument('--console-log-level', help='Log level for console')
 parser.add_argument('--disable-file-log', action='store_true', help='Disable file logging')
+parser.add_argument('--sw-log-levels', help='Comma separated soccer window log levels (e.g. intercept,pass), any or none')
+parser.add_argument('--disable-debug-client', action='store_true', help='Disable the debug client messages')
+parser.add_argument('--record', help='Record the received and sent datagrams of the agents in this directory')
+parser.add_argument('--async-runtime', action='store_true', help='Run the agent on the asyncio event loop')
+parser.add_argument('--oracle-full-state', action='store_true',
+                    help='With fullstate on, decide on the full world only, without see parsing and localization')
+parser.add_argument('--team', action='store_true', help='Run the goalie, ten players and the coach in this process')
+parser.add_argument('--profile-startup', action='store_true',
+                    help='Print the import time of the modules and the startup phases when the agents are connected')
+parser.add_argument('--profile-cycles',
+                    help='Write the phase times of every decision of the players in this directory (JSON lines)')
+parser.add_argument('--telemetry', help='Write the latency and missed action metrics of the players in this directory')
+parser.add_argument('--telemetry-format', choices=['prometheus', 'json'], help='Format of the --telemetry files')
 args = parser.parse_args()
 
 team_config.update_team_config(args)
 
-from base.sample_coach import SampleCoach
-from base.sample_player import SamplePlayer
-import sys
+from lib.debug.startup_profile import profile
+
+
+def mark(phase: str):
+    if profile() is not None:
+        profile().mark(phase)
+
+
+def run_team():
+    from base.sample_coach import SampleCoach
+    from base.sample_player import SamplePlayer
+    from lib.player.agent_runtime import run_agents
+    import asyncio
+    mark('imports')
+    if profile() is not None:
+        profile().set_agents(12)
+    agents = [SamplePlayer(True)] + [SamplePlayer() for _ in range(10)] + [SampleCoach()]
+    mark('agents')
+    try:
+        asyncio.run(run_agents(agents, start_interval=0.1))
+    except KeyboardInterrupt:
+        print("\nApplication interrupted. Exiting...")
+        sys.exit(0)
+
 
-        
 def main():
+    mark('arguments')
+    if team_config.SINGLE_PROCESS_TEAM:
+        run_team()
+        return
+
+    # only the modules of the agent are imported, a coach does not need the decision making of the players
     if args.player:
+        from base.sample_player import SamplePlayer
+        mark('imports')
         agent = SamplePlayer()
     elif args.coach:
+        from base.sample_coach import SampleCoach
+        mark('imports')
         agent = SampleCoach()
     elif args.goalie:
+        from base.sample_player import SamplePlayer
+        mark('imports')
         agent = SamplePlayer(True)
     else:
         print("Please specify --player or --coach")
         return
+    mark('agent')
+
+    if team_config.USE_ASYNC_RUNTIME:
+        from lib.player.agent_runtime import run_agent
+        try:
+            run_agent(agent)
+        except KeyboardInterrupt:
+            print("\nApplication interrupted. Exiting...")
+            sys.exit(0)
+        return
         
     if not agent.handle_start():
         agent.handle_exit()
@@ -8,13 +8,32 @@ LOG_PATH = f'logs/{datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}'
 FILE_LOG_LEVEL = logging.ERROR
 DISABLE_FILE_LOG = False
 CONSOLE_LOG_LEVEL = logging.ERROR
+SW_LOG_LEVELS = 'any'  # comma separated lib.debug.level.Level names (e.g. 'intercept,pass'), 'any' or 'none'
+USE_DEBUG_CLIENT = True
+# soccer window logs and debug client messages are written by a background thread (lib/debug/log_writer.py)
+LOG_BUFFER_SIZE = 1024  # max queued writes, about two per agent and cycle
+LOG_BUFFER_POLICY = 'drop'  # drop: drop new writes when the buffer is full, block: wait LOG_BUFFER_BLOCK_TIMEOUT sec first
+LOG_BUFFER_BLOCK_TIMEOUT = 0.01
 HOST = 'localhost'
 PLAYER_PORT = 6000
 TRAINER_PORT = 6001
 COACH_PORT = 6002
 DEBUG_CLIENT_PORT = 6032
+KICK_TABLE_PATH = 'data/kick_tables'
+FORMATION_GRID_STEP = None  # meters, look the formation positions up in a precomputed pitch grid, None to interpolate
+FORMATION_CACHE_PATH = 'data/formations'  # triangulations and grids of the formations, None to compute them in every agent
+RECORD_DIR = None  # record the datagrams of every agent in this directory, see lib/player/replay.py
+CYCLE_PROFILE_DIR = None  # phase times of every decision of the players in this directory, see lib/debug/cycle_profile.py
+TELEMETRY_DIR = None  # latency and missed action metrics of every player in this directory, see lib/debug/agent_telemetry.py
+TELEMETRY_FORMAT = 'prometheus'  # prometheus: .prom text files (node_exporter textfile collector), json: .json files
+TELEMETRY_INTERVAL = 100  # decisions between two writes of the metrics, they are written at exit too
 
 SOCKET_INTERVAL = 0.01
+DECISION_TIME_BUDGET_MSEC = 50  # from the sense_body message of the cycle, anytime generators stop when it is over
+INCREMENTAL_INTERCEPT_TABLE = False  # shift the ball cache of the last cycle if the ball follows it, exact if unseen
+BATCH_PLAYER_MATCHING = True  # match the players of a see message in one assignment, False: one by one greedily
+USE_ASYNC_RUNTIME = False
+SINGLE_PROCESS_TEAM = False
 WAIT_TIME_THR_SYNCH_VIEW = 30
 WAIT_TIME_THR_NOSYNCH_VIEW = 75
 
@@ -22,6 +41,7 @@ PLAYER_VERSION = 18
 COACH_VERSION = 18
 
 WORLD_IS_FULL_WORLD_IF_EXIST = True
+ORACLE_FULL_STATE = False  # fullstate on: only the full world is updated, no see parsing and no localization
 WORLD_IS_REAL_WORLD = True
 S_WORLD_IS_REAL_WORLD = False
 
@@ -55,4 +75,32 @@ def update_team_config(args):
         team_config.CONSOLE_LOG_LEVEL = getattr(logging, args.console_log_level.upper(), logging.INFO)
         
     if args.disable_file_log:
-        team_config.DISABLE_FILE_LOG = args.disable_file_log
\ No newline at end of file
+        team_config.DISABLE_FILE_LOG = args.disable_file_log
+
+    if args.sw_log_levels is not None:
+        team_config.SW_LOG_LEVELS = args.sw_log_levels
+
+    if args.disable_debug_client:
+        team_config.USE_DEBUG_CLIENT = False
+
+    if args.record:
+        team_config.RECORD_DIR = args.record
+
+    if args.profile_cycles:
+        team_config.CYCLE_PROFILE_DIR = args.profile_cycles
+
+    if args.telemetry:
+        team_config.TELEMETRY_DIR = args.telemetry
+
+    if args.telemetry_format:
+        team_config.TELEMETRY_FORMAT = args.telemetry_format
+
+    if args.async_runtime:
+        team_config.USE_ASYNC_RUNTIME = args.async_runtime
+
+    if args.oracle_full_state:
+        team_config.ORACLE_FULL_STATE = args.oracle_full_state
+
+    if args.team:
+        team_config.SINGLE_PROCESS_TEAM = args.team
+        team_config.USE_ASYNC_RUNTIME = True
\ No newline at end of file
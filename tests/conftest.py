@@ -0,0 +1,9 @@
+import atexit
+import shutil
+import tempfile
+
+import team_config
+
+# the agents of the tests write their logs (and stderr) in a temporary directory, not in logs/ of the repository
+team_config.LOG_PATH = tempfile.mkdtemp(prefix='pyrus-test-logs-')
+atexit.register(shutil.rmtree, team_config.LOG_PATH, True)
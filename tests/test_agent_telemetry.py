@@ -0,0 +1,66 @@
+import json
+
+import team_config
+from base.sample_player import SamplePlayer
+from fixtures.messages import COUNTS, SENSE_BODY
+from fixtures.recordings import synthesize
+from lib.debug.agent_telemetry import Histogram
+from lib.player.replay import Replay
+from lib.player_command.player_command import CommandType
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram((1, 2, 5), '')
+    for value in (0.5, 1, 1.5, 3, 7, 9):
+        histogram.observe(value)
+    assert histogram.buckets() == [('1', 2), ('2', 3), ('5', 4), ('+Inf', 6)]
+    assert histogram.count() == 6 and histogram.sum() == 22
+
+
+def replay_with_telemetry(tmp_path, monkeypatch, telemetry_format: str) -> SamplePlayer:
+    path = str(tmp_path / 'player.rec')
+    synthesize(path, 5)
+    monkeypatch.setattr(team_config, 'TELEMETRY_DIR', str(tmp_path / 'metrics'))
+    monkeypatch.setattr(team_config, 'TELEMETRY_FORMAT', telemetry_format)
+    agents = []
+
+    def agent(goalie: bool):
+        agents.append(SamplePlayer(goalie))
+        return agents[-1]
+
+    result = Replay(path).run(agent)
+    assert result.cycles == 5 and result.mismatches == 0
+    return agents[-1]
+
+
+def test_replay_metrics(tmp_path, monkeypatch):
+    agent = replay_with_telemetry(tmp_path, monkeypatch, 'json')
+    telemetry = agent.telemetry()
+    assert telemetry.counter('decisions_total') == 5
+    assert telemetry.histogram('sense_to_send_seconds').count() == 5
+    assert telemetry.histogram('see_offset_seconds').count() == 5
+    assert telemetry.counter('missed_cycles_total') == 0
+
+    # no commands in cycles 6 and 7
+    counts = {c: agent._effector._command_counter[CommandType[c].value] for c in COUNTS}
+    for t in (6, 7, 8):
+        agent.parse_message(SENSE_BODY.format(time=t, **counts))
+    assert telemetry.counter('missed_cycles_total') == 2
+
+    telemetry.close()
+    with open(telemetry.path()) as f:
+        metrics = json.load(f)
+    assert telemetry.path().endswith('.json') and metrics['unum'] == '9' and metrics['cycle'] == 5
+    assert metrics['counters']['decisions_total'] == 5
+    assert metrics['histograms']['messages_per_decision']['buckets']['+Inf'] == 5
+
+
+def test_prometheus_text(tmp_path, monkeypatch):
+    telemetry = replay_with_telemetry(tmp_path, monkeypatch, 'prometheus').telemetry()
+    telemetry.close()
+    with open(telemetry.path()) as f:
+        text = f.read()
+    assert telemetry.path().endswith('.prom')
+    assert 'pyrus_decisions_total{team="HELIOS_base",unum="9"} 5\n' in text
+    assert 'pyrus_sense_to_send_seconds_bucket{team="HELIOS_base",unum="9",le="+Inf"} 5\n' in text
+    assert '# TYPE pyrus_see_offset_seconds histogram\n' in text
@@ -0,0 +1,64 @@
+from fixtures.recordings import read_profile, replay_profiled, synthesize
+from lib.debug.cycle_profile import CycleProfile, profile_method
+from lib.player.replay import Replay
+
+
+class Generator:
+    def generator(self, profile: CycleProfile):
+        profile.enter('candidate')
+        profile.leave()
+        return 1
+
+
+class Evaluator:
+    def generator(self):
+        return 1
+
+
+def test_nested_scopes(tmp_path):
+    profile = CycleProfile(str(tmp_path / 'profile.jsonl'))
+    profile_method(Generator, 'generator', 'pass')
+    for cycle in range(4):
+        profile.enter('decision')
+        assert Generator().generator(profile) == 1
+        profile.leave()
+        profile.end_cycle({'cycle': cycle})
+    assert Generator().generator(profile) == 1  # outside the scopes of the profile
+    profile.close()
+    lines, summary = read_profile(profile.path())
+    assert [line['cycle'] for line in lines] == [0, 1, 2, 3]
+    assert set(lines[0]['scopes']) == {'decision', 'decision/pass', 'decision/pass/candidate'}
+    assert summary['decision/pass']['count'] == 4
+    assert summary['decision']['p50'] <= summary['decision']['p95'] <= summary['decision']['p99']
+
+
+def test_generators_of_another_agent(tmp_path):
+    first = CycleProfile(str(tmp_path / 'first.jsonl'))
+    second = CycleProfile(str(tmp_path / 'second.jsonl'))
+    profile_method(Evaluator, 'generator', 'pass')
+    first.enter('decision')
+    first.leave()
+    Evaluator().generator()  # an agent without profile, after the decision of the first one
+    first.enter('decision')
+    second.enter('decision')
+    Evaluator().generator()
+    second.leave()
+    Evaluator().generator()
+    first.leave()
+    for profile in (first, second):
+        profile.end_cycle({})
+        profile.close()
+        (line,), _ = read_profile(profile.path())
+        assert set(line['scopes']) == {'decision', 'decision/pass'}
+
+
+def test_profiled_replay_repeats_recorded_decisions(tmp_path):
+    path = str(tmp_path / 'player.rec')
+    synthesize(path, 5)
+    result, profile = replay_profiled(Replay(path), str(tmp_path))
+    assert result.cycles == 5 and result.mismatches == 0
+    lines, summary = read_profile(profile)
+    assert [line['cycle'] for line in lines] == [1, 2, 3, 4, 5]
+    assert lines[0]['game_mode'] == 'play_on'
+    for scope in ('parse/see', 'action/world update', 'action/decision', 'action/send'):
+        assert summary[scope]['count'] == 5
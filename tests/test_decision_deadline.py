@@ -0,0 +1,41 @@
+import time
+
+from base.generator_dribble import BhvDribbleGen
+from base.generator_pass import BhvPassGen
+from fixtures.worlds import make_world
+from lib.player.decision_deadline import DecisionDeadline
+
+
+def test_budgets_share_the_time_left_and_count_overruns():
+    deadline = DecisionDeadline(1000)
+    deadline.start()
+    with deadline.budget('shoot', 0.25) as budget:
+        assert not budget.expired() and 0.2 < budget.remaining() <= 0.25
+    assert deadline.overruns() == {}
+
+    deadline = DecisionDeadline(0)
+    deadline.start()
+    for _ in range(2):
+        with deadline.budget('pass', 0.7) as budget:
+            assert budget.expired() and budget.remaining() == 0
+    assert deadline.expired() and deadline.overruns() == {'pass': 2}
+
+
+def test_deadline_counts_from_the_sense_body_message():
+    deadline = DecisionDeadline(1000)
+    deadline.start(time.perf_counter() - 0.4)
+    assert 0.5 < deadline.remaining() <= 0.6
+    deadline.start(time.perf_counter() - 1.0)
+    assert deadline.expired()
+
+
+def test_used_up_budget_still_gives_the_first_candidates():
+    for seed in (None, 1, 2, 3):
+        wm = make_world(seed)
+        deadline = DecisionDeadline(0)
+        deadline.start()
+        with deadline.budget('pass') as budget:
+            passes = BhvPassGen().generator(wm, budget)
+        with deadline.budget('dribble') as budget:
+            dribbles = BhvDribbleGen().generator(wm, budget)
+        assert 0 < len(passes) <= len(BhvPassGen().generator(wm)) and len(dribbles) > 0
@@ -0,0 +1,91 @@
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+import team_config
+from pyrusgeom.geom_2d import *
+
+from lib.formation.delaunay_triangulation import Formation
+
+# positions of the linear triangle scan and Vector2D interpolation before the triangle index
+# (benchmarks.formation.LegacyFormation) at random ball positions of every formation
+EXPECTED = os.path.join(os.path.dirname(__file__), 'data', 'formation_positions.json')
+
+# an agent process reading the formations of the first cycles, prints if scipy was imported
+FIRST_CYCLES = """
+import sys
+import team_config
+team_config.DISABLE_FILE_LOG = True
+team_config.FORMATION_CACHE_PATH = sys.argv[1] or None
+import base.sample_player
+from base.strategy_formation import StrategyFormation
+for name in ('before_kick_off', 'offense', 'defense'):
+    StrategyFormation.i().formation(name)
+print('scipy' in sys.modules)
+"""
+
+
+def grid_files(path) -> list[str]:
+    return [f for f in os.listdir(path) if f.startswith('grid_')]
+
+
+def first_cycles_import_scipy(cache: str) -> bool:
+    out = subprocess.run([sys.executable, '-c', FIRST_CYCLES, cache], capture_output=True, text=True, check=True).stdout
+    return out.splitlines()[-1] == 'True'
+
+
+def random_points(count: int) -> list[Vector2D]:
+    rng = random.Random(0)
+    return [Vector2D(rng.uniform(-56, 56), rng.uniform(-37, 37)) for _ in range(count)]
+
+
+def positions(formation: Formation, point: Vector2D):
+    formation.update(point)
+    return [(p.x(), p.y()) for p in formation.get_poses()]
+
+
+def test_triangle_index_matches_linear_scan():
+    with open(EXPECTED) as f:
+        expected = json.load(f)
+    for name, points in expected.items():
+        indexed = Formation(f'base/formation_dt/{name}.conf', grid_step=0)
+        for x, y, players in points:
+            assert [[round(px, 6), round(py, 6)] for px, py in positions(indexed, Vector2D(x, y))] == players
+        # the players of a training ball position are the trained ones
+        for ball, players in zip(indexed._balls, indexed._players):
+            got = positions(indexed, Vector2D(ball[0], ball[1]))
+            assert [c for p in got for c in p] == pytest.approx([c for p in players for c in p])
+
+
+def test_grid_is_cached_per_conf(tmp_path, monkeypatch):
+    monkeypatch.setattr(team_config, 'FORMATION_CACHE_PATH', str(tmp_path))
+    path = 'base/formation_dt/kickin_our_formation.conf'
+    grid = Formation(path, grid_step=5.0)
+    assert len(grid_files(tmp_path)) == 1
+    exact = Formation(path, grid_step=0)
+    node = Vector2D(-52.5 + 5.0 * 7, -34 + 5.0 * 4)
+    assert positions(grid, node) == positions(exact, node)
+
+    loaded = Formation(path, grid_step=5.0)
+    assert len(grid_files(tmp_path)) == 1
+    assert positions(loaded, Vector2D(3.3, -7.1)) == positions(grid, Vector2D(3.3, -7.1))
+    Formation(path, grid_step=2.5)
+    assert len(grid_files(tmp_path)) == 2
+
+
+def test_triangulation_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(team_config, 'FORMATION_CACHE_PATH', str(tmp_path))
+    path = 'base/formation_dt/offense_formation.conf'
+    computed = Formation(path, grid_step=0)
+    assert os.path.exists(computed.triangulation_file())
+    loaded = Formation(path, grid_step=0)
+    assert loaded._balls == computed._balls and loaded._players == computed._players
+    for point in random_points(200):
+        assert positions(loaded, point) == positions(computed, point)
+
+    assert first_cycles_import_scipy('')
+    first_cycles_import_scipy(str(tmp_path))  # the other formations of the first cycles
+    assert not first_cycles_import_scipy(str(tmp_path))
@@ -0,0 +1,21 @@
+import random
+
+from pyrusgeom.geom_2d import *
+
+from fixtures.worlds import ball_cache, make_world, randomize
+from lib.action.intercept_player import PlayerIntercept, PlayerInterceptBatch
+
+
+def test_batched_intercept_matches_player_intercept():
+    wm = make_world()
+    players = [p for p in wm.teammates() + wm.opponents() if p is not None and p.unum() != wm.self().unum()]
+    for seed in range(20):
+        rng = random.Random(seed)
+        randomize(wm, players, rng)
+        cache = ball_cache(wm, rng.randint(1, 100))
+        reach, final = PlayerInterceptBatch(wm, cache).predict(players)
+        scalar = PlayerIntercept(wm, cache)
+        for i, p in enumerate(players):
+            for max_cycle in (0, 3, 10, 30, 1000):
+                cycle = reach[i] if reach[i] < max_cycle else final[i]
+                assert cycle == scalar.predict(p, p.player_type(), max_cycle)
@@ -0,0 +1,42 @@
+import json
+import os
+import random
+
+from fixtures.worlds import make_world, randomize_self, self_ball_cache
+from lib.action.intercept_self import SelfIntercept
+from lib.player.stamina_model import StaminaModel
+
+# solutions of the cycle by cycle dash simulation before the batched long step dashes
+# (benchmarks.intercept.LegacySelfIntercept) for randomize_self with the seeds 0..9 on make_world()
+EXPECTED = os.path.join(os.path.dirname(__file__), 'data', 'self_intercept.json')
+
+
+def intercept_table(infos):
+    return [[i.mode().value, i.turn_cycle(), i.dash_cycle(), round(i.dash_power(), 6),
+             round(i.dash_angle().degree(), 6), round(i.self_pos().x(), 6), round(i.self_pos().y(), 6),
+             round(i.ball_dist(), 6), round(i.stamina(), 6)] for i in infos]
+
+
+def test_batched_long_step_matches_legacy():
+    with open(EXPECTED) as f:
+        expected = json.load(f)
+    wm = make_world()
+    for seed, solutions in enumerate(expected):
+        randomize_self(wm, random.Random(seed))
+        cache = self_ball_cache(wm)
+        batched = []
+        SelfIntercept(wm, cache).predict(min(100, len(cache)), batched)
+        assert intercept_table(batched) == solutions
+
+
+def test_simulate_waits():
+    wm = make_world()
+    ptype = wm.self().player_type()
+    for stamina, effort, recovery, capacity in ((8000, 1, 1, -1), (1500, 0.8, 0.7, 130600), (3000, 0.6, 1, 50)):
+        waits = StaminaModel(stamina, effort, recovery, capacity)
+        waits.simulate_waits(ptype, 40)
+        one_by_one = StaminaModel(stamina, effort, recovery, capacity)
+        for _ in range(40):
+            one_by_one.simulate_wait(ptype)
+        assert (waits.stamina(), waits.effort(), waits.recovery(), waits.capacity()) == \
+               (one_by_one.stamina(), one_by_one.effort(), one_by_one.recovery(), one_by_one.capacity())
@@ -0,0 +1,37 @@
+import random
+
+import team_config
+from pyrusgeom.geom_2d import *
+
+from fixtures.worlds import make_world, play_cycle, randomize, randomize_self
+from lib.action.intercept_table import InterceptTable
+
+
+def test_incremental_table_reuses_the_last_cycle(monkeypatch):
+    wm = make_world()
+    players = wm.teammates_from_ball() + wm.opponents_from_ball()
+    rng = random.Random(3)
+    randomize(wm, players, rng)
+    randomize_self(wm, rng)
+    wm.ball()._vel = Vector2D(1.5, 0.5)
+    wm._exist_kickable_opponents = wm._exist_kickable_teammates = False
+    for p in players:
+        p._vel = Vector2D(0.01, 0)
+        p._seen_vel_count = p._vel_count = 0
+
+    full = InterceptTable()
+    incremental = InterceptTable()
+    for cycle in range(1, 12):
+        play_cycle(wm, players, rng)
+        for table, incremental_table in ((full, False), (incremental, True)):
+            monkeypatch.setattr(team_config, 'INCREMENTAL_INTERCEPT_TABLE', incremental_table)
+            table.update(wm)
+
+        if wm.ball().seen_pos_count() > 0:
+            # an unseen ball follows the cache of the last cycle
+            assert [(b.x(), b.y()) for b in incremental._ball_cache] == [(b.x(), b.y()) for b in full._ball_cache]
+            assert incremental._player_cycles == full._player_cycles
+        assert incremental._player_cycles.keys() == full._player_cycles.keys()
+
+    assert incremental.ball_cache_hits() > 0 and incremental.ball_cache_misses() > 0
+    assert full.ball_cache_hits() == 0
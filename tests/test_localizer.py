@@ -0,0 +1,33 @@
+import random
+
+from pyrusgeom.sector_2d import Sector2D
+from pyrusgeom.vector_2d import Vector2D
+import numpy as np
+
+from lib.player.localizer import Localizer, sector_contains
+from lib.player.sensor.visual_sensor import SeeParser
+from lib.rcsc.game_time import GameTime
+from lib.rcsc.types import ViewWidth
+
+message = '(see 245 ((f c) 15.5 2 0 1.3) ((f c b) 48.9 16) ((f r t) 60.9 -86) ((f r b) 75.2 -27) ((f l b) 67.4 67) ((f g r b) 61.6 -47) ((g r) 59.7 -53) ((f g r t) 58.6 -60) ((f g l b) 51.9 88) ((f p r b) 54.1 -27) ((f p r c) 43.8 -48) ((f p r t) 41.7 -75) ((f p l b) 46.5 64) ((f p l c) 33.8 87) ((f b 0) 54.1 17) ((f b r 10) 55.7 7) ((f b r 20) 59.1 -3) ((f b r 30) 64.1 -11) ((f b r 40) 70.1 -18) ((f b r 50) 76.7 -23) ((f b l 10) 53.5 28) ((f b l 20) 55.7 38) ((f b l 30) 59.1 47) ((f b l 40) 64.1 55) ((f b l 50) 69.4 62) ((f r 0) 64.7 -54) ((f r t 10) 62.8 -63) ((f r t 20) 62.8 -72) ((f r t 30) 64.7 -81) ((f r b 10) 67.4 -46) ((f r b 20) 71.5 -39) ((f r b 30) 76.7 -32) ((f l b 10) 57.4 87) ((f l b 20) 62.8 79) ((f l b 30) 68.7 72) ((b) 33.1 -81 0.662 0.9) ((l b) 52.5 -67))'
+
+
+def test_sector_contains():
+    rnd = random.Random(7)
+    points = np.array([[rnd.uniform(-60, 60), rnd.uniform(-40, 40)] for _ in range(2000)])
+    for start, end in ((-30, 30), (150, 210), (170, -170), (-200, -100), (10, 10.5)):
+        center = Vector2D(rnd.uniform(-50, 50), rnd.uniform(-30, 30))
+        sector = Sector2D(center, 5.0, 40.0, start, end)
+        expected = [sector.contains(Vector2D(x, y)) for x, y in points]
+        assert list(sector_contains(points, center, 5.0, 40.0, start, end)) == expected
+
+
+def test_localize_self():
+    see = SeeParser()
+    see.parse(message, 'HELIOS_base', GameTime(-1, -1))
+    localizer = Localizer()
+    face, face_error = localizer.estimate_self_face(see, ViewWidth.NORMAL)
+    pos, pos_err, _ = localizer.localize_self(see, ViewWidth.NORMAL, face, face_error)
+    # position of the Vector2D particle localizer on this message
+    assert pos.dist(Vector2D(-5.346, -14.513)) < 0.05
+    assert 0.0 < pos_err.x() < 0.1 and 0.0 < pos_err.y() < 0.1
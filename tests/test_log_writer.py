@@ -0,0 +1,42 @@
+import io
+import threading
+
+from lib.debug.log_writer import LogWriter, DROP
+
+
+class SlowSink(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.writes = 0
+
+    def write(self, data):
+        self.entered.set()
+        self.release.wait()
+        self.writes += 1
+        return super().write(data)
+
+
+def test_full_buffer_drops_and_batches_writes():
+    writer = LogWriter(capacity=2, policy=DROP)
+    sink = SlowSink()
+    assert writer.put(sink, 'a')
+    assert sink.entered.wait(1.0)  # the writer thread holds 'a' in the slow write
+    assert writer.put(sink, 'b') and writer.put(sink, 'c')
+    assert not writer.put(sink, 'dd')
+    assert writer.dropped() == 1 and writer.dropped_bytes() == 2
+
+    sink.release.set()
+    assert writer.flush(1.0)
+    writer.close()
+    assert sink.getvalue() == 'abc'
+    assert sink.writes == 2 and writer.written() == 3
+
+
+def test_close_reports_the_drops_once(capsys):
+    writer = LogWriter(capacity=0, policy=DROP)
+    assert not writer.put(io.StringIO(), 'a')
+    writer.close()
+    writer.close()
+    assert capsys.readouterr().err == 'log writer dropped 1 writes (1 bytes)\n'
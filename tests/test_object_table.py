@@ -0,0 +1,40 @@
+from pyrusgeom.vector_2d import Vector2D
+
+from fixtures.messages import SEE
+from lib.player.localizer import Localizer
+from lib.player.object_table import LANDMARK_DISTANCE_TABLE, MOVABLE_DISTANCE_TABLE, ObjectTable
+from lib.player.sensor.visual_sensor import SeeParser
+from lib.rcsc.game_time import GameTime
+from lib.rcsc.types import ViewWidth
+
+
+def first_row_at_least(table, dist: float):
+    # the lower bound over the seen distances of the old lookups
+    return next((average, error) for seen_dist, average, error in table if seen_dist >= dist)
+
+
+def test_distance_ranges_are_unchanged():
+    table = ObjectTable.i()
+    for rows, lookup, batch in ((LANDMARK_DISTANCE_TABLE, table.get_landmark_distance_range,
+                                 table.get_landmark_distance_ranges),
+                                (MOVABLE_DISTANCE_TABLE, table.get_distance_range, table.get_distance_ranges)):
+        # every distance of a see message up to the last row of the table
+        dists = [round(d * 0.1, 1) for d in range(int(rows[-1][0] * 10) + 1)]
+        expected = [first_row_at_least(rows, d) for d in dists]
+        assert [lookup(ViewWidth.NORMAL, d) for d in dists] == expected
+        averages, errors = batch(ViewWidth.NORMAL, dists)
+        assert list(zip(averages.tolist(), errors.tolist())) == expected
+    # past the last row of the table
+    assert ObjectTable.i().get_distance_range(ViewWidth.NORMAL, 160.0) == (148.598714, 7.423750)
+
+
+def test_players_are_localized_at_once():
+    see = SeeParser()
+    see.parse(SEE, 'HELIOS_base', GameTime(245, 0))
+    seen_players = see.teammates() + see.unknown_teammates() + see.opponents() + see.unknown_players()
+    localizer = Localizer()
+    args = (-30.0, 2.0, Vector2D(-5.3, -14.5), Vector2D(0.2, 0.1), ViewWidth.NORMAL)
+    players = localizer.localize_players(seen_players, *args)
+    for seen_player, player in zip(seen_players, players):
+        one = localizer.localize_player(seen_player, *args)
+        assert (player.pos_.x(), player.pos_.y(), player.dist_error_) == (one.pos_.x(), one.pos_.y(), one.dist_error_)
@@ -0,0 +1,21 @@
+import json
+import os
+
+from base.generator_pass import BhvPassGen
+from fixtures.worlds import make_world
+
+# candidates of the per (course, step, opponent, cycle) loop before the batched evaluation
+# (benchmarks.pass_gen.LegacyBhvPassGen) in the worlds of make_world(None), make_world(1) and make_world(2)
+EXPECTED = os.path.join(os.path.dirname(__file__), 'data', 'pass_candidates.json')
+
+
+def candidate_table(candidates):
+    return [[c.target_unum, round(c.target_ball_pos.x(), 6), round(c.target_ball_pos.y(), 6), round(c.eval, 6)]
+            for c in candidates]
+
+
+def test_batched_passes_match_the_opponent_loop():
+    with open(EXPECTED) as f:
+        expected = json.load(f)
+    for seed in (None, 1, 2):
+        assert candidate_table(BhvPassGen().generator(make_world(seed))) == expected[str(seed)]
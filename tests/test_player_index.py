@@ -0,0 +1,64 @@
+import random
+
+from pyrusgeom.geom_2d import *
+
+from base.tools import Tools
+from fixtures.worlds import make_world, randomize
+from lib.player.localizer import Localizer
+from lib.player.object_player import PlayerObject
+from lib.player.object_table import ObjectTable
+from lib.player.sensor.visual_sensor import SeeParser
+from lib.rcsc.server_param import ServerParam as SP
+from lib.rcsc.types import MarkerID
+
+
+# the linear scans the index replaced
+def nearest_teammate(point: Vector2D, players: list):
+    nearest = min(players, key=lambda p: p.pos().dist2(point))
+    return nearest if nearest.pos().dist2(point) < 1000 else None
+
+
+def exist_teammates_in(wm, region: Region2D, count_thr: int):
+    return any(p.pos_count() <= count_thr and not p.is_ghost() and region.contains(p.pos()) for p in wm._teammates)
+
+
+def nearest_marker(point: Vector2D):
+    marker, pos = min(ObjectTable.i().landmark_map.items(), key=lambda m: point.dist(m[1]))
+    # the distance is compared with the squared threshold of 3 meters
+    return marker if point.dist(pos) < 3.0 * 3.0 else MarkerID.Marker_Unknown
+
+
+def test_index_queries_match_the_linear_scans():
+    wm = make_world()
+    players = [p for p in wm.teammates() + wm.opponents() if p is not None]
+    receivers = [p for p in wm.teammates() if p is not None]
+    penalty_area = Rect2D(Vector2D(-SP.i().pitch_half_length(), -SP.i().penalty_area_half_width()),
+                          Size2D(SP.i().penalty_area_length(), SP.i().penalty_area_width()))
+    localizer = Localizer()
+    rng = random.Random(1)
+    for _ in range(3):
+        randomize(wm, players, rng)
+        wm.update_player_state_cache()
+        for _ in range(200):
+            point = Vector2D(rng.uniform(-60, 60), rng.uniform(-40, 40))
+            assert Tools.get_nearest_teammate(wm, point, receivers) is nearest_teammate(point, receivers)
+            for region in (penalty_area, Circle2D(point, 10.0)):
+                assert wm.exist_teammates_in(region, 5, False) == exist_teammates_in(wm, region, 5)
+            assert localizer.get_nearest_marker(SeeParser.ObjectType.Obj_Marker, point) == nearest_marker(point)
+
+    # the positions are read from the store, a moved player is seen before the next update
+    mate = wm.teammates()[0]
+    mate._pos = Vector2D(30.5, -7.5)
+    assert Tools.get_nearest_teammate(wm, Vector2D(30, -7)) is mate
+
+    # players out of the index are scanned
+    stranger = PlayerObject()
+    stranger._pos = Vector2D(-12, 3)
+    receivers = [stranger] + wm.teammates()
+    point = Vector2D(-12.5, 3)
+    assert Tools.get_nearest_teammate(wm, point, receivers) is nearest_teammate(point, receivers)
+
+    sector = Sector2D(Vector2D(0, 0), 0, 40, AngleDeg(-45), AngleDeg(45))
+    index = wm.player_index()
+    rows = index.teammate_rows()
+    assert index.contains(sector, rows).tolist() == [sector.contains(index.player(r).pos()) for r in rows]
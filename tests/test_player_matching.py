@@ -0,0 +1,49 @@
+import itertools
+import math
+
+import numpy as np
+
+from fixtures.player_scenes import errors, match, scene
+from lib.player.player_matching import assign
+from lib.player.world_model import WorldModel
+
+
+def best_assignment(cost: np.ndarray) -> tuple[int, float]:
+    """
+    the most pairs of finite cost, then the least total cost, over every permutation
+    """
+    n, m = cost.shape
+    best = (0, 0.0)
+    for cols in itertools.permutations(list(range(m)) + [None] * n, n):
+        pairs = [(i, j) for i, j in enumerate(cols) if j is not None and math.isfinite(cost[i, j])]
+        total = sum(cost[i, j] for i, j in pairs)
+        if len(pairs) > best[0] or (len(pairs) == best[0] and total < best[1]):
+            best = (len(pairs), total)
+    return best
+
+
+def test_assignment_is_optimal():
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        cost = rng.random((rng.integers(0, 5), rng.integers(0, 5))) * 10
+        cost[rng.random(cost.shape) < 0.4] = math.inf
+        pairs = assign(cost)
+        assert len(set(i for i, _ in pairs)) == len(set(j for _, j in pairs)) == len(pairs)
+        count, total = best_assignment(cost)
+        assert len(pairs) == count and math.isclose(sum(cost[i, j] for i, j in pairs), total, abs_tol=1e-9)
+
+
+def test_batch_matching_swaps_less_than_greedy():
+    wm = WorldModel('real')
+    totals = {}
+    for batch in (False, True):
+        swaps = losses = 0
+        for seed in range(60):
+            known, seen, truth = scene(seed, 5.0)
+            new_known = match(wm, known, seen, batch)
+            assert len(new_known) == len(seen)
+            s, l = errors(known, new_known, truth)
+            swaps += s
+            losses += l
+        totals[batch] = (swaps, losses)
+    assert totals[True][0] < totals[False][0] and totals[True][1] <= totals[False][1]
@@ -0,0 +1,105 @@
+import json
+import os
+import random
+from enum import Enum
+
+from pyrusgeom.vector_2d import Vector2D
+
+from fixtures.messages import FULLSTATE
+from lib.parser.parser_message_fullstate_world import FullStateWorldMessageParser
+from lib.player.object_player import PlayerObject
+from lib.player.object_self import SelfObject
+from lib.player.player_store import PlayerStore, player_slots
+from lib.player.world_model import WorldModel
+from lib.rcsc.game_mode import GameMode
+from lib.rcsc.types import GameModeType, SideID
+
+# players of the s-expression dicts read one player at a time before the fullstate record
+# (benchmarks.fullstate.LegacyWorldModel) after FULLSTATE, with the agent on the left and on the right side
+EXPECTED = os.path.join(os.path.dirname(__file__), 'data', 'fullstate_players.json')
+
+
+def make_player(side: SideID, unum: int, pos: Vector2D, vel: Vector2D, vel_count: int) -> PlayerObject:
+    player = PlayerObject()
+    player.set_team(side, unum, False)
+    player._pos = pos
+    player._pos_count = 0
+    player._vel = vel
+    player._vel_count = vel_count
+    return player
+
+
+def test_player_view():
+    player = make_player(SideID.LEFT, 3, Vector2D(1, 2), Vector2D(0.5, -0.5), 0)
+    stopped = make_player(SideID.LEFT, 4, Vector2D(1, 2), Vector2D(0.5, -0.5), 10)
+    assert not PlayerObject()._pos.is_valid()
+    store = PlayerStore.i()
+    store.update_by_last_cycle(player_slots([player, stopped]))
+    player.update_by_last_cycle()
+    assert player.pos().equals(Vector2D(2, 1)) and player.pos_count() == 2 and player.vel_count() == 2
+    assert stopped.pos().equals(Vector2D(1, 2)) and stopped.vel_count() == 11
+    assert [(p.x(), p.y()) for p in player.pos_history()] == [(1.5, 1.5), (1, 2)]
+    player.reverse()
+    assert player.pos().equals(Vector2D(-2, -1)) and player.vel().equals(Vector2D(-0.5, 0.5))
+
+    me = SelfObject()
+    me._vel = Vector2D(0, 0)
+    me._vel.set_polar(1.0, 90.0)
+    assert abs(me.vel().y() - 1.0) < 1e-9
+
+
+def test_state_cache():
+    rnd = random.Random(3)
+    wm = WorldModel('real')
+    wm.init('PYRUS', 'l', 5, False)
+    wm._game_mode = GameMode(game_mode=GameModeType.PlayOn)
+    wm.self()._pos = Vector2D(0, 0)
+    wm.self()._pos_count = 0
+    wm.ball()._pos = Vector2D(10, 5)
+    wm.ball()._pos_count = 0
+
+    def random_pos():
+        return Vector2D(rnd.uniform(-50, 50), rnd.uniform(-30, 30))
+    wm._teammates = [make_player(SideID.LEFT, u, random_pos(), Vector2D(0, 0), 0) for u in range(1, 11)]
+    wm._opponents = [make_player(SideID.RIGHT, u, random_pos(), Vector2D(0, 0), 0) for u in range(1, 11)]
+    wm._unknown_players = [make_player(SideID.NEUTRAL, 0, random_pos(), Vector2D(0, 0), 0)]
+    wm._teammates[4]._pos = Vector2D(10.5, 5)
+    wm._opponents[2]._pos = Vector2D(9.5, 5.5)
+    wm.update_player_state_cache()
+
+    ball = wm.ball().pos()
+    others = wm._opponents + wm._unknown_players
+    assert wm.teammates_from_self() == sorted(wm._teammates, key=lambda p: p.pos().r())
+    assert wm.teammates_from_ball() == sorted(wm._teammates, key=lambda p: p.pos().dist(ball))
+    assert wm.opponents_from_self() == sorted(others, key=lambda p: p.pos().r())
+    assert wm.opponents_from_ball() == sorted(others, key=lambda p: p.pos().dist(ball))
+    assert abs(wm._teammates[4].dist_from_ball() - 0.5) < 1e-9
+    assert wm._kickable_teammate is wm._teammates[4]
+    assert wm._kickable_opponent is wm._opponents[2]
+
+
+def player_state(wm: WorldModel) -> list:
+    def value(v):
+        if isinstance(v, Enum):
+            return v.name
+        return round(v, 6) if isinstance(v, float) else v
+    return [[value(v) for v in (p.side(), p.unum(), p.goalie(), p.player_type_id(), p.pos().x(), p.pos().y(),
+                                p.vel().x(), p.vel().y(), p.body().degree(), p.neck().degree(),
+                                p.stamina_model().stamina(), p.stamina_model().capacity(), p.kick(), p.tackle(),
+                                p.charged(), p.card(), p.pos_count(), p.vel_count(), p.rpos().x(), p.rpos().y(),
+                                p.dist_from_self(), p.angle_from_self().degree(), p.dist_from_ball(),
+                                p.angle_from_ball().degree())]
+            for p in wm._teammates + wm._opponents] + [[wm.self().pos().x(), wm.self().pos().y()]]
+
+
+def test_full_state_record():
+    with open(EXPECTED) as f:
+        expected = json.load(f)
+    for side in ('l', 'r'):
+        record = WorldModel('full')
+        record.init('PYRUS', side, 5, False)
+        parser = FullStateWorldMessageParser()
+        parser.parse(FULLSTATE)
+        record.update_by_full_state_message(parser)
+        assert len(record._teammates) == 10 and len(record._opponents) == 11
+        assert player_state(record) == expected[side]
@@ -0,0 +1,28 @@
+import team_config
+from base.sample_player import SamplePlayer
+from fixtures.recordings import synthesize
+from lib.network.recorder import IN, OUT, read_recording
+from lib.player.replay import Replay
+
+
+def test_replay_repeats_recorded_decisions(tmp_path):
+    path = str(tmp_path / 'player.rec')
+    synthesize(path, 5)
+    records = list(read_recording(path))
+    assert records[0][0] == OUT and records[0][2].startswith(b'(init HELIOS_base')
+    assert sum(1 for r in records if r[0] == IN) == 1 + 1 + 18 + 1 + 2 * 5
+
+    replay = Replay(path)
+    assert replay.team_name() == 'HELIOS_base' and not replay.goalie()
+    result = replay.run(SamplePlayer)
+    assert result.cycles == 5 and result.mismatches == 0
+
+
+def test_oracle_full_state_replays_the_same_decisions(tmp_path, monkeypatch):
+    path = str(tmp_path / 'fullstate.rec')
+    synthesize(path, 5, fullstate=True)
+    assert sum(1 for r in read_recording(path) if r[0] == IN and r[2].startswith(b'(fullstate')) == 5
+
+    monkeypatch.setattr(team_config, 'ORACLE_FULL_STATE', True)
+    result = Replay(path).run(SamplePlayer)
+    assert result.cycles == 5 and result.mismatches == 0
@@ -0,0 +1,57 @@
+import math
+
+from lib.parser.parser_message_fullstate_world import FullStateWorldMessageParser
+from lib.parser.parser_message_params import MessageParamsParser
+from lib.parser.sexp_parser import _parse_json, _parse_tokens, parse_sexp
+
+
+def test_typed_values():
+    dic = MessageParamsParser().parse('(server_param (half_time 300)(ball_decay 0.94)(game_log_dir "./")(team_l_start ""))')
+    assert dic == {'server_param': {'half_time': 300, 'ball_decay': 0.94, 'game_log_dir': './', 'team_l_start': ''}}
+
+
+def test_json_and_token_paths():
+    messages = ['(fullstate 10 (pmode play_on) (vmode high normal) (count 0 1 2 3 4 5 6 7) ((b) 0 -1.5 1e-05 0))',
+                '(see_global 1 ((g l) -52.5 0) ((p "PYRUS" 1 goalie) -50 0 0 0 0 0 k))',
+                '(player_type (id 3)(player_speed_max 1.05)(kick_rand 0.0287182))']
+    for message in messages:
+        assert _parse_json(message) == _parse_tokens(message)
+    assert parse_sexp('(hear 10 referee play_on)\x00') == [['hear', 10, 'referee', 'play_on']]
+    assert parse_sexp('(hear 1 -30 our 3 "a,b")') == [['hear', 1, -30, 'our', 3, 'a,b']]
+    assert parse_sexp('(a (b .5 +3') == [['a', ['b', 0.5, 3]]]
+
+
+def test_fullstate_players():
+    parser = FullStateWorldMessageParser()
+    parser.parse('(fullstate 109 (pmode play_on) (vmode high normal) (count 0 25 82 0 79 0 0 0) '
+                 '(arm (movable 0) (expires 0) (target 0 0) (count 0)) (score 0 0) ((b) 0 0 0 0) '
+                 '((p l 1 g 0) -49 0 0 0 0 0 (focus_point 0 0) (stamina 8000 1 1 130600)) '
+                 '((p r 10 9) 0.0073 -23.03 -0.39 -0.08 -164.67 -90 44.22 1.38 (focus_point 2 10) '
+                 '(stamina 7539.49 0.93 1 129861) k y))')
+    assert parser.dash_count() == 25 and parser.move_count() == 79
+    assert list(parser.ball()) == [0, 0, 0, 0] and 'players' not in parser.dic()
+    goalie, player = parser.players().tolist()
+    assert goalie[:4] == ('l', 1, True, 0) and goalie[-4:] == (False, False, False, '')
+    assert player[:4] == ('r', 10, False, 9)
+    assert player[10:14] == (44.22, 1.38, 2, 10) and player[14:18] == (7539.49, 0.93, 1, 129861)
+    assert player[-4:] == (True, False, False, 'y')
+    assert math.isnan(goalie[10]) and goalie[17] == 130600
+
+    parser.parse('(fullstate 1 (pmode before_kick_off) (vmode high normal) (count 0 0 0 0 0 0 0 0) ((b) 0 0 0 0) '
+                 '((p l 2 3) 1 2 0 0 0 0 (stamina 8000 1 1)))')
+    (row,) = parser.players().tolist()
+    assert row[:10] == ('l', 2, False, 3, 1, 2, 0, 0, 0, 0) and row[12:] == (0, 0, 8000, 1, 1, -1, False, False,
+                                                                              False, '')
+    assert math.isnan(row[10]) and math.isnan(row[11])
+
+
+def test_fullstate_players_with_extra_whitespace():
+    parser = FullStateWorldMessageParser()
+    parser.parse('(fullstate 1 (pmode play_on) (vmode high normal) (count 0 0 0 0 0 0 0 0) ((b) 0 0 0 0) '
+                 '((p  l 2  3 )  1 2 0 0 0  0 (focus_point 2 10)  (stamina 8000  1 1 ) ) '
+                 '((p r 10 g 9) 1 2 0 0 0 0 44.22  1.38 (stamina  8000 1 1 129861 ) k))')
+    first, second = parser.players().tolist()
+    assert first[:10] == ('l', 2, False, 3, 1, 2, 0, 0, 0, 0) and first[12:18] == (2, 10, 8000, 1, 1, -1)
+    assert math.isnan(first[10]) and math.isnan(first[11])
+    assert second[:4] == ('r', 10, True, 9) and second[10:18] == (44.22, 1.38, 0, 0, 8000, 1, 1, 129861)
+    assert second[-4:] == (True, False, False, '')
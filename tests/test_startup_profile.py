@@ -0,0 +1,26 @@
+import importlib
+import sys
+
+from lib.debug.startup_profile import StartupProfile
+
+
+def test_import_times(tmp_path, monkeypatch):
+    (tmp_path / 'startup_a.py').write_text('import time\nimport startup_b\ntime.sleep(0.02)\n')
+    (tmp_path / 'startup_b.py').write_text('import time\ntime.sleep(0.01)\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+    profile = StartupProfile()
+    sys.meta_path.insert(0, profile)
+    try:
+        module = importlib.import_module('startup_a')
+    finally:
+        sys.meta_path.remove(profile)
+        sys.modules.pop('startup_a', None)
+        sys.modules.pop('startup_b', None)
+
+    a_self, a_total = profile.modules()['startup_a']
+    b_self, b_total = profile.modules()['startup_b']
+    assert b_self >= 0.01 and a_self >= 0.02
+    assert abs(a_total - a_self - b_total) < 1e-6
+    # the module keeps the loader that found it
+    assert type(module.__loader__).__name__ == 'SourceFileLoader'
+    assert module.__spec__.loader is module.__loader__
@@ -0,0 +1,34 @@
+from lib.debug.debug_client import DebugClient
+from lib.debug.level import Level, level_mask
+from lib.debug.sw_logger import SoccerWindow_Logger
+from lib.rcsc.game_time import GameTime
+
+
+class Exploding:
+    def __str__(self):
+        raise AssertionError('disabled levels must not format their messages')
+
+
+def test_disabled_levels_skip_formatting():
+    logger = SoccerWindow_Logger('test', 1, GameTime(3, 0), level_mask('intercept,pass'))
+    assert logger.is_enabled(Level.PASS) and not logger.is_enabled(Level.WORLD)
+
+    logger.world().add_text('ball {}', Exploding())
+    logger.pass_().add_text('pass to {} at {:.1f}', 7, 12.345)
+    assert logger.world()._commands == []
+    assert logger.pass_()._commands == [f'3,0 {Level.PASS.value} M pass to 7 at 12.3\n']
+
+    logger.set_levels(level_mask('none'))
+    logger.pass_().add_text('pass {}', Exploding())
+    logger.set_level(Level.WORLD)
+    logger.world().add_text('world')
+    assert logger.world().enabled and not logger.pass_().enabled
+
+
+def test_disabled_debug_client_skips_formatting():
+    client = DebugClient(False)
+    client.add_message('sent message: {}', Exploding())
+    client.set_on(True)
+    client.add_message('\nsent message: {}', '(dash 100)')
+    client.add_message('AttOff')
+    assert client._message == '/sent message: (dash 100)/AttOff'